@@ -137,5 +137,77 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Historique des tableaux du simplexe enregistré sur le Problem :
+# 'full', 'final', 'every-k', 'none' ou 'pivot-log' (tableau initial + pivots, rejoués à l'affichage)
+SIMPLEX_HISTORY_MODE = 'pivot-log'
+
+# Règle de choix de la colonne entrante : 'dantzig' (celle des cours), 'partial', 'devex' ou 'steepest-edge'
+SIMPLEX_PRICING = 'dantzig'
+
+# Re-résolution à partir de la base finale enregistrée sur le Problem (Problem.basis_vars)
+SIMPLEX_WARM_START = True
+
+# Présolution (lignes vides, singletons, doublons, colonnes vides) avant la construction du tableau
+SIMPLEX_PRESOLVE = True
+
+# Mise à l'échelle de la matrice des contraintes : None, 'geometric' ou 'equilibration'
+SIMPLEX_SCALING = None
+
+# Taille (variables x contraintes) à partir de laquelle un modèle dense est résolu par points intérieurs
+# puis crossover plutôt que par le simplexe seul ; None : jamais
+SIMPLEX_INTERIOR_POINT_MIN_SIZE = None
+
+# Durée maximale d'une résolution en secondes (None : aucune) ; au-delà, la meilleure base atteinte est renvoyée
+SIMPLEX_TIME_LIMIT = 30
+
+# Mode exact : pivots entiers sans fraction (Bareiss) et tableaux affichés en fractions exactes
+SIMPLEX_EXACT = False
+
+# Instrumentation du solveur : temps par phase (pricing, test du ratio, pivot, historique) et par itération,
+# pivots dégénérés, conditionnement de la base finale, pic mémoire des tableaux ; désactivée, elle ne coûte rien
+SIMPLEX_INSTRUMENTATION = False
+
+# Processus de la séparation et évaluation (variables entières) ; None : un par cœur, 1 : aucun pool.
+# Le pool n'est démarré que si la relaxation racine est fractionnaire ; en arrière-plan (SIMPLEX_SOLVE_ASYNC),
+# chaque processus de résolution aurait le sien : SIMPLEX_SOLVE_WORKERS x SIMPLEX_MIP_WORKERS processus
+SIMPLEX_MIP_WORKERS = 1
+
+# Résolution en arrière-plan : la requête rend la main aussitôt, la page suit l'avancement (queued, running).
+# SIMPLEX_SOLVE_WORKERS processus préchauffés, au plus SIMPLEX_SOLVE_QUEUE_SIZE résolutions en attente ou en cours
+SIMPLEX_SOLVE_ASYNC = True
+SIMPLEX_SOLVE_WORKERS = 2
+SIMPLEX_SOLVE_QUEUE_SIZE = 32
+# Au-delà de ce délai (s) en file ou en cours, une résolution est considérée comme perdue (redémarrage du serveur,
+# processus tué) : le problème passe en erreur et peut être relancé
+SIMPLEX_SOLVE_JOB_TIMEOUT = 15 * 60
+
+# Importation en arrière-plan (problems.import_pipeline) : traitements simultanés par étape
+IMPORT_STAGE_CONCURRENCY = {'rasterize': 2, 'preprocess': 2, 'extract': 4, 'parse': 2, 'validate': 2, 'persist': 1}
+# Pages d'un même PDF traitées en même temps ; sans fusion, la première page contenant un problème complet
+# est retenue et les pages suivantes ne sont pas traitées, avec fusion toutes les pages sont lues et réunies
+IMPORT_PAGE_CONCURRENCY = 4
+IMPORT_MERGE_PAGES = False
+# Au-delà de ce délai (s) sans avancement, une importation est considérée comme perdue et passe en échec
+IMPORT_JOB_TIMEOUT = 10 * 60
+# Préparation des images avant l'envoi au modèle (problems.image_preprocessing) : rotation EXIF, plus grand côté
+# réduit à max_long_edge pixels, niveaux de gris et contraste, recadrage sur le texte, ré-encodage. None : image d'origine
+IMPORT_IMAGE_PREPROCESSING = {
+    'max_long_edge': 1600,
+    'grayscale': True,
+    'normalize_contrast': True,
+    'crop': True,
+    # WebP sans perte : plus léger que le PNG, et qu'une page de PDF envoyée sans préparation
+    'format': 'WEBP',
+    'lossless': True,
+}
+
+# Cache des résultats partagé entre utilisateurs, clé : empreinte canonique du problème (ordre des variables,
+# des contraintes et écriture des nombres normalisés). LRU de SIMPLEX_SOLVE_CACHE_SIZE entrées par processus,
+# puis le cache Django SIMPLEX_SOLVE_CACHE_ALIAS (None : LRU seul), entrées conservées SIMPLEX_SOLVE_CACHE_TIMEOUT s
+SIMPLEX_SOLVE_CACHE = True
+SIMPLEX_SOLVE_CACHE_ALIAS = 'default'
+SIMPLEX_SOLVE_CACHE_SIZE = 256
+SIMPLEX_SOLVE_CACHE_TIMEOUT = 24 * 3600
+
 # Ajoutez dans settings.py
 GOOGLE_APPLICATION_CREDENTIALS = os.path.join(BASE_DIR, 'credentials', 'gen-lang-client-0924501457-9db60fd72dbb.json')
@@ -0,0 +1,184 @@
+# problems/batch.py
+"""
+Résolution simultanée d'une pile de programmes linéaires de même forme (m contraintes,
+n variables), typiquement un même énoncé décliné avec des données différentes.
+
+Les k tableaux sont empilés dans un tableau 3-D (k, m+1, n+m+1) et chaque itération
+effectue un pivot pour tous les problèmes encore actifs à la fois ; les problèmes
+terminés sont masqués. La suite des pivots de chaque problème est exactement celle
+du moteur tableau de SimplexSolver (règle de Dantzig, même test du ratio), et les
+résultats ont le format renvoyé par SimplexSolver.solve().
+"""
+
+import numpy as np
+
+from problems.limits import LIMIT_ITERATIONS, STATUS_TIME_LIMIT
+from problems.program import SENSE_GE, SENSE_LE, LinearProgram
+from problems.simplex import SimplexSolver, HISTORY_FULL
+
+TOLERANCE = 1e-9
+
+
+def solve_batch(objective_type, objective_coefficients, constraint_matrices, rhs, senses=None,
+                history=HISTORY_FULL, history_every=10, verbose=False):
+    """
+    objective_coefficients : (k, n) ; constraint_matrices : (k, m, n) ; rhs : (k, m).
+    senses : liste de m sens communs à tous les problèmes, ou tableau (k, m) ; '<=' par défaut.
+    Renvoie une liste de k dictionnaires de résultat, dans l'ordre de la pile.
+    """
+    C = np.atleast_2d(np.asarray(objective_coefficients, dtype=float))
+    A = np.asarray(constraint_matrices, dtype=float)
+    b = np.atleast_2d(np.asarray(rhs, dtype=float))
+    if A.ndim != 3:
+        raise ValueError(f"Les matrices de contraintes doivent former un tableau 3-D (k, m, n), reçu {A.shape}.")
+    num_problems, num_rows, num_vars = A.shape
+    if C.shape != (num_problems, num_vars) or b.shape != (num_problems, num_rows):
+        raise ValueError(f"Dimensions incohérentes : objectifs {C.shape}, contraintes {A.shape}, seconds membres {b.shape}.")
+    senses = np.broadcast_to(np.array(SENSE_LE if senses is None else senses, dtype=object), (num_problems, num_rows))
+
+    solvers = []
+    for i in range(num_problems):
+        program = LinearProgram(objective_type, C[i], A[i], b[i], senses[i])
+        solvers.append(SimplexSolver(objective_type, program.c, program, verbose=verbose,
+                                     history=history, history_every=history_every))
+
+    objective_type = objective_type.lower()
+    if objective_type not in ('max', 'min') or np.any((senses != SENSE_LE) & (senses != SENSE_GE)):
+        # Cas non gérés : le solveur unitaire produit le résultat (et le message) habituel
+        return [solver.solve() for solver in solvers]
+
+    tableaus, basis = _build_initial_tableaus(objective_type, C, A, b, senses)
+    for i, solver in enumerate(solvers):
+        solver._set_tableau_variable_names(num_vars, num_rows)
+        solver._record_tableau(_tableau_info(solver, tableaus, basis, i), 0)
+
+    statuses = _run(tableaus, basis, solvers)
+
+    sign = -1.0 if objective_type == 'min' else 1.0
+    results = []
+    for i, solver in enumerate(solvers):
+        if statuses[i] == STATUS_TIME_LIMIT:
+            solver.limit_reached = LIMIT_ITERATIONS
+        # Une base interrompue déjà primal réalisable garde sa solution, comme dans SimplexSolver
+        if statuses[i] == 'optimal' or (statuses[i] == STATUS_TIME_LIMIT and np.all(tableaus[i, :-1, -1] >= -TOLERANCE)):
+            solver.solution = np.zeros(num_vars)
+            structural = basis[i] < num_vars
+            solver.solution[basis[i][structural]] = tableaus[i, :-1, -1][structural]
+            solver.optimal_value = float(sign * tableaus[i, -1, -1])
+        results.append(solver.result_with_status(statuses[i]))
+    return results
+
+
+def _build_initial_tableaus(objective_type, C, A, b, senses):
+    # Forme standard max c'x, A'x <= b' de chaque problème, comme SimplexSolver._build_initial_tableau
+    num_problems, num_rows, num_vars = A.shape
+    signs = np.where(senses == SENSE_GE, -1.0, 1.0)
+    objective_sign = -1.0 if objective_type == 'min' else 1.0
+
+    tableaus = np.zeros((num_problems, num_rows + 1, num_vars + num_rows + 1))
+    tableaus[:, :num_rows, :num_vars] = A * signs[:, :, np.newaxis]
+    tableaus[:, np.arange(num_rows), num_vars + np.arange(num_rows)] = 1.0
+    tableaus[:, :num_rows, -1] = b * signs
+    tableaus[:, num_rows, :num_vars] = -objective_sign * C
+    basis = np.tile(np.arange(num_vars, num_vars + num_rows), (num_problems, 1))
+    return tableaus, basis
+
+
+def _tableau_info(solver, tableaus, basis, i):
+    return {'tableau': tableaus[i], 'basis_vars': basis[i].tolist(), 'variable_names': solver.variable_names}
+
+
+def _run(tableaus, basis, solvers):
+    """
+    Boucle commune : à chaque itération, les problèmes encore primal irréalisables font un pas
+    de simplexe dual, les autres un pas de simplexe primal, puis tous les pivots sont appliqués
+    en une seule mise à jour vectorisée.
+    """
+    num_problems = tableaus.shape[0]
+    statuses = np.full(num_problems, None, dtype=object)
+    iterations = np.zeros(num_problems, dtype=int)
+    # Même limite pour toute la pile : les problèmes ont la même forme
+    iteration_limit = solvers[0].iteration_limit if solvers else SimplexSolver.max_iterations
+
+    active = np.arange(num_problems)
+    while active.size:
+        at_limit = iterations[active] >= iteration_limit
+        statuses[active[at_limit]] = STATUS_TIME_LIMIT
+        active = active[~at_limit]
+        if not active.size:
+            break
+
+        current = tableaus[active]
+        rhs = current[:, :-1, -1]
+        z_row = current[:, -1, :-1]
+        pivot_rows = np.argmin(rhs, axis=1)
+        dual_step = rhs[np.arange(active.size), pivot_rows] < -TOLERANCE
+        pivot_cols = np.full(active.size, -1)
+
+        if np.any(dual_step):
+            dual = np.flatnonzero(dual_step)
+            pivot_cols[dual] = _dual_ratio_test(z_row[dual], current[dual, pivot_rows[dual], :-1])
+            statuses[active[dual[pivot_cols[dual] < 0]]] = 'infeasible'
+
+        primal = np.flatnonzero(~dual_step)
+        if primal.size:
+            entering = np.argmin(z_row[primal], axis=1)
+            optimal = z_row[primal, entering] >= -TOLERANCE
+            statuses[active[primal[optimal]]] = 'optimal'
+            primal, entering = primal[~optimal], entering[~optimal]
+            leaving = _ratio_test(rhs[primal], current[primal, :-1, entering])
+            statuses[active[primal[leaving < 0]]] = 'unbounded'
+            pivot_cols[primal] = entering
+            pivot_rows[primal] = leaving
+
+        pivoting = (statuses[active] == None) & (pivot_cols >= 0) & (pivot_rows >= 0)  # noqa: E711
+        active, pivot_rows, pivot_cols = active[pivoting], pivot_rows[pivoting], pivot_cols[pivoting]
+        if not active.size:
+            break
+
+        _pivot_batch(tableaus, active, pivot_rows, pivot_cols)
+        basis[active, pivot_rows] = pivot_cols
+        iterations[active] += 1
+        for i, pivot_row, pivot_col in zip(active, pivot_rows, pivot_cols):
+            solvers[i].iterations = int(iterations[i])
+            solvers[i]._record_tableau(_tableau_info(solvers[i], tableaus, basis, i), int(iterations[i]),
+                                       pivot=(int(pivot_row), int(pivot_col)))
+
+    return statuses
+
+
+def _ratio_test(rhs, columns):
+    # Test du ratio de SimplexSolver._ratio_test, ligne par ligne : plus petit indice parmi les ex aequo
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(columns > TOLERANCE, rhs / columns, np.inf)
+        ratios[ratios < -TOLERANCE] = np.inf
+        best = ratios.min(axis=1, initial=np.inf)
+        ties = np.abs(ratios - best[:, np.newaxis]) < TOLERANCE
+    return np.where(np.isfinite(best), np.argmax(ties, axis=1), -1)
+
+
+def _dual_ratio_test(z_rows, pivot_row_values):
+    # Test du ratio dual de SimplexSolver._dual_ratio_test : plus grand |alpha_rj| parmi les ex aequo
+    candidates = pivot_row_values < -TOLERANCE
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(candidates, np.maximum(z_rows, 0.0) / -pivot_row_values, np.inf)
+    best = ratios.min(axis=1, initial=np.inf)
+    ties = candidates & (ratios <= best[:, np.newaxis] + TOLERANCE)
+    cols = np.argmax(np.where(ties, -pivot_row_values, -np.inf), axis=1)
+    return np.where(candidates.any(axis=1), cols, -1)
+
+
+def _pivot_batch(tableaus, problems, pivot_rows, pivot_cols):
+    """Pivot de pivot_in_place appliqué à plusieurs tableaux de la pile en une seule mise à jour de rang 1."""
+    selection = np.arange(problems.size)
+    current = tableaus[problems]
+    pivot_elems = current[selection, pivot_rows, pivot_cols]
+    if np.any(np.abs(pivot_elems) < TOLERANCE):
+        raise ValueError("Pivot element is zero or close to zero. Algorithm error.")
+
+    pivot_row_values = current[selection, pivot_rows, :] / pivot_elems[:, np.newaxis]
+    current[selection, pivot_rows, :] = pivot_row_values
+    columns = current[selection, :, pivot_cols]
+    columns[selection, pivot_rows] = 0.0
+    current -= columns[:, :, np.newaxis] * pivot_row_values[:, np.newaxis, :]
+    tableaus[problems] = current
@@ -0,0 +1,28 @@
+# problems/benchmarks/__init__.py
+"""
+Mesures de performance du solveur, par domaine :
+
+    common     mesure du temps et de la mémoire, générateurs de problèmes partagés
+    engine     moteur : creux, pivot, pricing, mise à l'échelle, bornes, points intérieurs, exact, programme
+    workloads  plusieurs problèmes : pile, balayage paramétrique, séparation et évaluation, cache
+    suite      suite de référence enregistrée en JSON et comparaison de deux suites
+    images     préparation des images envoyées au modèle à l'importation
+
+Usage :
+    python -m problems.benchmarks sparse [--sizes 1000 2000 5000 10000] [--density 0.02]
+    python -m problems.benchmarks pivot [--sizes 100 500 2000] [--iterations 20]
+    python -m problems.benchmarks pricing [--sizes 20 40 60]
+    python -m problems.benchmarks batch [--counts 10 100 500] [--size 8]
+    python -m problems.benchmarks parametric [--sizes 10 30 60] [--points 1000]
+    python -m problems.benchmarks scaling [--sizes 20 40 60] [--spread 6]
+    python -m problems.benchmarks bounds [--sizes 20 40 80]
+    python -m problems.benchmarks interior-point [--sizes 50 100 200]
+    python -m problems.benchmarks exact [--sizes 5 10 20 40]
+    python -m problems.benchmarks mip [--sizes 10 15 20] [--workers 1 2 4]
+    python -m problems.benchmarks cache [--sizes 10 30 60]
+    python -m problems.benchmarks program [--sizes 100 500 2000]
+    python -m problems.benchmarks suite [--sizes 10 20 40] [--families ...] [--configs ...] [--output suite.json] [--instrument]
+    python -m problems.benchmarks compare avant.json après.json
+    python -m problems.benchmarks preprocessing [--kinds pdf-page scan photo] [--files page.jpg ...]
+                                                [--max-long-edge 1600] [--format WEBP] [--lossy] [--bandwidth 10] [--live]
+"""
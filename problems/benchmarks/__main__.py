@@ -0,0 +1,116 @@
+# problems/benchmarks/__main__.py
+"""Point d'entrée : python -m problems.benchmarks <benchmark> [options] (voir problems.benchmarks)."""
+
+import argparse
+
+from problems.benchmarks.engine import (bench_bounds, bench_exact, bench_interior_point, bench_pivot, bench_pricing,
+                                        bench_program, bench_scaling, bench_sparse_vs_dense)
+from problems.benchmarks.images import bench_preprocessing
+from problems.benchmarks.suite import SUITE_CONFIGS, SUITE_FAMILIES, compare_suites, run_suite
+from problems.benchmarks.workloads import bench_batch, bench_cache, bench_mip, bench_parametric
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m problems.benchmarks", description="Benchmarks du SimplexSolver")
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    sparse_parser = subparsers.add_parser('sparse', help="Représentation creuse contre dense")
+    sparse_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 2000, 5000, 10000])
+    sparse_parser.add_argument('--density', type=float, default=0.02)
+
+    pivot_parser = subparsers.add_parser('pivot', help="Noyau de pivot en place contre noyau historique")
+    pivot_parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 2000])
+    pivot_parser.add_argument('--iterations', type=int, default=20)
+
+    pricing_parser = subparsers.add_parser('pricing', help="Itérations par règle de pricing")
+    pricing_parser.add_argument('--sizes', type=int, nargs='+', default=[20, 40, 60])
+
+    batch_parser = subparsers.add_parser('batch', help="Pile de problèmes de même forme contre résolution un par un")
+    batch_parser.add_argument('--counts', type=int, nargs='+', default=[10, 100, 500])
+    batch_parser.add_argument('--size', type=int, default=8)
+
+    parametric_parser = subparsers.add_parser('parametric', help="Balayage paramétrique du second membre contre résolutions à froid")
+    parametric_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 30, 60])
+    parametric_parser.add_argument('--points', type=int, default=1000)
+
+    scaling_parser = subparsers.add_parser('scaling', help="Itérations et précision avec et sans mise à l'échelle")
+    scaling_parser.add_argument('--sizes', type=int, nargs='+', default=[20, 40, 60])
+    scaling_parser.add_argument('--spread', type=float, default=6)
+
+    bounds_parser = subparsers.add_parser('bounds', help="Bornes en lignes de contraintes contre simplexe à variables bornées")
+    bounds_parser.add_argument('--sizes', type=int, nargs='+', default=[20, 40, 80])
+
+    interior_parser = subparsers.add_parser('interior-point', help="Simplexe contre points intérieurs + crossover sur de grands problèmes denses")
+    interior_parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200])
+
+    exact_parser = subparsers.add_parser('exact', help="Surcoût du mode exact (Bareiss) par rapport au tableau flottant")
+    exact_parser.add_argument('--sizes', type=int, nargs='+', default=[5, 10, 20, 40])
+
+    mip_parser = subparsers.add_parser('mip', help="Séparation et évaluation par nombre de processus")
+    mip_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 15, 20])
+    mip_parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+
+    cache_parser = subparsers.add_parser('cache', help="Cache des résultats : résolution contre succès sur un problème permuté")
+    cache_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 30, 60])
+
+    program_parser = subparsers.add_parser('program', help="Construction : liste de dictionnaires contre LinearProgram")
+    program_parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 2000])
+
+    suite_parser = subparsers.add_parser('suite', help="Suite complète : familles d'instances x configurations, résultats en JSON")
+    suite_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 40])
+    suite_parser.add_argument('--families', nargs='+', choices=list(SUITE_FAMILIES), default=list(SUITE_FAMILIES))
+    suite_parser.add_argument('--configs', nargs='+', choices=list(SUITE_CONFIGS), default=list(SUITE_CONFIGS))
+    suite_parser.add_argument('--time-limit', type=float, default=60.0)
+    suite_parser.add_argument('--output', default='benchmark-suite.json')
+    suite_parser.add_argument('--instrument', action='store_true', help="Temps par phase et pivots dégénérés dans les résultats")
+
+    compare_parser = subparsers.add_parser('compare', help="Compare deux fichiers de résultats de la suite")
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+
+    preprocessing_parser = subparsers.add_parser('preprocessing', help="Images envoyées au modèle : d'origine contre préparées")
+    preprocessing_parser.add_argument('--kinds', nargs='*', choices=['pdf-page', 'scan', 'photo'], default=['pdf-page', 'scan', 'photo'])
+    preprocessing_parser.add_argument('--files', nargs='*', default=[])
+    preprocessing_parser.add_argument('--max-long-edge', type=int, default=1600)
+    preprocessing_parser.add_argument('--format', choices=['PNG', 'JPEG', 'WEBP'], default='WEBP')
+    preprocessing_parser.add_argument('--lossy', action='store_true', help="WebP avec perte (quality) plutôt que sans perte")
+    preprocessing_parser.add_argument('--bandwidth', type=float, default=10.0, help="Débit montant en Mbit/s pour l'envoi estimé")
+    preprocessing_parser.add_argument('--live', action='store_true', help="Appel réel au modèle (GEMINI_API_KEY)")
+
+    args = parser.parse_args(argv)
+    if args.benchmark == 'sparse':
+        bench_sparse_vs_dense(sizes=args.sizes, density=args.density)
+    elif args.benchmark == 'pivot':
+        bench_pivot(sizes=args.sizes, iterations=args.iterations)
+    elif args.benchmark == 'pricing':
+        bench_pricing(sizes=args.sizes)
+    elif args.benchmark == 'batch':
+        bench_batch(counts=args.counts, size=args.size)
+    elif args.benchmark == 'parametric':
+        bench_parametric(sizes=args.sizes, points=args.points)
+    elif args.benchmark == 'scaling':
+        bench_scaling(sizes=args.sizes, spread=args.spread)
+    elif args.benchmark == 'bounds':
+        bench_bounds(sizes=args.sizes)
+    elif args.benchmark == 'interior-point':
+        bench_interior_point(sizes=args.sizes)
+    elif args.benchmark == 'exact':
+        bench_exact(sizes=args.sizes)
+    elif args.benchmark == 'mip':
+        bench_mip(sizes=args.sizes, workers=args.workers)
+    elif args.benchmark == 'cache':
+        bench_cache(sizes=args.sizes)
+    elif args.benchmark == 'program':
+        bench_program(sizes=args.sizes)
+    elif args.benchmark == 'suite':
+        run_suite(sizes=args.sizes, families=args.families, configs=args.configs, time_limit=args.time_limit,
+                  output=args.output, instrument=args.instrument)
+    elif args.benchmark == 'compare':
+        compare_suites(args.before, args.after)
+    elif args.benchmark == 'preprocessing':
+        bench_preprocessing(kinds=args.kinds, files=args.files, bandwidth=args.bandwidth, live=args.live,
+                            max_long_edge=args.max_long_edge, format=args.format, lossless=not args.lossy)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# problems/benchmarks/common.py
+"""
+Outils partagés par les benchmarks : mesure du temps et de la mémoire, générateurs de problèmes.
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from problems.sparse import CSRMatrix
+
+
+def measure(func, repeat=1):
+    """
+    Exécute func et renvoie (résultat, durée moyenne en s, pic mémoire en octets).
+    Le temps est mesuré hors tracemalloc, qui ralentit fortement les allocations.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def random_sparse_lp(num_vars, num_rows, density, seed=0):
+    """
+    Problème max c x s.t. A x <= b, x >= 0 borné, avec A aléatoire creuse (densité donnée)
+    et au moins une entrée par colonne. Renvoie (c, A au format CSRMatrix, b).
+    """
+    rng = np.random.default_rng(seed)
+    nnz_per_row = max(1, int(round(density * num_vars)))
+    rows = np.repeat(np.arange(num_rows), nnz_per_row)
+    cols = np.concatenate([rng.choice(num_vars, nnz_per_row, replace=False) for _ in range(num_rows)])
+    # Chaque colonne apparaît au moins une fois pour que le problème reste borné
+    rows = np.concatenate([rows, rng.integers(0, num_rows, num_vars)])
+    cols = np.concatenate([cols, np.arange(num_vars)])
+
+    dense_positions = np.unique(rows * num_vars + cols)
+    rows, cols = np.divmod(dense_positions, num_vars)
+    values = rng.uniform(1.0, 10.0, rows.size)
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=num_rows))])
+
+    A = CSRMatrix(values, cols, indptr, (num_rows, num_vars))
+    b = rng.uniform(10.0, 100.0, num_rows)
+    c = rng.uniform(1.0, 10.0, num_vars)
+    return c, A, b
+
+
+def random_dense_lp(num_vars, num_rows, seed=0):
+    """Problème max c x s.t. A x <= b, x >= 0 dense et borné. Renvoie une liste de contraintes au format Problem."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(1.0, 10.0, (num_rows, num_vars))
+    b = rng.uniform(10.0, 100.0, num_rows)
+    c = rng.uniform(1.0, 10.0, num_vars)
+    constraints = [{'coefficients': A[i].tolist(), 'sense': '<=', 'rhs': float(b[i])} for i in range(num_rows)]
+    return c.tolist(), constraints
+
+
+def degenerate_lp(num_vars, num_rows, seed=0):
+    """Problème fortement dégénéré : la moitié des seconds membres sont nuls."""
+    rng = np.random.default_rng(seed)
+    c, constraints = random_dense_lp(num_vars, num_rows, seed=seed)
+    for i in rng.choice(num_rows, num_rows // 2, replace=False):
+        constraints[i]['rhs'] = 0.0
+        constraints[i]['coefficients'] = (rng.uniform(-5.0, 5.0, num_vars)).tolist()
+    return c, constraints
+
+
+def badly_scaled_lp(generator, num_vars, num_rows, spread=6, seed=0):
+    """
+    Problème de `generator` dont chaque ligne et chaque colonne est multipliée par un facteur
+    aléatoire entre 10^-spread/2 et 10^spread/2 (unités incohérentes entre contraintes et variables).
+    """
+    rng = np.random.default_rng(seed)
+    c, constraints = generator(num_vars, num_rows, seed=seed)
+    row_factors = 10.0 ** rng.uniform(-spread / 2, spread / 2, num_rows)
+    column_factors = 10.0 ** rng.uniform(-spread / 2, spread / 2, num_vars)
+    # x_j = y_j / column_factors[j] : l'optimum ne change pas, seules les unités changent
+    c = (np.asarray(c) * column_factors).tolist()
+    for constraint, row_factor in zip(constraints, row_factors):
+        constraint['coefficients'] = (row_factor * np.asarray(constraint['coefficients']) * column_factors).tolist()
+        constraint['rhs'] = row_factor * constraint['rhs']
+    return c, constraints
+
+
+def integer_lp(num_vars, num_rows, seed=0):
+    """Problème d'exercice à coefficients entiers (max c x s.c. A x <= b), comme ceux résolus à la main."""
+    rng = np.random.default_rng(seed)
+    A = rng.integers(1, 10, (num_rows, num_vars))
+    b = rng.integers(10, 100, num_rows)
+    c = rng.integers(1, 10, num_vars)
+    constraints = [{'coefficients': A[i].tolist(), 'sense': '<=', 'rhs': int(b[i])} for i in range(num_rows)]
+    return c.tolist(), constraints
+
+
+def transportation_lp(num_sources, num_sinks, seed=0):
+    """
+    Problème de transport : min sum c_ij x_ij, offres sum_j x_ij <= s_i, demandes sum_i x_ij >= d_j,
+    offre totale supérieure à la demande. Variables x_ij dans l'ordre source par source.
+    """
+    rng = np.random.default_rng(seed)
+    cost = rng.uniform(1.0, 20.0, (num_sources, num_sinks))
+    demand = rng.uniform(10.0, 50.0, num_sinks)
+    supply = rng.dirichlet(np.ones(num_sources)) * demand.sum() * 1.2 + 1.0
+    num_vars = num_sources * num_sinks
+    constraints = []
+    for i in range(num_sources):
+        coefficients = np.zeros(num_vars)
+        coefficients[i * num_sinks:(i + 1) * num_sinks] = 1.0
+        constraints.append({'coefficients': coefficients.tolist(), 'sense': '<=', 'rhs': float(supply[i])})
+    for j in range(num_sinks):
+        coefficients = np.zeros(num_vars)
+        coefficients[j::num_sinks] = 1.0
+        constraints.append({'coefficients': coefficients.tolist(), 'sense': '>=', 'rhs': float(demand[j])})
+    return cost.reshape(-1).tolist(), constraints
+
+
+def klee_minty_lp(dimension):
+    """
+    Cube de Klee-Minty : max sum_j 2^(n-j) x_j s.c. sum_{j<i} 2^(i-j+1) x_j + x_i <= 5^i.
+    La règle de Dantzig visite ses 2^n sommets (2^n - 1 pivots) : pire cas du simplexe.
+    """
+    c = [2.0 ** (dimension - j) for j in range(1, dimension + 1)]
+    constraints = []
+    for i in range(1, dimension + 1):
+        coefficients = [2.0 ** (i - j + 1) for j in range(1, i)] + [1.0] + [0.0] * (dimension - i)
+        constraints.append({'coefficients': coefficients, 'sense': '<=', 'rhs': 5.0 ** i})
+    return c, constraints
@@ -0,0 +1,290 @@
+# problems/benchmarks/engine.py
+"""
+Benchmarks du moteur : représentation creuse, noyau de pivot, pricing, mise à l'échelle, bornes,
+points intérieurs, mode exact et construction du programme.
+"""
+
+from fractions import Fraction
+
+import numpy as np
+
+from problems.benchmarks.common import badly_scaled_lp, degenerate_lp, integer_lp, measure, random_dense_lp, random_sparse_lp
+from problems.bounds import bounds_to_constraints
+from problems.factorization import BasisFactorization
+from problems.pricing import PRICING_RULES
+from problems.program import LinearProgram
+from problems.scaling import SCALING_METHODS
+from problems.simplex import SimplexSolver, ENGINE_INTERIOR_POINT, ENGINE_REVISED, ENGINE_TABLEAU
+from problems.sparse import constraints_to_sparse
+
+
+def bench_sparse_vs_dense(sizes=(1000, 2000, 5000, 10000), density=0.02, rows_ratio=0.1, repeat=20):
+    """
+    Compare la représentation dense (liste de dicts) et la représentation CSR :
+    mémoire de l'entrée, temps de construction du SimplexSolver, puis temps d'une itération
+    de pricing (y^T A) et de test du ratio (ftran de la colonne entrante) pour le simplexe révisé.
+    """
+    rows = []
+    for num_vars in sizes:
+        num_rows = max(10, int(num_vars * rows_ratio))
+        c, A, b = random_sparse_lp(num_vars, num_rows, density, seed=num_vars)
+        dense_A = A.to_dense()
+
+        dense_constraints, _, dense_bytes = measure(lambda: [
+            {'coefficients': dense_A[i].tolist(), 'sense': '<=', 'rhs': float(b[i])} for i in range(num_rows)
+        ])
+        sparse_constraints, _, sparse_bytes = measure(lambda: constraints_to_sparse(dense_constraints))
+
+        measures = {}
+        for label, constraints in (('dense', dense_constraints), ('sparse', sparse_constraints)):
+            solver, build_time, _ = measure(lambda: SimplexSolver('max', c.tolist(), constraints, engine=ENGINE_REVISED))
+            matrix, _ = solver._constraint_matrix()
+            factorization = BasisFactorization(np.eye(num_rows))
+            y = factorization.btran(np.ones(num_rows))
+            z_row, pricing_time, _ = measure(lambda: solver._price(matrix, y) - c, repeat=repeat)
+            pivot_col = int(np.argmin(z_row))
+            _, ratio_time, _ = measure(
+                lambda: solver._ratio_test(b, factorization.ftran(solver._tableau_column(matrix, pivot_col))),
+                repeat=repeat,
+            )
+            measures[label] = (build_time, pricing_time, ratio_time)
+
+        rows.append((num_vars, num_rows, A.density, dense_bytes, sparse_bytes, measures))
+
+    header = f"{'n':>6} {'m':>5} {'dens.':>6} | {'entrée dense':>13} {'entrée CSR':>11} | " \
+             f"{'build d/s (ms)':>15} | {'pricing d/s (ms)':>17} | {'ratio d/s (ms)':>15}"
+    print(header)
+    print('-' * len(header))
+    for num_vars, num_rows, dens, dense_bytes, sparse_bytes, measures in rows:
+        d, s = measures['dense'], measures['sparse']
+        print(f"{num_vars:>6} {num_rows:>5} {dens:>6.3f} | {dense_bytes / 1e6:>10.1f} MB {sparse_bytes / 1e6:>8.1f} MB | "
+              f"{d[0] * 1e3:>7.1f}/{s[0] * 1e3:<7.1f} | {d[1] * 1e3:>8.2f}/{s[1] * 1e3:<8.2f} | "
+              f"{d[2] * 1e3:>7.2f}/{s[2] * 1e3:<7.2f}")
+    return rows
+
+
+def _reference_pivot(tableau, pivot_row, pivot_col):
+    # Noyau historique : copie du tableau puis élimination ligne par ligne en Python
+    new_tableau = tableau.copy()
+    new_tableau[pivot_row, :] /= new_tableau[pivot_row, pivot_col]
+    for i in range(new_tableau.shape[0]):
+        if i != pivot_row:
+            new_tableau[i, :] -= new_tableau[i, pivot_col] * new_tableau[pivot_row, :]
+    return new_tableau
+
+
+def bench_pivot(sizes=(100, 500, 2000), iterations=20):
+    """
+    Temps moyen par itération du simplexe tableau (m = n = taille) :
+    - historique : copie du tableau courant + copie dans le pivot + boucle Python + copie d'enregistrement ;
+    - en place   : mise à jour de rang 1 par blocs de lignes dans des tampons préalloués, sans enregistrement.
+    Les deux noyaux suivent exactement la même suite de pivots.
+    """
+    rows = []
+    for size in sizes:
+        c, constraints = random_dense_lp(size, size, seed=size)
+        solver = SimplexSolver('max', c, constraints)
+        initial_tableau, _ = solver._build_initial_tableau()
+
+        pivots = []
+        tableau = initial_tableau.copy()
+        solver._allocate_pivot_workspace(tableau)
+        for _ in range(iterations):
+            pivot_col = solver._choose_pivot_column(tableau)
+            if pivot_col is None:
+                break
+            pivot_row = solver._choose_pivot_row(tableau, pivot_col)
+            if pivot_row is None:
+                break
+            pivots.append((pivot_row, pivot_col))
+            solver._perform_pivot_operations(tableau, pivot_row, pivot_col)
+
+        def run_reference():
+            current = initial_tableau.copy()
+            history = []
+            for pivot_row, pivot_col in pivots:
+                current = _reference_pivot(current.copy(), pivot_row, pivot_col)
+                history.append(current.copy())
+
+        def run_in_place():
+            current = initial_tableau.copy()
+            for pivot_row, pivot_col in pivots:
+                solver._perform_pivot_operations(current, pivot_row, pivot_col)
+
+        _, reference_time, reference_peak = measure(run_reference)
+        _, in_place_time, in_place_peak = measure(run_in_place)
+        count = max(1, len(pivots))
+        rows.append((size, len(pivots), reference_time / count, in_place_time / count, reference_peak, in_place_peak))
+
+    header = f"{'m = n':>6} {'pivots':>7} | {'historique (ms/it)':>19} {'en place (ms/it)':>17} {'gain':>6} | " \
+             f"{'pic hist.':>10} {'pic en place':>13}"
+    print(header)
+    print('-' * len(header))
+    for size, count, reference_time, in_place_time, reference_peak, in_place_peak in rows:
+        print(f"{size:>6} {count:>7} | {reference_time * 1e3:>19.2f} {in_place_time * 1e3:>17.2f} "
+              f"{reference_time / in_place_time:>5.1f}x | {reference_peak / 1e6:>7.1f} MB {in_place_peak / 1e6:>10.1f} MB")
+    return rows
+
+
+def bench_pricing(sizes=(20, 40, 60)):
+    """Itérations et temps de résolution de chaque règle de pricing, pour les deux moteurs."""
+    families = (('aléatoire', random_dense_lp), ('dégénéré', degenerate_lp))
+    header = f"{'famille':>10} {'m = n':>6} {'moteur':>8} | " + " | ".join(f"{name:>20}" for name in PRICING_RULES)
+    print(header)
+    print('-' * len(header))
+    for family, generator in families:
+        for size in sizes:
+            c, constraints = generator(size, size, seed=size)
+            for engine in ('tableau', 'revised'):
+                cells = []
+                for pricing in PRICING_RULES:
+                    solver = SimplexSolver('max', c, constraints, engine=engine, history='none', pricing=pricing)
+                    result, elapsed, _ = measure(solver.solve)
+                    cells.append(f"{result['iterations']:>5} it {elapsed * 1e3:>8.1f} ms" if result['status'] == 'optimal'
+                                 else f"{result['status']:>20}")
+                print(f"{family:>10} {size:>6} {engine:>8} | " + " | ".join(cells))
+
+
+def bench_scaling(sizes=(20, 40, 60), spread=6):
+    """
+    Itérations, temps et écart relatif à l'optimum du problème non mis à l'échelle, sans
+    mise à l'échelle puis avec chaque méthode, pour les deux moteurs.
+    """
+    families = (('aléatoire', random_dense_lp), ('dégénéré', degenerate_lp))
+    methods = (None,) + SCALING_METHODS
+    header = f"{'famille':>10} {'m = n':>6} {'moteur':>8} | " + " | ".join(f"{str(method):>30}" for method in methods)
+    print(header)
+    print('-' * len(header))
+    rows = []
+    for family, generator in families:
+        for size in sizes:
+            reference_c, reference_constraints = generator(size, size, seed=size)
+            reference = SimplexSolver('max', reference_c, reference_constraints, history='none').solve()
+            c, constraints = badly_scaled_lp(generator, size, size, spread=spread, seed=size)
+            for engine in ('tableau', 'revised'):
+                cells = []
+                for method in methods:
+                    solver = SimplexSolver('max', c, constraints, engine=engine, history='none', scaling=method)
+                    result, elapsed, _ = measure(solver.solve)
+                    if result['status'] == 'optimal' and reference['status'] == 'optimal':
+                        error = abs(result['optimal_value'] - reference['optimal_value']) / max(1.0, abs(reference['optimal_value']))
+                        cells.append(f"{result['iterations']:>5} it {elapsed * 1e3:>7.1f} ms {error:>8.1e}")
+                    else:
+                        error = None
+                        cells.append(f"{result['status']:>30}")
+                    rows.append((family, size, engine, method, result['status'], result['iterations'], elapsed, error))
+                print(f"{family:>10} {size:>6} {engine:>8} | " + " | ".join(cells))
+    return rows
+
+
+def bench_bounds(sizes=(20, 40, 80)):
+    """
+    Problème à n variables toutes bornées (0 <= x_j <= u_j) et n / 4 vraies contraintes :
+    bornes écrites en lignes de contraintes, contre bornes gérées par le simplexe à variables bornées.
+    """
+    header = (f"{'n':>5} | {'lignes':>7} {'cellules':>9} {'it':>4} {'temps (ms)':>11} | "
+              f"{'lignes':>7} {'cellules':>9} {'it':>4} {'temps (ms)':>11} | {'écart':>8}")
+    print(f"{'':>5} | {'bornes en contraintes':^34} | {'variables bornées':^34} |")
+    print(header)
+    print('-' * len(header))
+    rows = []
+    for size in sizes:
+        num_rows = max(1, size // 4)
+        c, constraints = random_dense_lp(size, num_rows, seed=size)
+        upper = np.random.default_rng(size).uniform(1.0, 5.0, size)
+        bounds = [[0.0, float(u)] for u in upper]
+        explicit = constraints + bounds_to_constraints(bounds, size)
+
+        cells = []
+        for problem_constraints, problem_bounds in ((explicit, None), (constraints, bounds)):
+            solver = SimplexSolver('max', c, problem_constraints, history='none', bounds=problem_bounds)
+            result, elapsed, _ = measure(solver.solve)
+            m = len(problem_constraints)
+            cells.append((m, (m + 1) * (size + m + 1), result['iterations'], elapsed, result['optimal_value']))
+        (m1, n1, it1, t1, v1), (m2, n2, it2, t2, v2) = cells
+        gap = abs(v1 - v2) if v1 is not None and v2 is not None else float('nan')
+        rows.append((size, cells))
+        print(f"{size:>5} | {m1:>7} {n1:>9} {it1:>4} {t1 * 1e3:>11.1f} | {m2:>7} {n2:>9} {it2:>4} {t2 * 1e3:>11.1f} | {gap:>8.1e}")
+    return rows
+
+
+def bench_interior_point(sizes=(50, 100, 200)):
+    """
+    Grand problème dense à n variables et n contraintes : simplexe sur le tableau contre points
+    intérieurs + crossover (itérations de Mehrotra, puis pivots de nettoyage du simplexe).
+    """
+    header = (f"{'n':>5} | {'pivots':>7} {'temps (ms)':>11} | {'it. PI':>7} {'pivots':>7} "
+              f"{'PI (ms)':>9} {'total (ms)':>11} | {'écart':>8}")
+    print(f"{'':>5} | {'simplexe':^19} | {'points intérieurs + crossover':^39} |")
+    print(header)
+    print('-' * len(header))
+    rows = []
+    for size in sizes:
+        c, constraints = random_dense_lp(size, size, seed=size)
+        results = []
+        for engine in (ENGINE_TABLEAU, ENGINE_INTERIOR_POINT):
+            solver = SimplexSolver('max', c, constraints, engine=engine, history='none')
+            result, elapsed, _ = measure(solver.solve)
+            results.append((result, elapsed))
+        (simplex, simplex_time), (interior, interior_time) = results
+        # Le rapport de measure vient de l'exécution sous tracemalloc : temps relevés sur une exécution nue
+        report = SimplexSolver('max', c, constraints, engine=ENGINE_INTERIOR_POINT, history='none').solve()['interior_point']
+        gap = (abs(simplex['optimal_value'] - interior['optimal_value'])
+               if simplex['optimal_value'] is not None and interior['optimal_value'] is not None else float('nan'))
+        rows.append((size, simplex['iterations'], simplex_time, report['iterations'], interior['iterations'], interior_time))
+        print(f"{size:>5} | {simplex['iterations']:>7} {simplex_time * 1e3:>11.1f} | {report['iterations']:>7} "
+              f"{interior['iterations']:>7} {report['ipm_time'] * 1e3:>9.1f} {interior_time * 1e3:>11.1f} | {gap:>8.1e}")
+    return rows
+
+
+def bench_exact(sizes=(5, 10, 20, 40)):
+    """
+    Surcoût du mode exact (pivots entiers sans fraction) par rapport au moteur tableau flottant,
+    historique complet dans les deux cas ; taille en bits du plus grand dénominateur final.
+    """
+    header = (f"{'m = n':>6} {'it':>4} | {'flottant (ms)':>14} {'exact (ms)':>11} {'surcoût':>8} | "
+              f"{'bits dén.':>9} {'écart':>8}")
+    print(header)
+    print('-' * len(header))
+    rows = []
+    for size in sizes:
+        c, constraints = integer_lp(size, size, seed=size)
+        float_result, float_time, _ = measure(SimplexSolver('max', c, constraints).solve)
+        exact_solver = SimplexSolver('max', c, constraints, exact=True)
+        exact_result, exact_time, _ = measure(exact_solver.solve)
+        bits = max(Fraction(v).denominator.bit_length() for row in exact_result['tableaus'][-1]['exact_tableau'] for v in row)
+        gap = abs(float(Fraction(exact_result['exact']['optimal_value'])) - float_result['optimal_value'])
+        rows.append((size, exact_result['iterations'], float_time, exact_time, bits))
+        print(f"{size:>6} {exact_result['iterations']:>4} | {float_time * 1e3:>14.2f} {exact_time * 1e3:>11.2f} "
+              f"{exact_time / float_time:>7.1f}x | {bits:>9} {gap:>8.1e}")
+    return rows
+
+
+def _dict_path(constraints):
+    # Chemin historique : copie des dictionnaires de contraintes, puis relecture contrainte par contrainte
+    copies = [dict(constraint) for constraint in constraints]
+    A = np.array([constraint.get('coefficients') for constraint in copies], dtype=float)
+    b = np.array([constraint.get('rhs', 0.0) for constraint in copies], dtype=float)
+    return copies, A, b
+
+
+def bench_program(sizes=(100, 500, 2000)):
+    """
+    Construction des données du solveur : liste de dictionnaires (chemin historique) contre
+    LinearProgram, puis construction d'un SimplexSolver à partir d'un LinearProgram déjà construit
+    (cas des nœuds de la séparation et évaluation et de la présolution, qui le partagent sans copie).
+    """
+    header = (f"{'m = n':>6} | {'dict (ms)':>10} {'program (ms)':>13} {'partagé (ms)':>13} | "
+              f"{'dict (Mo)':>10} {'program (Mo)':>13} {'conservé (Mo)':>14}")
+    print(header)
+    print('-' * len(header))
+    rows = []
+    for size in sizes:
+        c, constraints = random_dense_lp(size, size, seed=size)
+        _, dict_time, dict_peak = measure(lambda: _dict_path(constraints), repeat=5)
+        program, program_time, program_peak = measure(lambda: LinearProgram.from_constraints('max', c, constraints), repeat=5)
+        _, shared_time, _ = measure(lambda: SimplexSolver('max', c, program), repeat=5)
+        rows.append((size, dict_time, program_time, shared_time, dict_peak, program_peak, program.nbytes))
+        print(f"{size:>6} | {dict_time * 1e3:>10.2f} {program_time * 1e3:>13.2f} {shared_time * 1e3:>13.3f} | "
+              f"{dict_peak / 1e6:>10.2f} {program_peak / 1e6:>13.2f} {program.nbytes / 1e6:>14.2f}")
+    return rows
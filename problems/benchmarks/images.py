@@ -0,0 +1,129 @@
+# problems/benchmarks/images.py
+"""
+Benchmark de la préparation des images envoyées au modèle à l'importation, sur des pages
+synthétiques (page de PDF, numérisation, photo) ou des fichiers.
+"""
+
+import io
+import os
+import time
+
+import numpy as np
+
+from problems.benchmarks.common import measure
+
+
+PAGE_TEXT = [
+    "Une entreprise fabrique deux produits P1 et P2.",
+    "Maximiser Z = 3x1 + 5x2",
+    "sous les contraintes :",
+    "    1x1 + 0x2 <= 4",
+    "    0x1 + 2x2 <= 12",
+    "    3x1 + 2x2 <= 18",
+    "    x1 >= 0, x2 >= 0",
+]
+
+
+def synthetic_page(kind, seed=0):
+    """
+    Image d'énoncé telle qu'elle arrive à l'importation :
+    'pdf-page' (page A4 convertie à 300 dpi), 'scan' (page numérisée : fond gris, bruit, poussières),
+    'photo' (photo de téléphone 12 Mpx, JPEG, prise de côté : orientation EXIF 6).
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    rng = np.random.default_rng(seed)
+    width, height = (4032, 3024) if kind == 'photo' else (2480, 3508)
+    if kind == 'pdf-page':
+        page = Image.new('RGB', (width, height), 'white')
+    else:
+        # Fond inégal (éclairage, papier) et bruit du capteur
+        gradient = np.linspace(200, 235, width)[None, :] + np.linspace(0, 15, height)[:, None]
+        noise = rng.normal(0, 6, (height, width, 1))
+        page = Image.fromarray(np.clip(gradient[:, :, None] + noise + [0, 2, -6], 0, 255).astype(np.uint8), 'RGB')
+    draw = ImageDraw.Draw(page)
+    font = ImageFont.load_default(size=60)
+    left, top = (width // 5, height // 3) if kind == 'photo' else (width // 8, height // 6)
+    for line, text in enumerate(PAGE_TEXT):
+        draw.text((left, top + line * 95), text, fill=(25, 25, 35), font=font)
+    if kind == 'scan':
+        for x, y in rng.integers(0, [width, height], size=(40, 2)):
+            draw.point((int(x), int(y)), fill='black')
+
+    if kind != 'photo':
+        return page
+    # Capteur en paysage, téléphone tenu en portrait : pixels tournés, orientation dans l'EXIF
+    page = page.transpose(Image.Transpose.ROTATE_90)
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    buffer = io.BytesIO()
+    page.save(buffer, format='JPEG', quality=92, exif=exif.tobytes())
+    buffer.seek(0)
+    return Image.open(buffer)
+
+
+def _sdk_payload(image):
+    # Ce que le client Gemini envoie pour une image PIL en mémoire : WebP sans perte, à pleine résolution
+    buffer = io.BytesIO()
+    image.save(buffer, format='webp', lossless=True)
+    return {'mime_type': 'image/webp', 'data': buffer.getvalue()}
+
+
+def _file_payload(path):
+    from problems.import_pipeline import ORIGINAL_MIME_TYPES
+
+    mime_type = ORIGINAL_MIME_TYPES.get(path.rsplit('.', 1)[-1].lower())
+    if mime_type is None:
+        return None
+    with open(path, 'rb') as file:
+        return {'mime_type': mime_type, 'data': file.read()}
+
+
+def _live_extraction(payload):
+    import google.generativeai as genai
+
+    from problems.services import EXTRACTION_PROMPT
+
+    genai.configure(api_key=os.environ['GEMINI_API_KEY'])
+    start = time.perf_counter()
+    genai.GenerativeModel('gemini-1.5-flash').generate_content([EXTRACTION_PROMPT, payload])
+    return time.perf_counter() - start
+
+
+def bench_preprocessing(kinds=('pdf-page', 'scan', 'photo'), files=(), bandwidth=10.0, live=False, **options):
+    """
+    Préparation des images avant l'envoi au modèle : octets envoyés et latence de bout en bout, image
+    d'origine (WebP sans perte à pleine résolution, comme le client l'encode, ou le fichier lui-même) contre image préparée
+    (problems.image_preprocessing, `options` en plus de DEFAULT_OPTIONS).
+    Latence : préparation + envoi estimé à `bandwidth` Mbit/s ; avec `live` (GEMINI_API_KEY), appel réel
+    au modèle mesuré à la place de l'envoi estimé.
+    """
+    from PIL import Image
+
+    from problems.image_preprocessing import DEFAULT_OPTIONS, preprocess_image
+
+    options = dict(DEFAULT_OPTIONS, **options)
+    header = (f"{'image':>16} {'pixels avant':>12} {'après':>11} | {'avant (ko)':>11} {'après (ko)':>11} {'gain':>6} | "
+              f"{'prép. avant (ms)':>16} {'prép. après (ms)':>16} | {'bout en bout avant (ms)':>24} {'après (ms)':>11}")
+    print(header)
+    print('-' * len(header))
+    # Fichier importé tel quel : son encodage d'origine est aussi le contenu envoyé sans préparation
+    images = [(kind, synthetic_page(kind), None) for kind in kinds] + \
+        [(path.rsplit('/', 1)[-1], Image.open(path), _file_payload(path)) for path in files]
+    rows = []
+    for name, image, original in images:
+        before, before_time, _ = measure(lambda: original or _sdk_payload(image))
+        after, after_time, _ = measure(lambda: preprocess_image(image, original=original, **options))
+        if live:
+            before_total = before_time + _live_extraction(before)
+            after_total = after_time + _live_extraction(after)
+        else:
+            before_total = before_time + len(before['data']) * 8 / (bandwidth * 1e6)
+            after_total = after_time + len(after['data']) * 8 / (bandwidth * 1e6)
+        size = Image.open(io.BytesIO(after['data'])).size
+        rows.append((name, image.size, size, len(before['data']), len(after['data']), before_time, after_time,
+                     before_total, after_total))
+        print(f"{name[:16]:>16} {image.width:>6}x{image.height:<5} {size[0]:>5}x{size[1]:<5} | {len(before['data']) / 1e3:>11.0f} "
+              f"{len(after['data']) / 1e3:>11.0f} {len(before['data']) / len(after['data']):>5.1f}x | "
+              f"{before_time * 1e3:>16.0f} {after_time * 1e3:>16.0f} | {before_total * 1e3:>24.0f} {after_total * 1e3:>11.0f}")
+    return rows
@@ -0,0 +1,150 @@
+# problems/benchmarks/suite.py
+"""
+Suite de référence : familles de problèmes x configurations du solveur, enregistrée en JSON
+(avec le commit et la machine) et comparée d'une version à l'autre.
+"""
+
+import datetime
+import json
+import platform
+import subprocess
+
+import numpy as np
+
+from problems.benchmarks.common import (degenerate_lp, klee_minty_lp, measure, random_dense_lp, random_sparse_lp,
+                                        transportation_lp)
+from problems.simplex import (SimplexSolver, ENGINE_INTERIOR_POINT, ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_FULL,
+                              HISTORY_NONE, HISTORY_PIVOT_LOG)
+
+
+def _sparse_family(size, seed):
+    c, A, b = random_sparse_lp(10 * size, size, density=0.05, seed=seed)
+    return 'max', c.tolist(), {'matrix': A, 'senses': ['<='] * size, 'rhs': b.tolist()}
+
+
+# Familles d'instances de la suite : size -> (objective_type, c, contraintes), déterministes (graine = size)
+SUITE_FAMILIES = {
+    'dense': lambda size, seed: ('max',) + random_dense_lp(size, size, seed=seed),
+    # 10 size variables, size contraintes, densité 5 %
+    'sparse': _sparse_family,
+    # size sources x size destinations : size^2 variables, 2 size contraintes
+    'transportation': lambda size, seed: ('min',) + transportation_lp(size, size, seed=seed),
+    # Dimension size / 4 : le nombre de pivots double à chaque dimension
+    'klee-minty': lambda size, seed: ('max',) + klee_minty_lp(max(2, size // 4)),
+    'degenerate': lambda size, seed: ('max',) + degenerate_lp(size, size, seed=seed),
+}
+
+
+# Configurations de la suite : options de SimplexSolver
+SUITE_CONFIGS = {
+    'tableau': {'engine': ENGINE_TABLEAU, 'history': HISTORY_FULL},
+    'tableau-pivot-log': {'engine': ENGINE_TABLEAU, 'history': HISTORY_PIVOT_LOG},
+    'tableau-no-history': {'engine': ENGINE_TABLEAU, 'history': HISTORY_NONE},
+    'revised': {'engine': ENGINE_REVISED, 'history': HISTORY_NONE},
+    'interior-point': {'engine': ENGINE_INTERIOR_POINT, 'history': HISTORY_NONE},
+    'exact': {'engine': ENGINE_TABLEAU, 'history': HISTORY_PIVOT_LOG, 'exact': True},
+}
+
+
+def _history_bytes(result):
+    # Taille de l'historique tel qu'il est enregistré sur le Problem (JSON)
+    history = {'tableaus': result.get('tableaus') or [], 'pivot_log': result.get('pivot_log')}
+    return len(json.dumps(history, default=str))
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(sizes=(10, 20, 40), families=tuple(SUITE_FAMILIES), configs=tuple(SUITE_CONFIGS), time_limit=60.0,
+              output=None, instrument=False):
+    """
+    Chaque famille à chaque taille, résolue dans chaque configuration : temps (hors tracemalloc),
+    itérations, pic mémoire et taille de l'historique. Renvoie le rapport, écrit en JSON dans
+    `output` s'il est donné (comparable d'un commit à l'autre avec `compare`). `instrument` : temps
+    par phase, pivots dégénérés et conditionnement de la base finale dans chaque enregistrement.
+    """
+    header = (f"{'famille':>15} {'taille':>6} {'configuration':>19} | {'statut':>10} {'it':>6} {'temps (ms)':>11} "
+              f"{'pic (Mo)':>9} {'historique (ko)':>16}")
+    print(header)
+    print('-' * len(header))
+    records = []
+    for family in families:
+        for size in sizes:
+            objective_type, c, constraints = SUITE_FAMILIES[family](size, size)
+            for config in configs:
+                options = SUITE_CONFIGS[config]
+                result, elapsed, peak = measure(
+                    lambda: SimplexSolver(objective_type, c, constraints, time_limit=time_limit, instrument=instrument,
+                                          **options).solve())
+                record = {
+                    'family': family,
+                    'size': size,
+                    'config': config,
+                    'num_variables': len(c),
+                    'num_constraints': len(constraints['rhs']) if isinstance(constraints, dict) else len(constraints),
+                    'status': result['status'],
+                    'optimal_value': result['optimal_value'],
+                    'limit': result.get('limit'),
+                    # Points intérieurs : 'iterations' ne compte que les pivots du crossover
+                    'iterations': result['iterations'],
+                    'ipm_iterations': (result.get('interior_point') or {}).get('iterations'),
+                    'wall_time': elapsed,
+                    'peak_memory': peak,
+                    'history_bytes': _history_bytes(result),
+                }
+                if instrument:
+                    instrumentation = result['instrumentation']
+                    record.update(phase_times=instrumentation['times'],
+                                  degenerate_pivots=instrumentation['degenerate_pivots'],
+                                  basis_condition=instrumentation['basis_condition'],
+                                  peak_tableau_bytes=instrumentation['peak_tableau_bytes'])
+                records.append(record)
+                iterations = record['ipm_iterations'] if record['ipm_iterations'] is not None else record['iterations']
+                print(f"{family:>15} {size:>6} {config:>19} | {record['status']:>10} {iterations:>6} "
+                      f"{elapsed * 1e3:>11.2f} {peak / 1e6:>9.2f} {record['history_bytes'] / 1e3:>16.1f}")
+
+    report = {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.platform(),
+        'sizes': list(sizes),
+        'time_limit': time_limit,
+        'records': records,
+    }
+    if output:
+        with open(output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Résultats écrits dans {output}")
+    return report
+
+
+def compare_suites(before_path, after_path):
+    """Rapports de deux exécutions de la suite : rapport des temps, itérations et pics mémoire (après / avant)."""
+    with open(before_path, encoding='utf-8') as handle:
+        before = json.load(handle)
+    with open(after_path, encoding='utf-8') as handle:
+        after = json.load(handle)
+    print(f"avant : {before.get('commit') or '?'} ({before.get('created')})")
+    print(f"après : {after.get('commit') or '?'} ({after.get('created')})")
+    header = f"{'famille':>15} {'taille':>6} {'configuration':>19} | {'temps':>7} {'it':>9} {'pic':>7} {'statut':>21}"
+    print(header)
+    print('-' * len(header))
+    previous = {(r['family'], r['size'], r['config']): r for r in before['records']}
+    rows = []
+    for record in after['records']:
+        old = previous.get((record['family'], record['size'], record['config']))
+        if old is None:
+            continue
+        time_ratio = record['wall_time'] / old['wall_time'] if old['wall_time'] else float('nan')
+        memory_ratio = record['peak_memory'] / old['peak_memory'] if old['peak_memory'] else float('nan')
+        status = record['status'] if record['status'] == old['status'] else f"{old['status']} -> {record['status']}"
+        rows.append((record['family'], record['size'], record['config'], time_ratio, memory_ratio))
+        print(f"{record['family']:>15} {record['size']:>6} {record['config']:>19} | {time_ratio:>6.2f}x "
+              f"{old['iterations']:>4}>{record['iterations']:<4} {memory_ratio:>6.2f}x {status:>21}")
+    return rows
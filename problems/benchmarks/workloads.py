@@ -0,0 +1,119 @@
+# problems/benchmarks/workloads.py
+"""
+Benchmarks des traitements de plusieurs problèmes : pile de problèmes de même forme, balayage
+paramétrique, séparation et évaluation en parallèle, cache des résultats.
+"""
+
+import numpy as np
+
+from problems.batch import solve_batch
+from problems.benchmarks.common import integer_lp, measure, random_dense_lp
+from problems.branch_and_bound import BranchAndBoundSolver
+from problems.parametric import rhs_sweep
+from problems.solve_cache import CanonicalProblem, SolveCache
+from problems.simplex import SimplexSolver
+
+
+def bench_batch(counts=(10, 100, 500), size=8):
+    """
+    Résolution de `count` problèmes de même forme (m = n = size) : un SimplexSolver par
+    problème, contre solve_batch sur la pile 3-D. Historique désactivé dans les deux cas.
+    """
+    header = f"{'k':>6} {'m = n':>6} | {'un par un (ms)':>15} {'batch (ms)':>11} {'gain':>6}"
+    print(header)
+    print('-' * len(header))
+    rows = []
+    for count in counts:
+        rng = np.random.default_rng(count)
+        A = rng.uniform(1.0, 10.0, (count, size, size))
+        b = rng.uniform(10.0, 100.0, (count, size))
+        C = rng.uniform(1.0, 10.0, (count, size))
+
+        def run_one_by_one():
+            for i in range(count):
+                constraints = [{'coefficients': A[i, r].tolist(), 'sense': '<=', 'rhs': float(b[i, r])} for r in range(size)]
+                SimplexSolver('max', C[i].tolist(), constraints, history='none').solve()
+
+        _, single_time, _ = measure(run_one_by_one)
+        _, batch_time, _ = measure(lambda: solve_batch('max', C, A, b, history='none'))
+        rows.append((count, size, single_time, batch_time))
+        print(f"{count:>6} {size:>6} | {single_time * 1e3:>15.1f} {batch_time * 1e3:>11.1f} {single_time / batch_time:>5.1f}x")
+    return rows
+
+
+def bench_parametric(sizes=(10, 30, 60), points=1000):
+    """
+    Balayage du second membre b + t d sur `points` valeurs de t : une résolution à froid par
+    point, contre rhs_sweep (une résolution puis un pivot dual par point de rupture).
+    """
+    header = f"{'m = n':>6} {'points':>7} | {'à froid (ms)':>13} {'balayage (ms)':>14} {'ruptures':>9} {'gain':>7}"
+    print(header)
+    print('-' * len(header))
+    rows = []
+    for size in sizes:
+        c, constraints = random_dense_lp(size, size, seed=size)
+        direction = np.random.default_rng(size).uniform(-1.0, 1.0, size)
+        ts = np.linspace(-20.0, 20.0, points)
+
+        def run_cold():
+            for t in ts:
+                shifted = [dict(constraint, rhs=constraint['rhs'] + t * d) for constraint, d in zip(constraints, direction)]
+                SimplexSolver('max', c, shifted, history='none').solve()
+
+        _, cold_time, _ = measure(run_cold)
+        sweep, sweep_time, _ = measure(lambda: rhs_sweep('max', c, constraints, direction, (ts[0], ts[-1]), values=ts))
+        rows.append((size, points, cold_time, sweep_time, len(sweep['breakpoints'])))
+        print(f"{size:>6} {points:>7} | {cold_time * 1e3:>13.1f} {sweep_time * 1e3:>14.1f} "
+              f"{len(sweep['breakpoints']):>9} {cold_time / sweep_time:>6.0f}x")
+    return rows
+
+
+def bench_mip(sizes=(10, 15, 20), workers=(1, 2, 4)):
+    """
+    Séparation et évaluation sur des programmes en nombres entiers (problèmes d'exercice à
+    n variables entières et n / 2 contraintes) : nœuds, temps et accélération par nombre de processus.
+    """
+    header = f"{'n':>4} {'processus':>9} | {'nœuds':>7} {'temps (ms)':>11} {'accél.':>7} | {'valeur':>10}"
+    print(header)
+    print('-' * len(header))
+    rows = []
+    for size in sizes:
+        c, constraints = integer_lp(size, max(1, size // 2), seed=size)
+        reference = None
+        for count in workers:
+            solver = BranchAndBoundSolver('max', c, constraints, range(size), workers=count, history='none')
+            result, elapsed, _ = measure(solver.solve)
+            reference = reference or elapsed
+            rows.append((size, count, result['branch_and_bound']['nodes'], elapsed))
+            print(f"{size:>4} {count:>9} | {result['branch_and_bound']['nodes']:>7} {elapsed * 1e3:>11.1f} "
+                  f"{reference / elapsed:>6.2f}x | {result['optimal_value']:>10.2f}")
+    return rows
+
+
+def bench_cache(sizes=(10, 30, 60)):
+    """
+    Cache des résultats : résolution (défaut de cache) contre succès sur une copie du problème
+    aux variables et contraintes permutées (forme canonique, renumérotation du journal de pivots).
+    """
+    header = f"{'m = n':>6} {'it':>4} | {'résolution (ms)':>16} {'clé (ms)':>9} {'succès (ms)':>12} {'gain':>7}"
+    print(header)
+    print('-' * len(header))
+    rows = []
+    rng = np.random.default_rng(0)
+    for size in sizes:
+        c, constraints = random_dense_lp(size, size, seed=size)
+        cache = SolveCache()
+        result, solve_time, _ = measure(lambda: SimplexSolver('max', c, constraints, history='pivot-log').solve())
+        cache.put(CanonicalProblem('max', c, constraints), result)
+
+        columns, order = rng.permutation(size), rng.permutation(size)
+        permuted_c = [c[j] for j in columns]
+        permuted = [{'coefficients': [constraints[i]['coefficients'][j] for j in columns], 'sense': '<=',
+                     'rhs': float(constraints[i]['rhs'])} for i in order]
+        canonical, key_time, _ = measure(lambda: CanonicalProblem('max', permuted_c, permuted), repeat=5)
+        hit, hit_time, _ = measure(lambda: cache.get(canonical), repeat=5)
+        assert hit is not None
+        rows.append((size, result['iterations'], solve_time, key_time, hit_time))
+        print(f"{size:>6} {result['iterations']:>4} | {solve_time * 1e3:>16.2f} {key_time * 1e3:>9.2f} {hit_time * 1e3:>12.2f} "
+              f"{solve_time / (key_time + hit_time):>6.1f}x")
+    return rows
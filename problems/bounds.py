@@ -0,0 +1,85 @@
+# problems/bounds.py
+"""
+Bornes des variables l <= x <= u, traitées par le simplexe à variables bornées sans
+ajouter de ligne ni de variable d'écart au tableau.
+
+Une borne est une paire [lower, upper] par variable ; upper vaut None (JSON) pour +inf.
+Sans bornes, chaque variable est dans [0, +inf), la convention de tout le reste de l'outil.
+"""
+
+import numpy as np
+
+from problems.program import SENSE_EQ, SENSE_GE, SENSE_LE
+
+BOUND_TOLERANCE = 1e-9
+
+
+def normalize_bounds(bounds, num_variables):
+    """Tableaux (lower, upper) de taille num_variables ; une entrée None vaut [0, +inf)."""
+    lower, upper = np.zeros(num_variables), np.full(num_variables, np.inf)
+    if bounds is None:
+        return lower, upper
+    if len(bounds) != num_variables:
+        raise ValueError(f"Les bornes doivent contenir {num_variables} paires [inférieure, supérieure], reçu {len(bounds)}.")
+    for j, bound in enumerate(bounds):
+        if bound is None:
+            continue
+        low, high = bound
+        lower[j] = 0.0 if low is None else float(low)
+        upper[j] = np.inf if high is None else float(high)
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("Les bornes inférieures doivent être finies (variables libres non gérées).")
+    return lower, upper
+
+
+def has_bounds(lower, upper):
+    """Vrai si au moins une variable a une borne autre que [0, +inf)."""
+    return bool(np.any(lower != 0.0) or np.any(np.isfinite(upper)))
+
+
+def serialize_bounds(lower, upper):
+    return [[float(low), float(high) if np.isfinite(high) else None] for low, high in zip(lower, upper)]
+
+
+def extract_bounds(constraints, num_variables):
+    """
+    Sépare les contraintes à une seule variable (a x_j <= r, >= r ou = r) des autres : elles
+    deviennent des bornes, intersectées avec x_j >= 0. Renvoie (contraintes restantes, bornes),
+    bornes valant None si aucune contrainte n'en est une.
+    """
+    lower, upper = np.zeros(num_variables), np.full(num_variables, np.inf)
+    remaining = []
+    found = False
+    for constraint in constraints:
+        coefficients = np.asarray(constraint['coefficients'], dtype=float)
+        nonzero = np.flatnonzero(np.abs(coefficients) > BOUND_TOLERANCE)
+        sense = constraint.get('sense')
+        if nonzero.size != 1 or sense not in (SENSE_LE, SENSE_GE, SENSE_EQ):
+            remaining.append(constraint)
+            continue
+        j = int(nonzero[0])
+        a = coefficients[j]
+        value = float(constraint['rhs']) / a
+        # Diviser par un coefficient négatif inverse le sens
+        if sense == SENSE_EQ or (sense == SENSE_LE) == (a > 0):
+            upper[j] = min(upper[j], value)
+        if sense == SENSE_EQ or (sense == SENSE_GE) == (a > 0):
+            lower[j] = max(lower[j], value)
+        found = True
+    return remaining, serialize_bounds(lower, upper) if found else None
+
+
+def bounds_to_constraints(bounds, num_variables):
+    """Bornes réécrites en contraintes explicites x_j >= l_j et x_j <= u_j (pour les traitements sans bornes)."""
+    lower, upper = normalize_bounds(bounds, num_variables)
+    if np.any(lower < 0.0):
+        raise ValueError("Une borne inférieure négative ne s'écrit pas comme contrainte avec x >= 0.")
+    constraints = []
+    for j in range(num_variables):
+        unit = [0.0] * num_variables
+        unit[j] = 1.0
+        if lower[j] > 0.0:
+            constraints.append({'coefficients': unit, 'sense': SENSE_GE, 'rhs': float(lower[j])})
+        if np.isfinite(upper[j]):
+            constraints.append({'coefficients': unit[:], 'sense': SENSE_LE, 'rhs': float(upper[j])})
+    return constraints
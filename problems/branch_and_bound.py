@@ -0,0 +1,287 @@
+# problems/branch_and_bound.py
+"""
+Programmes linéaires en nombres entiers (ou mixtes) par séparation et évaluation.
+
+Chaque nœud est la relaxation continue du problème, avec des bornes resserrées sur les
+variables entières (x_j <= floor(v) d'un côté, x_j >= ceil(v) de l'autre). Elle est résolue
+par SimplexSolver à partir de la base optimale du nœud parent (initial_basis) : seules des
+bornes changent, la base reste dual réalisable et le simplexe dual la répare en quelques
+pivots.
+
+Les nœuds ouverts sont explorés du meilleur au moins bon (borne du parent) et résolus en
+parallèle dans un pool de processus, démarré seulement si la relaxation racine est
+fractionnaire. La valeur de la meilleure solution entière trouvée (l'incumbent) est
+partagée entre les processus : un nœud dont la relaxation ne fait pas mieux est élagué
+par le processus qui l'a résolu, sans renvoyer sa solution.
+"""
+
+import heapq
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from problems.bounds import normalize_bounds, serialize_bounds
+from problems.limits import LIMIT_ITERATIONS, LIMIT_NODES, LIMIT_TIME, STATUS_TIME_LIMIT, SolveLimits
+from problems.program import LinearProgram
+from problems.simplex import HISTORY_NONE, HISTORY_PIVOT_LOG, STATUS_UNSUPPORTED, SimplexSolver
+
+INTEGRALITY_TOLERANCE = 1e-6
+DEFAULT_NODE_LIMIT = 10000
+
+# Résultat d'un nœud élagué par le processus qui l'a résolu (relaxation pas meilleure que l'incumbent)
+STATUS_PRUNED = 'pruned'
+# Statuts de la relaxation racine qui sont ceux du problème entier
+ROOT_FAILURES = ('infeasible', 'unbounded', 'error', STATUS_UNSUPPORTED)
+
+
+class BranchAndBoundSolver:
+    """
+    Même interface que SimplexSolver, plus `integer_variables` (indices des variables entières).
+    `workers` : nombre de processus (None : un par cœur ; 1 : exploration dans le processus courant).
+    Les autres options (engine, pricing, scaling, presolve, history...) sont celles de SimplexSolver ;
+    l'historique (et l'instrumentation) est celui de la relaxation du nœud de la solution retenue.
+    """
+
+    def __init__(self, objective_type, objective_coefficients, constraints, integer_variables, bounds=None,
+                 workers=None, time_limit=None, node_limit=DEFAULT_NODE_LIMIT, gap_tolerance=1e-6,
+                 cancel_token=None, history=HISTORY_PIVOT_LOG, instrument=False, **solver_options):
+        self.objective_type = objective_type.lower()
+        # Construit une fois, partagé par tous les nœuds (et transmis une fois à chaque processus)
+        self.program = LinearProgram.from_constraints(objective_type, objective_coefficients, constraints)
+        self.c = self.program.c
+        num_variables = self.program.num_variables
+        self.integer_variables = sorted({int(j) for j in integer_variables})
+        if any(not 0 <= j < num_variables for j in self.integer_variables):
+            raise ValueError(f"Indices de variables entières invalides : {self.integer_variables} ({num_variables} variables).")
+        self.lower, self.upper = normalize_bounds(bounds, num_variables)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.gap_tolerance = gap_tolerance
+        self.cancel_token = cancel_token
+        self.history = history
+        self.instrument = instrument
+        self.solver_options = solver_options
+        self.report = None
+
+    def solve(self):
+        """
+        Renvoie le dictionnaire de résultat de SimplexSolver pour la relaxation du nœud retenu,
+        avec la solution entière et un rapport 'branch_and_bound' (nœuds, écart, durée).
+        """
+        start = time.perf_counter()
+        limits = SolveLimits(self.time_limit, self.node_limit, self.cancel_token)
+        sign = -1.0 if self.objective_type == 'min' else 1.0
+        # Valeur (au sens de la maximisation) de la meilleure solution entière, partagée avec les processus
+        incumbent = multiprocessing.Value('d', -math.inf)
+        problem = (self.program, self.solver_options)
+
+        root = {'lower': self.lower.copy(), 'upper': self.upper.copy(), 'basis': None, 'depth': 0, 'bound': math.inf}
+        open_nodes = []
+        counter = 0
+        heapq.heappush(open_nodes, (-root['bound'], 0, counter, root))
+        running = {}
+        best_node, root_status, stopped = None, None, None
+        nodes = 0
+
+        # La racine est résolue dans le processus courant : le pool n'est démarré que s'il faut séparer
+        pool = None
+        try:
+            while open_nodes or running:
+                # Nœuds ouverts distribués tant que des processus sont libres ; élagage à la sortie du tas
+                while open_nodes and len(running) < max(self.workers, 1) and stopped is None:
+                    _, _, _, node = heapq.heappop(open_nodes)
+                    if node['bound'] <= self._cutoff(incumbent.value):
+                        continue
+                    stopped = _limit_name(limits.reached(nodes + len(running)))
+                    if stopped is not None:
+                        heapq.heappush(open_nodes, (-node['bound'], -node['depth'], counter, node))
+                        break
+                    if pool is None:
+                        running[counter] = (node, _solve_node(problem, node, incumbent, limits.remaining_time()))
+                    else:
+                        running[counter] = (node, pool.submit(_solve_node_in_worker, node, limits.remaining_time()))
+                    counter += 1
+                if not running:
+                    break
+
+                if pool is None:
+                    finished = list(running)
+                else:
+                    done, _ = wait([future for _, future in running.values()], return_when=FIRST_COMPLETED)
+                    finished = [key for key, (_, future) in running.items() if future in done]
+                for key in finished:
+                    node, outcome = running.pop(key)
+                    status, solution, value, basis, limit = outcome if pool is None else outcome.result()
+                    nodes += 1
+                    if node['depth'] == 0:
+                        root_status = status
+                    if status == STATUS_TIME_LIMIT:
+                        # Temps épuisé pendant la relaxation : le nœud reste ouvert
+                        stopped = stopped or limit
+                        heapq.heappush(open_nodes, (-node['bound'], -node['depth'], counter, node))
+                        counter += 1
+                        continue
+                    if status != 'optimal' or value <= self._cutoff(incumbent.value):
+                        continue
+
+                    branching = self._branching_variable(solution)
+                    if branching is None:
+                        with incumbent.get_lock():
+                            if value > incumbent.value:
+                                incumbent.value = value
+                        if best_node is None or value > best_node['value']:
+                            best_node = dict(node, basis=basis, value=value, solution=solution)
+                        continue
+                    for child in self._children(node, branching, solution[branching], value, basis):
+                        heapq.heappush(open_nodes, (-child['bound'], -child['depth'], counter, child))
+                        counter += 1
+                if stopped is not None and not running:
+                    break
+                if pool is None and self.workers > 1 and open_nodes:
+                    pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(problem, incumbent))
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        # Nœuds encore ouverts dont la borne ne peut plus améliorer l'incumbent : la recherche est en fait terminée
+        open_nodes = [entry for entry in open_nodes if entry[3]['bound'] > self._cutoff(incumbent.value)]
+        if not open_nodes:
+            stopped = None
+
+        if root_status in ROOT_FAILURES:
+            status = root_status
+        elif stopped is not None:
+            status = STATUS_TIME_LIMIT
+        elif best_node is not None:
+            status = 'optimal'
+        else:
+            status = 'infeasible'
+
+        # Meilleure borne : celle des nœuds encore ouverts, sinon la solution elle-même
+        best_value = best_node['value'] if best_node is not None else -math.inf
+        open_bound = max((node['bound'] for _, _, _, node in open_nodes), default=-math.inf)
+        bound = max(open_bound, best_value)
+        gap = None
+        if best_node is not None:
+            gap = max(0.0, bound - best_value) / max(1.0, abs(best_value)) if math.isfinite(bound) else None
+
+        self.report = {
+            'nodes': nodes,
+            'open_nodes': len(open_nodes),
+            'gap': gap,
+            'best_bound': sign * bound if math.isfinite(bound) else None,
+            'solve_time': time.perf_counter() - start,
+            'workers': self.workers,
+            'integer_variables': self.integer_variables,
+        }
+        return self._final_result(status, best_node, stopped, root_status in ROOT_FAILURES)
+
+    def _needs_history(self):
+        # Le résultat final ne résout la relaxation du nœud retenu que pour ce qu'elle seule fournit
+        return self.history != HISTORY_NONE or self.instrument or self.solver_options.get('exact', False)
+
+    def _cutoff(self, incumbent_value):
+        # Un nœud dont la borne ne dépasse pas l'incumbent de plus de l'écart toléré est élagué
+        if not math.isfinite(incumbent_value):
+            return -math.inf
+        return incumbent_value + self.gap_tolerance * max(1.0, abs(incumbent_value))
+
+    def _branching_variable(self, solution):
+        # Variable entière la plus fractionnaire (partie fractionnaire la plus proche de 1/2)
+        best, best_distance = None, INTEGRALITY_TOLERANCE
+        for j in self.integer_variables:
+            fraction = solution[j] - math.floor(solution[j])
+            distance = min(fraction, 1.0 - fraction)
+            if distance > best_distance:
+                best, best_distance = j, distance
+        return best
+
+    def _children(self, node, j, value, bound, basis):
+        down, up = dict(node), dict(node)
+        down['upper'] = node['upper'].copy()
+        down['upper'][j] = math.floor(value)
+        up['lower'] = node['lower'].copy()
+        up['lower'][j] = math.ceil(value)
+        for child in (down, up):
+            child.update(basis=basis, depth=node['depth'] + 1, bound=bound)
+        # Une branche vide (borne inférieure au-dessus de la borne supérieure) n'est pas créée
+        return [child for child in (down, up) if child['lower'][j] <= child['upper'][j]]
+
+    def _final_result(self, status, best_node, limit, root_failed):
+        node = best_node or {'lower': self.lower, 'upper': self.upper, 'basis': None}
+        # Départ de la base optimale du nœud : l'historique (tableaux, instrumentation, fractions) est
+        # celui de sa relaxation, sans la résoudre à nouveau depuis la base des écarts
+        solver = SimplexSolver(self.objective_type, self.c, self.program,
+                               bounds=serialize_bounds(node['lower'], node['upper']), initial_basis=node['basis'],
+                               history=self.history, instrument=self.instrument, **self.solver_options)
+        if root_failed:
+            # Échec de la relaxation racine : son résultat (et son message d'erreur) est celui du problème
+            result = solver.solve()
+        elif best_node is None or not self._needs_history():
+            # Pas de solution entière, ou rien à montrer de la relaxation : résultat au format de SimplexSolver
+            result = solver.result_with_status(status)
+            if best_node is not None:
+                result['basis_vars'] = best_node['basis']
+        else:
+            result = solver.solve()
+        if best_node is not None:
+            # Solution de l'incumbent telle que le nœud l'a trouvée ; seules les valeurs entières à la
+            # tolérance près sont arrondies
+            solution = np.array(best_node['solution'], dtype=float)
+            integers = np.array(self.integer_variables, dtype=int)
+            rounded = np.round(solution[integers])
+            close = np.abs(solution[integers] - rounded) <= INTEGRALITY_TOLERANCE
+            solution[integers[close]] = rounded[close]
+            result.update(
+                status=status,
+                solution=solution.tolist(),
+                optimal_value=float(self.c @ solution),
+                # Sensibilité de la relaxation d'un nœud : sans signification pour le problème entier
+                sensitivity=None,
+            )
+        result['limit'] = limit
+        result['branch_and_bound'] = self.report
+        return result
+
+
+def _limit_name(limit):
+    # La limite d'itérations de SolveLimits compte ici les nœuds
+    return LIMIT_NODES if limit == LIMIT_ITERATIONS else limit
+
+
+_worker_problem = None
+_worker_incumbent = None
+
+
+def _init_worker(problem, incumbent):
+    # Données du problème transmises une seule fois à chaque processus, avec l'incumbent partagé
+    global _worker_problem, _worker_incumbent
+    _worker_problem, _worker_incumbent = problem, incumbent
+
+
+def _solve_node_in_worker(node, time_limit):
+    return _solve_node(_worker_problem, node, _worker_incumbent, time_limit)
+
+
+def _solve_node(problem, node, incumbent, time_limit=None):
+    """
+    Relaxation continue d'un nœud, départ de la base du parent.
+    Renvoie (statut, solution, valeur au sens de la maximisation, base, limite atteinte).
+    """
+    program, solver_options = problem
+    if time_limit is not None and time_limit <= 0:
+        return STATUS_TIME_LIMIT, None, None, None, LIMIT_TIME
+    solver = SimplexSolver(program.objective_type, program.c, program, bounds=serialize_bounds(node['lower'], node['upper']),
+                           initial_basis=node['basis'], history=HISTORY_NONE, time_limit=time_limit, **solver_options)
+    result = solver.solve()
+    if result['status'] != 'optimal':
+        return result['status'], None, None, None, result.get('limit')
+    value = (-1.0 if program.objective_type == 'min' else 1.0) * result['optimal_value']
+    if value <= incumbent.value:
+        return STATUS_PRUNED, None, None, None, None
+    return 'optimal', result['solution'], value, result['basis_vars'], None
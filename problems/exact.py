@@ -0,0 +1,140 @@
+# problems/exact.py
+"""
+Arithmétique exacte du moteur tableau : pivotage entier sans fraction (Bareiss / Edmonds).
+
+Le tableau est tenu comme une matrice d'entiers Python M et un dénominateur commun d,
+T = M / d. Un pivot sur M[r, s] calcule M'[i, j] = (M[r, s] M[i, j] - M[i, s] M[r, j]) / d,
+division exacte (chaque entrée est un mineur des données entières), et le nouveau
+dénominateur est M[r, s]. Les entiers restent de la taille des déterminants de base, sans
+PGCD à chaque opération comme avec des fractions.Fraction.
+
+Les données rationnelles sont rendues entières sans changer la base initiale : la ligne de
+contrainte i est multipliée par L_i (PPCM de ses dénominateurs) et son écart remplacé par
+s'_i = L_i s_i, dont la colonne reste unité ; la ligne Z est multipliée par L_z, et la colonne
+du second membre par un facteur commun pour les bornes supérieures rationnelles. La
+conversion en flottants et l'export en fractions reviennent au tableau du problème d'origine.
+"""
+
+from fractions import Fraction
+from math import lcm
+
+import numpy as np
+
+
+def to_fraction(value):
+    """Valeur exacte d'une donnée : un flottant est lu par son écriture décimale (0.1 -> 1/10)."""
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, (int, np.integer)):
+        return Fraction(int(value))
+    if isinstance(value, str):
+        return Fraction(value)
+    return Fraction(repr(float(value)))
+
+
+class ExactTableau:
+    """
+    Tableau exact de la forme standard. `rows` : lignes de contraintes [a'_i | b'_i] et
+    `objective_row` : ligne Z initiale (-c'), en fractions ; la base initiale est celle des écarts.
+    """
+
+    def __init__(self, rows, objective_row):
+        num_rows, num_vars = len(rows), len(objective_row)
+        self.num_structural = num_vars
+        self.row_scale = [lcm(*(v.denominator for v in row)) for row in rows]
+        self.objective_scale = lcm(*(v.denominator for v in objective_row))
+        self.rhs_scale = 1
+
+        numerators = np.zeros((num_rows + 1, num_vars + num_rows + 1), dtype=object)
+        for i, (row, scale) in enumerate(zip(rows, self.row_scale)):
+            numerators[i, :num_vars] = [int(v * scale) for v in row[:-1]]
+            numerators[i, num_vars + i] = 1
+            numerators[i, -1] = int(row[-1] * scale)
+        numerators[num_rows, :num_vars] = [int(v * self.objective_scale) for v in objective_row]
+        self.numerators = numerators
+        self.denominator = 1
+
+    def pivot(self, pivot_row, pivot_col):
+        """Pivot sans fraction en place ; le pivot devient le dénominateur commun."""
+        numerators = self.numerators
+        pivot_elem = numerators[pivot_row, pivot_col]
+        if pivot_elem == 0:
+            raise ValueError("Pivot element is zero or close to zero. Algorithm error.")
+        others = np.arange(numerators.shape[0]) != pivot_row
+        column = numerators[others, pivot_col]
+        # Division entière exacte : le résultat est un mineur des données entières
+        numerators[others] = (pivot_elem * numerators[others] - np.multiply.outer(column, numerators[pivot_row])) // self.denominator
+        self.denominator = pivot_elem
+
+    def complement(self, column, upper, basis_row=None):
+        """
+        Changement de variable x_j = u_j - x̄_j (u_j rationnel) : le second membre est d'abord
+        multiplié pour que rhs_scale * u_j soit entier, puis traité comme complement_in_place.
+        """
+        upper = to_fraction(upper)
+        rhs_scale = lcm(self.rhs_scale, upper.denominator)
+        if rhs_scale != self.rhs_scale:
+            self.numerators[:, -1] *= rhs_scale // self.rhs_scale
+            self.rhs_scale = rhs_scale
+        self.numerators[:, -1] -= int(upper * rhs_scale) * self.numerators[:, column]
+        self.numerators[:, column] *= -1
+        if basis_row is not None:
+            self.numerators[basis_row, :] *= -1
+
+    def entry(self, row, column, basis_vars):
+        """T[row, column] du problème d'origine, en fraction (column = -1 : second membre)."""
+        column %= self.numerators.shape[1]
+        numerator, denominator = self._column_factors(column)
+        return Fraction(int(self.numerators[row, column]) * numerator,
+                        self.denominator * self._row_factor(row, basis_vars) * denominator)
+
+    def to_fractions(self, basis_vars):
+        """Tableau du problème d'origine, en fractions (liste de lignes)."""
+        num_rows, num_columns = self.numerators.shape
+        return [[self.entry(i, j, basis_vars) for j in range(num_columns)] for i in range(num_rows)]
+
+    def to_float(self, basis_vars):
+        """Tableau du problème d'origine en flottants, tel que le construirait le moteur tableau."""
+        num_rows, num_columns = self.numerators.shape
+        try:
+            with np.errstate(over='raise'):
+                column_factors = np.array([self._column_factors(j) for j in range(num_columns)], dtype=float)
+                row_factors = np.array([self._row_factor(i, basis_vars) for i in range(num_rows)], dtype=float)
+                scale = column_factors[:, 0] / column_factors[:, 1]
+                return self.numerators.astype(float) * scale[np.newaxis, :] / (float(self.denominator) * row_factors[:, np.newaxis])
+        except (OverflowError, FloatingPointError):
+            # Données décimales : les entiers de Bareiss (ou les facteurs L_i) dépassent la plage des flottants.
+            # Division entière de Python (arrondi correct, sans débordement) sur les tableaux d'objets
+            column_factors = [self._column_factors(j) for j in range(num_columns)]
+            numerators = self.numerators * np.array([numerator for numerator, _ in column_factors], dtype=object)
+            denominators = np.multiply.outer(
+                np.array([self.denominator * self._row_factor(i, basis_vars) for i in range(num_rows)], dtype=object),
+                np.array([denominator for _, denominator in column_factors], dtype=object))
+            return (numerators / denominators).astype(float)
+
+    def _row_factor(self, row, basis_vars):
+        # Ligne Z : L_z ; ligne dont la variable de base est l'écart s'_k = L_k s_k : L_k
+        if row == len(basis_vars):
+            return self.objective_scale
+        var = basis_vars[row]
+        return self.row_scale[var - self.num_structural] if var >= self.num_structural else 1
+
+    def _column_factors(self, column):
+        # (numérateur, dénominateur) du facteur de colonne : L_k pour l'écart k, 1 / rhs_scale pour le second membre
+        if column == self.numerators.shape[1] - 1:
+            return 1, self.rhs_scale
+        if column >= self.num_structural:
+            return self.row_scale[column - self.num_structural], 1
+        return 1, 1
+
+
+def fraction_pivot(tableau, pivot_row, pivot_col):
+    """Pivot de Gauss-Jordan en fractions sur un tableau d'objets Fraction (rejeu d'un journal exact)."""
+    pivot_elem = tableau[pivot_row, pivot_col]
+    if pivot_elem == 0:
+        raise ValueError("Pivot element is zero or close to zero. Algorithm error.")
+    tableau[pivot_row] = tableau[pivot_row] / pivot_elem
+    column = tableau[:, pivot_col].copy()
+    column[pivot_row] = 0
+    tableau -= np.multiply.outer(column, tableau[pivot_row])
+    return tableau
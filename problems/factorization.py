@@ -0,0 +1,101 @@
+# problems/factorization.py
+
+import numpy as np
+
+PIVOT_TOLERANCE = 1e-12
+
+
+class BasisFactorization:
+    """
+    Factorisation LU de la matrice de base B utilisée par le simplexe révisé.
+
+    B est factorisée sous la forme P B = L U (pivot partiel). Les changements de base
+    successifs sont appliqués sous forme produit (fichier d'etas) jusqu'à la prochaine
+    refactorisation, déclenchée tous les `refactor_frequency` pivots.
+    """
+
+    def __init__(self, basis_matrix, refactor_frequency=50):
+        self.refactor_frequency = refactor_frequency
+        self.size = basis_matrix.shape[0]
+        self.etas = []
+        self.num_refactorizations = 0
+        self.refactor(basis_matrix)
+
+    def refactor(self, basis_matrix):
+        self.lu, self.piv = _lu_factor(basis_matrix)
+        self.etas = []
+        self.num_refactorizations += 1
+
+    def needs_refactor(self):
+        return len(self.etas) >= self.refactor_frequency
+
+    def ftran(self, rhs):
+        """Résout B x = rhs."""
+        x = _lu_solve(self.lu, self.piv, rhs)
+        for r, eta in self.etas:
+            x_r = x[r]
+            if x_r != 0.0:
+                x[r] = 0.0
+                x += eta * x_r
+        return x
+
+    def btran(self, rhs):
+        """Résout B^T y = rhs."""
+        y = np.array(rhs, dtype=float)
+        for r, eta in reversed(self.etas):
+            y[r] = eta @ y
+        return _lu_solve_transposed(self.lu, self.piv, y)
+
+    def update(self, pivot_row, entering_column):
+        """
+        Remplace la colonne `pivot_row` de la base. `entering_column` doit être B^{-1} a_q
+        (résultat de ftran) pour la base courante.
+        """
+        pivot_elem = entering_column[pivot_row]
+        if abs(pivot_elem) < PIVOT_TOLERANCE:
+            raise ValueError("Pivot element is zero or close to zero. Algorithm error.")
+        eta = -entering_column / pivot_elem
+        eta[pivot_row] = 1.0 / pivot_elem
+        self.etas.append((pivot_row, eta))
+
+
+def _lu_factor(matrix):
+    lu = np.array(matrix, dtype=float)
+    n = lu.shape[0]
+    piv = np.arange(n)
+
+    for k in range(n):
+        p = k + int(np.argmax(np.abs(lu[k:, k])))
+        if abs(lu[p, k]) < PIVOT_TOLERANCE:
+            raise ValueError("La matrice de base est singulière.")
+        if p != k:
+            lu[[k, p], :] = lu[[p, k], :]
+            piv[[k, p]] = piv[[p, k]]
+        lu[k + 1:, k] /= lu[k, k]
+        lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+
+    return lu, piv
+
+
+def _lu_solve(lu, piv, rhs):
+    # L U x = P rhs : descente sur L (diagonale unité) puis remontée sur U
+    n = lu.shape[0]
+    x = np.array(rhs, dtype=float)[piv]
+    for k in range(1, n):
+        x[k] -= lu[k, :k] @ x[:k]
+    for k in range(n - 1, -1, -1):
+        x[k] = (x[k] - lu[k, k + 1:] @ x[k + 1:]) / lu[k, k]
+    return x
+
+
+def _lu_solve_transposed(lu, piv, rhs):
+    # B^T y = rhs avec B = P^T L U : U^T w = rhs, L^T v = w, puis y = P^T v
+    n = lu.shape[0]
+    w = np.array(rhs, dtype=float)
+    for k in range(n):
+        w[k] = (w[k] - lu[:k, k] @ w[:k]) / lu[k, k]
+    for k in range(n - 2, -1, -1):
+        w[k] -= lu[k + 1:, k] @ w[k + 1:]
+    y = np.empty(n)
+    y[piv] = w
+    return y
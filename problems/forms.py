@@ -14,7 +14,7 @@ class ManualProblemForm(forms.ModelForm):
     constraints_equation_str = forms.CharField(
         label="Contraintes (une par ligne)",
         widget=forms.Textarea, # Utiliser un Textarea pour la saisie multiligne
-        help_text="Entrez chaque contrainte sur une nouvelle ligne (Ex: x1 + x2 <= 10)."
+        help_text="Entrez chaque contrainte sur une nouvelle ligne (Ex: x1 + x2 <= 10). Variables entières : « entiers : x1, x2 »."
     )
 
     # Configuration du champ objective_type
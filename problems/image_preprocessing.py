@@ -0,0 +1,154 @@
+# problems/image_preprocessing.py
+"""
+Préparation des images envoyées au modèle (photo importée ou page de PDF convertie).
+
+Le volume envoyé et la latence du modèle croissent avec le nombre de pixels ; une photo de
+téléphone (12 Mpx) ou une page A4 à 300 dpi (8,7 Mpx) n'en demande pas autant pour lire un
+énoncé. Les opérations, toutes facultatives :
+
+    1. rotation selon l'orientation EXIF (photo prise de côté) ;
+    2. niveaux de gris et normalisation du contraste : le fond (papier grisâtre, éclairage inégal
+       d'une photo) est estimé puis ramené au blanc, le grain du papier et le bruit du capteur
+       avec lui, et ne coûtent plus rien à la compression ;
+    3. recadrage sur la zone du texte, avec une marge ;
+    4. réduction du plus grand côté à max_long_edge pixels ;
+    5. ré-encodage (WebP sans perte par défaut, PNG, JPEG ou WebP avec perte selon quality).
+
+Le recadrage précède la réduction : toute la résolution disponible va au texte. Le résultat est
+un contenu déjà encodé ({'mime_type': ..., 'data': ...}), transmis tel quel au modèle.
+
+Une page de PDF propre (texte noir sur blanc) se compresse déjà très bien : le PNG de l'image
+réduite, avec les gris de l'anticrénelage, dépasse le WebP sans perte de la page entière que le
+client envoie sans préparation ; le WebP sans perte de l'image préparée reste en dessous. Pour un
+fichier importé tel quel, son encodage d'origine (`original`) est gardé s'il est plus léger.
+"""
+
+import io
+
+import numpy as np
+from PIL import Image, ImageFilter, ImageOps
+
+# Options par défaut (IMPORT_IMAGE_PREPROCESSING les complète ou les remplace une à une)
+DEFAULT_OPTIONS = {
+    'max_long_edge': 1600,
+    'grayscale': True,
+    'normalize_contrast': True,
+    'crop': True,
+    'format': 'WEBP',
+    'lossless': True,
+    'quality': 85,
+}
+
+# Contraste : fond estimé sur l'image réduite de BACKGROUND_REDUCTION (le texte y disparaît sous un filtre
+# maximum), pixel ramené au blanc s'il est à moins de PAPER_TOLERANCE niveaux du fond
+BACKGROUND_REDUCTION = 8
+PAPER_TOLERANCE = 40
+# Recadrage : pixel d'encre s'il est plus foncé que le fond de CROP_THRESHOLD niveaux (sur 255),
+# marge autour de la zone de texte en fraction du plus grand côté
+CROP_THRESHOLD = 60
+CROP_MARGIN = 0.02
+# Ligne ou colonne retenue si elle contient au moins ce nombre (ou cette fraction) de pixels d'encre
+CROP_MIN_INK = 3
+CROP_MIN_INK_RATIO = 0.003
+# Taille de l'image réduite sur laquelle la zone de texte est cherchée
+CROP_DETECTION_EDGE = 800
+
+MIME_TYPES = {'PNG': 'image/png', 'JPEG': 'image/jpeg', 'WEBP': 'image/webp'}
+
+
+def preprocess_image(image, max_long_edge=1600, grayscale=True, normalize_contrast=True, crop=True, format='WEBP',
+                     lossless=True, quality=85, original=None):
+    """
+    Image PIL -> contenu encodé prêt à l'envoi ({'mime_type': ..., 'data': ...}).
+    max_long_edge=None : pas de réduction. `original` : contenu encodé de l'image d'origine (fichier
+    importé), renvoyé tel quel si la préparation ne le rend pas plus léger.
+    """
+    format = format.upper()
+    if format not in MIME_TYPES:
+        raise ValueError(f"Format d'encodage inconnu : {format} (formats acceptés : {', '.join(MIME_TYPES)})")
+
+    image = ImageOps.exif_transpose(image)
+    image = _flatten(image)
+    if grayscale:
+        image = image.convert('L')
+    if normalize_contrast:
+        image = flatten_background(image) if image.mode == 'L' else ImageOps.autocontrast(image, preserve_tone=True)
+    if crop:
+        box = text_bounding_box(image)
+        if box is not None:
+            image = image.crop(box)
+    if max_long_edge and max(image.size) > max_long_edge:
+        scale = max_long_edge / max(image.size)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    encoded = encode_image(image, format=format, quality=quality, lossless=lossless)
+    if original is not None and len(original['data']) <= len(encoded['data']):
+        return original
+    return encoded
+
+
+def text_bounding_box(image):
+    """
+    Zone contenant l'encre (left, upper, right, lower), marge comprise, dans les coordonnées de `image` ;
+    None si la page est vide. Cherchée sur une copie réduite ; les lignes et colonnes qui ne contiennent
+    que quelques pixels d'encre (poussière, bruit du scanner) sont ignorées.
+    """
+    gray = image.convert('L')
+    scale = min(1.0, CROP_DETECTION_EDGE / max(gray.size))
+    small = gray.resize((max(1, round(gray.width * scale)), max(1, round(gray.height * scale))), Image.Resampling.BOX) \
+        if scale < 1.0 else gray
+    ink = np.asarray(small) < background_level(small.histogram()) - CROP_THRESHOLD
+
+    rows = np.flatnonzero(ink.sum(axis=1) >= max(CROP_MIN_INK, CROP_MIN_INK_RATIO * small.width))
+    columns = np.flatnonzero(ink.sum(axis=0) >= max(CROP_MIN_INK, CROP_MIN_INK_RATIO * small.height))
+    if not rows.size or not columns.size:
+        return None
+
+    margin = CROP_MARGIN * max(small.size)
+    box = (max(0, columns[0] - margin), max(0, rows[0] - margin),
+           min(small.width, columns[-1] + 1 + margin), min(small.height, rows[-1] + 1 + margin))
+    return tuple(min(limit, int(round(coordinate / scale))) for coordinate, limit in zip(box, gray.size * 2))
+
+
+def flatten_background(image):
+    """
+    Image en niveaux de gris divisée par son fond (papier et éclairage), puis presque-blancs ramenés au blanc.
+    Un étirement global (autocontraste) ne convient pas : l'encre fait moins de 1 % des pixels d'une page,
+    et un fond en dégradé occuperait toute l'échelle.
+    """
+    small = image.reduce(BACKGROUND_REDUCTION) if min(image.size) >= 8 * BACKGROUND_REDUCTION else image
+    background = small.filter(ImageFilter.MaxFilter(5)).filter(ImageFilter.GaussianBlur(3))
+    background = np.maximum(np.asarray(background.resize(image.size, Image.Resampling.BILINEAR), dtype=np.uint16), 1)
+    pixels = np.minimum(np.asarray(image, dtype=np.uint16) * 255 // background, 255).astype(np.uint8)
+    pixels[pixels >= 255 - PAPER_TOLERANCE] = 255
+    return Image.fromarray(pixels, 'L')
+
+
+def background_level(histogram):
+    """Teinte du fond d'une image en niveaux de gris : la plus fréquente parmi les teintes claires (histogramme PIL)."""
+    return 128 + int(np.argmax(histogram[128:256]))
+
+
+def encode_image(image, format='WEBP', quality=85, lossless=True):
+    """Image PIL -> {'mime_type': ..., 'data': ...} (format PNG, JPEG ou WEBP ; lossless : WebP sans perte)."""
+    format = format.upper()
+    buffer = io.BytesIO()
+    if format == 'PNG':
+        # optimize=True : quelques % de moins pour un encodage 5 fois plus long
+        image.save(buffer, format='PNG')
+    elif format == 'JPEG':
+        image.convert('L' if image.mode == 'L' else 'RGB').save(buffer, format='JPEG', quality=quality, optimize=True)
+    else:
+        image.save(buffer, format=format, quality=quality, lossless=lossless)
+    return {'mime_type': MIME_TYPES[format], 'data': buffer.getvalue()}
+
+
+def _flatten(image):
+    # Transparence posée sur fond blanc (sinon elle devient noire en niveaux de gris)
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        return Image.alpha_composite(background, image).convert('RGB')
+    if image.mode not in ('RGB', 'L'):
+        return image.convert('RGB')
+    return image
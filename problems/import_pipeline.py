@@ -0,0 +1,376 @@
+# problems/import_pipeline.py
+"""
+Importation d'un problème depuis un fichier (ImportedProblem), en arrière-plan.
+
+La requête d'envoi enregistre le fichier et rend la main ; le traitement passe ensuite par
+six étapes, chacune avec sa propre file et son propre nombre de traitements simultanés
+(IMPORT_STAGE_CONCURRENCY) :
+
+    rasterize  une page du PDF -> image (poppler), image -> image chargée
+    preprocess image -> contenu réduit et ré-encodé (GeminiService.prepare_image)
+    extract    appel au modèle (Gemini) : réponse brute
+    parse      réponse -> données au format Problem (page complète ou fragment)
+    validate   page complète ou fragment (GeminiService.page_outcome)
+    persist    écriture du problème (save(update_fields=...))
+
+Les cinq premières étapes se font page par page : chaque page d'un PDF est convertie au moment
+où elle entre dans le pipeline, et au plus IMPORT_PAGE_CONCURRENCY pages d'une même importation
+y sont en même temps. Dès que le résultat est connu (GeminiService.resolve_pages : première page
+complète, ou fusion de toutes les pages avec IMPORT_MERGE_PAGES), les pages restantes ne sont pas
+lancées et celles en file sont abandonnées avant l'appel au modèle.
+
+Les étapes attendent surtout des entrées-sorties (poppler, API du modèle, base) : des threads
+suffisent, sans copier images et réponses d'un processus à l'autre. Les données d'une étape à
+la suivante restent en mémoire ; seuls l'étape courante et l'horodatage de chaque étape
+(ImportedProblem.import_timeline) sont écrits en base, lus par la page qui suit l'importation.
+
+Une importation interrompue (serveur redémarré, thread perdu) resterait 'processing' pour
+toujours : sans avancement depuis IMPORT_JOB_TIMEOUT, elle passe en échec (reset_stale_imports,
+appelée au démarrage du pipeline de chaque serveur et par import_progress).
+"""
+
+import copy
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+STAGE_RASTERIZE = 'rasterize'
+STAGE_PREPROCESS = 'preprocess'
+STAGE_EXTRACT = 'extract'
+STAGE_PARSE = 'parse'
+STAGE_VALIDATE = 'validate'
+STAGE_PERSIST = 'persist'
+STAGES = (STAGE_RASTERIZE, STAGE_PREPROCESS, STAGE_EXTRACT, STAGE_PARSE, STAGE_VALIDATE, STAGE_PERSIST)
+# Étapes faites page par page
+PAGE_STAGES = STAGES[:-1]
+
+# Traitements simultanés par étape : les appels au modèle sont les plus longs, l'écriture en base la plus courte
+DEFAULT_CONCURRENCY = {
+    STAGE_RASTERIZE: 2,
+    STAGE_PREPROCESS: 2,
+    STAGE_EXTRACT: 4,
+    STAGE_PARSE: 2,
+    STAGE_VALIDATE: 2,
+    STAGE_PERSIST: 1,
+}
+# Pages d'une même importation en cours de traitement en même temps
+DEFAULT_PAGE_CONCURRENCY = 4
+
+# Résolution des pages d'un PDF
+RASTERIZE_DPI = 300
+# Extension d'un fichier image importé -> type MIME de son contenu
+ORIGINAL_MIME_TYPES = {'png': 'image/png', 'jpg': 'image/jpeg', 'jpeg': 'image/jpeg'}
+
+# Statuts d'une importation pas encore terminée ; délai (s) sans avancement au-delà duquel elle est abandonnée
+IN_PROGRESS_STATUSES = ('pending', 'processing')
+DEFAULT_JOB_TIMEOUT = 10 * 60
+STALE_IMPORT_ERROR = "Importation interrompue (serveur redémarré ou traitement arrêté) : veuillez renvoyer le fichier."
+
+_executors = {}
+_lock = threading.Lock()
+
+
+class ImportJob:
+    """Une importation en cours : pages lancées, résultat de chaque page, données retenues."""
+
+    def __init__(self, pk, path, is_pdf):
+        self.pk = pk
+        self.path = path
+        self.is_pdf = is_pdf
+        self.merge = getattr(settings, 'IMPORT_MERGE_PAGES', False)
+        self.window = getattr(settings, 'IMPORT_PAGE_CONCURRENCY', DEFAULT_PAGE_CONCURRENCY)
+        self.lock = threading.RLock()
+        self.timeline = {}
+        self.service = None
+        self.page_count = None
+        self.next_page = 1
+        self.in_flight = 0
+        # Numéro de page -> GeminiService.page_outcome, ou None pour une page en échec
+        self.outcomes = {}
+        # (numéro de page, message) des pages en échec
+        self.page_errors = []
+        self.data = None
+        self.done = False
+
+
+def submit_import(problem):
+    """Met en file l'importation de `problem` (ImportedProblem dont le fichier est enregistré)."""
+    job = ImportJob(problem.pk, problem.file.path, problem.file.name.lower().endswith('.pdf'))
+    _mark(job, STAGE_RASTERIZE, 'queued_at')
+    _save_progress(job, import_stage=STAGE_RASTERIZE)
+    _stage_executor(STAGE_RASTERIZE).submit(_run_task, job, STAGE_RASTERIZE, _open)
+    return job
+
+
+def is_stale(problem):
+    """Importation en cours sans avancement depuis IMPORT_JOB_TIMEOUT : le traitement qui la portait est perdu."""
+    return problem.statusForImport in IN_PROGRESS_STATUSES and problem.date_updated < _stale_cutoff()
+
+
+def reset_stale_imports(pk=None):
+    """Passe en échec les importations abandonnées (is_stale), toutes ou celle de `pk` ; renvoie leur nombre."""
+    from problems.models import ImportedProblem
+
+    now = timezone.now()
+    stale = ImportedProblem.objects.filter(statusForImport__in=IN_PROGRESS_STATUSES, date_updated__lt=_stale_cutoff())
+    if pk is not None:
+        stale = stale.filter(pk=pk)
+    count = stale.update(statusForImport='failed', error_message=STALE_IMPORT_ERROR, processing_completed_at=now,
+                         date_updated=now)
+    if count:
+        logger.warning(f"{count} importation(s) abandonnée(s) passée(s) en échec")
+    return count
+
+
+def _stale_cutoff():
+    return timezone.now() - timedelta(seconds=getattr(settings, 'IMPORT_JOB_TIMEOUT', DEFAULT_JOB_TIMEOUT))
+
+
+def _stage_executor(stage):
+    started = False
+    with _lock:
+        if stage not in _executors:
+            started = not _executors
+            limits = dict(DEFAULT_CONCURRENCY, **getattr(settings, 'IMPORT_STAGE_CONCURRENCY', {}))
+            _executors[stage] = ThreadPoolExecutor(max_workers=limits[stage], thread_name_prefix=f'import-{stage}')
+        executor = _executors[stage]
+    if started:
+        # Démarrage du pipeline : les importations d'un serveur arrêté sont abandonnées
+        reset_stale_imports()
+    return executor
+
+
+def _run_task(job, stage, task):
+    try:
+        task(job)
+    except Exception as e:
+        _fail(job, stage, e)
+    finally:
+        # Chaque thread a sa propre connexion : elle est rendue après chaque tâche
+        connection.close()
+
+
+def _open(job):
+    from problems.services import GeminiService
+
+    job.service = GeminiService()
+    job.page_count = job.service.count_pdf_pages(job.path) if job.is_pdf else 1
+    with job.lock:
+        job.timeline['pages'] = {'total': job.page_count, 'processed': 0}
+    _save_progress(job, statusForImport='processing', processing_started_at=timezone.now())
+    _fill(job)
+
+
+def _fill(job):
+    """Lance les pages suivantes, dans la limite de job.window pages en cours."""
+    with job.lock:
+        pages = []
+        while not job.done and job.in_flight < job.window and job.next_page <= job.page_count \
+                and job.service.pages_needed(job.outcomes, job.next_page, job.merge):
+            pages.append(job.next_page)
+            job.next_page += 1
+            job.in_flight += 1
+    for page in pages:
+        _submit_page(job, page, 0, None)
+
+
+def _submit_page(job, page, index, value):
+    stage = PAGE_STAGES[index]
+    _mark(job, stage, 'queued_at')
+    _stage_executor(stage).submit(_page_step, job, page, index, value)
+
+
+def _page_step(job, page, index, value):
+    stage = PAGE_STAGES[index]
+    with job.lock:
+        wanted = not job.done and job.service.pages_needed(job.outcomes, page, job.merge)
+    if not wanted:
+        # Résultat déjà connu, ou une page précédente est complète : la page est abandonnée
+        _page_finished(job, page, None, processed=False)
+        return
+
+    succeeded = False
+    try:
+        _mark(job, stage, 'started_at')
+        _save_progress(job, import_stage=stage)
+        value = PAGE_HANDLERS[stage](job, page, value)
+        succeeded = True
+    except Exception as e:
+        with job.lock:
+            job.page_errors.append((page, str(e)))
+    finally:
+        connection.close()
+
+    if succeeded and index + 1 < len(PAGE_STAGES):
+        _submit_page(job, page, index + 1, value)
+    else:
+        _page_finished(job, page, value if succeeded else None)
+
+
+def _page_finished(job, page, outcome, processed=True):
+    error = None
+    with job.lock:
+        job.in_flight -= 1
+        if processed:
+            job.outcomes[page] = outcome
+            job.timeline['pages']['processed'] += 1
+        if job.done:
+            return
+        try:
+            job.data = job.service.resolve_pages(job.outcomes, job.page_count, job.merge)
+        except ValueError as e:
+            error = ValueError(f"{e}{_page_errors_summary(job)}")
+        job.done = job.data is not None or error is not None
+
+    if error is not None:
+        _fail(job, STAGE_VALIDATE, error)
+    elif job.data is not None:
+        with job.lock:
+            now = _now()
+            for stage in PAGE_STAGES:
+                job.timeline.setdefault(stage, {'queued_at': now}).setdefault('completed_at', now)
+        _mark(job, STAGE_PERSIST, 'queued_at')
+        _save_progress(job, import_stage=STAGE_PERSIST)
+        _stage_executor(STAGE_PERSIST).submit(_run_task, job, STAGE_PERSIST, _persist)
+    else:
+        _fill(job)
+
+
+def _page_errors_summary(job, limit=3):
+    """Erreurs des premières pages, pour le message d'échec (un PDF de 30 pages n'en affiche pas 30)."""
+    errors = sorted(job.page_errors)
+    if not errors:
+        return ''
+    more = f" ; {len(errors) - limit} autre(s) page(s) en échec" if len(errors) > limit else ''
+    return f" ({'; '.join(f'page {page} : {message}' for page, message in errors[:limit])}{more})"
+
+
+def _fail(job, stage, error):
+    logger.error(f"Importation {job.pk} : échec de l'étape {stage} : {error}",
+                 exc_info=(type(error), error, error.__traceback__))
+    with job.lock:
+        job.done = True
+        job.timeline.setdefault(stage, {})['failed_at'] = _now()
+    _save_progress(job, import_stage=stage, statusForImport='failed', error_message=str(error),
+                   processing_completed_at=timezone.now())
+
+
+def _mark(job, stage, event):
+    """Horodatage d'une étape ; pour les étapes par page, celui de la première page."""
+    with job.lock:
+        job.timeline.setdefault(stage, {}).setdefault(event, _now())
+
+
+def _save_progress(job, **fields):
+    from problems.models import ImportedProblem
+    with job.lock:
+        timeline = copy.deepcopy(job.timeline)
+    # date_updated : dernier avancement (update() ne le renseigne pas lui-même), lu par is_stale
+    ImportedProblem.objects.filter(pk=job.pk).update(import_timeline=timeline, date_updated=timezone.now(), **fields)
+
+
+def _now():
+    return timezone.now().isoformat()
+
+
+def _rasterize(job, page, _):
+    from PIL import Image
+
+    if job.is_pdf:
+        return job.service.rasterize_pdf_page(job.path, page, dpi=RASTERIZE_DPI)
+    with Image.open(job.path) as image:
+        image.load()
+        return image.copy()
+
+
+def _preprocess(job, page, image):
+    # Fichier image importé : son encodage d'origine reste candidat (une page de PDF n'en a pas)
+    original = None
+    mime_type = ORIGINAL_MIME_TYPES.get(job.path.rsplit('.', 1)[-1].lower())
+    if not job.is_pdf and mime_type:
+        with open(job.path, 'rb') as file:
+            original = {'mime_type': mime_type, 'data': file.read()}
+    return job.service.prepare_image(image, original=original)
+
+
+def _extract(job, page, image):
+    return job.service.extract_text(image)
+
+
+def _parse(job, page, text):
+    return job.service.parse_response(text, partial=True)
+
+
+def _validate(job, page, data):
+    return job.service.page_outcome(data)
+
+
+PAGE_HANDLERS = {
+    STAGE_RASTERIZE: _rasterize,
+    STAGE_PREPROCESS: _preprocess,
+    STAGE_EXTRACT: _extract,
+    STAGE_PARSE: _parse,
+    STAGE_VALIDATE: _validate,
+}
+
+
+def _persist(job):
+    from problems.models import ImportedProblem
+
+    data = job.data
+    problem = ImportedProblem.objects.get(pk=job.pk)
+    problem.objective_type = data['objective_type']
+    problem.objective_coefficients = data['objective_coefficients']
+    problem.constraints = data['constraints']
+    problem.num_variables = len(data['objective_coefficients'])
+
+    # Assurer la cohérence des longueurs de coefficients dans les contraintes
+    for constraint in problem.constraints:
+        if len(constraint['coefficients']) < problem.num_variables:
+            constraint['coefficients'].extend([0.0] * (problem.num_variables - len(constraint['coefficients'])))
+
+    problem.variable_names = [f"x{i+1}" for i in range(problem.num_variables)]
+    problem.objective_equation_str = data.get('objective_function')
+    if data.get('constraints_equations'):
+        problem.constraints_equation_str = "\n".join(data['constraints_equations'])
+    # save(update_fields=...) ne recalcule pas la forme creuse : elle est faite ici
+    problem.refresh_sparse_constraints()
+
+    _mark(job, STAGE_PERSIST, 'started_at')
+    _mark(job, STAGE_PERSIST, 'completed_at')
+    with job.lock:
+        problem.import_timeline = copy.deepcopy(job.timeline)
+    problem.import_stage = None
+    problem.statusForImport = 'completed'
+    problem.processing_completed_at = timezone.now()
+    problem.save(update_fields=[
+        'objective_type', 'objective_coefficients', 'constraints', 'sparse_constraints', 'num_variables',
+        'variable_names', 'objective_equation_str', 'constraints_equation_str', 'import_timeline', 'import_stage',
+        'statusForImport', 'processing_completed_at', 'date_updated',
+    ])
+
+
+def progress_summary(problem):
+    """Avancement d'une importation, pour la page qui l'interroge (JSON)."""
+    timeline = problem.import_timeline or {}
+    completed = [stage for stage in STAGES if timeline.get(stage, {}).get('completed_at')]
+    return {
+        'status': problem.statusForImport,
+        'status_display': problem.get_statusForImport_display(),
+        'done': problem.statusForImport in ('completed', 'failed'),
+        'stage': problem.import_stage,
+        'stages': list(STAGES),
+        'completed_stages': len(completed),
+        'progress': len(completed) / len(STAGES),
+        'pages': timeline.get('pages'),
+        'timeline': {stage: timeline[stage] for stage in STAGES if stage in timeline},
+        'error': problem.error_message,
+        'problem_id': problem.pk,
+    }
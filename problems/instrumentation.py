@@ -0,0 +1,103 @@
+# problems/instrumentation.py
+"""
+Instrumentation d'une résolution : temps passé dans chaque phase d'une itération (pricing,
+test du ratio, pivot, enregistrement de l'historique), pivots dégénérés et pic de mémoire
+des tableaux.
+
+Désactivée (cas par défaut), le solveur utilise NO_STATS, dont les méthodes ne font rien :
+quelques appels vides par itération, négligeables devant un pivot.
+"""
+
+import time
+
+PRICING = 0
+RATIO_TEST = 1
+PIVOT = 2
+RECORDING = 3
+PHASES = ('pricing', 'ratio_test', 'pivot', 'recording')
+
+# Pivot dégénéré : l'objectif ne progresse pas de plus de DEGENERACY_TOLERANCE (relative)
+DEGENERACY_TOLERANCE = 1e-9
+
+
+class SolveStats:
+    """
+    Chronomètre d'une résolution, démarré à la construction. lap(phase) ajoute à la phase le
+    temps écoulé depuis le repère précédent ; end_iteration() clôt la ligne de l'itération.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self._mark = self.start
+        self._current = [0.0] * len(PHASES)
+        self.totals = [0.0] * len(PHASES)
+        self.per_iteration = []
+        self.degenerate = []
+        self.peak_tableau_bytes = 0
+
+    def mark(self):
+        """Nouveau repère : le temps écoulé depuis le précédent n'est compté dans aucune phase."""
+        self._mark = time.perf_counter()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self._current[phase] += now - self._mark
+        self._mark = now
+
+    def end_iteration(self, degenerate, tableau_bytes):
+        self.per_iteration.append(self._current)
+        self.degenerate.append(degenerate)
+        for phase, elapsed in enumerate(self._current):
+            self.totals[phase] += elapsed
+        self._current = [0.0] * len(PHASES)
+        self.note_bytes(tableau_bytes)
+        self.mark()
+
+    def note_bytes(self, tableau_bytes):
+        self.peak_tableau_bytes = max(self.peak_tableau_bytes, tableau_bytes)
+
+    def report(self, engine, iterations, basis_condition=None):
+        """Dictionnaire 'instrumentation' du résultat de SimplexSolver.solve() (durées en secondes)."""
+        # Dernier passage sans pivot (test d'optimalité ou de réalisabilité) : compté dans les totaux
+        totals = [total + elapsed for total, elapsed in zip(self.totals, self._current)]
+        return {
+            'engine': engine,
+            'iterations': iterations,
+            'solve_time': time.perf_counter() - self.start,
+            'times': dict(zip(PHASES, totals)),
+            'per_iteration': {
+                **{name: [row[phase] for row in self.per_iteration] for phase, name in enumerate(PHASES)},
+                'degenerate': list(self.degenerate),
+            },
+            'degenerate_pivots': sum(self.degenerate),
+            'basis_condition': basis_condition,
+            'peak_tableau_bytes': self.peak_tableau_bytes,
+        }
+
+
+class _DisabledStats:
+    """Même interface que SolveStats, sans effet."""
+
+    enabled = False
+
+    def mark(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def end_iteration(self, degenerate, tableau_bytes):
+        pass
+
+    def note_bytes(self, tableau_bytes):
+        pass
+
+
+NO_STATS = _DisabledStats()
+
+
+def is_degenerate(before, after):
+    """Pivot sans progrès de l'objectif (valeurs de la ligne Z avant et après le pivot)."""
+    return bool(abs(after - before) <= DEGENERACY_TOLERANCE * max(1.0, abs(before)))
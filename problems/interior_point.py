@@ -0,0 +1,212 @@
+# problems/interior_point.py
+"""
+Méthode de points intérieurs (prédicteur-correcteur de Mehrotra) et crossover.
+
+Le problème traité est min c^T x s.c. A x = b, 0 <= x <= u (u_j = +inf autorisé), soit la
+forme standard du SimplexSolver avec ses variables d'écart : A = [A' I]. Chaque itération
+résout deux fois les équations normales A D A^T dy = r avec la même factorisation de
+Cholesky, au lieu de parcourir les sommets un par un.
+
+Le point obtenu est intérieur : le crossover en extrait une base (colonnes les plus
+éloignées de leurs bornes, linéairement indépendantes), d'où quelques pivots du simplexe
+donnent un sommet optimal, sa base et son tableau.
+"""
+
+import numpy as np
+
+IPM_TOLERANCE = 1e-8
+IPM_MAX_ITERATIONS = 100
+# Fraction du pas maximal conservée pour rester strictement à l'intérieur
+IPM_STEP_FRACTION = 0.99
+# Au-delà, les itérés divergent (problème infaisable ou non borné) : le simplexe tranchera
+IPM_DIVERGENCE = 1e12
+
+CROSSOVER_TOLERANCE = 1e-8
+
+
+def mehrotra_predictor_corrector(A, b, c, upper=None, tolerance=IPM_TOLERANCE, max_iterations=IPM_MAX_ITERATIONS,
+                                 stop=None):
+    """
+    Résout min c^T x s.c. A x = b, 0 <= x <= upper (A dense, de rang plein en lignes).
+    Renvoie {'x', 'y', 'z', 'status', 'iterations', 'primal_residual', 'dual_residual', 'gap'} ;
+    status vaut 'optimal', 'diverged', 'iteration_limit' ou 'interrupted' (stop(), appelée
+    avant chaque itération, a renvoyé vrai). Les variables de borne supérieure nulle sont
+    fixées à 0 hors de l'algorithme.
+    """
+    num_rows, num_columns = A.shape
+    upper = np.full(num_columns, np.inf) if upper is None else np.asarray(upper, dtype=float)
+    free = upper > tolerance
+    x_full = np.zeros(num_columns)
+    z_full = np.zeros(num_columns)
+
+    A, c, upper = A[:, free], c[free], upper[free]
+    bounded = np.isfinite(upper)
+    u = np.where(bounded, upper, 0.0)
+    num_complementarity = A.shape[1] + int(bounded.sum())
+    b_norm, c_norm = 1.0 + np.linalg.norm(b), 1.0 + np.linalg.norm(c)
+
+    x, y, z = _starting_point(A, b, c)
+    # w = u - x et v (multiplicateur de x <= u) n'existent que pour les variables bornées
+    x = np.where(bounded & (x >= u), u / 2.0, x)
+    w = np.where(bounded, u - x, 1.0)
+    v = np.where(bounded, z, 0.0)
+
+    status = 'iteration_limit'
+    iteration = 0
+    residuals = (np.inf, np.inf, np.inf)
+    for iteration in range(max_iterations + 1):
+        r_b = b - A @ x
+        r_c = c - A.T @ y - z + v
+        r_u = np.where(bounded, u - x - w, 0.0)
+        primal_objective = c @ x
+        dual_objective = b @ y - u @ v
+        residuals = (
+            max(np.linalg.norm(r_b), np.linalg.norm(r_u)) / b_norm,
+            np.linalg.norm(r_c) / c_norm,
+            abs(primal_objective - dual_objective) / (1.0 + abs(primal_objective)),
+        )
+        if max(residuals) < tolerance:
+            status = 'optimal'
+            break
+        if iteration == max_iterations:
+            break
+        if stop is not None and stop():
+            status = 'interrupted'
+            break
+        if max(np.abs(x).max(initial=0.0), np.abs(y).max(initial=0.0)) > IPM_DIVERGENCE:
+            status = 'diverged'
+            break
+
+        mu = (x @ z + w[bounded] @ v[bounded]) / num_complementarity
+        d = 1.0 / (z / x + np.where(bounded, v / w, 0.0))
+        normal_equations = _NormalEquations((A * d) @ A.T)
+
+        def direction(r_xz, r_wv):
+            r_hat = r_c - r_xz / x + np.where(bounded, (r_wv - v * r_u) / w, 0.0)
+            dy = normal_equations.solve(r_b + A @ (d * r_hat))
+            dx = d * (A.T @ dy - r_hat)
+            dz = (r_xz - z * dx) / x
+            dw = np.where(bounded, r_u - dx, 0.0)
+            dv = np.where(bounded, (r_wv - v * dw) / w, 0.0)
+            return dx, dy, dz, dw, dv
+
+        # Prédicteur (direction affine, sans centrage)
+        dx, dy, dz, dw, dv = direction(-x * z, np.where(bounded, -w * v, 0.0))
+        primal_step = _max_step((x, dx), (w[bounded], dw[bounded]))
+        dual_step = _max_step((z, dz), (v[bounded], dv[bounded]))
+        mu_affine = ((x + primal_step * dx) @ (z + dual_step * dz)
+                     + (w + primal_step * dw)[bounded] @ (v + dual_step * dv)[bounded]) / num_complementarity
+        sigma = (mu_affine / mu) ** 3
+
+        # Correcteur : centrage sigma * mu et terme du second ordre de Mehrotra
+        dx, dy, dz, dw, dv = direction(
+            sigma * mu - x * z - dx * dz,
+            np.where(bounded, sigma * mu - w * v - dw * dv, 0.0),
+        )
+        primal_step = min(1.0, IPM_STEP_FRACTION * _max_step((x, dx), (w[bounded], dw[bounded]), limit=np.inf))
+        dual_step = min(1.0, IPM_STEP_FRACTION * _max_step((z, dz), (v[bounded], dv[bounded]), limit=np.inf))
+        x = x + primal_step * dx
+        w = np.where(bounded, w + primal_step * dw, 1.0)
+        y = y + dual_step * dy
+        z = z + dual_step * dz
+        v = np.where(bounded, v + dual_step * dv, 0.0)
+
+    x_full[free] = x
+    z_full[free] = z - v
+    return {
+        'x': x_full,
+        'y': y,
+        'z': z_full,
+        'status': status,
+        'iterations': iteration,
+        'primal_residual': float(residuals[0]),
+        'dual_residual': float(residuals[1]),
+        'gap': float(residuals[2]),
+    }
+
+
+def crossover_basis(A, x, upper=None):
+    """
+    Base extraite d'un point (quasi) optimal x : les colonnes sont prises de la plus éloignée
+    de ses bornes à la plus proche, et gardées si elles sont linéairement indépendantes des
+    colonnes déjà retenues (orthogonalisation de Gram-Schmidt). Renvoie (basis_vars, at_upper),
+    at_upper étant les variables hors base plus proches de leur borne supérieure que de 0.
+    """
+    num_rows, num_columns = A.shape
+    upper = np.full(num_columns, np.inf) if upper is None else np.asarray(upper, dtype=float)
+    distance = np.minimum(x, upper - x)
+    order = np.argsort(-distance, kind='stable')
+
+    q = np.zeros((num_rows, num_rows))
+    basis_vars = []
+    for j in order:
+        if len(basis_vars) == num_rows:
+            break
+        column = A[:, j]
+        chosen = q[:, :len(basis_vars)]
+        residual = column - chosen @ (chosen.T @ column)
+        # Seconde passe : Gram-Schmidt réorthogonalisé, stable pour des colonnes presque dépendantes
+        residual -= chosen @ (chosen.T @ residual)
+        norm = np.linalg.norm(residual)
+        if norm > CROSSOVER_TOLERANCE * max(1.0, np.linalg.norm(column)):
+            q[:, len(basis_vars)] = residual / norm
+            basis_vars.append(int(j))
+
+    in_basis = np.zeros(num_columns, dtype=bool)
+    in_basis[basis_vars] = True
+    at_upper = np.flatnonzero(~in_basis & np.isfinite(upper) & (x > upper / 2.0))
+    return basis_vars, [int(j) for j in at_upper]
+
+
+class _NormalEquations:
+    """Factorisation de Cholesky de A D A^T, régularisée si elle n'est pas numériquement définie positive."""
+
+    def __init__(self, matrix):
+        regularization = 1e-14 * (1.0 + np.abs(np.diag(matrix)).max(initial=0.0))
+        identity = np.eye(matrix.shape[0])
+        while True:
+            try:
+                lower = np.linalg.cholesky(matrix + regularization * identity)
+                break
+            except np.linalg.LinAlgError:
+                regularization *= 100.0
+        self._lower = lower
+
+    def solve(self, rhs):
+        # L L^T x = rhs : descente sur L puis remontée sur L^T
+        lower = self._lower
+        n = lower.shape[0]
+        x = np.array(rhs, dtype=float)
+        for k in range(n):
+            x[k] = (x[k] - lower[k, :k] @ x[:k]) / lower[k, k]
+        for k in range(n - 1, -1, -1):
+            x[k] = (x[k] - lower[k + 1:, k] @ x[k + 1:]) / lower[k, k]
+        return x
+
+
+def _starting_point(A, b, c):
+    """Point de départ de Mehrotra : solutions de moindre norme, décalées dans l'orthant positif."""
+    normal_equations = _NormalEquations(A @ A.T)
+    x = A.T @ normal_equations.solve(b)
+    y = normal_equations.solve(A @ c)
+    z = c - A.T @ y
+
+    x += max(-1.5 * x.min(initial=0.0), 0.0)
+    z += max(-1.5 * z.min(initial=0.0), 0.0)
+    product = x @ z
+    if product <= 0.0 or not np.isfinite(product):
+        return np.maximum(x, 1.0), y, np.maximum(z, 1.0)
+    x += 0.5 * product / z.sum()
+    z += 0.5 * product / x.sum()
+    return x, y, z
+
+
+def _max_step(*pairs, limit=1.0):
+    """Plus grand pas alpha <= limit gardant value + alpha * direction >= 0 pour chaque paire."""
+    step = limit
+    for values, directions in pairs:
+        decreasing = directions < 0
+        if np.any(decreasing):
+            with np.errstate(over='ignore'):
+                step = min(step, float(np.min(-values[decreasing] / directions[decreasing])))
+    return step
@@ -0,0 +1,175 @@
+# problems/jobs.py
+"""
+Résolutions en arrière-plan : la vue soumet le problème à un pool de processus borné et rend
+la main aussitôt ; Problem.status passe par 'queued' puis 'running' avant le statut final,
+que la page interroge (problem_status).
+
+Une résolution perdue (serveur redémarré, processus tué, pool inutilisable) laisserait le
+problème 'queued' ou 'running' pour toujours : au-delà de SIMPLEX_SOLVE_JOB_TIMEOUT depuis sa
+mise en file ou sa prise en charge, elle est considérée comme abandonnée (reset_stale_jobs,
+appelée au démarrage du pool de chaque serveur et par les vues du problème concerné).
+
+Les processus sont démarrés une fois (spawn : ni connexion à la base ni verrou hérités du
+serveur) et préchauffés : Django, NumPy et le solveur sont importés et une petite résolution
+est faite avant le premier problème. Le processus qui résout écrit lui-même le résultat
+(save(update_fields=...)) : il est enregistré même si la requête d'origine est terminée.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+# Statuts d'un problème dont la résolution n'est pas terminée
+IN_PROGRESS_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 32
+DEFAULT_JOB_TIMEOUT = 15 * 60
+
+STALE_JOB_ERROR = "Résolution en arrière-plan interrompue (serveur redémarré ou processus arrêté) : elle peut être relancée."
+
+_executor = None
+_slots = None
+_lock = threading.Lock()
+
+
+def submit_solve(problem):
+    """
+    Met la résolution de `problem` en file d'attente (statut 'queued').
+    Renvoie False, sans rien changer, si SIMPLEX_SOLVE_QUEUE_SIZE résolutions sont déjà en attente.
+    """
+    from problems.models import Problem
+
+    executor, slots = _job_pool()
+    if not slots.acquire(blocking=False):
+        return False
+    previous_status = problem.status
+    problem.status = STATUS_QUEUED
+    problem.solve_queued_at = timezone.now()
+    problem.solve_started_at = None
+    problem.save(update_fields=['status', 'solve_queued_at', 'solve_started_at', 'date_updated'])
+    try:
+        future = executor.submit(solve_job, problem.pk)
+    except Exception:
+        # Pool inutilisable (processus tué) : il sera recréé à la prochaine soumission
+        slots.release()
+        _reset_pool(executor)
+        Problem.objects.filter(pk=problem.pk, status=STATUS_QUEUED).update(status=previous_status)
+        raise
+    future.add_done_callback(lambda done: _job_done(done, problem.pk, executor, slots))
+    return True
+
+
+def is_stale(problem):
+    """Résolution en file ou en cours depuis plus de SIMPLEX_SOLVE_JOB_TIMEOUT : le processus qui la portait est perdu."""
+    if problem.status not in IN_PROGRESS_STATUSES:
+        return False
+    since = problem.solve_started_at if problem.status == STATUS_RUNNING else problem.solve_queued_at
+    return since is None or since < timezone.now() - timedelta(seconds=_job_timeout())
+
+
+def reset_stale_jobs(pk=None):
+    """
+    Passe en erreur les résolutions abandonnées (is_stale), toutes ou celle du problème `pk` ;
+    renvoie leur nombre. Un résultat qui arriverait malgré tout plus tard remplace l'erreur.
+    """
+    from problems.models import Problem
+
+    cutoff = timezone.now() - timedelta(seconds=_job_timeout())
+    stale = Problem.objects.filter(
+        (Q(status=STATUS_QUEUED) & (Q(solve_queued_at__isnull=True) | Q(solve_queued_at__lt=cutoff)))
+        | (Q(status=STATUS_RUNNING) & (Q(solve_started_at__isnull=True) | Q(solve_started_at__lt=cutoff))))
+    if pk is not None:
+        stale = stale.filter(pk=pk)
+    count = stale.update(status='error', solve_summary={'error': STALE_JOB_ERROR, 'background': True},
+                         date_updated=timezone.now())
+    if count:
+        logger.warning(f"{count} résolution(s) en arrière-plan abandonnée(s) passée(s) en erreur")
+    return count
+
+
+def _job_timeout():
+    return getattr(settings, 'SIMPLEX_SOLVE_JOB_TIMEOUT', DEFAULT_JOB_TIMEOUT)
+
+
+def _job_pool():
+    global _executor, _slots
+    started = False
+    with _lock:
+        if _executor is None:
+            workers = getattr(settings, 'SIMPLEX_SOLVE_WORKERS', DEFAULT_WORKERS)
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                            initializer=_warm_worker)
+            _slots = threading.BoundedSemaphore(getattr(settings, 'SIMPLEX_SOLVE_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+            started = True
+        executor, slots = _executor, _slots
+    if started:
+        # Démarrage (ou remplacement) du pool : les résolutions d'un serveur arrêté sont abandonnées
+        reset_stale_jobs()
+    return executor, slots
+
+
+def _reset_pool(executor):
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _job_done(future, pk, executor, slots):
+    slots.release()
+    error = future.exception()
+    if error is None:
+        return
+    # Le processus n'a pas pu écrire son résultat (arrêt brutal) : le problème ne reste pas en cours
+    logger.error(f"Résolution en arrière-plan du problème {pk} interrompue : {error}")
+    from problems.models import Problem
+    Problem.objects.filter(pk=pk, status__in=IN_PROGRESS_STATUSES).update(
+        status='error', solve_summary={'error': str(error), 'background': True})
+    _reset_pool(executor)
+
+
+def _warm_worker():
+    import django
+    django.setup()
+    # Imports et premiers appels NumPy faits une fois par processus, pas à la première résolution
+    import problems.views  # noqa: F401
+    from problems.simplex import SimplexSolver
+    SimplexSolver('max', [1.0], [{'coefficients': [1.0], 'sense': '<=', 'rhs': 1.0}], history='none', presolve=True).solve()
+
+
+def solve_job(pk):
+    """Résolution d'un problème en file d'attente, exécutée dans un processus du pool."""
+    from django.contrib.messages import DEFAULT_TAGS
+
+    from problems.models import Problem
+    from problems.views import SOLUTION_FIELDS, run_solve
+
+    # Prise en charge atomique : un problème supprimé ou déjà pris en charge est ignoré
+    now = timezone.now()
+    if not Problem.objects.filter(pk=pk, status=STATUS_QUEUED).update(status=STATUS_RUNNING, solve_started_at=now,
+                                                                       date_updated=now):
+        return
+    problem = Problem.objects.get(pk=pk)
+    try:
+        level, message = run_solve(problem)
+    except Exception as e:
+        logger.error(f"Erreur lors de la résolution du problème {pk} : {e}", exc_info=True)
+        problem.status = 'error'
+        problem.solve_summary = {'error': str(e), 'background': True}
+        problem.save(update_fields=['status', 'solve_summary', 'date_updated'])
+        return
+    # Message affiché par la page une fois la résolution terminée (pas de requête pour le porter)
+    problem.solve_summary = dict(problem.solve_summary, message=message, message_level=DEFAULT_TAGS[level], background=True)
+    problem.save(update_fields=SOLUTION_FIELDS)
@@ -0,0 +1,69 @@
+# problems/limits.py
+"""
+Limites d'une résolution : durée (horloge murale), nombre d'itérations proportionnel à la
+taille du problème et jeton d'annulation coopératif, vérifiés entre deux pivots.
+
+Une résolution interrompue renvoie le statut 'time_limit' avec la dernière base atteinte
+(et sa solution si elle est réalisable) ; la clé 'limit' du résultat dit laquelle a joué.
+"""
+
+import threading
+import time
+
+STATUS_TIME_LIMIT = 'time_limit'
+
+LIMIT_TIME = 'time'
+LIMIT_ITERATIONS = 'iterations'
+LIMIT_CANCELLED = 'cancelled'
+# Séparation et évaluation : nombre de nœuds explorés
+LIMIT_NODES = 'nodes'
+
+# Limite d'itérations par défaut : ITERATIONS_PER_DIMENSION * (m + n) pivots
+ITERATIONS_PER_DIMENSION = 10
+
+
+def scaled_iteration_limit(num_rows, num_columns, minimum):
+    """Limite d'itérations d'un problème m x n, jamais inférieure à `minimum`."""
+    return max(minimum, ITERATIONS_PER_DIMENSION * (num_rows + num_columns))
+
+
+class CancellationToken:
+    """
+    Jeton partagé entre le code qui lance une résolution et le solveur : cancel(), appelé
+    depuis n'importe quel thread, interrompt la résolution au pivot suivant.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class SolveLimits:
+    """Échéance, limite d'itérations et jeton d'une résolution, démarrés à la construction."""
+
+    def __init__(self, time_limit=None, iteration_limit=None, cancel_token=None):
+        self.deadline = None if time_limit is None else time.monotonic() + time_limit
+        self.iteration_limit = iteration_limit
+        self.cancel_token = cancel_token
+
+    def reached(self, iterations=0):
+        """Limite atteinte (LIMIT_CANCELLED, LIMIT_ITERATIONS ou LIMIT_TIME), ou None."""
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            return LIMIT_CANCELLED
+        if self.iteration_limit is not None and iterations >= self.iteration_limit:
+            return LIMIT_ITERATIONS
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return LIMIT_TIME
+        return None
+
+    def remaining_time(self):
+        """Temps restant en secondes (jamais négatif), ou None sans limite de temps."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
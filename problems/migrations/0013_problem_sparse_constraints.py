@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0012_alter_problem_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problem',
+            name='sparse_constraints',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
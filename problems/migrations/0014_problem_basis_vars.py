@@ -0,0 +1,23 @@
+# Generated by Django 4.2.21 on 2026-10-18 16:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0013_problem_sparse_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problem',
+            name='basis_vars',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='problem',
+            name='solved_fingerprint',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
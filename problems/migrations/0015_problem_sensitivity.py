@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0014_problem_basis_vars'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problem',
+            name='sensitivity',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 16:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0015_problem_sensitivity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problem',
+            name='bounds',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
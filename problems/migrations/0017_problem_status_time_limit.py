@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 16:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0016_problem_bounds'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='problem',
+            name='status',
+            field=models.CharField(choices=[('optimal', 'Solution optimale trouvée'), ('infeasible', 'Problème infaisable'), ('unbounded', 'Problème non borné'), ('error', 'Erreur lors de la résolution'), ('time_limit', "Résolution interrompue (limite de temps ou d'itérations)"), ('unsupported', 'Type de problème non supporté'), ('pending', 'En attente de résolution')], default='pending', max_length=20),
+        ),
+    ]
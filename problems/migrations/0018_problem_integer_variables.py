@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0017_problem_status_time_limit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problem',
+            name='integer_variables',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
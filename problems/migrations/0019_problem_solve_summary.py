@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0018_problem_integer_variables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problem',
+            name='solve_summary',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
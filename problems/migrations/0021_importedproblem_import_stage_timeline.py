@@ -0,0 +1,23 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0020_problem_status_queued_running'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importedproblem',
+            name='import_stage',
+            field=models.CharField(blank=True, max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name='importedproblem',
+            name='import_timeline',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
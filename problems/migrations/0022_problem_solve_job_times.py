@@ -0,0 +1,23 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('problems', '0021_importedproblem_import_stage_timeline'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problem',
+            name='solve_queued_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='problem',
+            name='solve_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
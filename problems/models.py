@@ -5,6 +5,9 @@ from django.utils.translation import gettext_lazy as _
 import json
 from django.contrib.auth.models import User
 
+from problems.program import LinearProgram
+from problems.sparse import SPARSE_DENSITY_THRESHOLD, constraints_density, constraints_to_sparse
+
 class Problem(models.Model):
     """
     Représente un problème de Programmation Linéaire.
@@ -33,11 +36,22 @@ class Problem(models.Model):
     # Ex: [{"coefficients": [1, 1], "sense": "<=", "rhs": 10}, {"coefficients": [2, 0], "sense": ">=", "rhs": 5}]
     constraints = models.JSONField(blank=True, null=True)
 
+    # Même matrice de contraintes en forme creuse (CSR), renseignée automatiquement lorsque la densité
+    # est faible. Ex: {"matrix": {"format": "csr", "shape": [2, 2], "data": [...], "indices": [...], "indptr": [...]},
+    #                  "senses": ["<=", ">="], "rhs": [10, 5]}
+    sparse_constraints = models.JSONField(blank=True, null=True)
+
     # Noms des variables, utile pour l'affichage (ex: ['x1', 'x2'])
     variable_names = models.JSONField(default=list, blank=True)
 
     # Nombre de variables, peut être déduit mais utile à stocker
     num_variables = models.IntegerField(null=True, blank=True)
+    # Bornes des variables [inférieure, supérieure] (null pour +inf), traitées par le solveur sans ligne
+    # de contrainte. Ex: [[0, 40], [2, null]] pour 0 <= x1 <= 40 et x2 >= 2 ; null : toutes dans [0, +inf)
+    bounds = models.JSONField(blank=True, null=True)
+    # Indices des variables astreintes à des valeurs entières (programme linéaire en nombres entiers
+    # ou mixte, résolu par séparation et évaluation). Ex: [0, 2] pour x1 et x3 ; null : aucune
+    integer_variables = models.JSONField(blank=True, null=True)
     # --- Fin des champs PL ---
 
 
@@ -49,8 +63,11 @@ class Problem(models.Model):
         ('infeasible', 'Problème infaisable'),
         ('unbounded', 'Problème non borné'),
         ('error', 'Erreur lors de la résolution'),
+        ('time_limit', "Résolution interrompue (limite de temps ou d'itérations)"),
         ('unsupported', 'Type de problème non supporté'),
         ('pending', 'En attente de résolution'),
+        ('queued', "Résolution en file d'attente"),
+        ('running', 'Résolution en cours'),
     ]
     status = models.CharField(
         max_length=20,
@@ -60,6 +77,24 @@ class Problem(models.Model):
     # Stocke tous les tableaux d'itérations, pour affichage pas à pas.
     # Chaque élément de la liste est un tableau NumPy converti en liste de listes Python.
     tableaus_history = models.JSONField(blank=True, null=True)
+    # Base finale de la dernière résolution (indices des colonnes de base, écarts compris),
+    # point de départ de la résolution suivante après modification du problème. Ex: [0, 3, 1]
+    basis_vars = models.JSONField(blank=True, null=True)
+    # Empreinte des données et des réglages de la dernière résolution (CanonicalProblem.fingerprint) :
+    # basis_vars et tableaus_history ne valent que pour ces données
+    solved_fingerprint = models.CharField(max_length=64, blank=True, null=True)
+    # Analyse de sensibilité de la solution optimale, calculée avec elle (aucune nouvelle résolution).
+    # Ex: {"shadow_prices": [...], "reduced_costs": [...],
+    #      "rhs_ranges": [{"current": 10, "lower": 6, "upper": null}, ...], "objective_ranges": [...]}
+    sensitivity = models.JSONField(blank=True, null=True)
+    # Résumé de la dernière résolution : itérations, durée, moteur, et le détail de l'instrumentation
+    # si elle est activée (SIMPLEX_INSTRUMENTATION). Ex: {"iterations": 4, "solve_ms": 1.8, "engine": "tableau",
+    # "cached": false, "phases_ms": {"pricing": 0.1, ...}, "degenerate_pivots": 0, "basis_condition": 12.5, ...}
+    solve_summary = models.JSONField(blank=True, null=True)
+    # Mise en file et prise en charge de la dernière résolution en arrière-plan (problems.jobs) : un problème
+    # resté 'queued' ou 'running' au-delà de SIMPLEX_SOLVE_JOB_TIMEOUT est considéré comme abandonné
+    solve_queued_at = models.DateTimeField(blank=True, null=True)
+    solve_started_at = models.DateTimeField(blank=True, null=True)
     # --- Fin des champs pour la résolution ---
 
     date_created = models.DateTimeField(auto_now_add=True)
@@ -83,13 +118,40 @@ class Problem(models.Model):
                         raise ValidationError(_(f'Constraint {i+1} has an invalid sense.'))
                     if 'rhs' not in constraint or not isinstance(constraint['rhs'], (int, float)):
                         raise ValidationError(_(f'Constraint {i+1} has an invalid right-hand side value.'))
+            if self.bounds is not None:
+                if len(self.bounds) != self.num_variables:
+                    raise ValidationError(_('The number of variable bounds must match the number of variables.'))
+                for j, bound in enumerate(self.bounds):
+                    if not isinstance(bound, list) or len(bound) != 2 or not isinstance(bound[0], (int, float)) \
+                       or not (bound[1] is None or isinstance(bound[1], (int, float))):
+                        raise ValidationError(_(f'Variable {j+1} has invalid bounds.'))
+            if self.integer_variables is not None:
+                if any(not isinstance(j, int) or not 0 <= j < self.num_variables for j in self.integer_variables):
+                    raise ValidationError(_('Integer variables must be indices of existing variables.'))
         else:
             # num_variables est None, les champs comme objective_coefficients (None)
             # et variable_names ([]) sont maintenant autorisés à être "blank"
             # donc full_clean ne devrait plus poser de problème pour eux à ce stade.
             pass
 
+    def refresh_sparse_constraints(self):
+        if self.constraints and constraints_density(self.constraints) <= SPARSE_DENSITY_THRESHOLD:
+            self.sparse_constraints = constraints_to_sparse(self.constraints)
+        else:
+            self.sparse_constraints = None
+
+    def get_solver_constraints(self):
+        """Contraintes à transmettre au SimplexSolver : la forme creuse si elle existe."""
+        return self.sparse_constraints or self.constraints
+
+    def get_program(self):
+        """Programme linéaire en tableaux NumPy (LinearProgram), construit une fois et passé tel quel au solveur."""
+        return LinearProgram.from_constraints(self.objective_type, self.objective_coefficients,
+                                              self.get_solver_constraints(), names=self.variable_names or None)
+
     def save(self, *args, **kwargs):
+        if kwargs.get('update_fields') is None:
+            self.refresh_sparse_constraints()
         self.full_clean()
         super().save(*args, **kwargs)
 
@@ -132,6 +194,12 @@ class ImportedProblem(Problem):
         null=True,
         blank=True
     )
+    # Étape en cours de l'importation en arrière-plan (problems.import_pipeline.STAGES), null une fois terminée
+    import_stage = models.CharField(max_length=20, blank=True, null=True)
+    # Horodatage de chaque étape (pour les étapes par page : première page commencée, toutes les pages terminées)
+    # et pages traitées. Ex: {"rasterize": {"queued_at": "...", "started_at": "...", "completed_at": "..."},
+    #                         "extract": {...}, ..., "pages": {"total": 12, "processed": 3}}
+    import_timeline = models.JSONField(blank=True, null=True)
 
     def __str__(self):
         return f"{self.nom} (Importé)"
@@ -0,0 +1,310 @@
+# problems/parametric.py
+"""
+Analyse paramétrique : second membre b(t) = b + t d ou objectif c(t) = c + t d, pour t
+dans un intervalle [t_min, t_max].
+
+Une seule résolution complète est faite, au début de l'intervalle. Le tableau optimal est
+ensuite augmenté de la dérivée en t (colonne B^-1 d' pour le second membre, ligne de coûts
+réduits de d' pour l'objectif) : chaque pivot la met à jour comme le reste du tableau.
+Entre deux points de rupture la base reste optimale et la valeur optimale est affine en t ;
+à chaque point de rupture, un seul pivot (dual pour le second membre, primal pour
+l'objectif) donne la base du morceau suivant.
+
+Les bornes éventuelles des variables (option `bounds`) sont réécrites en contraintes
+explicites : le balayage pivote sur le tableau complet, sans variables complémentées.
+"""
+
+import numpy as np
+
+from problems.bounds import bounds_to_constraints
+from problems.simplex import SimplexSolver, ENGINE_TABLEAU, HISTORY_NONE, pivot_in_place
+from problems.sparse import as_compressed
+
+PARAMETRIC_TOLERANCE = 1e-9
+
+SWEEP_RHS = 'rhs'
+SWEEP_OBJECTIVE = 'objective'
+
+
+def rhs_sweep(objective_type, objective_coefficients, constraints, direction, interval, values=None, **solver_options):
+    """
+    Valeur optimale en fonction de t pour le second membre b + t * direction.
+    `constraints` a le format accepté par SimplexSolver (liste de dicts ou forme creuse).
+    Si `values` est fourni, la fonction est aussi évaluée en ces points (sans nouveau pivot).
+    """
+    t_min, t_max = _check_interval(interval)
+    direction = _check_direction(direction, len(_rhs_of(constraints)), "du second membre")
+    constraints, solver_options = _with_bound_rows(constraints, len(objective_coefficients), solver_options)
+    # Les lignes des bornes ne bougent pas avec t
+    direction = np.concatenate([direction, np.zeros(len(_rhs_of(constraints)) - direction.size)])
+
+    def make_solver(t):
+        return _make_solver(objective_type, objective_coefficients, _shift_rhs(constraints, direction, t), solver_options)
+
+    solver = make_solver(t_min)
+    result = solver.solve()
+    start = t_min
+    if result['status'] == 'infeasible':
+        # L'ensemble des t réalisables est un intervalle : on cherche sa borne inférieure
+        start = _first_feasible_rhs_parameter(solver, direction, t_min, t_max)
+        if start is None:
+            return _sweep_result(SWEEP_RHS, t_min, t_max, [_piece(t_min, t_max, 'infeasible')], 0, values)
+        solver = make_solver(start)
+        result = solver.solve()
+
+    pieces = [_piece(t_min, start, 'infeasible')] if start > t_min else []
+    if result['status'] != 'optimal':
+        # Problème non borné (ou erreur) : le dual ne dépend pas de b, l'état vaut pour tout t réalisable
+        pieces.append(_piece(start, t_max, result['status']))
+        return _sweep_result(SWEEP_RHS, t_min, t_max, pieces, 0, values)
+
+    tableau, basis_vars = _optimal_tableau(solver, result)
+    num_rows = len(basis_vars)
+    d_std = solver._row_signs() * direction
+    # Colonne de la dérivée, insérée avant le second membre : B^-1 d' et, en ligne Z, y'.d'
+    d_column = np.linalg.solve(solver._basis_matrix(solver._constraint_matrix()[0], basis_vars), d_std)
+    c_full = solver._standard_costs(num_rows)
+    tableau = np.insert(tableau, -1, np.append(d_column, c_full[basis_vars] @ d_column), axis=1)
+
+    sign = solver._objective_sign()
+    num_vars = solver.num_original_variables
+    t, pivots = start, 0
+    while True:
+        x0, dx = tableau[:-1, -1], tableau[:-1, -2]
+        # x_B(t) = x0 + (t - start) dx reste >= 0 jusqu'au premier t où une composante s'annule
+        leaving, t_next = None, t_max
+        for r in np.flatnonzero(dx < -PARAMETRIC_TOLERANCE):
+            t_r = start - x0[r] / dx[r]
+            if t_r < t_next - PARAMETRIC_TOLERANCE:
+                leaving, t_next = r, max(t_r, t)
+
+        pieces.append(_optimal_piece(
+            t, t_next, start, sign, tableau[-1, -1], tableau[-1, -2],
+            _solution(basis_vars, x0, num_vars), _solution(basis_vars, dx, num_vars), basis_vars,
+        ))
+        if leaving is None:
+            break
+        if pivots >= solver.iteration_limit:
+            pieces.append(_piece(t_next, t_max, 'error'))
+            break
+
+        entering = solver._dual_ratio_test(tableau[-1, :-2], tableau[leaving, :-2])
+        if entering is None:
+            # Au-delà de t_next, la ligne `leaving` n'admet plus de solution
+            pieces.append(_piece(t_next, t_max, 'infeasible'))
+            break
+        pivot_in_place(tableau, leaving, entering)
+        basis_vars[leaving] = entering
+        pivots += 1
+        t = t_next
+
+    return _sweep_result(SWEEP_RHS, t_min, t_max, pieces, pivots, values)
+
+
+def objective_sweep(objective_type, objective_coefficients, constraints, direction, interval, values=None, **solver_options):
+    """Valeur optimale en fonction de t pour l'objectif c + t * direction (mêmes conventions que rhs_sweep)."""
+    t_min, t_max = _check_interval(interval)
+    direction = _check_direction(direction, len(objective_coefficients), "de l'objectif")
+    constraints, solver_options = _with_bound_rows(constraints, len(objective_coefficients), solver_options)
+    base_c = np.asarray(objective_coefficients, dtype=float)
+
+    def make_solver(t):
+        return _make_solver(objective_type, (base_c + t * direction).tolist(), constraints, solver_options)
+
+    solver = make_solver(t_min)
+    result = solver.solve()
+    start = t_min
+    if result['status'] == 'unbounded':
+        # L'ensemble des t pour lesquels le problème est borné est un intervalle : borne inférieure
+        start = _first_bounded_objective_parameter(solver, base_c, direction, t_min, t_max)
+        if start is None:
+            return _sweep_result(SWEEP_OBJECTIVE, t_min, t_max, [_piece(t_min, t_max, 'unbounded')], 0, values)
+        solver = make_solver(start)
+        result = solver.solve()
+
+    pieces = [_piece(t_min, start, 'unbounded')] if start > t_min else []
+    if result['status'] != 'optimal':
+        # Problème infaisable (ou erreur) : la réalisabilité ne dépend pas de c
+        pieces.append(_piece(start, t_max, result['status']))
+        return _sweep_result(SWEEP_OBJECTIVE, t_min, t_max, pieces, 0, values)
+
+    tableau, basis_vars = _optimal_tableau(solver, result)
+    num_rows = len(basis_vars)
+    sign = solver._objective_sign()
+    d_full = np.concatenate([sign * direction, np.zeros(num_rows)])
+    # Ligne de la dérivée des coûts réduits (convention de la ligne Z), ajoutée sous la ligne Z
+    derivative = d_full[basis_vars] @ tableau[:-1, :]
+    derivative[:-1] -= d_full
+    tableau = np.vstack([tableau, derivative])
+
+    num_vars = solver.num_original_variables
+    t, pivots = start, 0
+    while True:
+        z0, dz = tableau[-2, :-1], tableau[-1, :-1]
+        # Coûts réduits z0 + (t - start) dz >= 0 jusqu'au premier t où l'un d'eux s'annule
+        entering, t_next = None, t_max
+        for j in np.flatnonzero(dz < -PARAMETRIC_TOLERANCE):
+            t_j = start - z0[j] / dz[j]
+            if t_j < t_next - PARAMETRIC_TOLERANCE:
+                entering, t_next = j, max(t_j, t)
+
+        solution = _solution(basis_vars, tableau[:-2, -1], num_vars)
+        pieces.append(_optimal_piece(
+            t, t_next, start, sign, tableau[-2, -1], tableau[-1, -1], solution, np.zeros(num_vars), basis_vars,
+        ))
+        if entering is None:
+            break
+        if pivots >= solver.iteration_limit:
+            pieces.append(_piece(t_next, t_max, 'error'))
+            break
+
+        leaving = solver._ratio_test(tableau[:-2, -1], tableau[:-2, entering])
+        if leaving is None:
+            pieces.append(_piece(t_next, t_max, 'unbounded'))
+            break
+        pivot_in_place(tableau, leaving, entering)
+        basis_vars[leaving] = entering
+        pivots += 1
+        t = t_next
+
+    return _sweep_result(SWEEP_OBJECTIVE, t_min, t_max, pieces, pivots, values)
+
+
+def evaluate_sweep(sweep, t):
+    """
+    Valeur optimale au point t d'un balayage déjà calculé (None hors des morceaux optimaux).
+    Un point de rupture appartient aux deux morceaux voisins : l'optimum y est atteint dès que
+    l'un d'eux est optimal (borne d'un intervalle réalisable, par exemple).
+    """
+    for piece in sweep['pieces']:
+        if piece['status'] == 'optimal' and piece['start'] - PARAMETRIC_TOLERANCE <= t <= piece['end'] + PARAMETRIC_TOLERANCE:
+            return piece['value_start'] + piece['slope'] * (t - piece['start'])
+    return None
+
+
+def _make_solver(objective_type, objective_coefficients, constraints, solver_options):
+    # Le balayage travaille sur le tableau complet, à l'échelle d'origine : moteur tableau, sans historique
+    # ni présolution (la base finale doit couvrir toutes les lignes, même quand la présolution les retirerait)
+    options = dict(solver_options, engine=ENGINE_TABLEAU, history=HISTORY_NONE, scaling=None, presolve=False)
+    return SimplexSolver(objective_type, objective_coefficients, constraints, **options)
+
+
+def _with_bound_rows(constraints, num_variables, solver_options):
+    bounds = solver_options.get('bounds')
+    if bounds is None:
+        return constraints, solver_options
+    if isinstance(constraints, dict):
+        dense = as_compressed(constraints['matrix']).to_dense()
+        constraints = [{'coefficients': dense[i].tolist(), 'sense': sense, 'rhs': rhs}
+                       for i, (sense, rhs) in enumerate(zip(constraints['senses'], constraints['rhs']))]
+    options = {key: value for key, value in solver_options.items() if key != 'bounds'}
+    return list(constraints) + bounds_to_constraints(bounds, num_variables), options
+
+
+def _check_interval(interval):
+    t_min, t_max = (float(v) for v in interval)
+    if t_max < t_min:
+        raise ValueError(f"Intervalle du paramètre invalide : [{t_min}, {t_max}].")
+    return t_min, t_max
+
+
+def _check_direction(direction, size, label):
+    direction = np.asarray(direction, dtype=float)
+    if direction.shape != (size,):
+        raise ValueError(f"La direction {label} doit contenir {size} valeurs, reçu {direction.size}.")
+    return direction
+
+
+def _rhs_of(constraints):
+    if isinstance(constraints, dict):
+        return constraints['rhs']
+    return [c.get('rhs', 0.0) for c in constraints]
+
+
+def _shift_rhs(constraints, direction, t):
+    rhs = [float(value) + t * float(d) for value, d in zip(_rhs_of(constraints), direction)]
+    if isinstance(constraints, dict):
+        return dict(constraints, rhs=rhs)
+    return [dict(c, rhs=value) for c, value in zip(constraints, rhs)]
+
+
+def _optimal_tableau(solver, result):
+    # Tableau optimal (forme standard) reconstruit depuis la base finale : un seul système linéaire
+    basis_vars = list(result['basis_vars'])
+    return solver._tableau_from_basis(basis_vars), basis_vars
+
+
+def _solution(basis_vars, basic_values, num_vars):
+    solution = np.zeros(num_vars)
+    for i, var_idx in enumerate(basis_vars):
+        if var_idx < num_vars:
+            solution[var_idx] = basic_values[i]
+    return solution
+
+
+def _piece(start, end, status):
+    return {'start': float(start), 'end': float(end), 'status': status}
+
+
+def _optimal_piece(start, end, origin, sign, value, slope, solution, solution_slope, basis_vars):
+    # Valeur (forme standard) value + (t - origin) slope, reconvertie au sens de l'objectif saisi
+    value_start = sign * (value + (start - origin) * slope)
+    return dict(
+        _piece(start, end, 'optimal'),
+        value_start=float(value_start),
+        value_end=float(value_start + sign * slope * (end - start)),
+        slope=float(sign * slope),
+        solution_start=(solution + (start - origin) * solution_slope).tolist(),
+        solution_end=(solution + (end - origin) * solution_slope).tolist(),
+        basis_vars=[int(j) for j in basis_vars],
+    )
+
+
+def _sweep_result(kind, t_min, t_max, pieces, pivots, values):
+    pieces = [piece for piece in pieces if piece['end'] > piece['start'] + PARAMETRIC_TOLERANCE] or pieces[:1]
+    sweep = {
+        'kind': kind,
+        'interval': [t_min, t_max],
+        'pieces': pieces,
+        'breakpoints': [piece['start'] for piece in pieces[1:]],
+        'pivots': pivots,
+    }
+    if values is not None:
+        sweep['values'] = [evaluate_sweep(sweep, float(t)) for t in values]
+    return sweep
+
+
+def _first_feasible_rhs_parameter(solver, direction, t_min, t_max):
+    """
+    Plus petit t de [t_min, t_max] pour lequel A'x <= b' + t d' admet une solution :
+    min u s.c. A'x - d' u <= b'(t_min), u <= t_max - t_min, x, u >= 0 (t = t_min + u).
+    """
+    A, b = solver._constraint_matrix()
+    A = A.to_dense() if hasattr(A, 'to_dense') else A
+    d_std = solver._row_signs() * direction
+    num_vars = A.shape[1]
+    constraints = [{'coefficients': A[i].tolist() + [-d_std[i]], 'sense': '<=', 'rhs': float(b[i])} for i in range(A.shape[0])]
+    constraints.append({'coefficients': [0.0] * num_vars + [1.0], 'sense': '<=', 'rhs': t_max - t_min})
+    result = SimplexSolver('min', [0.0] * num_vars + [1.0], constraints, history=HISTORY_NONE).solve()
+    if result['status'] != 'optimal':
+        return None
+    return t_min + result['optimal_value']
+
+
+def _first_bounded_objective_parameter(solver, base_c, direction, t_min, t_max):
+    """
+    Plus petit t de [t_min, t_max] pour lequel le dual de la forme standard est réalisable :
+    min u s.c. A'^T y - d' u >= c'(t_min), u <= t_max - t_min, y, u >= 0 (t = t_min + u).
+    """
+    A, _ = solver._constraint_matrix()
+    A = A.to_dense() if hasattr(A, 'to_dense') else A
+    sign = solver._objective_sign()
+    c_std, d_std = sign * base_c, sign * direction
+    num_rows = A.shape[0]
+    constraints = [{'coefficients': A[:, j].tolist() + [-d_std[j]], 'sense': '>=', 'rhs': float(c_std[j] + t_min * d_std[j])}
+                   for j in range(A.shape[1])]
+    constraints.append({'coefficients': [0.0] * num_rows + [1.0], 'sense': '<=', 'rhs': t_max - t_min})
+    result = SimplexSolver('min', [0.0] * num_rows + [1.0], constraints, history=HISTORY_NONE).solve()
+    if result['status'] != 'optimal':
+        return None
+    return t_min + result['optimal_value']
@@ -0,0 +1,426 @@
+# problems/presolve.py
+"""
+Présolution : réductions appliquées au problème avant toute construction de tableau,
+puis postsolution qui replace le résultat du problème réduit dans les variables et
+contraintes d'origine.
+
+Réductions (forme standard a x <= b, x >= 0, lignes '>=' changées de signe), répétées
+jusqu'à ce qu'aucune ne s'applique plus :
+- ligne vide : supprimée si 0 <= b, sinon problème infaisable ;
+- ligne singleton a x_j <= b : redondante si a < 0 et b >= 0, fixe x_j = 0 si a > 0 et
+  b = 0, infaisable si a > 0 et b < 0 (les autres restent : ce sont des bornes) ;
+- lignes en double (proportionnelles avec un facteur positif) : seule la plus serrée reste ;
+- colonne vide : la variable est fixée à 0 (à sa borne inférieure) ; si son coût l'attire,
+  elle est fixée à sa borne supérieure, ou le problème est non borné dès qu'il est réalisable.
+Les réductions de lignes singleton supposent x_j >= 0 : elles ne touchent que les variables
+de borne inférieure nulle. Les bornes des colonnes conservées passent au problème réduit.
+Les contraintes d'égalité ne sont pas réduites (elles sont conservées telles quelles).
+"""
+
+import time
+
+import numpy as np
+
+from problems.bounds import normalize_bounds, serialize_bounds
+from problems.limits import STATUS_TIME_LIMIT
+from problems.program import SENSE_GE, SENSE_LE, LinearProgram
+from problems.sparse import CSRMatrix
+
+PRESOLVE_TOLERANCE = 1e-9
+
+
+class Presolve:
+    """
+    Résultat d'une présolution : problème réduit (`program`, LinearProgram dense ou creux comme
+    le problème d'entrée), correspondance avec le problème d'origine et statistiques.
+    `constraints` : LinearProgram, liste de contraintes ou forme creuse {'matrix', 'senses', 'rhs'}.
+    """
+
+    def __init__(self, objective_type, objective_coefficients, constraints, bounds=None):
+        start = time.perf_counter()
+        self.objective_type = objective_type.lower()
+        self.c = np.array(objective_coefficients, dtype=float)
+        self.has_bounds = bounds is not None
+        self.lower, self.upper = normalize_bounds(bounds, self.c.size)
+        program = LinearProgram.from_constraints(objective_type, objective_coefficients, constraints)
+        self.sparse_input = program.is_sparse
+        self.A = program.A.tocsr() if self.sparse_input else CSRMatrix.from_dense(program.A)
+        self.senses = program.senses.tolist()
+        # b : second membre d'origine (postsolution) ; reduced_b : décalé par les variables fixées
+        self.b = program.b
+        self.reduced_b = program.b
+
+        self.num_rows, self.num_columns = self.A.shape
+        self.active_rows = np.ones(self.num_rows, dtype=bool)
+        self.active_columns = np.ones(self.num_columns, dtype=bool)
+        self.fixed_values = np.zeros(self.num_columns)
+        self.empty_columns = []
+        # Colonne fixée à 0 par une ligne singleton a x_j <= 0 -> indice de cette ligne
+        self.fixing_rows = {}
+        self.unbounded_columns = []
+        self.status = None
+        self.stats = {'empty_rows': 0, 'singleton_rows': 0, 'duplicate_rows': 0, 'fixed_columns': 0, 'empty_columns': 0}
+
+        self._reduce()
+        self.kept_rows = np.flatnonzero(self.active_rows)
+        self.kept_columns = np.flatnonzero(self.active_columns)
+        self.program = self._reduced_problem()
+        self.bounds = serialize_bounds(self.lower[self.kept_columns], self.upper[self.kept_columns]) if self.has_bounds else None
+        self.presolve_time = time.perf_counter() - start
+
+    @property
+    def is_empty(self):
+        return self.kept_rows.size == 0 and self.kept_columns.size == 0
+
+    def _row_signs(self):
+        return np.array([-1.0 if sense == SENSE_GE else 1.0 for sense in self.senses])
+
+    def _reduce(self):
+        signs = self._row_signs()
+        # Les lignes d'égalité ne sont jamais réduites, mais leurs coefficients occupent les colonnes
+        reducible = np.array([sense in (SENSE_LE, SENSE_GE) for sense in self.senses], dtype=bool)
+        entry_rows = self.A._major_index_of_entries()
+        entry_values = self.A.data * signs[entry_rows]
+        standard_cost = (-1.0 if self.objective_type == 'min' else 1.0) * self.c
+
+        changed = True
+        while changed and self.status is None:
+            changed = False
+            standard_rhs = signs * self.reduced_b
+            live = self.active_rows[entry_rows] & self.active_columns[self.A.indices] & (np.abs(self.A.data) > PRESOLVE_TOLERANCE)
+            row_counts = np.bincount(entry_rows[live], minlength=self.num_rows)
+            column_counts = np.bincount(self.A.indices[live], minlength=self.num_columns)
+
+            for i in np.flatnonzero(self.active_rows & reducible & (row_counts == 0)):
+                if standard_rhs[i] < -PRESOLVE_TOLERANCE:
+                    self.status = 'infeasible'
+                    return
+                self.active_rows[i] = False
+                self.stats['empty_rows'] += 1
+                changed = True
+
+            for i in np.flatnonzero(self.active_rows & reducible & (row_counts == 1)):
+                entry = self.A.indptr[i] + int(np.flatnonzero(live[self.A.indptr[i]:self.A.indptr[i + 1]])[0])
+                j, a = self.A.indices[entry], entry_values[entry]
+                if not self.active_columns[j] or self.lower[j] != 0.0:
+                    continue
+                rhs = standard_rhs[i]
+                if a > 0 and rhs < -PRESOLVE_TOLERANCE:
+                    self.status = 'infeasible'
+                    return
+                if a > 0 and rhs <= PRESOLVE_TOLERANCE:
+                    # a x_j <= 0 avec x_j >= 0 : la variable est fixée à 0
+                    self._fix_column(j, 0.0)
+                    self.fixing_rows[int(j)] = int(i)
+                    self.stats['fixed_columns'] += 1
+                elif a > 0:
+                    # Borne supérieure x_j <= b / a : conservée comme contrainte
+                    continue
+                elif rhs < -PRESOLVE_TOLERANCE:
+                    # Borne inférieure strictement positive : conservée comme contrainte
+                    continue
+                self.active_rows[i] = False
+                self.stats['singleton_rows'] += 1
+                changed = True
+
+            for j in np.flatnonzero(self.active_columns & (column_counts == 0)):
+                value = self.lower[j]
+                if standard_cost[j] > PRESOLVE_TOLERANCE:
+                    if np.isfinite(self.upper[j]):
+                        value = self.upper[j]
+                    else:
+                        self.unbounded_columns.append(int(j))
+                self.empty_columns.append(int(j))
+                self._fix_column(j, value)
+                self.stats['empty_columns'] += 1
+                changed = True
+
+            changed = self._remove_duplicate_rows(entry_rows, entry_values, standard_rhs, reducible) or changed
+
+    def _fix_column(self, j, value):
+        # x_j = value : la contribution de la colonne passe dans le second membre du problème réduit
+        self.active_columns[j] = False
+        self.fixed_values[j] = value
+        if value != 0.0:
+            column = self.A.getcol(j)
+            self.reduced_b = self.reduced_b - column * value
+
+    def _remove_duplicate_rows(self, entry_rows, entry_values, standard_rhs, reducible):
+        kept = {}
+        removed = False
+        for i in np.flatnonzero(self.active_rows & reducible):
+            lo, hi = self.A.indptr[i], self.A.indptr[i + 1]
+            live = self.active_columns[self.A.indices[lo:hi]] & (np.abs(self.A.data[lo:hi]) > PRESOLVE_TOLERANCE)
+            columns, values = self.A.indices[lo:hi][live], entry_values[lo:hi][live]
+            if columns.size == 0:
+                continue
+            order = np.argsort(columns)
+            scale = np.abs(values).max()
+            key = (tuple(columns[order]), tuple(np.round(values[order] / scale, 12)))
+            rhs = standard_rhs[i] / scale
+            if key not in kept:
+                kept[key] = (i, rhs)
+                continue
+            # Même ligne à un facteur positif près : seule la plus serrée (plus petit b / facteur) reste
+            other, other_rhs = kept[key]
+            loser = i if rhs >= other_rhs else other
+            if loser == other:
+                kept[key] = (i, rhs)
+            self.active_rows[loser] = False
+            self.stats['duplicate_rows'] += 1
+            removed = True
+        return removed
+
+    def _reduced_problem(self):
+        matrix = self._reduced_matrix()
+        senses = [self.senses[i] for i in self.kept_rows]
+        return LinearProgram(self.objective_type, self.c[self.kept_columns], matrix if self.sparse_input else matrix.to_dense(),
+                             self.reduced_b[self.kept_rows], senses)
+
+    def _reduced_matrix(self):
+        # Sous-matrice CSR des lignes et colonnes conservées, sans densification
+        entry_rows = self.A._major_index_of_entries()
+        keep = self.active_rows[entry_rows] & self.active_columns[self.A.indices]
+        row_map = np.full(self.num_rows, -1)
+        row_map[self.kept_rows] = np.arange(self.kept_rows.size)
+        column_map = np.full(self.num_columns, -1)
+        column_map[self.kept_columns] = np.arange(self.kept_columns.size)
+        rows = row_map[entry_rows[keep]]
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=self.kept_rows.size))])
+        return CSRMatrix(self.A.data[keep], column_map[self.A.indices[keep]], indptr, (self.kept_rows.size, self.kept_columns.size))
+
+    def report(self, solve_time=None):
+        """Lignes et colonnes supprimées, temps de présolution et estimation du temps gagné."""
+        report = dict(
+            self.stats,
+            rows_removed=int(self.num_rows - self.kept_rows.size),
+            columns_removed=int(self.num_columns - self.kept_columns.size),
+            original_size=[self.num_rows, self.num_columns],
+            reduced_size=[int(self.kept_rows.size), int(self.kept_columns.size)],
+            presolve_time=self.presolve_time,
+            solve_time=solve_time,
+            estimated_time_saved=None,
+        )
+        if solve_time is not None:
+            # Estimation : même nombre de pivots, coût d'un pivot proportionnel à la taille du tableau
+            original_cells = (self.num_rows + 1) * (self.num_columns + self.num_rows + 1)
+            reduced_cells = (self.kept_rows.size + 1) * (self.kept_columns.size + self.kept_rows.size + 1)
+            report['estimated_time_saved'] = solve_time * (original_cells / reduced_cells - 1.0) - self.presolve_time
+        return report
+
+    def reduced_basis(self, basis_vars):
+        """Base exprimée dans les indices d'origine -> base du problème réduit (None si elle ne correspond plus)."""
+        if not basis_vars:
+            return None
+        column_index = {int(j): k for k, j in enumerate(self.kept_columns)}
+        row_index = {int(i): k for k, i in enumerate(self.kept_rows)}
+        num_kept_columns = self.kept_columns.size
+        reduced = []
+        for j in basis_vars:
+            if j < self.num_columns and j in column_index:
+                reduced.append(column_index[j])
+            elif j >= self.num_columns and j - self.num_columns in row_index:
+                reduced.append(num_kept_columns + row_index[j - self.num_columns])
+        return reduced if len(reduced) == self.kept_rows.size else None
+
+    def original_column(self, j):
+        # Indice d'une colonne du tableau réduit (variable ou écart) dans le tableau d'origine
+        num_kept_columns = self.kept_columns.size
+        if j < num_kept_columns:
+            return int(self.kept_columns[j])
+        return self.num_columns + int(self.kept_rows[j - num_kept_columns])
+
+    def reduced_variable_names(self):
+        return [f"x{j + 1}" for j in self.kept_columns] + [f"s{i + 1}" for i in self.kept_rows]
+
+    def postsolve(self, result, solve_time=None):
+        """Replace le résultat du problème réduit dans les variables et contraintes d'origine."""
+        result = dict(result)
+        result['presolve'] = self.report(solve_time)
+        result['variable_names'] = [f"x{j + 1}" for j in range(self.num_columns)] + [f"s{i + 1}" for i in range(self.num_rows)]
+
+        names = self.reduced_variable_names()
+        result['tableaus'] = [dict(entry, variable_names=names) for entry in result.get('tableaus') or []]
+        if result.get('pivot_log'):
+            pivot_log = dict(result['pivot_log'])
+            pivot_log['initial'] = dict(pivot_log['initial'], variable_names=names)
+            result['pivot_log'] = pivot_log
+        reduced_basis = result.get('basis_vars')
+        if reduced_basis is not None:
+            # Les écarts des lignes supprimées complètent la base d'origine
+            result['basis_vars'] = [self.original_column(j) for j in reduced_basis] + \
+                [self.num_columns + int(i) for i in np.flatnonzero(~self.active_rows)]
+
+        # Une résolution interrompue ('time_limit') sur une base réalisable a aussi sa solution courante
+        if result['status'] not in ('optimal', STATUS_TIME_LIMIT) or result.get('solution') is None:
+            return result
+        if self.unbounded_columns and result['status'] == 'optimal':
+            # Une variable absente des contraintes améliore l'objectif sans limite
+            result.update(status='unbounded', solution=None, optimal_value=None, sensitivity=None)
+            return result
+
+        solution = self.fixed_values.copy()
+        solution[self.kept_columns] = result['solution']
+        result['solution'] = solution.tolist()
+        result['optimal_value'] = float(result['optimal_value'] + self.c @ self.fixed_values)
+        if result.get('sensitivity'):
+            result['sensitivity'] = self._postsolve_sensitivity(result['sensitivity'], solution, reduced_basis)
+        return result
+
+    def _postsolve_sensitivity(self, sensitivity, solution, reduced_basis):
+        shadow_prices = np.zeros(self.num_rows)
+        shadow_prices[self.kept_rows] = sensitivity['shadow_prices']
+        reduced_costs = self.c - self.A.rmatvec(shadow_prices)
+        objective_sign = -1.0 if self.objective_type == 'min' else 1.0
+        binding_rows = {}
+        for j, i in self.fixing_rows.items():
+            # La ligne qui fixe x_j = 0 est serrante si x_j améliorerait l'objectif : son prix annule le coût réduit
+            if objective_sign * reduced_costs[j] > PRESOLVE_TOLERANCE:
+                shadow_prices[i] = reduced_costs[j] / self.A.getrow(i)[j]
+                reduced_costs[j] = 0.0
+                binding_rows[i] = j
+        reduced_costs[np.abs(reduced_costs) < PRESOLVE_TOLERANCE] = 0.0
+
+        activity = self.A.matvec(solution)
+        removed_limits = self._removed_rows_limits(activity, reduced_basis)
+        binding_ranges = self._binding_rows_ranges(binding_rows, solution, activity, reduced_basis)
+        rhs_ranges = []
+        kept_rows = {int(i): k for k, i in enumerate(self.kept_rows)}
+        for i in range(self.num_rows):
+            if i in kept_rows:
+                rhs_range = sensitivity['rhs_ranges'][kept_rows[i]]
+                if removed_limits is not None:
+                    rhs_range = _narrow(rhs_range, *removed_limits[kept_rows[i]])
+                rhs_ranges.append(rhs_range)
+            elif i in binding_ranges:
+                rhs_ranges.append(binding_ranges[i])
+            elif self.senses[i] == SENSE_GE:
+                # Contrainte supprimée (non serrante) : elle le reste tant que b ne dépasse pas l'activité
+                rhs_ranges.append({'current': float(self.b[i]), 'lower': None, 'upper': float(activity[i])})
+            else:
+                rhs_ranges.append({'current': float(self.b[i]), 'lower': float(activity[i]), 'upper': None})
+
+        objective_ranges = []
+        kept_columns = {int(j): k for k, j in enumerate(self.kept_columns)}
+        empty_columns = set(self.empty_columns)
+        for j in range(self.num_columns):
+            if j in kept_columns:
+                objective_ranges.append(sensitivity['objective_ranges'][kept_columns[j]])
+            elif j in empty_columns:
+                # Variable absente des contraintes : à sa borne inférieure tant que son coût ne l'attire pas,
+                # à sa borne supérieure tant qu'il l'attire
+                at_lower = (self.objective_type == 'max') != (self.fixed_values[j] > self.lower[j])
+                bound = {'lower': None, 'upper': 0.0} if at_lower else {'lower': 0.0, 'upper': None}
+                objective_ranges.append(dict(current=float(self.c[j]), **bound))
+            else:
+                objective_ranges.append({'current': float(self.c[j]), 'lower': None, 'upper': None})
+
+        return {
+            'shadow_prices': shadow_prices.tolist(),
+            'reduced_costs': reduced_costs.tolist(),
+            'rhs_ranges': rhs_ranges,
+            'objective_ranges': objective_ranges,
+        }
+
+    def _removed_rows_limits(self, activity, reduced_basis):
+        """
+        Variation (low, high) du second membre de chaque ligne conservée au-delà de laquelle une ligne
+        supprimée (doublon moins serré, singleton redondant) deviendrait violée : l'intervalle du problème
+        réduit les ignore. Le second membre b_k bouge la solution de base de d x_B = B^-1 e_k (au signe
+        de la ligne près), l'écart de chaque ligne supprimée de a_r d x. None : rien à restreindre.
+        """
+        removed = np.flatnonzero(~self.active_rows)
+        num_rows, num_columns = self.kept_rows.size, self.kept_columns.size
+        if not removed.size or not num_rows or reduced_basis is None or len(reduced_basis) != num_rows:
+            return None
+        signs = self._row_signs()
+        kept_signs = signs[self.kept_rows]
+        reduced_A = self.program.A.to_dense() if self.sparse_input else np.asarray(self.program.A)
+        basis = np.zeros((num_rows, num_rows))
+        for r, j in enumerate(reduced_basis):
+            if j < num_columns:
+                basis[:, r] = kept_signs * reduced_A[:, j]
+            else:
+                basis[j - num_columns, r] = 1.0
+        try:
+            basic_steps = np.linalg.solve(basis, np.diag(kept_signs))
+        except np.linalg.LinAlgError:
+            return None
+        # Colonne k : variation des variables conservées par unité de b_k (hors base : à leur valeur)
+        steps = np.zeros((num_columns, num_rows))
+        structural = [r for r, j in enumerate(reduced_basis) if j < num_columns]
+        steps[[reduced_basis[r] for r in structural]] = basic_steps[structural]
+
+        removed_A = np.array([self.A.getrow(i)[self.kept_columns] for i in removed]) * signs[removed, None]
+        slacks = np.maximum(signs[removed] * (self.b[removed] - activity[removed]), 0.0)
+        # Écart de la ligne r après une variation delta de b_k : slack_r - delta * growth[r, k] >= 0
+        growth = removed_A @ steps
+        limits = []
+        for k in range(num_rows):
+            low, high = -np.inf, np.inf
+            for slack, rate in zip(slacks, growth[:, k]):
+                if rate > PRESOLVE_TOLERANCE:
+                    high = min(high, slack / rate)
+                elif rate < -PRESOLVE_TOLERANCE:
+                    low = max(low, slack / rate)
+            limits.append((low, high))
+        return limits
+
+    def _binding_rows_ranges(self, binding_rows, solution, activity, reduced_basis):
+        """
+        Intervalle de second membre de chaque ligne supprimée qui fixe x_j = 0 et reste serrante
+        (binding_rows : ligne -> j). Dans la base d'origine, x_j y remplace l'écart de la ligne : la base
+        réduite, x_j pour chaque ligne serrante et l'écart des autres lignes supprimées. Le second membre
+        b_i bouge la solution de base de d x_B = B^-1 e_i (au signe de la ligne près) ; l'intervalle
+        s'arrête à la première variable de base qui atteint une borne.
+        """
+        if not binding_rows or (reduced_basis is None and self.kept_rows.size):
+            return {}
+        signs = self._row_signs()
+        basis = [self.original_column(k) for k in reduced_basis or []] + [
+            binding_rows.get(int(i), self.num_columns + int(i)) for i in np.flatnonzero(~self.active_rows)]
+        if len(basis) != self.num_rows:
+            return {}
+        # Colonnes de la forme standard : s_i a_i x + écart_i = s_i b_i
+        dense = signs[:, None] * self.A.to_dense()
+        matrix = np.zeros((self.num_rows, self.num_rows))
+        for r, j in enumerate(basis):
+            if j < self.num_columns:
+                matrix[:, r] = dense[:, j]
+            else:
+                matrix[j - self.num_columns, r] = 1.0
+        rows = list(binding_rows)
+        try:
+            # Colonne k : variation des variables de base par unité de b de la k-ième ligne serrante
+            steps = np.linalg.solve(matrix, np.eye(self.num_rows)[:, rows] * signs[rows])
+        except np.linalg.LinAlgError:
+            return {}
+        slack_values = signs * (self.b - activity)
+        values = np.array([solution[j] if j < self.num_columns else slack_values[j - self.num_columns] for j in basis])
+        lower = np.array([self.lower[j] if j < self.num_columns else 0.0 for j in basis])
+        upper = np.array([self.upper[j] if j < self.num_columns else np.inf for j in basis])
+
+        ranges = {}
+        for k, i in enumerate(rows):
+            low, high = -np.inf, np.inf
+            for value, step, floor, ceiling in zip(values, steps[:, k], lower, upper):
+                if step > PRESOLVE_TOLERANCE:
+                    low, high = max(low, (floor - value) / step), min(high, (ceiling - value) / step)
+                elif step < -PRESOLVE_TOLERANCE:
+                    low, high = max(low, (ceiling - value) / step), min(high, (floor - value) / step)
+            current = float(self.b[i])
+            ranges[i] = {'current': current, 'lower': current + float(low) if np.isfinite(low) else None,
+                         'upper': current + float(high) if np.isfinite(high) else None}
+        return ranges
+
+
+def _narrow(rhs_range, low, high):
+    """Intervalle de second membre {'current', 'lower', 'upper'} restreint à [current + low, current + high]."""
+    current = rhs_range['current']
+    lower, upper = rhs_range['lower'], rhs_range['upper']
+    if np.isfinite(low):
+        lower = current + low if lower is None else max(lower, current + low)
+    if np.isfinite(high):
+        upper = current + high if upper is None else min(upper, current + high)
+    return {'current': current, 'lower': None if lower is None else float(lower),
+            'upper': None if upper is None else float(upper)}
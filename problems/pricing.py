@@ -0,0 +1,160 @@
+# problems/pricing.py
+"""
+Règles de choix de la colonne entrante (pricing) du simplexe primal.
+
+Une règle ne manipule jamais le tableau directement : le moteur lui fournit une vue
+exposant les quantités dont elle a besoin (coûts réduits au format de la ligne Z,
+ligne pivot, produits scalaires de colonnes). Le même code sert donc au moteur
+tableau et au simplexe révisé.
+"""
+
+import numpy as np
+
+PRICING_TOLERANCE = 1e-9
+
+PRICING_DANTZIG = 'dantzig'
+PRICING_PARTIAL = 'partial'
+PRICING_DEVEX = 'devex'
+PRICING_STEEPEST_EDGE = 'steepest-edge'
+
+
+class PricingRule:
+    """
+    Interface d'une règle de pricing. Les coûts réduits suivent la convention de la ligne Z
+    du tableau (c_B B^-1 a_j - c_j) : une colonne est candidate si son coût réduit est < 0.
+    """
+    name = None
+
+    def start(self, view, basis_vars):
+        """Appelée une fois avant la première itération."""
+        pass
+
+    def select(self, view):
+        """Renvoie l'indice de la colonne entrante, ou None si la base est optimale."""
+        raise NotImplementedError
+
+    def update(self, view, pivot_row, pivot_col, leaving_col, pivot_column):
+        """
+        Appelée juste avant le pivot (la vue décrit encore l'ancienne base).
+        `pivot_column` est B^-1 a_q pour la colonne entrante q.
+        """
+        pass
+
+
+class DantzigPricing(PricingRule):
+    """Coût réduit le plus négatif sur toutes les colonnes."""
+    name = PRICING_DANTZIG
+
+    def select(self, view):
+        reduced_costs = view.reduced_costs()
+        j = int(np.argmin(reduced_costs))
+        return j if reduced_costs[j] < -PRICING_TOLERANCE else None
+
+
+class PartialPricing(PricingRule):
+    """
+    Pricing partiel : les colonnes sont parcourues par segments à partir du segment qui suit
+    le dernier choix ; on retient le meilleur candidat du premier segment qui en contient.
+    Seul le simplexe révisé en tire un gain de calcul (coûts réduits évalués par segment).
+    """
+    name = PRICING_PARTIAL
+
+    def __init__(self, segment_size=None):
+        self.segment_size = segment_size
+        self._offset = 0
+
+    def start(self, view, basis_vars):
+        num_columns = view.num_columns
+        self._size = self.segment_size or max(32, int(np.ceil(num_columns / 8)))
+        self._offset = 0
+
+    def select(self, view):
+        num_columns = view.num_columns
+        num_segments = int(np.ceil(num_columns / self._size))
+        for k in range(num_segments):
+            segment = (self._offset + k) % num_segments
+            start = segment * self._size
+            stop = min(start + self._size, num_columns)
+            reduced_costs = view.reduced_costs(start, stop)
+            j = int(np.argmin(reduced_costs))
+            if reduced_costs[j] < -PRICING_TOLERANCE:
+                self._offset = (segment + 1) % num_segments
+                return start + j
+        return None
+
+
+class _WeightedPricing(PricingRule):
+    """Choix du candidat maximisant d_j^2 / w_j, avec des poids de référence w."""
+
+    def select(self, view):
+        reduced_costs = view.reduced_costs()
+        candidates = reduced_costs < -PRICING_TOLERANCE
+        if not np.any(candidates):
+            return None
+        scores = np.where(candidates, reduced_costs ** 2 / self.weights, -1.0)
+        return int(np.argmax(scores))
+
+
+class DevexPricing(_WeightedPricing):
+    """
+    Devex (Forrest-Goldfarb) : approximation des normes du steepest edge dans un référentiel
+    initial, mise à jour à partir de la seule ligne pivot.
+    """
+    name = PRICING_DEVEX
+
+    # Au-delà, les poids ne sont plus représentatifs : on réinitialise le référentiel
+    RESET_THRESHOLD = 1e6
+
+    def start(self, view, basis_vars):
+        self.weights = np.ones(view.num_columns)
+
+    def update(self, view, pivot_row, pivot_col, leaving_col, pivot_column):
+        alpha_r = view.pivot_row_values(pivot_row)
+        alpha_rq = alpha_r[pivot_col]
+        weight_q = self.weights[pivot_col]
+        ratios = alpha_r / alpha_rq
+        np.maximum(self.weights, ratios ** 2 * weight_q, out=self.weights)
+        self.weights[leaving_col] = max(weight_q / alpha_rq ** 2, 1.0)
+        self.weights[pivot_col] = 1.0
+        if self.weights.max() > self.RESET_THRESHOLD:
+            self.weights.fill(1.0)
+
+
+class SteepestEdgePricing(_WeightedPricing):
+    """
+    Steepest edge exact : w_j = 1 + ||B^-1 a_j||^2, mis à jour à chaque pivot par les
+    formules de Goldfarb-Reid (un produit B^-T alpha_q supplémentaire par itération).
+    """
+    name = PRICING_STEEPEST_EDGE
+
+    def start(self, view, basis_vars):
+        self.weights = 1.0 + view.column_norms_squared()
+
+    def update(self, view, pivot_row, pivot_col, leaving_col, pivot_column):
+        alpha_r = view.pivot_row_values(pivot_row)
+        alpha_rq = pivot_column[pivot_row]
+        weight_q = 1.0 + pivot_column @ pivot_column
+        ratios = alpha_r / alpha_rq
+        dots = view.column_dot_products(pivot_column)
+
+        updated = self.weights - 2.0 * ratios * dots + ratios ** 2 * weight_q
+        np.maximum(updated, 1.0 + ratios ** 2, out=self.weights)
+        self.weights[leaving_col] = max(weight_q / alpha_rq ** 2, 1.0)
+        self.weights[pivot_col] = 1.0
+
+
+PRICING_RULES = {
+    PRICING_DANTZIG: DantzigPricing,
+    PRICING_PARTIAL: PartialPricing,
+    PRICING_DEVEX: DevexPricing,
+    PRICING_STEEPEST_EDGE: SteepestEdgePricing,
+}
+
+
+def make_pricing_rule(pricing):
+    """Instancie une règle à partir de son nom ; une instance de PricingRule est renvoyée telle quelle."""
+    if isinstance(pricing, PricingRule):
+        return pricing
+    if pricing not in PRICING_RULES:
+        raise ValueError(f"Règle de pricing inconnue : {pricing}. Choix possibles : {', '.join(PRICING_RULES)}.")
+    return PRICING_RULES[pricing]()
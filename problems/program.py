@@ -0,0 +1,121 @@
+# problems/program.py
+"""
+Représentation compacte et immuable d'un programme linéaire : max/min c^T x s.c. A x (sens) b.
+
+Construite une seule fois (depuis le JSON d'un Problem ou depuis les listes du parseur),
+elle est passée telle quelle à tous les moteurs : plus de liste de dictionnaires copiée à la
+construction du solveur puis relue contrainte par contrainte avec .get(). Les tableaux NumPy
+sont en lecture seule, ce qui permet de les partager sans copie entre solveurs (pile de
+problèmes, nœuds de la séparation et évaluation, problème réduit par la présolution).
+"""
+
+import numpy as np
+
+from problems.sparse import CSCMatrix, CSRMatrix, as_compressed
+
+# Sens des contraintes, partagés par tous les modules (simplex les réexporte)
+SENSE_LE = '<='
+SENSE_GE = '>='
+SENSE_EQ = '='
+
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+
+class LinearProgram:
+    """
+    `c` (n), `A` (m x n, dense ou CSR/CSC), `b` (m), `senses` (m, '<=' / '>=' / '='),
+    `names` (n, facultatif). Les données sont copiées une fois, à la construction
+    (copy=False : tableaux déjà construits pour l'occasion, pris tels quels et figés).
+    """
+
+    __slots__ = ('objective_type', 'c', 'A', 'b', 'senses', 'names')
+
+    def __init__(self, objective_type, c, A, b, senses, names=None, copy=True):
+        as_array = np.array if copy else np.asarray
+        c = _read_only(as_array(c, dtype=float).reshape(-1))
+        b = _read_only(as_array(b, dtype=float).reshape(-1))
+        if isinstance(A, (CSRMatrix, CSCMatrix)):
+            for array in (A.data, A.indices, A.indptr):
+                array.flags.writeable = False
+        else:
+            A = _read_only(as_array(A, dtype=float).reshape(b.size, c.size))
+        if A.shape != (b.size, c.size):
+            raise ValueError(f"Dimensions incohérentes : objectif {c.size}, contraintes {A.shape}, second membre {b.size}.")
+        # Sens absent (None) : chaîne vide, rejetée comme un sens non géré par le solveur
+        senses = _read_only(np.array(['' if sense is None else sense for sense in senses], dtype='<U2').reshape(-1))
+        if senses.size != b.size:
+            raise ValueError(f"Le nombre de sens ({senses.size}) doit être égal au nombre de contraintes ({b.size}).")
+        object.__setattr__(self, 'objective_type', objective_type.lower())
+        object.__setattr__(self, 'c', c)
+        object.__setattr__(self, 'A', A)
+        object.__setattr__(self, 'b', b)
+        object.__setattr__(self, 'senses', senses)
+        object.__setattr__(self, 'names', tuple(names) if names is not None else None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LinearProgram est immuable.")
+
+    def __reduce__(self):
+        # Pickle (pool de processus) : reconstruit par le constructeur, qui refait les tableaux en lecture seule
+        return (LinearProgram, (self.objective_type, self.c, self.A, self.b, self.senses, self.names))
+
+    @classmethod
+    def from_constraints(cls, objective_type, objective_coefficients, constraints, names=None):
+        """
+        Depuis le format JSON de Problem : liste de contraintes {'coefficients', 'sense', 'rhs'}
+        ou forme creuse {'matrix': CSR (ou sa forme JSON), 'senses': [...], 'rhs': [...]}.
+        """
+        if isinstance(constraints, LinearProgram):
+            return constraints.with_objective(objective_type, objective_coefficients)
+        num_variables = len(objective_coefficients)
+        if isinstance(constraints, dict):
+            return cls(objective_type, objective_coefficients, as_compressed(constraints['matrix']),
+                       constraints['rhs'], constraints['senses'], names)
+        if any(len(constraint.get('coefficients', [])) != num_variables for constraint in constraints):
+            raise ValueError(f"Chaque contrainte doit avoir {num_variables} coefficients.")
+        A = np.array([constraint['coefficients'] for constraint in constraints], dtype=float).reshape(len(constraints), num_variables)
+        b = [constraint.get('rhs', 0.0) for constraint in constraints]
+        senses = [constraint.get('sense') for constraint in constraints]
+        # A et b viennent d'être construits : seul l'objectif (peut-être un tableau de l'appelant) est copié
+        c = np.array(objective_coefficients, dtype=float)
+        return cls(objective_type, c, A, b, senses, names, copy=False)
+
+    def with_objective(self, objective_type, objective_coefficients):
+        """Même système de contraintes (partagé, sans copie) avec un autre objectif."""
+        program = object.__new__(LinearProgram)
+        object.__setattr__(program, 'objective_type', objective_type.lower())
+        object.__setattr__(program, 'c', _read_only(np.array(objective_coefficients, dtype=float).reshape(-1)))
+        for name in ('A', 'b', 'senses', 'names'):
+            object.__setattr__(program, name, getattr(self, name))
+        if program.c.size != self.num_variables:
+            raise ValueError(f"L'objectif doit avoir {self.num_variables} coefficients, reçu {program.c.size}.")
+        return program
+
+    @property
+    def num_variables(self):
+        return self.c.size
+
+    @property
+    def num_constraints(self):
+        return self.b.size
+
+    @property
+    def is_sparse(self):
+        return isinstance(self.A, (CSRMatrix, CSCMatrix))
+
+    @property
+    def nbytes(self):
+        return self.A.nbytes + self.c.nbytes + self.b.nbytes + self.senses.nbytes
+
+    def dense_matrix(self):
+        """A en tableau dense (partagé si A est déjà dense, en lecture seule)."""
+        return self.A.to_dense() if self.is_sparse else self.A
+
+    def to_constraints(self):
+        """Liste de contraintes au format JSON de Problem."""
+        A = self.dense_matrix()
+        return [{'coefficients': A[i].tolist(), 'sense': str(self.senses[i]), 'rhs': float(self.b[i])}
+                for i in range(self.num_constraints)]
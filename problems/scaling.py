@@ -0,0 +1,97 @@
+# problems/scaling.py
+"""
+Mise à l'échelle de la matrice des contraintes : A_s = R A S, avec R = diag(row_scale) et
+S = diag(column_scale). Le solveur travaille sur max (S c)^T x_s s.c. A_s x_s <= R b et
+remet la solution à l'échelle d'origine par x = S x_s (la valeur optimale est inchangée).
+
+Les facteurs sont arrondis à des puissances de 2 : multiplier par un tel facteur est exact
+en virgule flottante, la mise à l'échelle et son inverse n'ajoutent donc aucune erreur.
+"""
+
+import numpy as np
+
+from problems.sparse import CSCMatrix
+
+SCALING_GEOMETRIC = 'geometric'          # moyenne géométrique des extrêmes de chaque ligne / colonne
+SCALING_EQUILIBRATION = 'equilibration'  # plus grand coefficient de chaque ligne / colonne ramené à 1
+SCALING_METHODS = (SCALING_GEOMETRIC, SCALING_EQUILIBRATION)
+
+GEOMETRIC_PASSES = 4
+
+
+def compute_scaling(A, method):
+    """Facteurs (row_scale, column_scale) pour A (dense ou CSCMatrix) selon `method`."""
+    if method not in SCALING_METHODS:
+        raise ValueError(f"Méthode de mise à l'échelle inconnue : {method}. Choix possibles : {', '.join(SCALING_METHODS)}.")
+    rows, columns, values = _nonzero_entries(A)
+    num_rows, num_columns = A.shape
+    row_scale, column_scale = np.ones(num_rows), np.ones(num_columns)
+    if values.size == 0:
+        return row_scale, column_scale
+
+    if method == SCALING_GEOMETRIC:
+        for _ in range(GEOMETRIC_PASSES):
+            scaled = values * column_scale[columns]
+            row_scale = 1.0 / np.sqrt(_group_max(rows, scaled, num_rows) * _group_min(rows, scaled, num_rows))
+            scaled = values * row_scale[rows]
+            column_scale = 1.0 / np.sqrt(_group_max(columns, scaled, num_columns) * _group_min(columns, scaled, num_columns))
+    else:
+        row_scale = 1.0 / _group_max(rows, values, num_rows)
+        column_scale = 1.0 / _group_max(columns, values * row_scale[rows], num_columns)
+
+    return _power_of_two(row_scale), _power_of_two(column_scale)
+
+
+def scale_matrix(A, row_scale, column_scale):
+    """R A S, au format de A (dense ou CSCMatrix)."""
+    if isinstance(A, CSCMatrix):
+        column_ids = A._major_index_of_entries()
+        return CSCMatrix(A.data * row_scale[A.indices] * column_scale[column_ids], A.indices, A.indptr, A.shape)
+    return A * row_scale[:, np.newaxis] * column_scale[np.newaxis, :]
+
+
+def unscale_tableau(tableau, basis_vars, row_scale, column_scale):
+    """
+    Tableau du problème d'origine pour la même base. Avec B_s = R B D (D : s_j pour une
+    variable de base structurelle j, 1 / r_i pour l'écart de la ligne i), chaque ligne est
+    multipliée par D, les colonnes structurelles divisées par s_j, celles des écarts
+    multipliées par r_i ; la ligne Z et le second membre ne changent que par les colonnes.
+    """
+    num_columns = column_scale.size
+    basis = np.asarray(basis_vars, dtype=int)
+    row_factors = np.where(basis < num_columns,
+                           column_scale[np.minimum(basis, num_columns - 1)],
+                           1.0 / row_scale[np.maximum(basis - num_columns, 0)])
+    column_factors = np.concatenate([1.0 / column_scale, row_scale, [1.0]])
+
+    unscaled = tableau * column_factors[np.newaxis, :]
+    unscaled[:-1, :] *= row_factors[:, np.newaxis]
+    return unscaled
+
+
+def _nonzero_entries(A):
+    if isinstance(A, CSCMatrix):
+        rows, columns, values = A.indices, A._major_index_of_entries(), np.abs(A.data)
+    else:
+        rows, columns = np.nonzero(A)
+        values = np.abs(A[rows, columns])
+    keep = values > 0
+    return rows[keep], columns[keep], values[keep]
+
+
+def _group_max(groups, values, size):
+    result = np.zeros(size)
+    np.maximum.at(result, groups, values)
+    result[result == 0] = 1.0
+    return result
+
+
+def _group_min(groups, values, size):
+    result = np.full(size, np.inf)
+    np.minimum.at(result, groups, values)
+    result[~np.isfinite(result)] = 1.0
+    return result
+
+
+def _power_of_two(scale):
+    return np.exp2(np.round(np.log2(scale)))
@@ -0,0 +1,110 @@
+# problems/sensitivity.py
+"""
+Analyse de sensibilité post-optimale, calculée à partir du tableau final (B^-1 [A' I | b']
+et ligne Z) sans aucun pivot supplémentaire.
+
+Le solveur travaille sur la forme standard max c'x, A'x <= b' (objectif d'une minimisation
+et lignes '>=' changés de signe) : les résultats sont reconvertis dans les termes du
+problème saisi. Les bornes infinies sont représentées par None (sérialisable en JSON).
+
+Avec des variables bornées, le tableau est écrit en x̄_j = u_j - x_j pour les variables de
+`at_upper` et les variables de base doivent aussi rester sous leur borne supérieure.
+"""
+
+import numpy as np
+
+SENSITIVITY_TOLERANCE = 1e-9
+
+
+def sensitivity_from_tableau(tableau, basis_vars, objective_coefficients, rhs, row_signs, objective_sign,
+                             upper_bounds=None, at_upper=()):
+    """
+    `upper_bounds` : borne supérieure de chaque colonne du tableau (None : aucune).
+    - shadow_prices : variation de la valeur optimale par unité de second membre, par contrainte ;
+    - reduced_costs : c_j - y^T A_j pour chaque variable (nul pour une variable de base) ;
+    - rhs_ranges : intervalle du second membre de chaque contrainte sur lequel la base reste optimale ;
+    - objective_ranges : intervalle de chaque coefficient de l'objectif sur lequel la base reste optimale.
+    """
+    tableau = np.asarray(tableau, dtype=float)
+    c = np.asarray(objective_coefficients, dtype=float)
+    rhs = np.asarray(rhs, dtype=float)
+    row_signs = np.asarray(row_signs, dtype=float)
+    num_rows = tableau.shape[0] - 1
+    num_vars = c.size
+    basis_vars = [int(j) for j in basis_vars]
+    complemented = np.zeros(tableau.shape[1] - 1, dtype=bool)
+    complemented[[int(j) for j in at_upper]] = True
+    basic_upper = None if upper_bounds is None else np.asarray(upper_bounds, dtype=float)[basis_vars]
+
+    body = tableau[:-1, :-1]
+    z_row = tableau[-1, :-1]
+    basic_values = tableau[:-1, -1]
+    basis_inverse = body[:, num_vars:num_vars + num_rows]
+
+    # Sous les colonnes d'écart, la ligne Z contient les variables duales y' de la forme standard
+    shadow_prices = objective_sign * row_signs * z_row[num_vars:num_vars + num_rows]
+    # Une colonne complémentée porte l'opposé du coût réduit de x_j
+    reduced_costs = -objective_sign * np.where(complemented[:num_vars], -z_row[:num_vars], z_row[:num_vars])
+
+    rhs_ranges = []
+    for i in range(num_rows):
+        # b'_i + delta : x_B + delta * B^-1 e_i doit rester >= 0
+        low, high = _step_interval(basic_values, basis_inverse[:, i], basic_upper)
+        if row_signs[i] < 0:
+            low, high = -high, -low
+        rhs_ranges.append(_interval(rhs[i], low, high))
+
+    basis_row = {j: r for r, j in enumerate(basis_vars)}
+    nonbasic = np.ones(z_row.size, dtype=bool)
+    nonbasic[basis_vars] = False
+    objective_ranges = []
+    for j in range(num_vars):
+        if j in basis_row:
+            # c'_j + delta : la ligne Z devient d + delta * alpha_r, qui doit rester >= 0 hors base
+            row = body[basis_row[j], nonbasic]
+            low, high = _step_interval(z_row[nonbasic], -row if complemented[j] else row)
+        elif complemented[j]:
+            # Variable hors base à sa borne supérieure : elle y reste tant que c'_j ne descend pas sous c'_j - d̄_j
+            low, high = -z_row[j], np.inf
+        else:
+            # Variable hors base : elle entre dès que c'_j dépasse c'_j + d_j
+            low, high = -np.inf, z_row[j]
+        if objective_sign < 0:
+            low, high = -high, -low
+        objective_ranges.append(_interval(c[j], low, high))
+
+    return {
+        'shadow_prices': _clean(shadow_prices),
+        'reduced_costs': _clean(reduced_costs),
+        'rhs_ranges': rhs_ranges,
+        'objective_ranges': objective_ranges,
+    }
+
+
+def _step_interval(values, directions, upper=None):
+    """Plus grand intervalle [low, high] de delta tel que 0 <= values + delta * directions (<= upper)."""
+    if upper is not None:
+        finite = np.isfinite(upper)
+        # values + delta * directions <= upper  <=>  (upper - values) - delta * directions >= 0
+        values = np.concatenate([values, upper[finite] - values[finite]])
+        directions = np.concatenate([directions, -directions[finite]])
+    low, high = -np.inf, np.inf
+    for value, direction in zip(values, directions):
+        if direction > SENSITIVITY_TOLERANCE:
+            low = max(low, -value / direction)
+        elif direction < -SENSITIVITY_TOLERANCE:
+            high = min(high, -value / direction)
+    return low, high
+
+
+def _interval(current, low, high):
+    return {
+        'current': float(current),
+        'lower': float(current + low) if np.isfinite(low) else None,
+        'upper': float(current + high) if np.isfinite(high) else None,
+    }
+
+
+def _clean(values):
+    # Supprime les -0.0 et le bruit numérique autour de zéro
+    return [0.0 if abs(v) < SENSITIVITY_TOLERANCE else float(v) for v in values]
@@ -1,12 +1,38 @@
 import google.generativeai as genai
 from django.conf import settings
-import os
-from PIL import Image
 import io
 import json
 import re
-from pdf2image import convert_from_path
-import tempfile
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+from problems.image_preprocessing import DEFAULT_OPTIONS as DEFAULT_PREPROCESSING, preprocess_image
+
+# Consigne envoyée au modèle avec chaque image
+EXTRACTION_PROMPT = """
+Analyse cette image qui contient un problème de programmation linéaire.
+Extrais et renvoie uniquement les informations au format JSON suivant :
+{
+    "objective_type": "max" ou "min",
+    "objective_function": "équation complète (ex: 3x1 + 2x2)",
+    "constraints": [
+        "1x1 + 1x2 <= 10",  # TOUJOURS avec tous les coefficients
+        "1x1 + 0x2 >= 5"    # Même les coefficients nuls
+    ]
+}
+
+Important :
+- Utilise x1, x2, x3, etc. pour les variables
+- Utilise <=, >=, ou = pour les contraintes
+- N'inclue que les coefficients numériques (pas de fractions)
+- Assure-toi que le format est exactement comme dans les exemples
+
+Règles strictes :
+1. Utilisez TOUJOURS toutes les variables dans chaque équation
+2. Même si un coefficient est 0, incluez-le explicitement (ex: 0x2)
+3. Format exact : [coefficient][variable] +/- [coefficient][variable]...
+4. Si l'image ne contient qu'une partie du problème (suite de contraintes d'une page précédente),
+   renvoie uniquement les champs présents (ex: seulement "constraints")
+"""
 
 class GeminiService:
     def __init__(self):
@@ -14,132 +40,162 @@ class GeminiService:
         genai.configure(api_key=settings.GEMINI_API_KEY)
         self.model = genai.GenerativeModel('gemini-1.5-flash')
 
-    def process_image(self, image_file):
+    def count_pdf_pages(self, pdf_path):
+        """Nombre de pages du PDF (sans rien convertir)."""
+        pages = pdfinfo_from_path(pdf_path)['Pages']
+        if not pages:
+            raise ValueError("Aucune page trouvée dans le PDF")
+        return pages
+
+    def rasterize_pdf_page(self, pdf_path, page, dpi=300):
+        """Une page du PDF (numérotée à partir de 1) en image, convertie seulement quand elle est demandée."""
+        images = convert_from_path(
+            pdf_path,
+            fmt='png',
+            dpi=dpi,  # Résolution élevée pour une meilleure qualité
+            first_page=page,
+            last_page=page
+        )
+        if not images:
+            raise ValueError(f"Page {page} introuvable dans le PDF")
+        return images[0]
+
+    def prepare_image(self, image, original=None):
+        """
+        Image à envoyer au modèle : réduite, en niveaux de gris, recadrée et ré-encodée selon
+        IMPORT_IMAGE_PREPROCESSING (problems.image_preprocessing) ; None : image inchangée.
+        `original` : contenu du fichier importé ({'mime_type': ..., 'data': ...}), envoyé tel quel s'il est plus léger.
+        """
+        options = getattr(settings, 'IMPORT_IMAGE_PREPROCESSING', DEFAULT_PREPROCESSING)
+        if options is None:
+            return image
+        return preprocess_image(image, original=original, **dict(DEFAULT_PREPROCESSING, **options))
+
+    def extract_text(self, image):
         """
-        Traite une image avec Gemini pour extraire les équations du problème de PL
+        Appel au modèle : réponse brute (texte contenant le JSON) pour une image PIL
+        ou un contenu déjà encodé ({'mime_type': ..., 'data': ...}, voir prepare_image).
+        """
+        response = self.model.generate_content([EXTRACTION_PROMPT, image])
+        return response.text
+
+    def parse_response(self, text, partial=False):
+        """
+        Réponse du modèle -> données au format Problem (objective_type, objective_coefficients, constraints).
+        Avec partial=True, une page sans fonction objectif (suite de contraintes) est acceptée :
+        objective_type, objective_function et objective_coefficients valent alors None.
         """
         try:
-            # Lecture de l'image
-            image = Image.open(image_file)
-            
-            # Préparation du prompt
-            prompt = """
-            Analyse cette image qui contient un problème de programmation linéaire.
-            Extrais et renvoie uniquement les informations au format JSON suivant :
-            {
-                "objective_type": "max" ou "min",
-                "objective_function": "équation complète (ex: 3x1 + 2x2)",
-                "constraints": [
-                    "1x1 + 1x2 <= 10",  # TOUJOURS avec tous les coefficients
-                    "1x1 + 0x2 >= 5"    # Même les coefficients nuls
-                ]
-            }
-            
-            Important :
-            - Utilise x1, x2, x3, etc. pour les variables
-            - Utilise <=, >=, ou = pour les contraintes
-            - N'inclue que les coefficients numériques (pas de fractions)
-            - Assure-toi que le format est exactement comme dans les exemples
-            
-            Règles strictes :
-            1. Utilisez TOUJOURS toutes les variables dans chaque équation
-            2. Même si un coefficient est 0, incluez-le explicitement (ex: 0x2)
-            3. Format exact : [coefficient][variable] +/- [coefficient][variable]...
-            
-            """
-            
-            # Génération de la réponse
-            response = self.model.generate_content([prompt, image])
-            
-            # Extraction du JSON de la réponse
-            try:
-                # Recherche du JSON dans la réponse
-                json_match = re.search(r'\{.*\}', response.text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group()
-                    data = json.loads(json_str)
-                else:
-                    raise ValueError("Format JSON non trouvé dans la réponse")
-                
-                # Validation des données
-                if not self._validate_data(data):
-                    raise ValueError("Données invalides dans la réponse")
-                
-                # Validation des équations
-                if not self._validate_equations(data):
-                    raise ValueError("Format des équations invalide")
-                
-                # Formatage des données pour correspondre au format attendu
-                formatted_data = {
-                    'objective_type': data['objective_type'],
-                    'objective_coefficients': self._parse_equation(data['objective_function']),
-                    'constraints': [
-                        {
-                            'coefficients': self._parse_equation(constraint),
-                            'sense': self._get_constraint_sense(constraint),
-                            'rhs': self._get_constraint_rhs(constraint)
-                        }
-                        for constraint in data['constraints']
-                    ]
+            # Recherche du JSON dans la réponse
+            json_match = re.search(r'\{.*\}', text, re.DOTALL)
+            if json_match:
+                json_str = json_match.group()
+                data = json.loads(json_str)
+            else:
+                raise ValueError("Format JSON non trouvé dans la réponse")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Erreur de parsing JSON : {str(e)}")
+
+        if not data.get('objective_function'):
+            if not partial:
+                raise ValueError("Données invalides dans la réponse")
+            data = dict(data, objective_type=None, objective_function=None)
+            data.setdefault('constraints', [])
+
+        # Validation des données
+        if not self._validate_data(data):
+            raise ValueError("Données invalides dans la réponse")
+
+        # Validation des équations
+        if not self._validate_equations(data):
+            raise ValueError("Format des équations invalide")
+
+        # Formatage des données pour correspondre au format attendu
+        return {
+            'objective_type': data['objective_type'],
+            'objective_function': data['objective_function'],
+            'constraints_equations': data['constraints'],
+            'objective_coefficients': self._parse_equation(data['objective_function']) if data['objective_function'] else None,
+            'constraints': [
+                {
+                    'coefficients': self._parse_equation(constraint),
+                    'sense': self._get_constraint_sense(constraint),
+                    'rhs': self._get_constraint_rhs(constraint)
                 }
-                
-                # Validation finale des données formatées
-                if not self._validate_formatted_data(formatted_data):
-                    raise ValueError("Données formatées invalides")
-                
-                return formatted_data
-                
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Erreur de parsing JSON : {str(e)}")
-            
-        except Exception as e:
-            raise Exception(f"Erreur lors du traitement de l'image : {str(e)}")
+                for constraint in data['constraints']
+            ]
+        }
+
+    def validate(self, formatted_data):
+        """Validation finale des données formatées ; les renvoie, complétées si besoin."""
+        if not self._validate_formatted_data(formatted_data):
+            raise ValueError("Données formatées invalides")
+        return formatted_data
 
-    def process_pdf(self, pdf_file):
+    def page_outcome(self, data):
         """
-        Traite un PDF avec Gemini pour extraire les équations du problème de PL
+        Résultat d'une page : {'data': ..., 'complete': True} si la page contient à elle seule un problème
+        valide, sinon un fragment ({'complete': False}) qui ne sert qu'à la fusion des pages.
         """
+        if data['objective_coefficients'] is None:
+            return {'data': data, 'complete': False}
         try:
-            # Création d'un dossier temporaire pour les images
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Conversion du PDF en images
-                images = convert_from_path(
-                    pdf_file,
-                    output_folder=temp_dir,
-                    fmt='png',
-                    dpi=300  # Résolution élevée pour une meilleure qualité
-                )
-                
-                if not images:
-                    raise ValueError("Aucune page trouvée dans le PDF")
-                
-                # Traitement de chaque page
-                all_results = []
-                for i, image in enumerate(images):
-                    try:
-                        # Sauvegarde temporaire de l'image
-                        image_path = os.path.join(temp_dir, f'page_{i+1}.png')
-                        image.save(image_path, 'PNG')
-                        
-                        # Traitement de l'image
-                        with open(image_path, 'rb') as img_file:
-                            result = self.process_image(img_file)
-                            all_results.append(result)
-                            
-                    except Exception as e:
-                        print(f"Erreur lors du traitement de la page {i+1}: {str(e)}")
-                        continue
-                
-                if not all_results:
-                    raise ValueError("Aucune page n'a pu être traitée avec succès")
-                
-                # Fusion des résultats
-                # Pour l'instant, nous prenons le premier résultat valide
-                # TODO: Implémenter une logique plus sophistiquée pour fusionner les résultats
-                return all_results[0]
-                
-        except Exception as e:
-            raise Exception(f"Erreur lors du traitement du PDF : {str(e)}")
+            return {'data': self.validate(data), 'complete': True}
+        except ValueError:
+            return {'data': data, 'complete': False}
+
+    def resolve_pages(self, outcomes, page_count, merge=False):
+        """
+        Données retenues pour un document de `page_count` pages, à partir des pages déjà traitées
+        (`outcomes` : numéro de page -> page_outcome, ou None pour une page en échec).
+        Renvoie None tant que la réponse dépend d'une page non traitée :
+        - merge=False : la première page complète, dès que toutes les pages qui la précèdent sont traitées
+          (les pages suivantes ne sont pas nécessaires) ;
+        - merge=True, ou aucune page complète : fusion de toutes les pages, une fois toutes traitées.
+        """
+        if not merge:
+            for page in range(1, page_count + 1):
+                if page not in outcomes:
+                    return None
+                if outcomes[page] and outcomes[page]['complete']:
+                    return outcomes[page]['data']
+        if len(outcomes) < page_count:
+            return None
+        return self.merge_pages([outcomes[page]['data'] for page in sorted(outcomes) if outcomes[page]])
+
+    def pages_needed(self, outcomes, page, merge=False):
+        """La page `page` peut-elle changer le résultat ? Non si une page complète la précède (sans fusion)."""
+        return merge or not any(outcome and outcome['complete'] for p, outcome in outcomes.items() if p < page)
+
+    def merge_pages(self, pages):
+        """
+        Fusion de pages d'un même problème, dans l'ordre : fonction objectif de la première page qui en
+        contient une, contraintes de toutes les pages (une contrainte répétée d'une page à l'autre est gardée une fois).
+        """
+        objective = next((data for data in pages if data['objective_coefficients'] is not None), None)
+        if objective is None:
+            raise ValueError("Aucune page n'a pu être traitée avec succès")
+
+        constraints, equations, seen = [], [], set()
+        for data in pages:
+            for equation, constraint in zip(data['constraints_equations'], data['constraints']):
+                key = equation.replace(' ', '')
+                if key in seen:
+                    continue
+                seen.add(key)
+                equations.append(equation)
+                constraints.append(dict(constraint, coefficients=list(constraint['coefficients'])))
+
+        # Une variable absente de la fonction objectif mais présente dans les contraintes : coefficient nul
+        width = max([len(objective['objective_coefficients'])] + [len(c['coefficients']) for c in constraints])
+        coefficients = list(objective['objective_coefficients']) + [0.0] * (width - len(objective['objective_coefficients']))
+        return self.validate({
+            'objective_type': objective['objective_type'],
+            'objective_function': objective['objective_function'],
+            'constraints_equations': equations,
+            'objective_coefficients': coefficients,
+            'constraints': constraints,
+        })
 
     def _validate_data(self, data):
         """Valide la structure des données"""
@@ -147,7 +203,8 @@ class GeminiService:
         if not all(key in data for key in required_keys):
             return False
         
-        if data['objective_type'] not in ['max', 'min']:
+        # Page sans fonction objectif (parse_response(partial=True)) : pas de type d'objectif
+        if data['objective_type'] not in ['max', 'min'] and data['objective_function'] is not None:
             return False
         
         if not isinstance(data['constraints'], list):
@@ -158,7 +215,7 @@ class GeminiService:
     def _validate_equations(self, data):
         """Valide le format des équations"""
         # Validation de la fonction objectif
-        if not re.match(r'^[+-]?\s*\d*\.?\d*x\d+(\s*[+-]\s*\d*\.?\d*x\d+)*$', data['objective_function']):
+        if data['objective_function'] is not None and not re.match(r'^[+-]?\s*\d*\.?\d*x\d+(\s*[+-]\s*\d*\.?\d*x\d+)*$', data['objective_function']):
             return False
         
         # Validation des contraintes
@@ -1,23 +1,113 @@
 # solver/simplex.py
 
-import numpy as np
+import time
 import traceback
+from fractions import Fraction
+
+import numpy as np
 
-SENSE_LE = '<='
-SENSE_GE = '>='
-SENSE_EQ = '='
+from problems.bounds import has_bounds, normalize_bounds, serialize_bounds
+from problems.exact import ExactTableau, fraction_pivot, to_fraction
+from problems.factorization import BasisFactorization
+from problems.instrumentation import NO_STATS, PIVOT, PRICING, RATIO_TEST, RECORDING, SolveStats, is_degenerate
+from problems.interior_point import crossover_basis, mehrotra_predictor_corrector
+from problems.limits import STATUS_TIME_LIMIT, SolveLimits, scaled_iteration_limit
+from problems.presolve import Presolve
+from problems.pricing import PRICING_DANTZIG, make_pricing_rule
+from problems.program import SENSE_GE, SENSE_LE, LinearProgram
+from problems.scaling import SCALING_METHODS, compute_scaling, scale_matrix, unscale_tableau
+from problems.sensitivity import sensitivity_from_tableau
+from problems.sparse import CSCMatrix
 
 STATUS_UNSUPPORTED = 'unsupported'
 
+# Moteurs de résolution disponibles
+ENGINE_TABLEAU = 'tableau'   # tableau dense complet, réécrit à chaque pivot
+ENGINE_REVISED = 'revised'   # simplexe révisé : matrice A + base factorisée LU
+ENGINE_INTERIOR_POINT = 'interior-point'  # points intérieurs (Mehrotra) puis crossover vers une base
+ENGINES = (ENGINE_TABLEAU, ENGINE_REVISED, ENGINE_INTERIOR_POINT)
+
+# Modes d'enregistrement de l'historique des tableaux
+HISTORY_FULL = 'full'            # copie de chaque tableau (comportement historique)
+HISTORY_NONE = 'none'            # aucun tableau
+HISTORY_FINAL = 'final'          # uniquement le tableau final
+HISTORY_EVERY_K = 'every-k'      # un tableau toutes les `history_every` itérations, plus le final
+HISTORY_PIVOT_LOG = 'pivot-log'  # tableau initial + suite des pivots (ligne, colonne), rejouée à la demande
+HISTORY_MODES = (HISTORY_FULL, HISTORY_NONE, HISTORY_FINAL, HISTORY_EVERY_K, HISTORY_PIVOT_LOG)
+
+# Lignes mises à jour ensemble par pivot_in_place : un bloc de 64 x n reste dans le cache
+PIVOT_BLOCK_ROWS = 64
+
 class SimplexSolver:
-    def __init__(self, objective_type, objective_coefficients, constraints, verbose=False):
+    # Limite d'itérations minimale ; par défaut elle croît avec la taille du problème (scaled_iteration_limit)
+    max_iterations = 100
+
+    def __init__(self, objective_type, objective_coefficients, constraints, verbose=False,
+                 engine=ENGINE_TABLEAU, refactor_frequency=50, history=HISTORY_FULL, history_every=10,
+                 pricing=PRICING_DANTZIG, initial_basis=None, presolve=False, scaling=None, bounds=None,
+                 time_limit=None, iteration_limit=None, cancel_token=None, exact=False, instrument=False):
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur de résolution inconnu : {engine}. Choix possibles : {', '.join(ENGINES)}.")
+        if history not in HISTORY_MODES:
+            raise ValueError(f"Mode d'historique inconnu : {history}. Choix possibles : {', '.join(HISTORY_MODES)}.")
+        if history == HISTORY_EVERY_K and history_every < 1:
+            raise ValueError("history_every doit être un entier strictement positif.")
+        if scaling is not None and scaling not in SCALING_METHODS:
+            raise ValueError(f"Méthode de mise à l'échelle inconnue : {scaling}. Choix possibles : {', '.join(SCALING_METHODS)}.")
+        if exact and (engine != ENGINE_TABLEAU or scaling is not None):
+            raise ValueError("Le mode exact fonctionne avec le moteur tableau, sans mise à l'échelle.")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("time_limit doit être une durée strictement positive (en secondes).")
+        if iteration_limit is not None and iteration_limit < 1:
+            raise ValueError("iteration_limit doit être un entier strictement positif.")
         self.objective_type = objective_type.lower()
-        self.c = np.array(objective_coefficients, dtype=float)
-        self.constraints_data = [c.copy() for c in constraints]
-        self.num_original_variables = len(objective_coefficients)
-        self.num_original_constraints = len(constraints)
+        # Programme linéaire immuable : construit une fois depuis la liste de contraintes ou la forme
+        # creuse ({'matrix', 'senses', 'rhs'}), ou partagé sans copie s'il est fourni (LinearProgram)
+        self.program = LinearProgram.from_constraints(objective_type, objective_coefficients, constraints)
+        self.c = self.program.c
+        # Forme standard (A', b'), éventuellement mise à l'échelle, calculée une seule fois
+        self._standard_form = None
+        self.scaling = scaling
+        self._row_scale = None
+        self._column_scale = None
+        self.num_original_variables = self.program.num_variables
+        self.num_original_constraints = self.program.num_constraints
+        # Bornes l <= x <= u (Problem.bounds) : gérées par le simplexe à variables bornées, sans ligne ajoutée
+        self.lower, self.upper = normalize_bounds(bounds, self.num_original_variables)
+        self.bounded = has_bounds(self.lower, self.upper)
+        # Limites vérifiées entre deux pivots : au-delà, statut 'time_limit' avec la dernière base atteinte
+        self.time_limit = time_limit
+        self.iteration_limit = iteration_limit if iteration_limit is not None else scaled_iteration_limit(
+            self.num_original_constraints, self.num_original_variables, self.max_iterations)
+        self.cancel_token = cancel_token
+        self.limit_reached = None
+        self._limits = None
+        # Mode exact : pivots entiers sans fraction, tableaux et solution exportés aussi en fractions
+        self.exact = exact
+        self.exact_solution = None
+        # Instrumentation (temps par phase et par itération) : résultat['instrumentation'], sinon None
+        self.instrument = instrument
+        self._stats = NO_STATS
+        self._history_bytes = 0
         self.verbose = verbose
+        self.engine = engine
+        self.refactor_frequency = refactor_frequency
+        self.history = history
+        self.history_every = history_every
+        self.pricing = pricing
+        self._pricing_rule = make_pricing_rule(pricing)
+        # Base optimale d'une résolution précédente (Problem.basis_vars), point de départ d'une re-résolution
+        self.initial_basis = initial_basis
+        self.presolve = presolve
+        self.presolve_report = None
+        self._presolved_solver = None
+        self.warm_started = False
+        self.interior_point_report = None
+        self._sensitivity = None
+        self.iterations = 0
         self.tableaus = []
+        self.pivot_log = None
+        self._last_record = None
 
         self.status = None
         self.solution = None
@@ -25,39 +115,43 @@ class SimplexSolver:
         self.variable_names = None
 
     def solve(self):
+        self.iterations = 0
         self.tableaus = []
+        self.pivot_log = None
+        self._last_record = None
         self.status = None
         self.solution = None
         self.optimal_value = None
         self.variable_names = None
+        self.warm_started = False
+        self.interior_point_report = None
+        self._sensitivity = None
+        self.presolve_report = None
+        self._presolved_solver = None
+        self.limit_reached = None
+        self._limits = SolveLimits(self.time_limit, self.iteration_limit, self.cancel_token)
+        self.exact_solution = None
+        self._stats = SolveStats() if self.instrument else NO_STATS
+        self._history_bytes = 0
 
         try:
-            current_constraints_data = [c.copy() for c in self.constraints_data]
-
-            if self.objective_type == 'min':
-                if any(c.get('sense') != SENSE_GE for c in current_constraints_data):
-                     self.status = STATUS_UNSUPPORTED
-                     return self._build_result_dict(error="L'outil ne gère que les problèmes de Minimisation avec uniquement des contraintes '>=' pour le moment.")
-                if any(c.get('rhs', 0) < -1e-9 for c in current_constraints_data):
-                     self.status = STATUS_UNSUPPORTED
-                     return self._build_result_dict(error="Un problème Min avec contraintes '>=' ne peut pas avoir de second membre négatif dans cette version.")
-
-                return self._solve_via_dual()
-
-            elif self.objective_type == 'max':
-                 if any(c.get('sense') != SENSE_LE for c in current_constraints_data):
-                     self.status = STATUS_UNSUPPORTED
-                     return self._build_result_dict(error="L'outil ne gère que les problèmes de Maximisation avec uniquement des contraintes '<=' pour le moment.")
+            if self.objective_type not in ('max', 'min'):
+                self.status = STATUS_UNSUPPORTED
+                return self._build_result_dict(error=f"Type d'objectif non supporté : {self.objective_type}. Seuls 'max' et 'min' sont acceptés.")
 
-                 if any(c.get('rhs', 0) < -1e-9 for c in current_constraints_data):
-                     self.status = 'infeasible'
-                     return self._build_result_dict(error="Un problème Max avec contraintes '<=' ne peut pas avoir de second membre négatif.")
+            if not np.all(np.isin(self.program.senses, (SENSE_LE, SENSE_GE))):
+                self.status = STATUS_UNSUPPORTED
+                return self._build_result_dict(error="L'outil ne gère que les contraintes '<=' et '>=' pour le moment (les contraintes d'égalité '=' ne sont pas encore prises en charge).")
 
-                 return self._solve_primal_max_le()
+            if np.any(self.lower > self.upper + 1e-9):
+                # Une variable dont la borne inférieure dépasse la borne supérieure : aucune solution
+                self.status = 'infeasible'
+                return self._build_result_dict()
 
-            else:
-                self.status = STATUS_UNSUPPORTED
-                return self._build_result_dict(error=f"Type d'objectif non supporté : {self.objective_type}. Seuls 'max' et 'min' sont acceptés.")
+            if self.presolve and not self.exact:
+                # En mode exact, les tableaux sont ceux du problème saisi, comparables aux calculs à la main
+                return self._solve_presolved()
+            return self._solve_standard_form()
 
         except NotImplementedError as e:
             self.status = STATUS_UNSUPPORTED
@@ -70,15 +164,22 @@ class SimplexSolver:
              print(f"Erreur inattendue dans solve(): {e}\n{traceback.format_exc()}")
              return self._build_result_dict(error=f"Une erreur inattendue est survenue lors de la résolution : {e}")
 
+    def result_with_status(self, status):
+        """
+        Résultat au format de solve() avec le statut final `status`, sans résoudre : solution, valeur
+        et limite sont celles déjà renseignées sur le solveur (None s'il n'a pas été résolu).
+        """
+        self.status = status
+        return self._build_result_dict()
+
     def _build_result_dict(self, error=None):
+        self._record_final_tableau()
+
         serializable_tableaus = []
         for t_info in self.tableaus:
-             if isinstance(t_info, dict) and 'tableau' in t_info and isinstance(t_info['tableau'], np.ndarray):
-                  serializable_tableaus.append({
-                       'tableau': t_info['tableau'].tolist(),
-                       'basis_vars': t_info.get('basis_vars'),
-                       'variable_names': t_info.get('variable_names')
-                  })
+             serializable_info = self._serialize_tableau_info(t_info)
+             if serializable_info is not None:
+                  serializable_tableaus.append(serializable_info)
              else:
                   print(f"Warning: Skipping unprocessable item in self.tableaus during serialization. Format: {type(t_info)}. Content Sample: {str(t_info)[:100]}")
                   pass
@@ -88,210 +189,689 @@ class SimplexSolver:
             'solution': self.solution.tolist() if isinstance(self.solution, np.ndarray) else self.solution,
             'optimal_value': float(self.optimal_value) if isinstance(self.optimal_value, (int, float, np.number)) else self.optimal_value,
             'tableaus': serializable_tableaus,
+            'history_mode': self.history,
+            'pricing': self._pricing_rule.name,
+            'iterations': self.iterations,
+            'pivot_log': self._serialize_pivot_log(),
             'variable_names': self.variable_names,
+            'basis_vars': [int(j) for j in self._last_record[0]['basis_vars']] if self._last_record is not None else None,
+            'warm_start': self.warm_started,
+            'sensitivity': self.sensitivity() if self.status == 'optimal' else None,
+            'presolve': self.presolve_report,
+            'interior_point': self.interior_point_report,
+            'limit': self.limit_reached,
+            'exact': self.exact_solution,
+            'instrumentation': self._instrumentation_report() if self._stats.enabled else None,
             'error': error,
             'unsupported_message': "Ce type de problème n'est pas encore géré par l'application. Nous travaillons à étendre nos capacités !" if self.status == STATUS_UNSUPPORTED else None
         }
 
-    def _solve_primal_max_le(self):
-        tableau, basis_vars = self._build_initial_tableau()
-
-        self._record_tableau({'tableau': tableau.copy(), 'basis_vars': basis_vars.copy(), 'variable_names': self.variable_names}, 0)
-
-        current_tableau = tableau.copy()
-
-        max_iterations = 100
-        iteration = 0
-
-        while iteration < max_iterations:
-            if self._check_optimality(current_tableau):
-                self.status = 'optimal'
-                self.solution, self.optimal_value = self._extract_solution(current_tableau, basis_vars)
-                return self._build_result_dict()
-
-            pivot_col = self._choose_pivot_column(current_tableau)
-
-            if pivot_col is None:
-                 print("Warning: _choose_pivot_column returned None, but _check_optimality was False.")
-                 self.status = 'error'
-                 return self._build_result_dict(error="Incohérence dans le choix du pivot.")
-
-            pivot_row = self._choose_pivot_row(current_tableau, pivot_col)
-
-            if pivot_row is None:
-                self.status = 'unbounded'
-                self.solution = None
-                self.optimal_value = None
-                return self._build_result_dict()
-
-            current_tableau = self._perform_pivot_operations(current_tableau.copy(), pivot_row, pivot_col)
-            basis_vars[pivot_row] = pivot_col
-
-            iteration += 1
-            self._record_tableau({'tableau': current_tableau.copy(), 'basis_vars': basis_vars.copy(), 'variable_names': self.variable_names}, iteration)
-
-        self.status = 'error'
-        return self._build_result_dict(error="Limite d'itérations atteinte, possible problème de dégénérescence ou bug non géré.")
-
-    def _solve_via_dual(self):
-        A_primal_coeffs = []
-        b_primal = []
-        c_primal = self.c
-
-        for constraint in self.constraints_data:
-            A_primal_coeffs.append(constraint.get('coefficients', []))
-            b_primal.append(constraint.get('rhs', 0))
-
-        A_primal_matrix = np.array(A_primal_coeffs, dtype=float)
-
-        A_dual_matrix = A_primal_matrix.T
-        c_dual_coeffs = b_primal
-        b_dual_vector = c_primal
-
-        dual_constraints_data = []
-        num_primal_vars = self.num_original_variables
-        num_primal_constraints = self.num_original_constraints
+    def _serialize_tableau_info(self, t_info):
+        if not isinstance(t_info, dict):
+             return None
+        if t_info.get('tableau') is None and t_info.get('basis_vars') is not None:
+             # Le moteur révisé n'enregistre que la base : le tableau est reconstruit à la demande
+             tableau = self._tableau_from_basis(t_info['basis_vars'], t_info.get('at_upper'))
+             t_info = dict(t_info, tableau=self._unscaled(tableau, t_info['basis_vars']))
+        if not isinstance(t_info.get('tableau'), np.ndarray):
+             return None
+        serialized = {
+             'tableau': t_info['tableau'].tolist(),
+             'basis_vars': [int(x) for x in t_info['basis_vars']] if t_info.get('basis_vars') is not None else None,
+             'variable_names': t_info.get('variable_names'),
+             'iteration': t_info.get('iteration'),
+        }
+        if t_info.get('at_upper'):
+             # Colonnes des variables à leur borne supérieure, écrites x_j = u_j - x̄_j dans ce tableau
+             serialized['at_upper'] = [int(j) for j in t_info['at_upper']]
+        if t_info.get('exact_tableau') is not None:
+             # Mode exact : le même tableau en fractions ('p/q')
+             serialized['exact_tableau'] = t_info['exact_tableau']
+        return serialized
+
+    def _serialize_pivot_log(self):
+        if self.pivot_log is None:
+             return None
+        return {
+             'mode': HISTORY_PIVOT_LOG,
+             'initial': self._serialize_tableau_info(self.pivot_log['initial']),
+             'pivots': [_serialize_pivot(pivot) for pivot in self.pivot_log['pivots']],
+        }
 
-        for i in range(num_primal_vars):
-            dual_constraints_data.append({
-                "coefficients": A_dual_matrix[i, :].tolist(),
-                "sense": SENSE_LE,
-                "rhs": b_dual_vector[i]
-            })
+    def _solve_presolved(self):
+        """
+        Résout le problème réduit par la présolution avec les mêmes options, puis replace
+        le résultat (solution, base, noms, analyse de sensibilité) dans le problème d'origine.
+        """
+        bounds = serialize_bounds(self.lower, self.upper) if self.bounded else None
+        reduction = Presolve(self.objective_type, self.c, self.program, bounds=bounds)
 
-        num_dual_original_vars = self.num_original_constraints
-        num_dual_constraints = self.num_original_variables
+        if reduction.status == 'infeasible':
+            self.status = 'infeasible'
+            self.presolve_report = reduction.report()
+            return self._build_result_dict()
 
-        dual_solver = SimplexSolver(
-            objective_type='max',
-            objective_coefficients=c_dual_coeffs,
-            constraints=dual_constraints_data,
-            verbose=self.verbose
+        # Le problème réduit dispose du temps restant (time_limit doit rester strictement positif)
+        remaining_time = self._limits.remaining_time()
+        if remaining_time is not None:
+            remaining_time = max(remaining_time, 1e-9)
+        inner = SimplexSolver(
+            self.objective_type, reduction.program.c, reduction.program, verbose=self.verbose,
+            engine=self.engine, refactor_frequency=self.refactor_frequency, history=self.history,
+            history_every=self.history_every, pricing=self.pricing, initial_basis=reduction.reduced_basis(self.initial_basis),
+            scaling=self.scaling, bounds=reduction.bounds, time_limit=remaining_time,
+            iteration_limit=self.iteration_limit, cancel_token=self.cancel_token, instrument=self.instrument,
         )
+        start = time.perf_counter()
+        if reduction.is_empty:
+            # Tout a été éliminé : la solution est celle des variables fixées. Le tableau réduit à la
+            # ligne de l'objectif, de base vide, tient lieu d'historique
+            inner.status, inner.solution, inner.optimal_value, inner.variable_names = 'optimal', np.zeros(0), 0.0, []
+            inner._record_tableau({'tableau': np.zeros((1, 1)), 'basis_vars': [], 'variable_names': [], 'at_upper': []}, 0)
+            inner._sensitivity = {'shadow_prices': [], 'reduced_costs': [], 'rhs_ranges': [], 'objective_ranges': []}
+            inner_result = inner._build_result_dict()
+        else:
+            inner_result = inner.solve()
+        result = reduction.postsolve(inner_result, solve_time=time.perf_counter() - start)
+
+        # Les tableaux restent ceux du problème réduit : final_tableau et tableau_at les lisent sur ce solveur
+        self._presolved_solver = inner
+        self.iterations = inner.iterations
+        self.warm_started = inner.warm_started
+        self.interior_point_report = inner.interior_point_report
+        self.limit_reached = inner.limit_reached
+        self.status = result['status']
+        self.solution = np.array(result['solution']) if result['solution'] is not None else None
+        self.optimal_value = result['optimal_value']
+        self.variable_names = result['variable_names']
+        self._sensitivity = result['sensitivity']
+        self.presolve_report = result['presolve']
+        if self._stats.enabled:
+            # Phases et itérations du problème réduit ; la durée totale compte aussi la présolution
+            result['instrumentation'] = dict(result['instrumentation'] or {}, solve_time=time.perf_counter() - self._stats.start)
+        return result
+
+    def _solve_standard_form(self):
+        """
+        Résout le problème sous la forme standard max c'x s.c. A'x <= b', x >= 0 : l'objectif
+        d'une minimisation et les lignes '>=' sont multipliés par -1, le second membre b' peut
+        donc être négatif. Le simplexe dual rétablit d'abord la réalisabilité primale sur le
+        même tableau (ou la même base factorisée), puis le simplexe primal termine
+        l'optimisation. Un problème déjà dual réalisable (minimisation à coûts positifs, par
+        exemple) est entièrement résolu par le simplexe dual.
+
+        Une limite atteinte (durée, itérations, annulation) arrête la résolution sur le statut
+        'time_limit' : la dernière base atteinte est renvoyée, avec sa solution et la valeur de
+        l'objectif si elle est déjà primal réalisable (phase primale).
+        """
+        state = self._initial_state()
+        self._record_tableau(state.tableau_info(), 0)
+        self._stats.note_bytes(self._tableau_bytes(state))
+
+        status = self._run_dual(state)
+        primal_feasible = status == 'feasible'
+        if primal_feasible:
+            status = self._run_primal(state)
+
+        if status == 'optimal':
+            self._set_optimal_solution(state)
+            return self._build_result_dict()
 
-        dual_solver.num_original_variables = num_dual_original_vars
-        dual_solver.num_original_constraints = num_dual_constraints
-
-        dual_result = dual_solver.solve()
-
-        # Transfer dual tableaus to primal solver's tableaus, converting list of lists back to ndarray
-        self.tableaus = []
-        if dual_result.get('tableaus'):
-             for t_info_serializable in dual_result['tableaus']:
-                  if isinstance(t_info_serializable, dict) and 'tableau' in t_info_serializable:
-                       try:
-                           dual_tableau_ndarray = np.array(t_info_serializable['tableau'], dtype=float)
-                           # Re-record using the primal solver's method to store as ndarray
-                           # Use current length as iteration number for recording order
-                           self._record_tableau({
-                               'tableau': dual_tableau_ndarray,
-                               'basis_vars': t_info_serializable.get('basis_vars'),
-                               'variable_names': t_info_serializable.get('variable_names')
-                           }, iteration=len(self.tableaus))
-                       except Exception as e:
-                           print(f"Error converting dual tableau to ndarray for recording: {e}")
-                           pass
-                  else:
-                      print(f"Warning: Skipping unprocessable item from dual result tableaus during transfer. Format: {type(t_info_serializable)}")
-                      pass
-
-        self.optimal_value = dual_result['optimal_value']
-        self.status = dual_result['status']
-
-        if dual_result['status'] == 'optimal':
-            if not dual_result.get('tableaus'):
-                 self.status = 'error'
-                 return self._build_result_dict(error="Le solveur dual a retourné optimal mais sans tableaux.")
-
-            final_dual_tableau_info = dual_result['tableaus'][-1]
-            final_dual_tableau_list = final_dual_tableau_info['tableau']
-            final_dual_tableau = np.array(final_dual_tableau_list)
-
-            dual_variable_names_in_tableau = final_dual_tableau_info['variable_names']
-
-            # Find columns for dual slack variables ('sX')
-            dual_slack_col_indices = [i for i, name in enumerate(dual_variable_names_in_tableau) if name.startswith('s')]
-
-            # Ensure the number of slack indices matches the number of original primal variables
-            if len(dual_slack_col_indices) != self.num_original_variables:
-                print(f"Error: Mismatch in dual slack count ({len(dual_slack_col_indices)}) and original primal variable count ({self.num_original_variables}).")
-                self.status = 'error'
-                return self._build_result_dict(error="Erreur interne lors de l'interprétation du résultat dual.")
-
-
-            # Primal solution values are the reduced costs of the dual slack variables
-            # Extract values from the Z-row (last row) at these indices
-            primal_solution_values = final_dual_tableau[-1, dual_slack_col_indices]
-
-            self.solution = primal_solution_values
-            self.variable_names = [f"x{i+1}" for i in range(self.num_original_variables)]
+        self.solution = None
+        self.optimal_value = None
+        if status == STATUS_TIME_LIMIT and primal_feasible:
+            self._set_basic_solution(state)
+        self.status = status
+        return self._build_result_dict()
+
+    def _initial_state(self):
+        if self.exact:
+            return self._exact_initial_state()
+        A, b = self._constraint_matrix()
+        num_rows, num_vars = A.shape
+        at_upper = ()
+        if self.engine == ENGINE_INTERIOR_POINT:
+            basis_vars, at_upper = self._interior_point_basis(A, b)
+        else:
+            basis_vars = self._starting_basis(A)
 
-            return self._build_result_dict()
+        if self.engine == ENGINE_REVISED or (self.engine == ENGINE_INTERIOR_POINT and isinstance(A, CSCMatrix)):
+            self._set_tableau_variable_names(num_vars, num_rows)
+            state = _RevisedState(self, A, b, self._standard_costs(num_rows), basis_vars, self._column_upper_bounds(num_rows))
+        else:
+            # Le tableau est modifié en place à chaque pivot ; seul _record_tableau en prend une copie
+            tableau, slack_basis = self._build_initial_tableau()
+            if basis_vars != slack_basis:
+                tableau = self._tableau_from_basis(basis_vars)
+            self._allocate_pivot_workspace(tableau)
+            state = _TableauState(self, tableau, basis_vars, self._column_upper_bounds(num_rows))
+        for j in at_upper:
+            state.complement(j)
+        return state
+
+    def _exact_initial_state(self):
+        """
+        État du mode exact, lu sur les données saisies (pas sur leur copie flottante) : base
+        des variables d'écart, les bases de départ fournies (initial_basis) étant ignorées pour
+        que les tableaux suivent le calcul à la main.
+        """
+        _, basis_vars = self._build_initial_tableau()
+        num_vars = self.num_original_variables
+        lower = [to_fraction(v) for v in self.lower]
+        rows = []
+        for coefficients, rhs, sign in zip(self.program.dense_matrix(), self.program.b, self._row_signs()):
+            a = [to_fraction(v) for v in coefficients]
+            # x = l + x' : la borne inférieure passe dans le second membre, comme dans _constraint_matrix
+            rhs = to_fraction(rhs) - sum((a_j * l_j for a_j, l_j in zip(a, lower)), Fraction(0))
+            rows.append([int(sign) * v for v in a] + [int(sign) * rhs])
+        objective_sign = int(self._objective_sign())
+        objective_row = [-objective_sign * to_fraction(v) for v in self.c[:num_vars]]
+
+        exact_upper = [to_fraction(u) - l if np.isfinite(u) else None for u, l in zip(self.upper, lower)]
+        exact_upper += [None] * len(basis_vars)
+        return _ExactTableauState(self, ExactTableau(rows, objective_row), basis_vars,
+                                  self._column_upper_bounds(len(basis_vars)), exact_upper)
+
+    def _interior_point_basis(self, A, b):
+        """
+        Moteur point intérieur : la méthode prédicteur-correcteur de Mehrotra résout
+        max c'x s.c. [A' I] z = b', 0 <= z <= u, puis le crossover extrait du point obtenu une
+        base et les variables hors base à leur borne supérieure. Le simplexe dual puis primal
+        part de cette base : en quelques pivots il donne un sommet optimal et son tableau, ou
+        conclut à l'infaisabilité ou au non-borné quand les itérés ont divergé.
+        """
+        num_rows, num_vars = A.shape
+        dense = A.to_dense() if isinstance(A, CSCMatrix) else A
+        full = np.hstack([dense, np.eye(num_rows)])
+        upper = self._column_upper_bounds(num_rows)
+
+        start = time.perf_counter()
+        point = mehrotra_predictor_corrector(full, b, -self._standard_costs(num_rows), upper,
+                                             stop=lambda: self._limits.reached() is not None)
+        ipm_time = time.perf_counter() - start
+        basis_vars, at_upper = crossover_basis(full, point['x'], upper)
+        try:
+            BasisFactorization(self._basis_matrix(A, basis_vars))
+        except ValueError:
+            # Base numériquement singulière : le simplexe repart des variables d'écart
+            basis_vars, at_upper = list(range(num_vars, num_vars + num_rows)), []
+
+        self.interior_point_report = {
+            'status': point['status'],
+            'iterations': point['iterations'],
+            'primal_residual': point['primal_residual'],
+            'dual_residual': point['dual_residual'],
+            'gap': point['gap'],
+            'objective': float(self._objective_sign() * (self._standard_costs(num_rows) @ point['x'])
+                               + self.c[:self.num_original_variables] @ self.lower),
+            'ipm_time': ipm_time,
+            'crossover_time': time.perf_counter() - start - ipm_time,
+        }
+        return basis_vars, at_upper
+
+    def _starting_basis(self, A):
+        """
+        Base de départ : `initial_basis` si elle est encore utilisable, complétée par les variables
+        d'écart des contraintes ajoutées depuis ; sinon la base des variables d'écart (B = I).
+        Après une modification de l'objectif, la base reste primal réalisable et seul le simplexe
+        primal travaille ; après une modification du second membre ou un ajout de contrainte,
+        elle reste dual réalisable et le simplexe dual la répare en quelques pivots.
+        """
+        num_rows, num_vars = A.shape
+        slack_basis = list(range(num_vars, num_vars + num_rows))
+        if not self.initial_basis or len(self.initial_basis) > num_rows:
+            return slack_basis
+
+        # Les contraintes ajoutées sont en fin de liste : leurs variables d'écart entrent dans la base
+        basis_vars = [int(j) for j in self.initial_basis] + slack_basis[len(self.initial_basis):]
+        if len(set(basis_vars)) != num_rows or not all(0 <= j < num_vars + num_rows for j in basis_vars):
+            return slack_basis
+        try:
+            BasisFactorization(self._basis_matrix(A, basis_vars))
+        except ValueError:
+            # Base singulière pour les nouvelles données : départ à froid
+            return slack_basis
+
+        self.warm_started = basis_vars != slack_basis
+        return basis_vars
+
+    def _run_dual(self, state):
+        """
+        Simplexe dual : la variable de base la plus négative sort, la colonne entrante est
+        choisie par le test du ratio dual sur la ligne pivot. La ligne Z est celle du vrai
+        objectif : si elle n'est pas encore dual réalisable, les coûts réduits négatifs sont
+        comptés comme nuls dans le ratio et le simplexe primal termine ensuite le travail.
+        Avec des bornes, une variable de base au-dessus de sa borne supérieure sort aussi : le
+        test porte alors sur la ligne changée de signe et la variable sort à sa borne supérieure.
+        Renvoie 'feasible', 'infeasible' ou 'time_limit'.
+        """
+        stats = self._stats
+        stats.mark()
+        while True:
+            basic_values = state.basic_values()
+            if not basic_values.size:
+                return 'feasible'
+            if self.bounded:
+                infeasibility = np.maximum(-basic_values, basic_values - state.upper[state.basis_vars])
+                pivot_row = int(np.argmax(infeasibility))
+                if infeasibility[pivot_row] <= 1e-9:
+                    return 'feasible'
+                above_upper = basic_values[pivot_row] > state.upper[state.basis_vars[pivot_row]]
+            else:
+                pivot_row = int(np.argmin(basic_values))
+                if basic_values[pivot_row] >= -1e-9:
+                    return 'feasible'
+                above_upper = False
+            stats.lap(PRICING)
+            # Limite vérifiée après le test de réalisabilité : une base réalisable garde sa solution
+            if self._limit_hit():
+                return STATUS_TIME_LIMIT
+
+            pivot_row_values = state.pivot_row_values(pivot_row)
+            flips = ()
+            if above_upper:
+                # x_B = u - x̄_B : la ligne de x̄_B est l'opposée, sans la variable sortante elle-même
+                leaving = state.basis_vars[pivot_row]
+                pivot_row_values = -pivot_row_values
+                pivot_row_values[leaving] = 0.0
+                flips = (leaving,)
+
+            pivot_col = self._dual_ratio_test(state.reduced_costs(), pivot_row_values)
+            stats.lap(RATIO_TEST)
+            if pivot_col is None:
+                # Ligne x_B = b_r - somme(alpha_rj x_j) avec b_r < 0 et alpha_rj >= 0 : aucune solution
+                return 'infeasible'
 
-        elif dual_result['status'] == 'unbounded':
-            self.status = 'infeasible'
-            self.solution = None
-            self.optimal_value = None
-            return self._build_result_dict(error="Le problème primal est infaisable (son dual est non borné).")
+            self._pivot(state, pivot_row, pivot_col, state.entering_column(pivot_col), flips)
 
-        elif dual_result['status'] == 'infeasible':
-             self.status = 'unbounded'
-             self.solution = None
-             self.optimal_value = None
-             return self._build_result_dict(error="Le problème primal est non borné (son dual est infaisable).")
+    def _run_primal(self, state):
+        """Simplexe primal à partir d'une base réalisable. Renvoie 'optimal', 'unbounded' ou 'time_limit'."""
+        stats = self._stats
+        stats.mark()
+        self._pricing_rule.start(state, state.basis_vars)
 
+        while not self._limit_hit():
+            pivot_col = self._pricing_rule.select(state)
+            stats.lap(PRICING)
+            if pivot_col is None:
+                return 'optimal'
+
+            alpha = state.entering_column(pivot_col)
+            if self.bounded:
+                step = self._bounded_ratio_test(state.basic_values(), alpha, state.upper[state.basis_vars], state.upper[pivot_col])
+                stats.lap(RATIO_TEST)
+                if step is None:
+                    return 'unbounded'
+                pivot_row, leaves_at_upper = step
+                if pivot_row is None:
+                    # La variable entrante atteint sa borne avant toute variable de base : changement de borne
+                    self._pivot(state, None, pivot_col, alpha, flips=(pivot_col,))
+                    continue
+                flips = (state.basis_vars[pivot_row],) if leaves_at_upper else ()
+            else:
+                pivot_row = self._ratio_test(state.basic_values(), alpha)
+                stats.lap(RATIO_TEST)
+                if pivot_row is None:
+                    return 'unbounded'
+                flips = ()
+
+            self._pricing_rule.update(state, pivot_row, pivot_col, state.basis_vars[pivot_row], alpha)
+            stats.lap(PRICING)
+            self._pivot(state, pivot_row, pivot_col, alpha, flips)
+
+        return STATUS_TIME_LIMIT
+
+    def _limit_hit(self):
+        # Vérifié avant chaque pivot : durée, nombre d'itérations et jeton d'annulation
+        self.limit_reached = self._limits.reached(self.iterations)
+        return self.limit_reached is not None
+
+    def _pivot(self, state, pivot_row, pivot_col, alpha, flips=()):
+        """
+        Une itération : pivot (sauf pour un simple changement de borne, pivot_row None), puis
+        passage des variables de `flips`, hors base, à l'autre borne (x_j = u_j - x̄_j).
+        """
+        stats = self._stats
+        if stats.enabled:
+            objective_before = state.objective_value()
+        if pivot_row is not None:
+            state.pivot(pivot_row, pivot_col, alpha)
+        for j in flips:
+            state.complement(j)
+        stats.lap(PIVOT)
+        self.iterations += 1
+        pivot = (pivot_row, pivot_col)
+        if flips:
+            # Le journal des pivots garde la borne (à l'échelle d'origine) pour rejouer le changement de variable
+            # (exacte en mode exact, pour rejouer le journal en fractions)
+            bound = (lambda j: state.exact_upper[j]) if self.exact else (lambda j: self._unscaled_upper(j, state.upper[j]))
+            pivot = (-1 if pivot_row is None else pivot_row, pivot_col, [(j, bound(j)) for j in flips])
+        self._record_tableau(state.tableau_info(), self.iterations, pivot=pivot)
+        stats.lap(RECORDING)
+        if stats.enabled:
+            stats.end_iteration(is_degenerate(objective_before, state.objective_value()), self._tableau_bytes(state))
+
+    def _bounded_ratio_test(self, basic_values, alpha, basic_upper, entering_upper):
+        """
+        Test du ratio avec bornes supérieures : la première variable de base à atteindre 0
+        (alpha > 0) ou sa borne supérieure (alpha < 0), plus petit indice parmi les ex aequo.
+        Renvoie (ligne, sortie à la borne supérieure), (None, False) si la variable entrante
+        atteint sa propre borne d'abord, ou None si rien ne la limite.
+        """
+        ratios = np.full(alpha.size, np.inf)
+        to_zero = alpha > 1e-9
+        ratios[to_zero] = basic_values[to_zero] / alpha[to_zero]
+        to_upper = (alpha < -1e-9) & np.isfinite(basic_upper)
+        ratios[to_upper] = (basic_upper[to_upper] - basic_values[to_upper]) / -alpha[to_upper]
+        ratios[ratios < -1e-9] = np.inf
+
+        best = ratios.min(initial=np.inf)
+        if entering_upper <= best + 1e-9:
+            return None if np.isinf(entering_upper) else (None, False)
+        pivot_row = int(np.flatnonzero(np.abs(ratios - best) < 1e-9)[0])
+        return pivot_row, bool(to_upper[pivot_row])
+
+    def _dual_ratio_test(self, reduced_costs, pivot_row_values):
+        candidates = np.flatnonzero(pivot_row_values < -1e-9)
+        if candidates.size == 0:
+            return None
+        ratios = np.maximum(reduced_costs[candidates], 0.0) / -pivot_row_values[candidates]
+        ties = candidates[ratios <= ratios.min() + 1e-9]
+        # Parmi les ex aequo, le plus grand |alpha_rj| pour la stabilité numérique
+        return int(ties[np.argmax(-pivot_row_values[ties])])
+
+    def _set_optimal_solution(self, state):
+        self._set_basic_solution(state)
+        self.status = 'optimal'
+
+    def _set_basic_solution(self, state):
+        # Solution de base (variables d'origine) et valeur de l'objectif de l'état courant
+        basic_values = state.basic_values()
+        self.solution = np.zeros(self.num_original_variables)
+        for i, var_idx in enumerate(state.basis_vars):
+            if var_idx < self.num_original_variables:
+                self.solution[var_idx] = basic_values[i]
+        for j in state.at_upper:
+            # Variable écrite x_j = u_j - x̄_j (hors base : x̄_j = 0, elle est à sa borne supérieure)
+            self.solution[j] = state.upper[j] - self.solution[j]
+        if self._column_scale is not None:
+            # x = S x_s ; la valeur de l'objectif est la même dans les deux échelles
+            self.solution *= self._column_scale
+        # La forme standard maximise : l'objectif d'une minimisation est de signe opposé
+        self.optimal_value = float(self._objective_sign() * state.objective_value())
+        if self.bounded:
+            # x = l + x' : la partie fixe c.l de l'objectif
+            self.solution += self.lower
+            self.optimal_value += float(self.c[:self.num_original_variables] @ self.lower)
+        if self.exact:
+            self._set_exact_solution(state)
+
+    def _set_exact_solution(self, state):
+        # Même calcul que _set_basic_solution, en fractions à partir du tableau exact
+        num_vars = self.num_original_variables
+        num_rows = len(state.basis_vars)
+        solution = [Fraction(0)] * num_vars
+        for i, var_idx in enumerate(state.basis_vars):
+            if var_idx < num_vars:
+                solution[var_idx] = state.exact.entry(i, -1, state.basis_vars)
+        for j in state.at_upper:
+            solution[j] = state.exact_upper[j] - solution[j]
+        lower = [to_fraction(v) for v in self.lower]
+        solution = [x + l for x, l in zip(solution, lower)]
+        value = int(self._objective_sign()) * state.exact.entry(num_rows, -1, state.basis_vars)
+        value += sum((to_fraction(c_j) * l_j for c_j, l_j in zip(self.c[:num_vars], lower)), Fraction(0))
+        self.exact_solution = {'solution': [str(x) for x in solution], 'optimal_value': str(value)}
+
+    def _objective_sign(self):
+        return -1.0 if self.objective_type == 'min' else 1.0
+
+    def _row_signs(self):
+        return np.where(self.program.senses == SENSE_GE, -1.0, 1.0)
+
+    def _constraint_matrix(self):
+        """
+        Matrice A' et second membre b' de la forme standard (lignes '>=' changées de signe) :
+        dense, ou CSC si le problème a été fourni en forme creuse. Avec `scaling`, ce sont
+        R A' S et R b' : tous les moteurs travaillent alors sur le problème mis à l'échelle.
+        """
+        if self._standard_form is not None:
+            return self._standard_form
+
+        signs = self._row_signs()
+        b = signs * self.program.b
+        if self.program.is_sparse:
+            # Conversion CSC (et changement de signe) : accès par colonne pour le pricing et ftran
+            csc = self.program.A.tocsc()
+            A = CSCMatrix(csc.data * signs[csc.indices], csc.indices, csc.indptr, csc.shape)
         else:
-            self.status = dual_result['status']
-            self.solution = None
-            self.optimal_value = None
-            dual_error_message = dual_result.get('error', 'Erreur inconnue dans le solveur dual.')
-            return self._build_result_dict(error=f"Une erreur est survenue lors de la résolution du problème dual : {dual_error_message}")
+            # Seule copie de A : celle de la forme standard, les lignes '>=' changées de signe
+            A = self.program.A * signs[:, np.newaxis]
+
+        if np.any(self.lower != 0.0):
+            # x = l + x' avec x' >= 0 : la borne inférieure passe dans le second membre
+            b = b - (A.matvec(self.lower) if isinstance(A, CSCMatrix) else A @ self.lower)
+
+        if self.scaling is not None:
+            self._row_scale, self._column_scale = compute_scaling(A, self.scaling)
+            A = scale_matrix(A, self._row_scale, self._column_scale)
+            b = b * self._row_scale
+
+        self._standard_form = (A, b)
+        return self._standard_form
+
+    def _standard_costs(self, num_rows):
+        # Coûts de la forme standard (S c' si le problème est mis à l'échelle), variables d'écart comprises
+        costs = self._objective_sign() * self.c[:self.num_original_variables]
+        if self.scaling is not None:
+            self._constraint_matrix()
+            costs = costs * self._column_scale
+        return np.concatenate([costs, np.zeros(num_rows)])
+
+    def _column_upper_bounds(self, num_rows):
+        # Borne supérieure de chaque colonne de travail (x' = x - l, mis à l'échelle), +inf pour les écarts
+        upper = self.upper - self.lower
+        if self.scaling is not None:
+            self._constraint_matrix()
+            upper = upper / self._column_scale
+        return np.concatenate([upper, np.full(num_rows, np.inf)])
+
+    def _unscaled_upper(self, j, upper):
+        return upper * self._column_scale[j] if self._column_scale is not None else upper
+
+    def _unscaled(self, tableau, basis_vars):
+        # Tableau du problème d'origine (copie), à partir du tableau de travail mis à l'échelle
+        if self._row_scale is None:
+            return tableau.copy()
+        return unscale_tableau(tableau, basis_vars, self._row_scale, self._column_scale)
+
+    def _price(self, A, y, start=0, stop=None):
+        # y^T A (colonnes start..stop-1), sans densifier A lorsqu'elle est creuse
+        if isinstance(A, CSCMatrix):
+            return A.rmatvec(y, start, stop)
+        return y @ A[:, start:stop]
+
+    def _tableau_column(self, A, j):
+        num_rows, num_vars = A.shape
+        if j < num_vars:
+            return A.getcol(j) if isinstance(A, CSCMatrix) else A[:, j].copy()
+        column = np.zeros(num_rows)
+        column[j - num_vars] = 1.0
+        return column
+
+    def _basis_matrix(self, A, basis_vars):
+        if not len(basis_vars):
+            # Aucune contrainte (toutes les limites sont des bornes) : base vide
+            return np.zeros((A.shape[0], 0))
+        return np.column_stack([self._tableau_column(A, j) for j in basis_vars])
+
+    def _tableau_from_basis(self, basis_vars, at_upper=None):
+        """
+        Reconstruit le tableau complet [B^-1 A' | B^-1 | B^-1 b'] et sa ligne Z pour une base donnée,
+        puis le changement de variable x_j = u_j - x̄_j des variables de `at_upper`.
+        """
+        A, b = self._constraint_matrix()
+        num_rows, num_vars = A.shape
+        c_full = self._standard_costs(num_rows)
+        if isinstance(A, CSCMatrix):
+            # Tableau destiné à l'affichage uniquement : la densification est assumée ici
+            A = A.to_dense()
+
+        body = np.hstack([A, np.eye(num_rows), b.reshape(-1, 1)])
+        tableau = np.zeros((num_rows + 1, body.shape[1]))
+        tableau[:-1, :] = np.linalg.solve(self._basis_matrix(A, basis_vars), body)
+
+        c_basis = c_full[list(basis_vars)]
+        tableau[-1, :-1] = c_basis @ tableau[:-1, :-1] - c_full
+        tableau[-1, -1] = c_basis @ tableau[:-1, -1]
+
+        if at_upper:
+            upper = self._column_upper_bounds(num_rows)
+            basis_rows = {j: r for r, j in enumerate(basis_vars)}
+            for j in at_upper:
+                complement_in_place(tableau, j, upper[j], basis_rows.get(j))
+        return tableau
 
     def _build_initial_tableau(self):
-         num_vars_in_this_problem = self.num_original_variables
-         num_constraints_in_this_problem = self.num_original_constraints
-
-         if any(c.get('sense') != SENSE_LE or c.get('rhs') is None or c.get('coefficients') is None for c in self.constraints_data):
+         sparse = self.program.is_sparse
+         if not np.all(np.isin(self.program.senses, (SENSE_LE, SENSE_GE))):
              raise ValueError("Internal Error: _build_initial_tableau received invalid constraint data format.")
-         if any(len(c.get('coefficients', [])) != num_vars_in_this_problem for c in self.constraints_data):
-              raise ValueError(f"Internal Error: Coefficient list length mismatch in _build_initial_tableau. Expected {num_vars_in_this_problem}, got different.")
 
-         num_slack = num_constraints_in_this_problem
-         num_total_vars_in_tableau = num_vars_in_this_problem + num_slack
+         A, b = self._constraint_matrix()
+         num_constraints, num_vars = A.shape
 
-         tableau = np.zeros((num_constraints_in_this_problem + 1, num_total_vars_in_tableau + 1), dtype=float)
+         tableau = np.zeros((num_constraints + 1, num_vars + num_constraints + 1), dtype=float)
+         if sparse:
+             A.to_dense(out=tableau[:num_constraints, :num_vars])
+         else:
+             tableau[:num_constraints, :num_vars] = A
 
-         basis_vars = []
-         slack_col_offset = num_vars_in_this_problem
-         current_slack = 0
+         # Variables d'écart de la forme standard : une colonne identité, et la base initiale
+         basis_vars = list(range(num_vars, num_vars + num_constraints))
+         tableau[np.arange(num_constraints), basis_vars] = 1.0
+         tableau[:num_constraints, -1] = b
+         tableau[num_constraints, :-1] = -self._standard_costs(num_constraints)
 
-         for i, constraint in enumerate(self.constraints_data):
-             coeffs = constraint.get('coefficients', [0.0] * num_vars_in_this_problem)
-             tableau[i, :num_vars_in_this_problem] = coeffs
-             tableau[i, slack_col_offset + current_slack] = 1.0
-             tableau[i, -1] = constraint.get('rhs', 0.0)
-             basis_vars.append(slack_col_offset + current_slack)
-             current_slack += 1
+         self._set_tableau_variable_names(num_vars, num_constraints)
 
-         c_coeffs = self.c[:num_vars_in_this_problem]
-         tableau[num_constraints_in_this_problem, :num_vars_in_this_problem] = -c_coeffs
+         return tableau, basis_vars
 
-         original_prefix = 'y' if self.objective_type == 'min' else 'x'
-         original_var_names = [f"{original_prefix}{i+1}" for i in range(num_vars_in_this_problem)]
+    def _set_tableau_variable_names(self, num_vars, num_slack):
+         original_var_names = [f"x{i+1}" for i in range(num_vars)]
          slack_var_names = [f"s{i+1}" for i in range(num_slack)]
          self.variable_names = original_var_names + slack_var_names
 
-         return tableau, basis_vars
+    def _record_tableau(self, tableau_info, iteration, pivot=None):
+         """
+         Enregistre l'itération selon le mode d'historique. `tableau_info` peut référencer le
+         tableau de travail (modifié en place) : seules les entrées conservées sont copiées.
+         """
+         # Simple référence vers l'état courant, copiée seulement si elle devient le tableau final
+         self._last_record = (tableau_info, iteration)
 
-    def _record_tableau(self, tableau_info, iteration):
-         cloned_info = {
-             'tableau': tableau_info['tableau'].copy(),
+         if self.verbose:
+              tableau = tableau_info.get('tableau')
+              if tableau is None:
+                   tableau = self._tableau_from_basis(tableau_info['basis_vars'], tableau_info.get('at_upper'))
+              self.print_tableau(dict(tableau_info, tableau=self._unscaled(tableau, tableau_info['basis_vars'])), iteration)
+
+         if self.history == HISTORY_PIVOT_LOG:
+              if self.pivot_log is None:
+                   self.pivot_log = {'initial': self._clone_tableau_info(tableau_info, iteration), 'pivots': []}
+              else:
+                   self.pivot_log['pivots'].append(pivot)
+              return
+
+         if self.history == HISTORY_FULL or (self.history == HISTORY_EVERY_K and iteration % self.history_every == 0):
+              self.tableaus.append(self._clone_tableau_info(tableau_info, iteration))
+
+    def _record_final_tableau(self):
+         # Modes 'final' et 'every-k' : le dernier tableau atteint est toujours conservé
+         if self.history not in (HISTORY_FINAL, HISTORY_EVERY_K) or self._last_record is None:
+              return
+         tableau_info, iteration = self._last_record
+         if not self.tableaus or self.tableaus[-1].get('iteration') != iteration:
+              self.tableaus.append(self._clone_tableau_info(tableau_info, iteration))
+
+    def _clone_tableau_info(self, tableau_info, iteration):
+         clone = {
+             'tableau': self._unscaled(tableau_info['tableau'], tableau_info['basis_vars']) if tableau_info.get('tableau') is not None else None,
              'basis_vars': tableau_info.get('basis_vars')[:] if tableau_info.get('basis_vars') is not None else None,
-             'variable_names': tableau_info.get('variable_names')[:] if tableau_info.get('variable_names') is not None else None
+             'variable_names': tableau_info.get('variable_names')[:] if tableau_info.get('variable_names') is not None else None,
+             'at_upper': list(tableau_info.get('at_upper') or []),
+             'iteration': iteration
          }
-         self.tableaus.append(cloned_info)
-         if self.verbose:
-              self.print_tableau(cloned_info, iteration)
+         if clone['tableau'] is not None:
+              self._history_bytes += clone['tableau'].nbytes
+         if tableau_info.get('exact') is not None:
+              # Fractions calculées seulement pour les tableaux conservés
+              clone['exact_tableau'] = [[str(v) for v in row] for row in tableau_info['exact'].to_fractions(tableau_info['basis_vars'])]
+         return clone
+
+    def _tableau_bytes(self, state):
+         # Tableau de travail (aucun pour le moteur révisé) et tableaux conservés par l'historique
+         tableau = getattr(state, 'tableau', None)
+         return (tableau.nbytes if tableau is not None else 0) + self._history_bytes
+
+    def _instrumentation_report(self):
+         return self._stats.report(self.engine, self.iterations, self._basis_condition())
+
+    def _basis_condition(self):
+         """Conditionnement (norme 1) de la base finale, dans la forme standard (mise à l'échelle comprise)."""
+         if self._last_record is None or self.status == 'error':
+              return None
+         A, _ = self._constraint_matrix()
+         basis = self._basis_matrix(A, self._last_record[0]['basis_vars'])
+         if not basis.size:
+              return None
+         try:
+              condition = float(np.linalg.cond(basis, 1))
+         except np.linalg.LinAlgError:
+              return None
+         return condition if np.isfinite(condition) else None
+
+    def final_tableau(self):
+         """Dernier tableau atteint par la résolution, quel que soit le mode d'historique."""
+         if self._presolved_solver is not None:
+              return self._presolved_solver.final_tableau()
+         if self._last_record is None:
+              return None
+         tableau_info, _ = self._last_record
+         tableau = tableau_info.get('tableau')
+         if tableau is None:
+              tableau = self._tableau_from_basis(tableau_info['basis_vars'], tableau_info.get('at_upper'))
+         return self._unscaled(tableau, tableau_info['basis_vars'])
+
+    def sensitivity(self):
+         """
+         Prix fictifs, coûts réduits et intervalles de stabilité de la base optimale
+         (seconds membres et coefficients de l'objectif), calculés une seule fois.
+         """
+         if self.status != 'optimal':
+              return None
+         if self._sensitivity is None and self._last_record is not None:
+              tableau_info, _ = self._last_record
+              # Tableau du moteur tableau lu sans copie ; sinon reconstruit depuis la base et remis à l'échelle
+              tableau = tableau_info['tableau'] if tableau_info.get('tableau') is not None and self.scaling is None else self.final_tableau()
+              num_rows = len(tableau_info['basis_vars'])
+              self._sensitivity = sensitivity_from_tableau(
+                  tableau, tableau_info['basis_vars'], self.c[:self.num_original_variables],
+                  self.program.b, self._row_signs(), self._objective_sign(),
+                  upper_bounds=np.concatenate([self.upper - self.lower, np.full(num_rows, np.inf)]) if self.bounded else None,
+                  at_upper=tableau_info.get('at_upper') or (),
+              )
+         return self._sensitivity
+
+    def tableau_at(self, iteration):
+         """Tableau d'une itération donnée, reconstruit depuis le journal des pivots si nécessaire."""
+         if self._presolved_solver is not None:
+              return self._presolved_solver.tableau_at(iteration)
+         if self.pivot_log is not None:
+              entries = replay_pivot_log(self._serialize_pivot_log(), iteration=iteration)
+              return entries[0] if entries else None
+         for t_info in self.tableaus:
+              if t_info.get('iteration') == iteration:
+                   return self._serialize_tableau_info(t_info)
+         return None
 
     def print_tableau(self, tableau_info, iteration=None):
         tableau = tableau_info['tableau']
@@ -352,21 +932,13 @@ class SimplexSolver:
              formatted_z_row.append(f"{tableau[num_constraint_rows, j]:.2f}".ljust(col_widths[col_idx_in_widths]))
         print(" ".join(formatted_z_row))
 
-    def _check_optimality(self, tableau):
-        last_row = tableau[-1, :-1]
-        return np.all(last_row >= -1e-9)
-
     def _choose_pivot_column(self, tableau):
-        last_row = tableau[-1, :-1]
-        j = np.argmin(last_row)
-        if last_row[j] < -1e-9:
-             return j
-        else:
-             return None
+        return self._pricing_rule.select(_TableauState(self, tableau, None))
 
     def _choose_pivot_row(self, tableau, pivot_col):
-        rhs = tableau[:-1, -1]
-        col = tableau[:-1, pivot_col]
+        return self._ratio_test(tableau[:-1, -1], tableau[:-1, pivot_col])
+
+    def _ratio_test(self, rhs, col):
         ratios = []
         for i in range(len(rhs)):
             if col[i] > 1e-9:
@@ -383,31 +955,347 @@ class SimplexSolver:
 
         return pivot_row_index
 
-    def _perform_pivot_operations(self, tableau, pivot_row, pivot_col):
-        new_tableau = tableau.copy()
-        pivot_elem = new_tableau[pivot_row, pivot_col]
-
-        if abs(pivot_elem) < 1e-9:
-             raise ValueError("Pivot element is zero or close to zero. Algorithm error.")
-
-        new_tableau[pivot_row, :] /= pivot_elem
-
-        num_rows = new_tableau.shape[0]
-        for i in range(num_rows):
-            if i != pivot_row:
-                factor = new_tableau[i, pivot_col]
-                new_tableau[i, :] -= factor * new_tableau[pivot_row, :]
-
-        return new_tableau
+    def _allocate_pivot_workspace(self, tableau):
+        # Tampons réutilisés par tous les pivots d'une résolution : aucune allocation par itération
+        self._pivot_column_buffer, self._pivot_block_buffer = pivot_workspace(tableau)
 
-    def _extract_solution(self, tableau, basis_vars):
-         num_vars_to_extract = self.num_original_variables
-         solution = np.zeros(num_vars_to_extract)
-
-         for i, var_idx in enumerate(basis_vars):
-             if var_idx < num_vars_to_extract:
-                 solution[var_idx] = tableau[i, -1]
-
-         optimal_value = tableau[-1, -1]
-
-         return solution, optimal_value
\ No newline at end of file
+    def _perform_pivot_operations(self, tableau, pivot_row, pivot_col):
+        if getattr(self, '_pivot_column_buffer', None) is None or self._pivot_column_buffer.size != tableau.shape[0] \
+                or self._pivot_block_buffer.shape[1] != tableau.shape[1]:
+             self._allocate_pivot_workspace(tableau)
+        return pivot_in_place(tableau, pivot_row, pivot_col, self._pivot_column_buffer, self._pivot_block_buffer)
+
+
+class _TableauState:
+    """
+    État du moteur tableau : le tableau courant, modifié en place à chaque pivot.
+    Sert aussi de vue aux règles de pricing, qui lisent directement la ligne Z.
+    """
+
+    def __init__(self, solver, tableau, basis_vars, upper=None):
+        self.solver = solver
+        self.tableau = tableau
+        self.basis_vars = basis_vars
+        self.num_columns = tableau.shape[1] - 1
+        self.upper = upper
+        # Variables écrites x_j = u_j - x̄_j : hors base, elles sont à leur borne supérieure
+        self.at_upper = set()
+
+    def reduced_costs(self, start=0, stop=None):
+        stop = self.num_columns if stop is None else stop
+        return self.tableau[-1, start:stop]
+
+    def column_norms_squared(self):
+        body = self.tableau[:-1, :-1]
+        return np.einsum('ij,ij->j', body, body)
+
+    def pivot_row_values(self, pivot_row):
+        return self.tableau[pivot_row, :-1]
+
+    def column_dot_products(self, vector):
+        return vector @ self.tableau[:-1, :-1]
+
+    def basic_values(self):
+        return self.tableau[:-1, -1]
+
+    def objective_value(self):
+        return self.tableau[-1, -1]
+
+    def entering_column(self, pivot_col):
+        return self.tableau[:-1, pivot_col]
+
+    def pivot(self, pivot_row, pivot_col, alpha):
+        self.solver._perform_pivot_operations(self.tableau, pivot_row, pivot_col)
+        self.basis_vars[pivot_row] = pivot_col
+
+    def complement(self, j):
+        complement_in_place(self.tableau, j, self.upper[j])
+        self.at_upper ^= {j}
+
+    def tableau_info(self):
+        return {'tableau': self.tableau, 'basis_vars': self.basis_vars, 'variable_names': self.solver.variable_names,
+                'at_upper': sorted(self.at_upper)}
+
+
+class _ExactTableauState(_TableauState):
+    """
+    État du mode exact : le tableau entier sans fraction (problems.exact.ExactTableau) fait
+    foi ; `tableau` en est la copie flottante, recalculée après chaque pivot, que lisent les
+    règles de pricing et les tests du ratio (mêmes choix de pivots que le moteur tableau).
+    """
+
+    def __init__(self, solver, exact, basis_vars, upper, exact_upper):
+        super().__init__(solver, exact.to_float(basis_vars), basis_vars, upper)
+        self.exact = exact
+        self.exact_upper = exact_upper
+
+    def pivot(self, pivot_row, pivot_col, alpha):
+        self.exact.pivot(pivot_row, pivot_col)
+        self.basis_vars[pivot_row] = pivot_col
+        self.tableau = self.exact.to_float(self.basis_vars)
+
+    def complement(self, j):
+        self.exact.complement(j, self.exact_upper[j])
+        self.at_upper ^= {j}
+        self.tableau = self.exact.to_float(self.basis_vars)
+
+    def tableau_info(self):
+        return dict(super().tableau_info(), exact=self.exact)
+
+
+class _RevisedState:
+    """
+    État du simplexe révisé : seule la matrice A' est conservée, la base est factorisée
+    (LU + etas) et les coûts réduits sont calculés à la demande. Les tableaux d'itérations
+    ne sont pas construits : seule la base est enregistrée et le tableau complet est
+    reconstruit lors de la sérialisation (ou à partir du journal des pivots).
+
+    Une variable à sa borne supérieure est écrite x_j = u_j - x̄_j : sa colonne et son coût
+    changent de signe (`signs`) et u_j a_j passe dans le second membre. La factorisation
+    reste celle de la base non signée ; les vues appliquent les signes.
+    """
+
+    def __init__(self, solver, A, b, c_full, basis_vars, upper=None):
+        self.solver = solver
+        self.A = A
+        self.b = b
+        self.c_full = c_full
+        self.basis_vars = basis_vars
+        self.num_structural = A.shape[1]
+        self.num_columns = A.shape[0] + A.shape[1]
+        self.upper = upper
+        self.at_upper = set()
+        self.signs = np.ones(self.num_columns)
+        self.objective_shift = 0.0
+        self.factorization = BasisFactorization(solver._basis_matrix(A, basis_vars), refactor_frequency=solver.refactor_frequency)
+        self.x_basic = self.factorization.ftran(b)
+        self._duals = None
+
+    @property
+    def duals(self):
+        # c_B B^-1, recalculé au plus une fois par base (les signes de la base et des coûts se compensent)
+        if self._duals is None:
+            self._duals = self.factorization.btran(self.c_full[self.basis_vars])
+        return self._duals
+
+    def _row_of_inverse_times(self, vector, start=0, stop=None):
+        # vector^T [A I] pour les colonnes start..stop-1
+        stop = self.num_columns if stop is None else stop
+        n = self.num_structural
+        parts = []
+        if start < n:
+            parts.append(self.solver._price(self.A, vector, start, min(stop, n)))
+        if stop > n:
+            parts.append(vector[max(start - n, 0):stop - n])
+        return np.concatenate(parts) if len(parts) > 1 else np.array(parts[0], dtype=float)
+
+    def _basis_signs(self):
+        return self.signs[self.basis_vars]
+
+    def reduced_costs(self, start=0, stop=None):
+        stop = self.num_columns if stop is None else stop
+        reduced_costs = self._row_of_inverse_times(self.duals, start, stop) - self.c_full[start:stop]
+        if self.at_upper:
+            reduced_costs *= self.signs[start:stop]
+        return reduced_costs
+
+    def column_norms_squared(self):
+        num_rows = self.A.shape[0]
+        if all(j >= self.num_structural for j in self.basis_vars):
+            # Base de variables d'écart : B = I, les normes sont celles des colonnes de [A I]
+            if isinstance(self.A, CSCMatrix):
+                structural_norms = self.A.column_norms_squared()
+            else:
+                structural_norms = np.einsum('ij,ij->j', self.A, self.A)
+            return np.concatenate([structural_norms, np.ones(num_rows)])
+        A_dense = self.A.to_dense() if isinstance(self.A, CSCMatrix) else self.A
+        basis_matrix = self.solver._basis_matrix(self.A, self.basis_vars)
+        body = np.linalg.solve(basis_matrix, np.hstack([A_dense, np.eye(num_rows)]))
+        return np.einsum('ij,ij->j', body, body)
+
+    def pivot_row_values(self, pivot_row):
+        unit = np.zeros(self.A.shape[0])
+        unit[pivot_row] = 1.0
+        values = self._row_of_inverse_times(self.factorization.btran(unit))
+        if self.at_upper:
+            values *= self.signs * self.signs[self.basis_vars[pivot_row]]
+        return values
+
+    def column_dot_products(self, vector):
+        if self.at_upper:
+            return self._row_of_inverse_times(self.factorization.btran(vector * self._basis_signs())) * self.signs
+        return self._row_of_inverse_times(self.factorization.btran(vector))
+
+    def basic_values(self):
+        return self.x_basic
+
+    def objective_value(self):
+        if self.at_upper:
+            return (self.c_full[self.basis_vars] * self._basis_signs()) @ self.x_basic + self.objective_shift
+        return self.c_full[self.basis_vars] @ self.x_basic
+
+    def entering_column(self, pivot_col):
+        alpha = self.factorization.ftran(self.solver._tableau_column(self.A, pivot_col))
+        if self.at_upper:
+            alpha *= self._basis_signs() * self.signs[pivot_col]
+        return alpha
+
+    def pivot(self, pivot_row, pivot_col, alpha):
+        theta = self.x_basic[pivot_row] / alpha[pivot_row]
+        self.x_basic -= theta * alpha
+        self.x_basic[pivot_row] = theta
+        if self.at_upper:
+            # Colonne entrante de la base non signée, pour la mise à jour de la factorisation
+            alpha = alpha * self._basis_signs() * self.signs[pivot_col]
+        self.basis_vars[pivot_row] = pivot_col
+        self._duals = None
+
+        self.factorization.update(pivot_row, alpha)
+        if self.factorization.needs_refactor():
+            self.factorization.refactor(self.solver._basis_matrix(self.A, self.basis_vars))
+            self.x_basic = self.factorization.ftran(self.b)
+            if self.at_upper:
+                self.x_basic *= self._basis_signs()
+
+    def complement(self, j):
+        # x_j = u_j - x̄_j (j hors base) : u_j fois sa colonne signée passe dans le second membre
+        upper = self.upper[j]
+        self.x_basic = self.x_basic - upper * self.entering_column(j)
+        self.b = self.b - upper * self.signs[j] * self.solver._tableau_column(self.A, j)
+        self.objective_shift += upper * self.signs[j] * self.c_full[j]
+        self.signs[j] = -self.signs[j]
+        self.at_upper ^= {j}
+
+    def tableau_info(self):
+        return {'tableau': None, 'basis_vars': self.basis_vars, 'variable_names': self.solver.variable_names,
+                'at_upper': sorted(self.at_upper)}
+
+
+def pivot_workspace(tableau):
+    """Tampons de pivot_in_place pour ce tableau : la colonne pivot (m) et un bloc de lignes."""
+    return np.empty(tableau.shape[0]), np.empty((min(tableau.shape[0], PIVOT_BLOCK_ROWS), tableau.shape[1]))
+
+
+def pivot_in_place(tableau, pivot_row, pivot_col, column_buffer=None, block_buffer=None):
+    """
+    Pivot en place : la ligne pivot est normalisée, puis toutes les autres lignes sont
+    éliminées par la mise à jour de rang 1 T -= col ⊗ ligne_pivot, où col est la colonne
+    pivot avec un zéro sur la ligne pivot (qui n'est donc pas modifiée). La mise à jour est
+    faite par blocs de PIVOT_BLOCK_ROWS lignes : le produit extérieur n'est jamais formé en
+    entier, la mémoire de travail reste petite devant le tableau.
+    Les tampons fournis (pivot_workspace) évitent toute allocation.
+    """
+    pivot_elem = tableau[pivot_row, pivot_col]
+
+    if abs(pivot_elem) < 1e-9:
+         raise ValueError("Pivot element is zero or close to zero. Algorithm error.")
+
+    if column_buffer is None or block_buffer is None:
+         column_buffer, block_buffer = pivot_workspace(tableau)
+
+    pivot_row_values = tableau[pivot_row]
+    pivot_row_values /= pivot_elem
+
+    np.copyto(column_buffer, tableau[:, pivot_col])
+    column_buffer[pivot_row] = 0.0
+    num_rows, block_rows = tableau.shape[0], block_buffer.shape[0]
+    for start in range(0, num_rows, block_rows):
+         stop = min(start + block_rows, num_rows)
+         update = block_buffer[:stop - start]
+         np.multiply(column_buffer[start:stop, np.newaxis], pivot_row_values[np.newaxis, :], out=update)
+         np.subtract(tableau[start:stop], update, out=tableau[start:stop])
+
+    return tableau
+
+
+def complement_in_place(tableau, column, upper, basis_row=None):
+    """
+    Changement de variable x_j = u_j - x̄_j : u_j fois la colonne passe dans le second membre
+    (ligne Z comprise) et la colonne change de signe. Si x_j est en base (ligne `basis_row`),
+    cette ligne change aussi de signe pour retrouver un vecteur unité.
+    """
+    tableau[:, -1] -= upper * tableau[:, column]
+    tableau[:, column] *= -1
+    if basis_row is not None:
+        tableau[basis_row, :] *= -1
+    return tableau
+
+
+def _serialize_pivot(pivot):
+    # [ligne, colonne], suivi pour un changement de borne de [[colonne, borne], ...] (ligne -1 : sans pivot) ;
+    # une borne exacte est écrite en fraction 'p/q'
+    if len(pivot) == 2:
+        return [int(pivot[0]), int(pivot[1])]
+    return [int(pivot[0]), int(pivot[1]),
+            [[int(j), str(upper) if isinstance(upper, Fraction) else float(upper)] for j, upper in pivot[2]]]
+
+
+def replay_pivot_log(pivot_log, iteration=None):
+    """
+    Reconstruit les tableaux à partir d'un journal {'initial': ..., 'pivots': [[ligne, colonne], ...]}
+    (forme sérialisée, telle que stockée dans Problem.tableaus_history).
+    Renvoie toutes les itérations, ou seulement `iteration` si elle est précisée. Un journal du
+    mode exact (tableau initial en fractions) est rejoué en fractions.
+    """
+    initial = pivot_log['initial']
+    pivots = pivot_log['pivots']
+    if iteration is not None and not 0 <= iteration <= len(pivots):
+        return []
+
+    tableau = np.array(initial['tableau'], dtype=float)
+    exact = None
+    if initial.get('exact_tableau') is not None:
+        exact = np.array([[Fraction(v) for v in row] for row in initial['exact_tableau']], dtype=object)
+    basis_vars = list(initial['basis_vars'])
+    at_upper = set(initial.get('at_upper') or [])
+    variable_names = initial.get('variable_names')
+    first_iteration = initial.get('iteration') or 0
+    last = len(pivots) if iteration is None else iteration
+    column_buffer, block_buffer = pivot_workspace(tableau)
+
+    entries = []
+    for step in range(last + 1):
+        if step > 0:
+            pivot = pivots[step - 1]
+            pivot_row, pivot_col = pivot[0], pivot[1]
+            if pivot_row >= 0:
+                if exact is not None:
+                    fraction_pivot(exact, pivot_row, pivot_col)
+                else:
+                    pivot_in_place(tableau, pivot_row, pivot_col, column_buffer, block_buffer)
+                basis_vars[pivot_row] = pivot_col
+            for j, upper in (pivot[2] if len(pivot) > 2 else ()):
+                if exact is not None:
+                    complement_in_place(exact, j, Fraction(upper))
+                else:
+                    complement_in_place(tableau, j, float(Fraction(upper)) if isinstance(upper, str) else upper)
+                at_upper ^= {j}
+            if exact is not None:
+                tableau = exact.astype(float)
+        if iteration is None or step == iteration:
+            entry = {
+                'tableau': tableau.tolist(),
+                'basis_vars': basis_vars[:],
+                'variable_names': variable_names,
+                'iteration': first_iteration + step,
+            }
+            if at_upper:
+                entry['at_upper'] = sorted(at_upper)
+            if exact is not None:
+                entry['exact_tableau'] = [[str(v) for v in row] for row in exact]
+            entries.append(entry)
+    return entries
+
+
+def expand_tableaus_history(history, iteration=None):
+    """
+    Liste des tableaux à afficher pour un historique stocké : liste de tableaux (modes
+    'full', 'final', 'every-k') ou journal de pivots (mode 'pivot-log').
+    """
+    if not history:
+        return []
+    if isinstance(history, dict) and history.get('mode') == HISTORY_PIVOT_LOG:
+        return replay_pivot_log(history, iteration=iteration)
+    if iteration is None:
+        return history
+    return [t for position, t in enumerate(history) if t.get('iteration', position) == iteration]
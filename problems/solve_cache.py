@@ -0,0 +1,245 @@
+# problems/solve_cache.py
+"""
+Cache des résultats de résolution, partagé entre utilisateurs.
+
+Le même exercice saisi par plusieurs étudiants ne diffère que par l'ordre des variables,
+l'ordre des contraintes et l'écriture des nombres (3, 3.0, 3.00). La forme canonique
+(CanonicalProblem) trie colonnes et lignes et lit chaque nombre en flottant :
+son empreinte SHA-256 est la clé du cache. Un résultat enregistré pour une saisie est
+renvoyé à une autre saisie du même problème après renumérotation des variables et des
+contraintes (solution, sensibilité, base, tableaux et journal de pivots).
+
+Deux niveaux : un LRU en mémoire du processus, puis un backend de cache Django (partagé
+entre processus selon sa configuration).
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from problems.bounds import normalize_bounds
+from problems.program import SENSE_EQ, SENSE_GE, SENSE_LE
+
+# Statuts définitifs : une résolution interrompue ou en erreur n'est pas mise en cache
+CACHEABLE_STATUSES = ('optimal', 'infeasible', 'unbounded')
+
+DEFAULT_LRU_SIZE = 256
+CACHE_KEY_PREFIX = 'linearis:solve:'
+
+SENSE_CODES = {SENSE_LE: 0, SENSE_GE: 1, SENSE_EQ: 2}
+
+
+class CanonicalProblem:
+    """
+    Forme canonique d'un problème (données JSON de Problem) et sa clé.
+    `columns[k]` et `rows[k]` sont les indices, dans la saisie, de la k-ième colonne et de la
+    k-ième ligne canoniques. `options` : réglages du solveur qui changent le résultat.
+    """
+
+    def __init__(self, objective_type, objective_coefficients, constraints, bounds=None, integer_variables=None,
+                 options=None):
+        # Nombres lus en flottants : 3, 3.0 et '3.00' sont égaux ; + 0.0 ramène -0.0 à 0.0
+        c = np.asarray(objective_coefficients, dtype=float) + 0.0
+        A = np.array([constraint['coefficients'] for constraint in constraints], dtype=float).reshape(len(constraints), c.size) + 0.0
+        b = np.array([constraint['rhs'] for constraint in constraints], dtype=float) + 0.0
+        senses = [constraint['sense'] for constraint in constraints]
+        lower, upper = normalize_bounds(bounds, c.size)
+        integers = np.zeros(c.size, dtype=bool)
+        integers[list(integer_variables or ())] = True
+
+        # Signature d'une colonne indépendante de l'ordre des lignes : ses coefficients triés par
+        # (sens, second membre, valeur). À égalité, l'ordre de saisie est gardé (tri stable) : deux
+        # saisies qui ne diffèrent que par ces colonnes donnent un défaut de cache, jamais un faux succès
+        sense_codes = np.array([SENSE_CODES.get(sense, len(SENSE_CODES)) for sense in senses], dtype=float)
+        # Rang de (sens, second membre) de chaque ligne, égal pour deux lignes de même clé
+        _, row_groups = np.unique(np.column_stack([sense_codes, b]), axis=0, return_inverse=True)
+        row_keys = np.broadcast_to(row_groups.reshape(-1), (c.size, b.size))
+        by_row_key = np.lexsort((A.T, row_keys), axis=-1)
+        signatures = np.take_along_axis(A.T, by_row_key, axis=-1)
+        self.columns = np.lexsort(tuple(signatures.T[::-1]) + (integers, upper, lower, c)).tolist()
+        canonical_A = A[:, self.columns]
+        self.rows = np.lexsort(tuple(canonical_A.T[::-1]) + (b, sense_codes)).tolist()
+
+        # Empreinte : en-tête JSON puis octets des tableaux dans l'ordre canonique (flottants déjà normalisés)
+        header = json.dumps({
+            'objective_type': objective_type.lower(),
+            'shape': [b.size, c.size],
+            'senses': [senses[i] for i in self.rows],
+            'integer_variables': np.flatnonzero(integers[self.columns]).tolist(),
+            'options': options or {},
+        }, sort_keys=True, separators=(',', ':'))
+        digest = hashlib.sha256(header.encode('utf-8'))
+        for array in (c[self.columns], canonical_A[self.rows], b[self.rows], lower[self.columns], upper[self.columns]):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        self.key = digest.hexdigest()
+
+    @property
+    def fingerprint(self):
+        """
+        Empreinte de la saisie elle-même : clé et ordre de saisie des colonnes et des lignes. Deux saisies
+        n'ont la même empreinte que si elles ne diffèrent que par l'écriture des nombres ; une base
+        (indices dans la saisie) n'est réutilisable telle quelle qu'entre saisies de même empreinte.
+        """
+        order = json.dumps([self.columns, self.rows], separators=(',', ':'))
+        return hashlib.sha256(f'{self.key}:{order}'.encode('utf-8')).hexdigest()
+
+
+class SolveCache:
+    """
+    Cache à deux niveaux : LRU en mémoire (`lru_size` entrées, la moins récemment utilisée est
+    évincée), puis `backend` (objet de cache Django, facultatif). Les entrées sont les résultats
+    de SimplexSolver.solve() (ou de BranchAndBoundSolver), avec l'ordre canonique de leur saisie.
+    """
+
+    def __init__(self, backend=None, lru_size=DEFAULT_LRU_SIZE, timeout=None):
+        self.backend = backend
+        self.lru_size = lru_size
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, canonical):
+        """Résultat mis en cache, exprimé dans l'ordre de `canonical`, ou None."""
+        with self._lock:
+            entry = self._entries.get(canonical.key)
+            if entry is not None:
+                self._entries.move_to_end(canonical.key)
+        if entry is None and self.backend is not None:
+            entry = self.backend.get(CACHE_KEY_PREFIX + canonical.key)
+            if entry is not None:
+                self._remember(canonical.key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return remap_result(entry['result'], entry['columns'], entry['rows'], canonical.columns, canonical.rows)
+
+    def put(self, canonical, result):
+        """Enregistre `result` s'il est définitif ; renvoie True s'il a été mis en cache."""
+        if result.get('status') not in CACHEABLE_STATUSES or result.get('error'):
+            return False
+        entry = {'result': result, 'columns': list(canonical.columns), 'rows': list(canonical.rows)}
+        self._remember(canonical.key, entry)
+        if self.backend is not None:
+            self.backend.set(CACHE_KEY_PREFIX + canonical.key, entry, self.timeout)
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.lru_size:
+                self._entries.popitem(last=False)
+
+
+def remap_result(result, stored_columns, stored_rows, columns, rows):
+    """
+    Copie de `result` (calculé pour la saisie d'ordre canonique stored_columns / stored_rows)
+    renumérotée pour la saisie d'ordre canonique columns / rows.
+    """
+    column_map = {int(old): int(new) for old, new in zip(stored_columns, columns)}
+    row_map = {int(old): int(new) for old, new in zip(stored_rows, rows)}
+    num_columns = len(column_map)
+
+    def by_column(values):
+        return _permuted(values, column_map)
+
+    def by_row(values):
+        return _permuted(values, row_map)
+
+    def original_index(j):
+        # Indice d'une colonne du problème d'origine (variable ou écart)
+        return column_map[j] if j < num_columns else num_columns + row_map[j - num_columns]
+
+    # Copie superficielle : tout ce qui est renuméroté est reconstruit, le reste n'est que lu
+    remapped = dict(result)
+    if remapped.get('solution') is not None:
+        remapped['solution'] = by_column(remapped['solution'])
+    if remapped.get('basis_vars') is not None:
+        remapped['basis_vars'] = [original_index(j) for j in remapped['basis_vars']]
+    if remapped.get('sensitivity'):
+        sensitivity = remapped['sensitivity']
+        remapped['sensitivity'] = dict(
+            sensitivity,
+            reduced_costs=by_column(sensitivity['reduced_costs']),
+            objective_ranges=by_column(sensitivity['objective_ranges']),
+            shadow_prices=by_row(sensitivity['shadow_prices']),
+            rhs_ranges=by_row(sensitivity['rhs_ranges']),
+        )
+    if remapped.get('exact'):
+        remapped['exact'] = dict(remapped['exact'], solution=by_column(remapped['exact']['solution']))
+    if remapped.get('branch_and_bound'):
+        report = remapped['branch_and_bound']
+        remapped['branch_and_bound'] = dict(report, integer_variables=sorted(column_map[j] for j in report['integer_variables']))
+
+    remapped['tableaus'] = [_remap_tableau(entry, column_map, row_map)[0] for entry in remapped.get('tableaus') or []]
+    if remapped.get('pivot_log'):
+        pivot_log = remapped['pivot_log']
+        initial, column_position, row_position = _remap_tableau(pivot_log['initial'], column_map, row_map)
+        pivots = []
+        for pivot in pivot_log['pivots']:
+            remapped_pivot = [row_position[pivot[0]] if pivot[0] >= 0 else pivot[0], column_position[pivot[1]]]
+            if len(pivot) > 2:
+                remapped_pivot.append([[column_position[j], upper] for j, upper in pivot[2]])
+            pivots.append(remapped_pivot)
+        remapped['pivot_log'] = dict(pivot_log, initial=initial, pivots=pivots)
+    return remapped
+
+
+def _permuted(values, index_map):
+    permuted = list(values)
+    for old, new in index_map.items():
+        permuted[new] = values[old]
+    return permuted
+
+
+def _remap_tableau(entry, column_map, row_map):
+    """
+    Tableau enregistré renuméroté : les colonnes sont identifiées par leur nom ('x3', 's2', y
+    compris après présolution), renommées puis remises dans l'ordre x1.., s1.. ; les lignes de
+    contraintes suivent l'ordre de leurs écarts. Renvoie (entrée, position des colonnes, position des lignes).
+    """
+    names = entry['variable_names']
+    renamed = []
+    for name in names:
+        index = int(name[1:]) - 1
+        renamed.append((name[0], (column_map if name[0] == 'x' else row_map)[index] + 1))
+    # Les x avant les s, chacun par indice croissant
+    order = sorted(range(len(names)), key=lambda k: (renamed[k][0] != 'x', renamed[k][1]))
+    column_position = {old: new for new, old in enumerate(order)}
+    column_position[len(names)] = len(names)
+
+    slack_columns = [k for k in range(len(names)) if renamed[k][0] == 's']
+    slack_order = sorted(range(len(slack_columns)), key=lambda r: renamed[slack_columns[r]][1])
+    row_position = {old: new for new, old in enumerate(slack_order)}
+    num_rows = len(slack_columns)
+    row_position[num_rows] = num_rows
+
+    def reorder(tableau):
+        rows = [None] * len(tableau)
+        for old, row in enumerate(tableau):
+            rows[row_position[old]] = [row[k] for k in order] + [row[-1]]
+        return rows
+
+    remapped = dict(entry, variable_names=[f"{kind}{index}" for kind, index in (renamed[k] for k in order)])
+    if entry.get('tableau') is not None:
+        remapped['tableau'] = reorder(entry['tableau'])
+    if entry.get('exact_tableau') is not None:
+        remapped['exact_tableau'] = reorder(entry['exact_tableau'])
+    if entry.get('basis_vars') is not None:
+        basis_vars = [None] * len(entry['basis_vars'])
+        for old, j in enumerate(entry['basis_vars']):
+            basis_vars[row_position[old]] = column_position[j]
+        remapped['basis_vars'] = basis_vars
+    if entry.get('at_upper'):
+        remapped['at_upper'] = sorted(column_position[j] for j in entry['at_upper'])
+    return remapped, column_position, row_position
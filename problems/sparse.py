@@ -0,0 +1,226 @@
+# problems/sparse.py
+
+import numpy as np
+
+# En dessous de cette densité, la matrice des contraintes est stockée en CSR sur le Problem
+SPARSE_DENSITY_THRESHOLD = 0.1
+
+
+class _CompressedMatrix:
+    """
+    Base commune des formats compressés CSR (lignes) et CSC (colonnes).
+    `indptr[k]:indptr[k+1]` délimite les entrées de la k-ième ligne (CSR) ou colonne (CSC).
+    """
+    format = None
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = (int(shape[0]), int(shape[1]))
+        self._major_ids = None
+
+    @property
+    def nnz(self):
+        return int(self.data.size)
+
+    @property
+    def density(self):
+        size = self.shape[0] * self.shape[1]
+        return self.nnz / size if size else 0.0
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + self.indices.nbytes + self.indptr.nbytes
+
+    def _num_major(self):
+        raise NotImplementedError
+
+    def _num_minor(self):
+        raise NotImplementedError
+
+    def _major_index_of_entries(self):
+        # Indice de ligne (CSR) ou de colonne (CSC) de chaque entrée, calculé une seule fois
+        if self._major_ids is None:
+            self._major_ids = np.repeat(np.arange(self._num_major()), np.diff(self.indptr))
+        return self._major_ids
+
+    def _major_dot(self, v, start=0, stop=None):
+        # Produit scalaire de chaque ligne (CSR) / colonne (CSC) d'indice start..stop-1 avec v
+        stop = self._num_major() if stop is None else stop
+        lo, hi = self.indptr[start], self.indptr[stop]
+        weights = self.data[lo:hi] * np.asarray(v, dtype=float)[self.indices[lo:hi]]
+        return np.bincount(self._major_index_of_entries()[lo:hi] - start, weights=weights, minlength=stop - start)
+
+    def _minor_dot(self, v):
+        weights = self.data * np.asarray(v, dtype=float)[self._major_index_of_entries()]
+        return np.bincount(self.indices, weights=weights, minlength=self._num_minor())
+
+    def _major_vector(self, k):
+        vector = np.zeros(self._num_minor())
+        start, end = self.indptr[k], self.indptr[k + 1]
+        vector[self.indices[start:end]] = self.data[start:end]
+        return vector
+
+    def _swap_compression(self, target_cls):
+        # Conversion CSR <-> CSC d'une même matrice (tri stable par indice mineur)
+        order = np.argsort(self.indices, kind='stable')
+        counts = np.bincount(self.indices, minlength=self._num_minor())
+        indptr = np.concatenate([[0], np.cumsum(counts)])
+        return target_cls(self.data[order], self._major_index_of_entries()[order], indptr, self.shape)
+
+    def to_dict(self):
+        """Forme sérialisable en JSON, utilisée pour le stockage sur le Problem."""
+        return {
+            'format': self.format,
+            'shape': list(self.shape),
+            'data': self.data.tolist(),
+            'indices': self.indices.tolist(),
+            'indptr': self.indptr.tolist(),
+        }
+
+
+class CSRMatrix(_CompressedMatrix):
+    format = 'csr'
+
+    def _num_major(self):
+        return self.shape[0]
+
+    def _num_minor(self):
+        return self.shape[1]
+
+    @classmethod
+    def from_dense(cls, dense):
+        dense = np.atleast_2d(np.asarray(dense, dtype=float))
+        rows, cols = np.nonzero(dense)
+        counts = np.bincount(rows, minlength=dense.shape[0])
+        indptr = np.concatenate([[0], np.cumsum(counts)])
+        return cls(dense[rows, cols], cols, indptr, dense.shape)
+
+    def matvec(self, x):
+        """A x"""
+        return self._major_dot(x)
+
+    def rmatvec(self, y):
+        """A^T y"""
+        return self._minor_dot(y)
+
+    def getrow(self, i):
+        return self._major_vector(i)
+
+    def getcol(self, j):
+        return self.tocsc().getcol(j)
+
+    def tocsr(self):
+        return self
+
+    def tocsc(self):
+        return self._swap_compression(CSCMatrix)
+
+    def transpose(self):
+        # A^T en CSC partage exactement les tableaux de A en CSR : aucune copie
+        return CSCMatrix(self.data, self.indices, self.indptr, (self.shape[1], self.shape[0]))
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def to_dense(self, out=None):
+        dense = np.zeros(self.shape) if out is None else out
+        dense[self._major_index_of_entries(), self.indices] = self.data
+        return dense
+
+
+class CSCMatrix(_CompressedMatrix):
+    format = 'csc'
+
+    def _num_major(self):
+        return self.shape[1]
+
+    def _num_minor(self):
+        return self.shape[0]
+
+    @classmethod
+    def from_dense(cls, dense):
+        return CSRMatrix.from_dense(np.asarray(dense, dtype=float).T).transpose()
+
+    def matvec(self, x):
+        """A x"""
+        return self._minor_dot(x)
+
+    def rmatvec(self, y, start=0, stop=None):
+        """A^T y (restreint aux colonnes start..stop-1) : un produit scalaire par colonne, c'est le calcul des coûts réduits."""
+        return self._major_dot(y, start, stop)
+
+    def getcol(self, j):
+        return self._major_vector(j)
+
+    def column_norms_squared(self):
+        return np.bincount(self._major_index_of_entries(), weights=self.data ** 2, minlength=self.shape[1])
+
+    def getrow(self, i):
+        return self.tocsr().getrow(i)
+
+    def tocsc(self):
+        return self
+
+    def tocsr(self):
+        return self._swap_compression(CSRMatrix)
+
+    def transpose(self):
+        return CSRMatrix(self.data, self.indices, self.indptr, (self.shape[1], self.shape[0]))
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def to_dense(self, out=None):
+        dense = np.zeros(self.shape) if out is None else out
+        dense[self.indices, self._major_index_of_entries()] = self.data
+        return dense
+
+
+def as_compressed(matrix):
+    """
+    Convertit en CSRMatrix/CSCMatrix une matrice éventuellement issue de scipy.sparse
+    ou de sa forme JSON (`to_dict`).
+    """
+    if isinstance(matrix, _CompressedMatrix):
+        return matrix
+    if isinstance(matrix, dict):
+        cls = CSCMatrix if matrix.get('format') == 'csc' else CSRMatrix
+        return cls(matrix['data'], matrix['indices'], matrix['indptr'], matrix['shape'])
+    if hasattr(matrix, 'tocsr') and hasattr(matrix, 'indptr'):
+        csr = matrix.tocsr()
+        return CSRMatrix(csr.data, csr.indices, csr.indptr, csr.shape)
+    raise ValueError(f"Format de matrice creuse non reconnu : {type(matrix)}")
+
+
+def constraints_to_sparse(constraints):
+    """
+    Convertit la liste de contraintes [{'coefficients', 'sense', 'rhs'}, ...] en forme creuse :
+    {'matrix': CSR sérialisée, 'senses': [...], 'rhs': [...]}.
+    """
+    data, indices, indptr = [], [], [0]
+    num_vars = len(constraints[0]['coefficients']) if constraints else 0
+    for constraint in constraints:
+        for j, value in enumerate(constraint['coefficients']):
+            if value != 0:
+                indices.append(j)
+                data.append(float(value))
+        indptr.append(len(data))
+
+    matrix = CSRMatrix(data, indices, indptr, (len(constraints), num_vars))
+    return {
+        'matrix': matrix.to_dict(),
+        'senses': [constraint['sense'] for constraint in constraints],
+        'rhs': [constraint['rhs'] for constraint in constraints],
+    }
+
+
+def constraints_density(constraints):
+    if not constraints:
+        return 1.0
+    num_entries = sum(len(constraint['coefficients']) for constraint in constraints)
+    num_nonzeros = sum(1 for constraint in constraints for value in constraint['coefficients'] if value != 0)
+    return num_nonzeros / num_entries if num_entries else 1.0
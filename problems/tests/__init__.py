@@ -0,0 +1,23 @@
+import numpy as np
+
+# Wyndor Glass (Hillier et Lieberman) : max 3 x1 + 5 x2, optimum 36 en (2, 6)
+WYNDOR = [
+    {'coefficients': [1, 0], 'sense': '<=', 'rhs': 4},
+    {'coefficients': [0, 2], 'sense': '<=', 'rhs': 12},
+    {'coefficients': [3, 2], 'sense': '<=', 'rhs': 18},
+]
+# Lignes '>=' pour min 2 x1 + 3 x2 (simplexe dual), optimum 9 en (3, 1)
+MIN_GE = [
+    {'coefficients': [1, 1], 'sense': '>=', 'rhs': 4},
+    {'coefficients': [1, 3], 'sense': '>=', 'rhs': 6},
+]
+
+
+def constraint_rows(*rows):
+    """Contraintes au format de SimplexSolver à partir de triplets (coefficients, sens, second membre)."""
+    return [{'coefficients': list(coefficients), 'sense': sense, 'rhs': rhs} for coefficients, sense, rhs in rows]
+
+
+def array_rows(A, b, senses):
+    """Contraintes au format de SimplexSolver à partir d'une matrice A, d'un second membre b et des sens."""
+    return constraint_rows(*zip(np.asarray(A, dtype=float).tolist(), senses, np.asarray(b, dtype=float).tolist()))
@@ -0,0 +1,63 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.batch import solve_batch
+from problems.simplex import SimplexSolver, STATUS_UNSUPPORTED
+from problems.tests import array_rows
+
+
+def _stack(num_problems, num_rows, num_vars, seed):
+    rng = np.random.default_rng(seed)
+    C = rng.uniform(1.0, 10.0, (num_problems, num_vars))
+    A = rng.uniform(1.0, 10.0, (num_problems, num_rows, num_vars))
+    b = rng.uniform(10.0, 100.0, (num_problems, num_rows))
+    return C, A, b
+
+
+class BatchTests(SimpleTestCase):
+    """Chaque résultat de la pile est celui de SimplexSolver sur le même problème seul."""
+
+    def assertSameResults(self, objective_type, C, A, b, senses):
+        results = solve_batch(objective_type, C, A, b, senses=senses)
+        self.assertEqual(len(results), C.shape[0])
+        senses = np.broadcast_to(np.array(senses, dtype=object), b.shape)
+        for i, result in enumerate(results):
+            with self.subTest(problem=i):
+                expected = SimplexSolver(objective_type, C[i].tolist(), array_rows(A[i], b[i], senses[i])).solve()
+                self.assertEqual(result['status'], expected['status'])
+                self.assertEqual(result['iterations'], expected['iterations'])
+                self.assertEqual(result['basis_vars'], expected['basis_vars'])
+                if expected['status'] == 'optimal':
+                    self.assertAlmostEqual(result['optimal_value'], expected['optimal_value'])
+                    np.testing.assert_allclose(result['solution'], expected['solution'], atol=1e-9)
+                self.assertEqual(len(result['tableaus']), len(expected['tableaus']))
+                for step, expected_step in zip(result['tableaus'], expected['tableaus']):
+                    self.assertEqual(step['basis_vars'], expected_step['basis_vars'])
+                    np.testing.assert_allclose(step['tableau'], expected_step['tableau'], atol=1e-9)
+        return results
+
+    def test_max_problems(self):
+        C, A, b = _stack(12, 5, 6, seed=1)
+        self.assertSameResults('max', C, A, b, ['<='] * 5)
+
+    def test_mixed_outcomes(self):
+        C, A, b = _stack(6, 3, 4, seed=2)
+        # Problème 1 non borné : la colonne 0 n'apparaît plus dans les contraintes
+        A[1, :, 0] = 0.0
+        # Problème 2 infaisable : sum x >= 1000, alors que les deux autres lignes imposent sum x <= 100
+        A[2, 2] = 1.0
+        b[2, 2] = 1000.0
+        senses = np.array([['<=', '<=', '<=']] * 6, dtype=object)
+        senses[2, 2] = '>='
+        results = self.assertSameResults('max', C, A, b, senses)
+        self.assertEqual([result['status'] for result in results[:3]], ['optimal', 'unbounded', 'infeasible'])
+
+    def test_min_with_ge_rows(self):
+        # Simplexe dual sur les lignes '>=' puis primal, par problème
+        C, A, b = _stack(8, 4, 5, seed=3)
+        self.assertSameResults('min', C, A, b, ['>=', '>=', '<=', '<='])
+
+    def test_equality_rows_fall_back_to_single_solves(self):
+        C, A, b = _stack(3, 2, 3, seed=4)
+        results = solve_batch('max', C, A, b, senses=['<=', '='])
+        self.assertEqual([result['status'] for result in results], [STATUS_UNSUPPORTED] * 3)
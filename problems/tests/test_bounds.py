@@ -0,0 +1,72 @@
+import numpy as np
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from problems.benchmarks.common import random_dense_lp
+from problems.bounds import bounds_to_constraints, extract_bounds
+from problems.models import Problem
+from problems.simplex import ENGINE_INTERIOR_POINT, ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_NONE, SimplexSolver
+from problems.tests import MIN_GE, WYNDOR
+
+# (nom, objectif, coefficients, contraintes, bornes)
+CASES = [
+    ('upper', 'max', [3, 5], WYNDOR[2:], [[0, 4], [0, 6]]),
+    ('lower-and-upper', 'max', [3, 5], WYNDOR, [[1, 3], [2, 5]]),
+    ('min-ge', 'min', [2, 3], MIN_GE, [[0.5, 2.5], [0, None]]),
+    ('random', 'max', *random_dense_lp(8, 5, seed=9), [[0, 1.5]] * 4 + [[0.2, None]] * 4),
+    # Une borne supérieure rend borné un problème qui ne l'était pas
+    ('was-unbounded', 'max', [1, 1], [{'coefficients': [1, -1], 'sense': '<=', 'rhs': 1}], [[0, 10], [0, 7]]),
+    ('unbounded', 'max', [1, 1], [{'coefficients': [1, -1], 'sense': '<=', 'rhs': 1}], [[0, 10], [0, None]]),
+    ('infeasible', 'max', [1, 1], [{'coefficients': [1, 1], 'sense': '<=', 'rhs': 2}], [[1.5, 3], [1, None]]),
+]
+
+
+class BoundsAsRowsTests(SimpleTestCase):
+    """Le simplexe à variables bornées redonne les résultats des bornes écrites en lignes de contrainte."""
+
+    def test_same_results_as_bound_rows(self):
+        for name, objective_type, c, constraints, bounds in CASES:
+            rows = list(constraints) + bounds_to_constraints(bounds, len(c))
+            reference = SimplexSolver(objective_type, c, rows, history=HISTORY_NONE).solve()
+            for engine in (ENGINE_TABLEAU, ENGINE_REVISED, ENGINE_INTERIOR_POINT):
+                for presolve in (False, True):
+                    with self.subTest(problem=name, engine=engine, presolve=presolve):
+                        result = SimplexSolver(objective_type, c, constraints, bounds=bounds, engine=engine,
+                                               presolve=presolve, history=HISTORY_NONE).solve()
+                        self.assertEqual(result['status'], reference['status'])
+                        if reference['status'] != 'optimal':
+                            continue
+                        self.assertAlmostEqual(result['optimal_value'], reference['optimal_value'], places=6)
+                        x = np.array(result['solution'])
+                        lower = np.array([bound[0] for bound in bounds])
+                        upper = np.array([np.inf if bound[1] is None else bound[1] for bound in bounds])
+                        self.assertTrue(np.all(x >= lower - 1e-9) and np.all(x <= upper + 1e-9))
+                        # Prix duaux des contraintes d'origine : les lignes des bornes viennent après
+                        np.testing.assert_allclose(result['sensitivity']['shadow_prices'],
+                                                   reference['sensitivity']['shadow_prices'][:len(constraints)], atol=1e-6)
+
+    def test_extracted_bounds_round_trip(self):
+        _, _, c, constraints, bounds = CASES[1]
+        rows = list(constraints) + bounds_to_constraints(bounds, len(c))
+        remaining, extracted = extract_bounds(rows, len(c))
+        # Les lignes x1 <= 4 et 2 x2 <= 12 de Wyndor sont aussi des bornes, plus lâches que les bornes données
+        self.assertEqual(remaining, constraints[2:])
+        self.assertEqual(extracted, [[1.0, 3.0], [2.0, 5.0]])
+
+
+@override_settings(SIMPLEX_SOLVE_CACHE=False, SIMPLEX_SOLVE_ASYNC=False, SIMPLEX_HISTORY_MODE='full')
+class BoundedHistoryTests(TestCase):
+
+    def test_stored_tableaus_keep_upper_bound_columns(self):
+        user = User.objects.create_user('etudiant', password='secret')
+        self.client.force_login(user)
+        # x1 s'arrête à sa borne supérieure 4, sans ligne de contrainte pour la porter
+        problem = Problem.objects.create(
+            user=user, nom='borné', objective_type='max', objective_coefficients=[1, 1], num_variables=2,
+            variable_names=['x1', 'x2'], bounds=[[0, 4], [0, None]],
+            constraints=[{'coefficients': [1, 2], 'sense': '<=', 'rhs': 10}])
+        self.client.post(reverse('solve_problem', args=[problem.pk]))
+        problem.refresh_from_db()
+        self.assertEqual(problem.solution_variables, [4.0, 3.0])
+        self.assertEqual(problem.tableaus_history[-1]['at_upper'], [0])
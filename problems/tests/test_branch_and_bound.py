@@ -0,0 +1,115 @@
+import itertools
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import integer_lp
+from problems import branch_and_bound
+from problems.branch_and_bound import BranchAndBoundSolver
+from problems.limits import LIMIT_NODES, STATUS_TIME_LIMIT
+from problems.simplex import HISTORY_NONE, HISTORY_PIVOT_LOG, SimplexSolver
+
+
+def _enumerate(c, constraints, box):
+    """Optimum d'une maximisation en nombres entiers sous lignes '<=' : tous les points entiers de [0, box]."""
+    points = np.array(list(itertools.product(*(range(int(upper) + 1) for upper in box))), dtype=float)
+    A = np.array([row['coefficients'] for row in constraints], dtype=float)
+    b = np.array([row['rhs'] for row in constraints], dtype=float)
+    feasible = points[np.all(points @ A.T <= b + 1e-9, axis=1)]
+    return float(np.max(feasible @ np.asarray(c, dtype=float)))
+
+
+def _enumerate_mixed(objective_type, c, constraints, integer_variables, box):
+    """
+    Optimum d'un problème mixte : toutes les valeurs entières des variables de `integer_variables`
+    dans [0, box[j]], les autres (continues) optimisées par le simplexe une fois celles-ci fixées.
+    """
+    sign = -1.0 if objective_type == 'min' else 1.0
+    best = None
+    for values in itertools.product(*(range(int(box[j]) + 1) for j in integer_variables)):
+        bounds = [[0, None] for _ in c]
+        for j, value in zip(integer_variables, values):
+            bounds[j] = [value, value]
+        result = SimplexSolver(objective_type, list(c), constraints, bounds=bounds, history=HISTORY_NONE).solve()
+        if result['status'] == 'optimal' and (best is None or sign * result['optimal_value'] > sign * best):
+            best = result['optimal_value']
+    return best
+
+
+def _box(constraints, num_vars):
+    # Coefficients positifs et lignes '<=' : x_j <= min_i b_i / a_ij
+    return [min(row['rhs'] / row['coefficients'][j] for row in constraints if row['coefficients'][j] > 0)
+            for j in range(num_vars)]
+
+
+class BranchAndBoundTests(SimpleTestCase):
+    """Séparation et évaluation comparée à l'énumération des valeurs entières."""
+
+    def solve(self, *args, **options):
+        return BranchAndBoundSolver(*args, workers=1, history=HISTORY_NONE, **options).solve()
+
+    def test_pure_integer_problems(self):
+        for seed in range(8):
+            c, constraints = integer_lp(4, 3, seed=seed)
+            with self.subTest(seed=seed):
+                result = self.solve('max', c, constraints, range(4))
+                self.assertEqual(result['status'], 'optimal')
+                self.assertAlmostEqual(result['optimal_value'], _enumerate(c, constraints, _box(constraints, 4)))
+                x = np.array(result['solution'])
+                np.testing.assert_array_equal(x, np.round(x))
+                A = np.array([row['coefficients'] for row in constraints])
+                self.assertTrue(np.all(A @ x <= np.array([row['rhs'] for row in constraints]) + 1e-9))
+                self.assertEqual(result['branch_and_bound']['gap'], 0.0)
+
+    def test_mixed_integer_problem(self):
+        c, constraints = integer_lp(5, 3, seed=7)
+        integer_variables = [0, 2, 4]
+        result = self.solve('max', c, constraints, integer_variables)
+        self.assertAlmostEqual(result['optimal_value'], _enumerate_mixed('max', c, constraints, integer_variables, _box(constraints, 5)))
+        x = np.array(result['solution'])
+        np.testing.assert_array_equal(x[integer_variables], np.round(x[integer_variables]))
+
+    def test_minimization(self):
+        # Couverture : min 3 x + 5 y, 2 x + 3 y >= 7, x + 4 y >= 5 (optimum relâché fractionnaire)
+        constraints = [{'coefficients': [2, 3], 'sense': '>=', 'rhs': 7}, {'coefficients': [1, 4], 'sense': '>=', 'rhs': 5}]
+        result = self.solve('min', [3, 5], constraints, [0, 1])
+        self.assertAlmostEqual(result['optimal_value'], _enumerate_mixed('min', [3, 5], constraints, [0, 1], [7, 5]))
+
+    def test_parallel_workers_agree(self):
+        c, constraints = integer_lp(5, 3, seed=3)
+        serial = self.solve('max', c, constraints, range(5))
+        parallel = BranchAndBoundSolver('max', c, constraints, range(5), workers=2, history=HISTORY_NONE).solve()
+        self.assertEqual(parallel['status'], 'optimal')
+        self.assertAlmostEqual(parallel['optimal_value'], serial['optimal_value'])
+
+    def test_integer_infeasible(self):
+        # 2 x = 1 n'a pas de solution entière, alors que la relaxation est réalisable
+        result = self.solve('max', [1], [{'coefficients': [2], 'sense': '<=', 'rhs': 1},
+                                         {'coefficients': [2], 'sense': '>=', 'rhs': 1}], [0])
+        self.assertEqual(result['status'], 'infeasible')
+        self.assertIsNone(result['solution'])
+
+    def test_node_limit(self):
+        c, constraints = integer_lp(6, 3, seed=1)
+        result = self.solve('max', c, constraints, range(6), node_limit=2)
+        self.assertEqual((result['status'], result['limit']), (STATUS_TIME_LIMIT, LIMIT_NODES))
+        self.assertEqual(result['branch_and_bound']['nodes'], 2)
+        self.assertGreater(result['branch_and_bound']['open_nodes'], 0)
+
+    def test_integral_root_starts_no_pool(self):
+        # Relaxation racine déjà entière (x = 2, y = 3) : aucun processus n'est démarré
+        constraints = [{'coefficients': [1, 0], 'sense': '<=', 'rhs': 2}, {'coefficients': [0, 1], 'sense': '<=', 'rhs': 3}]
+        with mock.patch.object(branch_and_bound, 'ProcessPoolExecutor') as pool:
+            result = BranchAndBoundSolver('max', [1, 1], constraints, [0, 1], workers=4, history=HISTORY_NONE).solve()
+        pool.assert_not_called()
+        self.assertEqual((result['status'], result['solution']), ('optimal', [2.0, 3.0]))
+
+    def test_history_resolve_keeps_incumbent(self):
+        # L'historique repart de la base du nœud retenu : même solution, sans pivot
+        c, constraints = integer_lp(5, 3, seed=3)
+        reference = self.solve('max', c, constraints, range(5))
+        result = BranchAndBoundSolver('max', c, constraints, range(5), workers=1, history=HISTORY_PIVOT_LOG).solve()
+        self.assertEqual(result['solution'], reference['solution'])
+        self.assertEqual(result['basis_vars'], reference['basis_vars'])
+        self.assertEqual(result['iterations'], 0)
@@ -0,0 +1,50 @@
+from django.test import SimpleTestCase
+
+from problems.simplex import ENGINE_REVISED, ENGINE_TABLEAU, STATUS_UNSUPPORTED, SimplexSolver
+from problems.tests import constraint_rows
+
+
+# Minimisations résolues par l'ancien chemin (transposition puis résolution du dual) :
+# (nom, coefficients, contraintes, statut, valeur optimale, solution)
+TRANSPOSE_RESULTS = [
+    ('diet', [0.6, 0.35], constraint_rows(([5, 7], '>=', 8), ([4, 2], '>=', 15), ([2, 1], '>=', 3)),
+     'optimal', 2.25, [3.75, 0.0]),
+    ('three-vars', [3, 2, 4], constraint_rows(([1, 1, 2], '>=', 4), ([2, 0, 3], '>=', 5), ([2, 1, 3], '>=', 7)),
+     'optimal', 28 / 3, [0.0, 0.0, 7 / 3]),
+    ('degenerate', [1, 1], constraint_rows(([1, 2], '>=', 2), ([2, 1], '>=', 2), ([1, 1], '>=', 4 / 3)),
+     'optimal', 4 / 3, [2 / 3, 2 / 3]),
+    ('zero-cost', [0, 1], constraint_rows(([1, 1], '>=', 3), ([1, 0], '>=', 1)),
+     'optimal', 0.0, [3.0, 0.0]),
+    ('unbounded', [-1, 0], constraint_rows(([1, -1], '>=', 1),),
+     'unbounded', None, None),
+    ('infeasible', [1, 1], constraint_rows(([-1, -1], '>=', 1),),
+     'infeasible', None, None),
+    # Les lignes '=' ne sont prises en charge ni par l'ancien chemin ni par le simplexe dual
+    ('equality', [1, 1], constraint_rows(([1, 1], '=', 4), ([1, -1], '>=', 1)),
+     STATUS_UNSUPPORTED, None, None),
+]
+
+
+class DualSimplexTests(SimpleTestCase):
+    """Le simplexe dual natif redonne les résultats de l'ancien chemin par transposition."""
+
+    def test_matches_transpose_results(self):
+        for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+            for name, c, constraints, status, value, solution in TRANSPOSE_RESULTS:
+                with self.subTest(engine=engine, problem=name):
+                    result = SimplexSolver('min', c, constraints, engine=engine).solve()
+                    self.assertEqual(result['status'], status)
+                    if status != 'optimal':
+                        continue
+                    self.assertAlmostEqual(result['optimal_value'], value)
+                    for x, expected in zip(result['solution'], solution):
+                        self.assertAlmostEqual(x, expected)
+
+    def test_mixed_rows(self):
+        # Lignes '<=' et '>=' mêlées dans une minimisation : refusées par l'ancien chemin, résolues désormais
+        constraints = constraint_rows(([1, 1], '>=', 2), ([1, 0], '<=', 3), ([0, 1], '<=', 3))
+        result = SimplexSolver('min', [1, 2], constraints).solve()
+        self.assertEqual(result['status'], 'optimal')
+        self.assertAlmostEqual(result['optimal_value'], 2.0)
+        self.assertEqual(SimplexSolver('min', [1, 2], constraint_rows(([1, 1], '>=', 4), ([1, 1], '<=', 2))).solve()['status'],
+                         'infeasible')
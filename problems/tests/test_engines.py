@@ -0,0 +1,67 @@
+from django.test import SimpleTestCase
+
+from problems.simplex import ENGINE_REVISED, ENGINE_TABLEAU, SimplexSolver
+from problems.tests import WYNDOR, constraint_rows
+
+# (nom, type d'objectif, coefficients, contraintes, statut attendu, valeur optimale, solution)
+KNOWN_PROBLEMS = [
+    ('wyndor', 'max', [3, 5], WYNDOR, 'optimal', 36.0, [2.0, 6.0]),
+    # Pivot dégénéré : la ligne 2 tombe à zéro au premier pivot (Taha, exemple 3.5-1)
+    ('degenerate', 'max', [3, 9], constraint_rows(([1, 4], '<=', 8), ([1, 2], '<=', 4)),
+     'optimal', 18.0, [0.0, 2.0]),
+    # Sommet dégénéré à l'optimum : trois contraintes actives en (4, 0)
+    ('degenerate-vertex', 'max', [2, 1], constraint_rows(([1, 1], '<=', 4), ([1, 0], '<=', 4), ([1, -1], '<=', 4)),
+     'optimal', 8.0, [4.0, 0.0]),
+    # Klee-Minty en dimension 3 : 7 pivots avec la règle de Dantzig
+    ('klee-minty', 'max', [100, 10, 1], constraint_rows(([1, 0, 0], '<=', 1), ([20, 1, 0], '<=', 100), ([200, 20, 1], '<=', 10000)),
+     'optimal', 10000.0, [0.0, 0.0, 10000.0]),
+    ('min-ge', 'min', [2, 3], constraint_rows(([1, 1], '>=', 4), ([1, 3], '>=', 6)),
+     'optimal', 9.0, [3.0, 1.0]),
+    ('unbounded', 'max', [1, 1], constraint_rows(([1, -1], '<=', 1),),
+     'unbounded', None, None),
+    ('infeasible', 'max', [1, 1], constraint_rows(([1, 1], '<=', 2), ([1, 1], '>=', 4)),
+     'infeasible', None, None),
+]
+
+
+class RevisedEngineTests(SimpleTestCase):
+    """Le simplexe révisé (base factorisée LU) donne les mêmes résultats que le tableau."""
+
+    def solve(self, engine, objective_type, c, constraints):
+        return SimplexSolver(objective_type, c, constraints, engine=engine).solve()
+
+    def test_known_problems(self):
+        for name, objective_type, c, constraints, status, value, solution in KNOWN_PROBLEMS:
+            with self.subTest(problem=name):
+                tableau = self.solve(ENGINE_TABLEAU, objective_type, c, constraints)
+                revised = self.solve(ENGINE_REVISED, objective_type, c, constraints)
+                self.assertEqual(tableau['status'], status)
+                self.assertEqual(revised['status'], status)
+                if status != 'optimal':
+                    continue
+                self.assertAlmostEqual(tableau['optimal_value'], value)
+                self.assertAlmostEqual(revised['optimal_value'], value)
+                for expected, x_tableau, x_revised in zip(solution, tableau['solution'], revised['solution']):
+                    self.assertAlmostEqual(x_tableau, expected)
+                    self.assertAlmostEqual(x_revised, expected)
+
+    def test_same_pivot_path(self):
+        # Même règle de pricing, mêmes départages : même suite de bases, donc même nombre de tableaux
+        for name, objective_type, c, constraints, status, _, _ in KNOWN_PROBLEMS:
+            with self.subTest(problem=name):
+                tableau = self.solve(ENGINE_TABLEAU, objective_type, c, constraints)
+                revised = self.solve(ENGINE_REVISED, objective_type, c, constraints)
+                self.assertEqual(len(tableau['tableaus']), len(revised['tableaus']))
+                for step_tableau, step_revised in zip(tableau['tableaus'], revised['tableaus']):
+                    self.assertEqual(list(step_tableau['basis_vars']), list(step_revised['basis_vars']))
+
+    def test_revised_tableaus_match(self):
+        # Le moteur révisé ne garde que les bases ; les tableaux reconstruits sont ceux du moteur tableau
+        _, objective_type, c, constraints, _, _, _ = KNOWN_PROBLEMS[0]
+        tableau = self.solve(ENGINE_TABLEAU, objective_type, c, constraints)
+        revised = self.solve(ENGINE_REVISED, objective_type, c, constraints)
+        self.assertEqual(len(tableau['tableaus']), len(revised['tableaus']))
+        for step_tableau, step_revised in zip(tableau['tableaus'], revised['tableaus']):
+            for row_tableau, row_revised in zip(step_tableau['tableau'], step_revised['tableau']):
+                for a, b in zip(row_tableau, row_revised):
+                    self.assertAlmostEqual(a, b)
@@ -0,0 +1,93 @@
+from fractions import Fraction
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import integer_lp
+from problems.exact import ExactTableau, fraction_pivot, to_fraction
+from problems.simplex import HISTORY_FINAL, SimplexSolver
+
+
+def _exact_final(result):
+    return [[Fraction(v) for v in row] for row in result['tableaus'][-1]['exact_tableau']]
+
+
+class BareissTests(SimpleTestCase):
+
+    def test_pivots_match_fraction_gauss_jordan(self):
+        # Données décimales et rationnelles : les lignes sont rendues entières par leur PPCM
+        rows = [[to_fraction(v) for v in row] for row in ([0.1, 2, '1/3', 4], [3, '2/7', 1, 0.5], [1, 1, 1, 10])]
+        objective_row = [to_fraction(v) for v in (-0.3, -1, '-5/2')]
+        exact = ExactTableau(rows, objective_row)
+
+        reference = np.zeros((4, 7), dtype=object)
+        reference[:] = Fraction(0)
+        for i, row in enumerate(rows):
+            reference[i, :3], reference[i, 3 + i], reference[i, -1] = row[:-1], Fraction(1), row[-1]
+        reference[3, :3] = objective_row
+
+        basis_vars = [3, 4, 5]
+        for pivot_row, pivot_col in ((0, 2), (1, 0), (2, 1), (0, 4)):
+            exact.pivot(pivot_row, pivot_col)
+            fraction_pivot(reference, pivot_row, pivot_col)
+            basis_vars[pivot_row] = pivot_col
+            self.assertEqual(exact.to_fractions(basis_vars), reference.tolist())
+            np.testing.assert_allclose(exact.to_float(basis_vars), reference.astype(float))
+
+    def test_float_conversion_beyond_float_range(self):
+        # Décimales à 400 chiffres : L_i = 10^400, les entiers de Bareiss dépassent la plage des flottants
+        rows = [[to_fraction(v) for v in row] for row in (['1e-400', 1, '2.5'], [1, '3e-400', 4])]
+        objective_row = [to_fraction(v) for v in ('-1e-400', -1)]
+        exact = ExactTableau(rows, objective_row)
+        with self.assertRaises(OverflowError):
+            float(exact.numerators[0, -1])
+
+        basis_vars = [2, 3]
+        for pivot_row, pivot_col in ((0, 1), (1, 0)):
+            exact.pivot(pivot_row, pivot_col)
+            basis_vars[pivot_row] = pivot_col
+            expected = np.array(exact.to_fractions(basis_vars), dtype=object).astype(float)
+            np.testing.assert_allclose(exact.to_float(basis_vars), expected)
+
+
+class ExactSolveTests(SimpleTestCase):
+
+    def test_decimal_data_gives_exact_fractions(self):
+        # 0.1 x + 0.2 y avec x + y <= 0.3 : l'optimum vaut exactement 3/50
+        result = SimplexSolver('max', [0.1, 0.2], [{'coefficients': [1, 1], 'sense': '<=', 'rhs': 0.3}], exact=True).solve()
+        self.assertEqual(result['exact'], {'solution': ['0', '3/10'], 'optimal_value': '3/50'})
+        self.assertEqual(result['optimal_value'], 0.06)
+
+    def test_exact_optimality_certificate(self):
+        cases = [('integer', 'max', *integer_lp(6, 4, seed=1), None),
+                 ('min-ge', 'min', [2, 3], [{'coefficients': [1, 1], 'sense': '>=', 'rhs': 4},
+                                            {'coefficients': [1, 3], 'sense': '>=', 'rhs': '6.5'}], None),
+                 ('bounded', 'max', *integer_lp(5, 3, seed=2), [[0, '5/2']] * 5)]
+        for name, objective_type, c, constraints, bounds in cases:
+            with self.subTest(problem=name):
+                constraints = [dict(row, rhs=float(Fraction(row['rhs']))) for row in constraints]
+                bounds = None if bounds is None else [[low, float(Fraction(high))] for low, high in bounds]
+                reference = SimplexSolver(objective_type, c, constraints, bounds=bounds, history=HISTORY_FINAL).solve()
+                result = SimplexSolver(objective_type, c, constraints, bounds=bounds, history=HISTORY_FINAL, exact=True).solve()
+                self.assertEqual(result['status'], 'optimal')
+                x = [Fraction(v) for v in result['exact']['solution']]
+                value = Fraction(result['exact']['optimal_value'])
+
+                # Solution exactement réalisable et valeur exactement c^T x
+                for row in constraints:
+                    activity = sum(to_fraction(a) * xj for a, xj in zip(row['coefficients'], x))
+                    rhs = to_fraction(row['rhs'])
+                    self.assertTrue(activity <= rhs if row['sense'] == '<=' else activity >= rhs)
+                for j, xj in enumerate(x):
+                    self.assertGreaterEqual(xj, 0)
+                    if bounds is not None:
+                        self.assertLessEqual(xj, to_fraction(bounds[j][1]))
+                self.assertEqual(value, sum(to_fraction(cj) * xj for cj, xj in zip(c, x)))
+
+                # Tableau final exact : second membre >= 0 et ligne Z >= 0, l'optimalité est démontrée sans arrondi
+                final = _exact_final(result)
+                self.assertTrue(all(row[-1] >= 0 for row in final[:-1]))
+                self.assertTrue(all(v >= 0 for v in final[-1][:-1]))
+
+                self.assertAlmostEqual(float(value), reference['optimal_value'])
+                np.testing.assert_allclose([float(v) for v in x], result['solution'])
@@ -0,0 +1,67 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import klee_minty_lp
+from problems.simplex import (ENGINE_REVISED, HISTORY_EVERY_K, HISTORY_FINAL, HISTORY_FULL, HISTORY_NONE,
+                              HISTORY_PIVOT_LOG, SimplexSolver, expand_tableaus_history, replay_pivot_log)
+from problems.tests import MIN_GE, WYNDOR
+
+# (nom, objectif, coefficients, contraintes, options du solveur)
+CASES = [
+    ('klee-minty', 'max', *klee_minty_lp(4), {}),
+    ('klee-minty-revised', 'max', *klee_minty_lp(4), {'engine': ENGINE_REVISED}),
+    # Simplexe dual (lignes '>=') puis primal
+    ('min-ge', 'min', [2, 3], MIN_GE, {}),
+    # Variables bornées : changements de borne sans pivot (colonnes complémentées)
+    ('bounded', 'max', [3, 5], WYNDOR[1:], {'bounds': [[0, 4], [0, 3]]}),
+    ('scaled', 'max', [3, 5], WYNDOR, {'scaling': 'geometric'}),
+    ('exact', 'max', [3, 5], WYNDOR, {'exact': True}),
+]
+
+
+class PivotLogTests(SimpleTestCase):
+    """Le journal de pivots, rejoué, redonne exactement l'historique complet."""
+
+    def solve(self, objective_type, c, constraints, options, history):
+        return SimplexSolver(objective_type, c, constraints, history=history, **options).solve()
+
+    def assertSameTableaus(self, replayed, full):
+        self.assertEqual(len(replayed), len(full))
+        for step_replayed, step_full in zip(replayed, full):
+            self.assertEqual(step_replayed['basis_vars'], step_full['basis_vars'])
+            self.assertEqual(step_replayed['iteration'], step_full['iteration'])
+            self.assertEqual(step_replayed.get('at_upper', []), step_full.get('at_upper', []))
+            self.assertEqual(step_replayed.get('exact_tableau'), step_full.get('exact_tableau'))
+            np.testing.assert_allclose(step_replayed['tableau'], step_full['tableau'], atol=1e-9)
+
+    def test_replay_matches_full_history(self):
+        for name, objective_type, c, constraints, options in CASES:
+            with self.subTest(problem=name):
+                full = self.solve(objective_type, c, constraints, options, HISTORY_FULL)
+                logged = self.solve(objective_type, c, constraints, options, HISTORY_PIVOT_LOG)
+                self.assertEqual(logged['status'], 'optimal')
+                self.assertEqual(logged['tableaus'], [])
+                self.assertEqual(logged['optimal_value'], full['optimal_value'])
+                self.assertEqual(logged['basis_vars'], full['basis_vars'])
+                self.assertSameTableaus(replay_pivot_log(logged['pivot_log']), full['tableaus'])
+                self.assertSameTableaus(expand_tableaus_history(logged['pivot_log']), full['tableaus'])
+
+    def test_replay_one_iteration(self):
+        c, constraints = klee_minty_lp(4)
+        full = self.solve('max', c, constraints, {}, HISTORY_FULL)
+        pivot_log = self.solve('max', c, constraints, {}, HISTORY_PIVOT_LOG)['pivot_log']
+        for iteration in (0, 7, len(full['tableaus']) - 1):
+            self.assertSameTableaus(replay_pivot_log(pivot_log, iteration=iteration), [full['tableaus'][iteration]])
+        self.assertEqual(replay_pivot_log(pivot_log, iteration=len(full['tableaus'])), [])
+
+    def test_partial_histories_are_subsets(self):
+        c, constraints = klee_minty_lp(4)
+        full = self.solve('max', c, constraints, {}, HISTORY_FULL)['tableaus']
+        final = self.solve('max', c, constraints, {}, HISTORY_FINAL)
+        self.assertSameTableaus(final['tableaus'], full[-1:])
+        every_k = SimplexSolver('max', c, constraints, history=HISTORY_EVERY_K, history_every=4).solve()['tableaus']
+        # Une itération sur 4, plus le tableau final
+        self.assertSameTableaus(every_k, full[::4] + full[-1:])
+        none = self.solve('max', c, constraints, {}, HISTORY_NONE)
+        self.assertEqual((none['tableaus'], none['pivot_log']), ([], None))
+        self.assertEqual(none['optimal_value'], final['optimal_value'])
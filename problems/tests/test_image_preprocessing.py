@@ -0,0 +1,48 @@
+import io
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from PIL import Image, ImageDraw, ImageFont
+
+from problems.image_preprocessing import DEFAULT_OPTIONS, encode_image, preprocess_image
+
+LINES = ["Maximiser Z = 3x1 + 5x2", "sous les contraintes :", "    1x1 + 0x2 <= 4", "    0x1 + 2x2 <= 12",
+         "    3x1 + 2x2 <= 18", "    x1 >= 0, x2 >= 0"]
+
+
+def _pdf_page():
+    """Page A4 convertie à 300 dpi : texte noir sur fond blanc, comme pdf2image la rend."""
+    page = Image.new('RGB', (2480, 3508), 'white')
+    draw = ImageDraw.Draw(page)
+    font = ImageFont.load_default(size=60)
+    for line, text in enumerate(LINES):
+        draw.text((310, 580 + line * 95), text, fill=(0, 0, 0), font=font)
+    return page
+
+
+def _lossless_webp(image):
+    # Ce que le client du modèle envoie pour une image PIL sans préparation
+    buffer = io.BytesIO()
+    image.save(buffer, format='WEBP', lossless=True)
+    return buffer.getvalue()
+
+
+class PreprocessingTests(SimpleTestCase):
+
+    def test_pdf_page_payload_is_not_larger(self):
+        page = _pdf_page()
+        options = dict(DEFAULT_OPTIONS, **(settings.IMPORT_IMAGE_PREPROCESSING or {}))
+        for name, candidate in (('défaut', DEFAULT_OPTIONS), ('réglages', options)):
+            with self.subTest(options=name):
+                payload = preprocess_image(page, **candidate)
+                self.assertLessEqual(len(payload['data']), len(_lossless_webp(page)))
+                self.assertLessEqual(len(payload['data']), len(encode_image(page, format='PNG')['data']))
+                # Le texte tient dans l'image envoyée : recadrée et réduite, pas agrandie
+                self.assertLessEqual(max(Image.open(io.BytesIO(payload['data'])).size), candidate['max_long_edge'])
+
+    def test_lighter_original_is_kept(self):
+        page = _pdf_page()
+        original = {'mime_type': 'image/png', 'data': b'\x89PNG' + b'\x00' * 16}
+        self.assertIs(preprocess_image(page, original=original), original)
+        heavy = encode_image(page, format='PNG')
+        self.assertEqual(preprocess_image(page, original=heavy)['mime_type'], 'image/webp')
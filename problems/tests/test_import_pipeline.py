@@ -0,0 +1,194 @@
+import json
+from collections import deque
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from problems import import_pipeline
+from problems.import_pipeline import STALE_IMPORT_ERROR, is_stale, reset_stale_imports, submit_import
+from problems.models import ImportedProblem
+from problems.services import GeminiService
+
+# Pages d'un PDF : problème complet, suite de contraintes, page illisible (réponse sans JSON)
+COMPLETE = {'objective_function': '3x1 + 5x2', 'objective_type': 'max',
+            'constraints': ['1x1 + 0x2 <= 4', '0x1 + 2x2 <= 12', '3x1 + 2x2 <= 18']}
+OTHER = {'objective_function': '1x1 + 1x2', 'objective_type': 'min', 'constraints': ['1x1 + 1x2 >= 2']}
+FRAGMENT = {'constraints': ['1x1 + 1x2 <= 10']}
+UNREADABLE = None
+
+
+@override_settings(IMPORT_JOB_TIMEOUT=60)
+class StaleImportTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user('etudiant', password='secret')
+
+    def _import(self, status, idle):
+        problem = ImportedProblem.objects.create(user=self.user, nom='importé', file='imported_problems/page.png',
+                                                 statusForImport='pending')
+        ImportedProblem.objects.filter(pk=problem.pk).update(
+            statusForImport=status, import_stage='extract', date_updated=timezone.now() - timedelta(seconds=idle))
+        problem.refresh_from_db()
+        return problem
+
+    def test_idle_imports_fail(self):
+        active = self._import('processing', idle=5)
+        interrupted = self._import('processing', idle=300)
+        never_started = self._import('pending', idle=300)
+        completed = self._import('completed', idle=300)
+
+        self.assertEqual([is_stale(p) for p in (active, interrupted, never_started, completed)], [False, True, True, False])
+        self.assertEqual(reset_stale_imports(), 2)
+        for problem in (interrupted, never_started):
+            problem.refresh_from_db()
+            self.assertEqual(problem.statusForImport, 'failed')
+            self.assertEqual(problem.error_message, STALE_IMPORT_ERROR)
+            self.assertIsNotNone(problem.processing_completed_at)
+        active.refresh_from_db()
+        self.assertEqual(active.statusForImport, 'processing')
+
+    def test_progress_reports_interrupted_import(self):
+        problem = self._import('processing', idle=300)
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('import_progress', args=[problem.pk])).json()
+        self.assertTrue(response['done'])
+        self.assertEqual(response['status'], 'failed')
+        self.assertEqual(response['error'], STALE_IMPORT_ERROR)
+
+
+class FakeGeminiService(GeminiService):
+    """Service sans appel au modèle : chaque page du PDF donne la réponse prévue pour elle."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.rasterized = []
+        self.extracted = []
+
+    def count_pdf_pages(self, pdf_path):
+        return len(self.pages)
+
+    def rasterize_pdf_page(self, pdf_path, page, dpi=300):
+        self.rasterized.append(page)
+        return page
+
+    def prepare_image(self, image, original=None):
+        return image
+
+    def extract_text(self, image):
+        self.extracted.append(image)
+        response = self.pages[image - 1]
+        return 'Réponse illisible' if response is UNREADABLE else json.dumps(response)
+
+
+class QueueExecutor:
+    """Files des étapes vidées à la main, dans l'ordre d'arrivée : pages entrelacées comme en parallèle."""
+
+    def __init__(self):
+        self.tasks = deque()
+
+    def submit(self, fn, *args):
+        self.tasks.append((fn, args))
+
+    def run(self):
+        while self.tasks:
+            fn, args = self.tasks.popleft()
+            fn(*args)
+
+
+class PdfPagesTests(TestCase):
+
+    LAYOUTS = [
+        [COMPLETE] + [OTHER] * 9,
+        [FRAGMENT, COMPLETE, OTHER, OTHER, OTHER, OTHER],
+        [UNREADABLE, FRAGMENT, FRAGMENT, OTHER, COMPLETE, OTHER],
+        [FRAGMENT, UNREADABLE, FRAGMENT],
+        [UNREADABLE, UNREADABLE],
+    ]
+
+    def setUp(self):
+        self.user = User.objects.create_user('etudiant', password='secret')
+
+    def reference(self, pages, merge):
+        """Résultat en traitant toutes les pages, une par une, sans arrêt anticipé."""
+        service = FakeGeminiService(pages)
+        outcomes = {}
+        for page in range(1, len(pages) + 1):
+            try:
+                text = service.extract_text(service.prepare_image(service.rasterize_pdf_page(None, page)))
+                outcomes[page] = service.page_outcome(service.parse_response(text, partial=True))
+            except ValueError:
+                outcomes[page] = None
+        try:
+            return service.resolve_pages(outcomes, len(pages), merge)
+        except ValueError:
+            return None
+
+    def run_import(self, pages, merge=False, window=2):
+        problem = ImportedProblem.objects.create(user=self.user, nom='importé', file='imported_problems/doc.pdf')
+        service = FakeGeminiService(pages)
+        executor = QueueExecutor()
+        with override_settings(IMPORT_MERGE_PAGES=merge, IMPORT_PAGE_CONCURRENCY=window), \
+                mock.patch('problems.services.GeminiService', lambda: service), \
+                mock.patch.object(import_pipeline, '_stage_executor', lambda stage: executor), \
+                mock.patch.object(import_pipeline, 'connection'):
+            submit_import(problem)
+            executor.run()
+        problem.refresh_from_db()
+        return problem, service
+
+    def test_resolve_pages_matches_full_processing(self):
+        service = FakeGeminiService([])
+        for pages in self.LAYOUTS:
+            for merge in (False, True):
+                with self.subTest(pages=pages, merge=merge):
+                    expected = self.reference(pages, merge)
+                    outcomes = {}
+                    for page in range(1, len(pages) + 1):
+                        # Toute réponse obtenue avant la dernière page est définitive
+                        resolved = service.resolve_pages(outcomes, len(pages), merge) if outcomes else None
+                        if resolved is not None:
+                            self.assertEqual(resolved, expected)
+                            self.assertFalse(service.pages_needed(outcomes, page, merge))
+                            break
+                        self.assertTrue(service.pages_needed(outcomes, page, merge))
+                        full = FakeGeminiService(pages)
+                        try:
+                            text = full.extract_text(page)
+                            outcomes[page] = full.page_outcome(full.parse_response(text, partial=True))
+                        except ValueError:
+                            outcomes[page] = None
+                    else:
+                        if expected is None:
+                            self.assertRaises(ValueError, service.resolve_pages, outcomes, len(pages), merge)
+                        else:
+                            self.assertEqual(service.resolve_pages(outcomes, len(pages), merge), expected)
+
+    def test_pipeline_matches_full_processing(self):
+        for pages in self.LAYOUTS:
+            for merge in (False, True):
+                with self.subTest(pages=pages, merge=merge):
+                    expected = self.reference(pages, merge)
+                    if expected is None:
+                        with self.assertLogs('problems.import_pipeline', 'ERROR'):
+                            problem, _ = self.run_import(pages, merge=merge)
+                        self.assertEqual(problem.statusForImport, 'failed')
+                        continue
+                    problem, service = self.run_import(pages, merge=merge)
+                    self.assertEqual(problem.statusForImport, 'completed')
+                    self.assertEqual(problem.objective_coefficients, expected['objective_coefficients'])
+                    self.assertEqual(problem.constraints, expected['constraints'])
+                    if merge:
+                        self.assertEqual(sorted(service.rasterized), list(range(1, len(pages) + 1)))
+
+    def test_pages_after_first_complete_page_are_skipped(self):
+        problem, service = self.run_import([COMPLETE] + [OTHER] * 9, window=2)
+        self.assertEqual(problem.statusForImport, 'completed')
+        self.assertEqual(problem.objective_coefficients, [3.0, 5.0])
+        # Seules les pages déjà lancées avec la première (fenêtre de 2) ont été converties
+        self.assertEqual(sorted(service.rasterized), [1, 2])
+        self.assertEqual(problem.import_timeline['pages']['total'], 10)
+        self.assertLessEqual(problem.import_timeline['pages']['processed'], 2)
@@ -0,0 +1,98 @@
+import numpy as np
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from problems.benchmarks.common import klee_minty_lp
+from problems.instrumentation import PHASES
+from problems.models import Problem
+from problems.simplex import ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_FULL, HISTORY_NONE, SimplexSolver
+from problems.tests.test_engines import KNOWN_PROBLEMS
+from problems.views import solve_summary
+
+WYNDOR = KNOWN_PROBLEMS[0]
+# Pivot dégénéré au deuxième pivot (Taha, exemple 3.5-1)
+DEGENERATE = KNOWN_PROBLEMS[1]
+
+
+class InstrumentationTests(SimpleTestCase):
+
+    def solve(self, problem, **options):
+        _, objective_type, c, constraints = problem[:4]
+        return SimplexSolver(objective_type, c, constraints, **options).solve()
+
+    def test_same_result_with_instrumentation(self):
+        for problem in KNOWN_PROBLEMS:
+            for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+                with self.subTest(problem=problem[0], engine=engine):
+                    plain = self.solve(problem, engine=engine)
+                    result = self.solve(problem, engine=engine, instrument=True)
+                    self.assertIsNone(plain['instrumentation'])
+                    for key in ('status', 'optimal_value', 'solution', 'basis_vars', 'iterations', 'tableaus'):
+                        self.assertEqual(result[key], plain[key])
+
+    def test_summary_is_consistent(self):
+        c, constraints = klee_minty_lp(4)
+        for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+            with self.subTest(engine=engine):
+                result = SimplexSolver('max', c, constraints, engine=engine, instrument=True).solve()
+                report = result['instrumentation']
+                self.assertEqual((report['engine'], report['iterations']), (engine, result['iterations']))
+                # Une ligne par pivot ; les totaux comptent aussi le dernier passage, sans pivot
+                for phase in PHASES:
+                    per_iteration = report['per_iteration'][phase]
+                    self.assertEqual(len(per_iteration), result['iterations'])
+                    self.assertTrue(all(elapsed >= 0 for elapsed in per_iteration))
+                    self.assertGreaterEqual(report['times'][phase], sum(per_iteration))
+                self.assertGreaterEqual(report['solve_time'], sum(report['times'].values()))
+                self.assertEqual(report['per_iteration']['degenerate'], [False] * result['iterations'])
+                self.assertEqual(report['degenerate_pivots'], 0)
+                # Base finale de Klee-Minty triangulaire à diagonale unité
+                self.assertGreaterEqual(report['basis_condition'], 1.0)
+
+    def test_degenerate_pivots(self):
+        report = self.solve(DEGENERATE, instrument=True)['instrumentation']
+        self.assertEqual(report['per_iteration']['degenerate'], [False, True])
+        self.assertEqual(report['degenerate_pivots'], 1)
+
+    def test_basis_condition_matches_numpy(self):
+        result = self.solve(WYNDOR, instrument=True)
+        A = np.hstack([np.array([row['coefficients'] for row in WYNDOR[3]], dtype=float), np.eye(3)])
+        basis = A[:, result['basis_vars']]
+        self.assertAlmostEqual(result['instrumentation']['basis_condition'], np.linalg.cond(basis, 1))
+
+    def test_peak_bytes_count_working_tableau_and_history(self):
+        # Wyndor : tableau de travail 4 x 6 ; l'historique complet en garde 3 copies
+        tableau_bytes = 4 * 6 * 8
+        self.assertEqual(self.solve(WYNDOR, instrument=True, history=HISTORY_NONE)['instrumentation']['peak_tableau_bytes'], tableau_bytes)
+        self.assertEqual(self.solve(WYNDOR, instrument=True, history=HISTORY_FULL)['instrumentation']['peak_tableau_bytes'], 4 * tableau_bytes)
+        # Le moteur révisé n'a pas de tableau de travail
+        self.assertEqual(self.solve(WYNDOR, instrument=True, history=HISTORY_NONE, engine=ENGINE_REVISED)
+                         ['instrumentation']['peak_tableau_bytes'], 0)
+
+    def test_solve_summary(self):
+        result = self.solve(WYNDOR, instrument=True)
+        summary = solve_summary(result, ENGINE_TABLEAU, 1.5)
+        self.assertEqual(set(summary['phases_ms']), set(PHASES))
+        self.assertAlmostEqual(summary['phases_ms']['pivot'], result['instrumentation']['times']['pivot'] * 1e3)
+        self.assertEqual(summary['degenerate_pivots'], 0)
+        # Résultat en cache : l'instrumentation est celle d'une autre résolution
+        self.assertEqual(solve_summary(result, ENGINE_TABLEAU, 0.1, cached=True),
+                         {'iterations': 2, 'solve_ms': 0.1, 'engine': ENGINE_TABLEAU, 'cached': True})
+
+
+@override_settings(SIMPLEX_INSTRUMENTATION=True, SIMPLEX_SOLVE_CACHE=False, SIMPLEX_SOLVE_ASYNC=False)
+class InstrumentedViewTests(TestCase):
+
+    def test_summary_stored_on_problem(self):
+        user = User.objects.create_user('etudiant', password='secret')
+        self.client.force_login(user)
+        _, objective_type, c, constraints = DEGENERATE[:4]
+        problem = Problem.objects.create(user=user, nom='dégénéré', objective_type=objective_type, objective_coefficients=c,
+                                         num_variables=2, variable_names=['x1', 'x2'], constraints=constraints)
+        self.client.post(reverse('solve_problem', args=[problem.pk]))
+        problem.refresh_from_db()
+        summary = problem.solve_summary
+        self.assertEqual(summary['degenerate_pivots'], 1)
+        self.assertEqual(set(summary['phases_ms']), set(PHASES))
+        self.assertIsNotNone(summary['basis_condition'])
@@ -0,0 +1,60 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import random_dense_lp, transportation_lp
+from problems.interior_point import crossover_basis, mehrotra_predictor_corrector
+from problems.simplex import ENGINE_INTERIOR_POINT, ENGINE_TABLEAU, HISTORY_NONE, SimplexSolver
+from problems.tests.test_engines import KNOWN_PROBLEMS
+
+
+class InteriorPointTests(SimpleTestCase):
+    """Points intérieurs puis crossover : mêmes résultats que le simplexe sur le tableau."""
+
+    def solve(self, engine, objective_type, c, constraints):
+        return SimplexSolver(objective_type, c, constraints, engine=engine, history=HISTORY_NONE).solve()
+
+    def test_known_problems(self):
+        for name, objective_type, c, constraints, status, value, _ in KNOWN_PROBLEMS:
+            with self.subTest(problem=name):
+                result = self.solve(ENGINE_INTERIOR_POINT, objective_type, c, constraints)
+                self.assertEqual(result['status'], status)
+                self.assertIsNotNone(result['interior_point'])
+                if status == 'optimal':
+                    self.assertAlmostEqual(result['optimal_value'], value)
+
+    def test_generated_problems_end_on_a_vertex(self):
+        cases = [('random', 'max', *random_dense_lp(40, 30, seed=1)), ('transport', 'min', *transportation_lp(5, 6, seed=2))]
+        for name, objective_type, c, constraints in cases:
+            with self.subTest(problem=name):
+                reference = self.solve(ENGINE_TABLEAU, objective_type, c, constraints)
+                result = self.solve(ENGINE_INTERIOR_POINT, objective_type, c, constraints)
+                self.assertEqual(result['status'], 'optimal')
+                self.assertAlmostEqual(result['optimal_value'], reference['optimal_value'], places=6)
+                report = result['interior_point']
+                self.assertEqual(report['status'], 'optimal')
+                self.assertAlmostEqual(report['objective'], reference['optimal_value'], places=4)
+                # Le crossover part près de l'optimum : moins de pivots que le simplexe depuis les écarts
+                self.assertLess(result['iterations'], reference['iterations'])
+                # Le sommet final a sa base et son analyse de sensibilité, comme celui du simplexe
+                self.assertEqual(len(result['basis_vars']), len(constraints))
+                np.testing.assert_allclose(result['sensitivity']['shadow_prices'], reference['sensitivity']['shadow_prices'], atol=1e-6)
+
+    def test_mehrotra_on_standard_form(self):
+        # Wyndor : max 3 x1 + 5 x2 en égalités avec écarts, soit min -3 x1 - 5 x2
+        A = np.array([[1.0, 0.0, 1.0, 0.0, 0.0], [0.0, 2.0, 0.0, 1.0, 0.0], [3.0, 2.0, 0.0, 0.0, 1.0]])
+        b = np.array([4.0, 12.0, 18.0])
+        c = np.array([-3.0, -5.0, 0.0, 0.0, 0.0])
+        point = mehrotra_predictor_corrector(A, b, c)
+        self.assertEqual(point['status'], 'optimal')
+        np.testing.assert_allclose(point['x'], [2.0, 6.0, 2.0, 0.0, 0.0], atol=1e-6)
+        # Crossover : les composantes strictement positives sont en base, les autres au niveau 0
+        basis_vars, at_upper = crossover_basis(A, point['x'])
+        self.assertEqual(sorted(basis_vars), [0, 1, 2])
+        self.assertEqual(at_upper, [])
+
+    def test_crossover_upper_bounds(self):
+        # x2 à sa borne supérieure 6 : hors base, marquée at_upper
+        A = np.array([[3.0, 2.0, 1.0]])
+        basis_vars, at_upper = crossover_basis(A, np.array([2.0, 6.0, 0.0]), upper=np.array([np.inf, 6.0, np.inf]))
+        self.assertEqual(basis_vars, [0])
+        self.assertEqual(at_upper, [1])
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from problems.jobs import STALE_JOB_ERROR, STATUS_QUEUED, STATUS_RUNNING, is_stale, reset_stale_jobs
+from problems.models import Problem
+
+
+@override_settings(SIMPLEX_SOLVE_JOB_TIMEOUT=60)
+class StaleJobTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user('etudiant', password='secret')
+
+    def _problem(self, status, queued_ago=None, started_ago=None):
+        now = timezone.now()
+        problem = Problem.objects.create(user=self.user, nom='p', objective_type='max', objective_coefficients=[1],
+                                         num_variables=1, constraints=[{'coefficients': [1], 'sense': '<=', 'rhs': 1}])
+        Problem.objects.filter(pk=problem.pk).update(
+            status=status,
+            solve_queued_at=None if queued_ago is None else now - timedelta(seconds=queued_ago),
+            solve_started_at=None if started_ago is None else now - timedelta(seconds=started_ago))
+        problem.refresh_from_db()
+        return problem
+
+    def test_old_jobs_are_reset(self):
+        fresh_queued = self._problem(STATUS_QUEUED, queued_ago=5)
+        fresh_running = self._problem(STATUS_RUNNING, queued_ago=300, started_ago=5)
+        old_queued = self._problem(STATUS_QUEUED, queued_ago=300)
+        old_running = self._problem(STATUS_RUNNING, queued_ago=400, started_ago=300)
+        # Mis en file avant que l'heure soit enregistrée
+        unknown = self._problem(STATUS_QUEUED)
+        finished = self._problem('optimal', queued_ago=300, started_ago=300)
+
+        self.assertEqual([is_stale(p) for p in (fresh_queued, fresh_running, old_queued, old_running, unknown, finished)],
+                         [False, False, True, True, True, False])
+        self.assertEqual(reset_stale_jobs(), 3)
+        for problem in (old_queued, old_running, unknown):
+            problem.refresh_from_db()
+            self.assertEqual(problem.status, 'error')
+            self.assertEqual(problem.solve_summary['error'], STALE_JOB_ERROR)
+        for problem, status in ((fresh_queued, STATUS_QUEUED), (fresh_running, STATUS_RUNNING), (finished, 'optimal')):
+            problem.refresh_from_db()
+            self.assertEqual(problem.status, status)
+
+    def test_reset_one_problem(self):
+        first = self._problem(STATUS_RUNNING, started_ago=300)
+        second = self._problem(STATUS_RUNNING, started_ago=300)
+        self.assertEqual(reset_stale_jobs(pk=first.pk), 1)
+        second.refresh_from_db()
+        self.assertEqual(second.status, STATUS_RUNNING)
+
+    def test_status_view_reports_abandoned_job(self):
+        problem = self._problem(STATUS_RUNNING, started_ago=300)
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('problem_status', args=[problem.pk])).json()
+        self.assertTrue(response['done'])
+        self.assertEqual(response['status'], 'error')
+        self.assertEqual(response['message'], STALE_JOB_ERROR)
@@ -0,0 +1,78 @@
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import klee_minty_lp, transportation_lp
+from problems.limits import LIMIT_CANCELLED, LIMIT_ITERATIONS, LIMIT_TIME, STATUS_TIME_LIMIT, CancellationToken
+from problems.simplex import ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_NONE, SimplexSolver
+
+
+class CountdownToken(CancellationToken):
+    """Jeton annulé de lui-même après `checks` consultations, comme par un autre thread en cours de résolution."""
+
+    def __init__(self, checks):
+        super().__init__()
+        self.checks = checks
+
+    @property
+    def cancelled(self):
+        self.checks -= 1
+        if self.checks < 0:
+            self.cancel()
+        return super().cancelled
+
+
+class LimitTests(SimpleTestCase):
+
+    def test_iteration_limit_keeps_last_basis(self):
+        c, constraints = klee_minty_lp(5)
+        for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+            with self.subTest(engine=engine):
+                full = SimplexSolver('max', c, constraints, engine=engine).solve()
+                result = SimplexSolver('max', c, constraints, engine=engine, iteration_limit=4).solve()
+                self.assertEqual(full['status'], 'optimal')
+                self.assertEqual((result['status'], result['limit'], result['iterations']), (STATUS_TIME_LIMIT, LIMIT_ITERATIONS, 4))
+                # Base et sommet atteints au quatrième pivot de la résolution complète, déjà réalisables
+                fourth = full['tableaus'][4]
+                self.assertEqual(result['basis_vars'], fourth['basis_vars'])
+                self.assertAlmostEqual(result['optimal_value'], fourth['tableau'][-1][-1])
+                self.assertLess(result['optimal_value'], full['optimal_value'])
+                self.assertIsNone(result['sensitivity'])
+
+    def test_interrupted_dual_phase_has_no_solution(self):
+        # Minimisation avec lignes '>=' : le simplexe dual passe par des bases non réalisables
+        c, constraints = transportation_lp(3, 4)
+        result = SimplexSolver('min', c, constraints, iteration_limit=1, history=HISTORY_NONE).solve()
+        self.assertEqual((result['status'], result['limit'], result['iterations']), (STATUS_TIME_LIMIT, LIMIT_ITERATIONS, 1))
+        self.assertIsNone(result['solution'])
+        self.assertIsNone(result['optimal_value'])
+
+    def test_cancelled_before_start(self):
+        c, constraints = transportation_lp(3, 4)
+        token = CancellationToken()
+        token.cancel()
+        for presolve in (False, True):
+            with self.subTest(presolve=presolve):
+                result = SimplexSolver('min', c, constraints, cancel_token=token, presolve=presolve).solve()
+                self.assertEqual((result['status'], result['limit'], result['iterations']), (STATUS_TIME_LIMIT, LIMIT_CANCELLED, 0))
+
+    def test_cancelled_during_solve(self):
+        c, constraints = klee_minty_lp(5)
+        full = SimplexSolver('max', c, constraints, history=HISTORY_NONE).solve()
+        result = SimplexSolver('max', c, constraints, cancel_token=CountdownToken(10), history=HISTORY_NONE).solve()
+        self.assertEqual((result['status'], result['limit']), (STATUS_TIME_LIMIT, LIMIT_CANCELLED))
+        self.assertGreater(result['iterations'], 0)
+        self.assertLess(result['iterations'], full['iterations'])
+
+    def test_time_limit(self):
+        c, constraints = klee_minty_lp(5)
+        for presolve in (False, True):
+            with self.subTest(presolve=presolve):
+                result = SimplexSolver('max', c, constraints, time_limit=1e-9, presolve=presolve).solve()
+                self.assertEqual((result['status'], result['limit']), (STATUS_TIME_LIMIT, LIMIT_TIME))
+        # Une limite large ne change rien
+        result = SimplexSolver('max', c, constraints, time_limit=60).solve()
+        self.assertEqual((result['status'], result['limit'], result['iterations']), ('optimal', None, 31))
+
+    def test_invalid_limits(self):
+        for options in ({'time_limit': 0}, {'time_limit': -1}, {'iteration_limit': 0}):
+            with self.subTest(**options), self.assertRaises(ValueError):
+                SimplexSolver('max', [1], [{'coefficients': [1], 'sense': '<=', 'rhs': 1}], **options)
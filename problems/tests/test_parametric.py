@@ -0,0 +1,103 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.parametric import evaluate_sweep, objective_sweep, rhs_sweep
+from problems.simplex import HISTORY_NONE, SimplexSolver
+from problems.sparse import constraints_to_sparse
+from problems.tests import MIN_GE, WYNDOR
+
+# (nom, objectif, coefficients, contraintes, direction, bornes)
+RHS_CASES = [
+    ('wyndor', 'max', [3, 5], WYNDOR, [0.0, 1.0, 0.0], None),
+    # Infaisable pour les petits t (4 + t < 0), puis plusieurs bases
+    ('wyndor-infeasible-start', 'max', [3, 5], WYNDOR, [1.0, 0.0, -0.5], None),
+    ('min-ge', 'min', [2, 3], MIN_GE, [0.5, -0.4], None),
+    ('bounded', 'max', [3, 5], WYNDOR[2:], [1.0], [[0, 4], [0, 6]]),
+]
+OBJECTIVE_CASES = [
+    ('wyndor', 'max', [3, 5], WYNDOR, [1.0, -0.5], None),
+    ('min-ge', 'min', [2, 3], MIN_GE, [0.3, -0.4], None),
+    ('bounded', 'max', [3, 5], WYNDOR[2:], [-1.0, 0.5], [[0, 4], [0, 6]]),
+]
+
+
+class RhsSweepTests(SimpleTestCase):
+
+    def test_presolve_option_is_ignored(self):
+        # La présolution retirerait l'unique ligne : le balayage garde la base complète
+        constraints = [{'coefficients': [-2.0], 'sense': '<=', 'rhs': 8.0}]
+        reference = rhs_sweep('max', [-1.0], constraints, [-2.0], (-5, 5))
+        sweep = rhs_sweep('max', [-1.0], constraints, [-2.0], (-5, 5), presolve=True)
+        self.assertEqual(sweep, reference)
+        self.assertEqual(sweep['breakpoints'], [4.0])
+
+    def test_breakpoint_after_infeasible_piece(self):
+        # x <= 2 + t et x >= 1 : réalisable à partir de t = -1, où l'optimum vaut 1
+        constraints = [{'coefficients': [1.0], 'sense': '<=', 'rhs': 2.0}, {'coefficients': [1.0], 'sense': '>=', 'rhs': 1.0}]
+        sweep = rhs_sweep('max', [1.0], constraints, [1.0, 0.0], (-3, 3), values=[-2, -1, 0])
+        self.assertEqual([piece['status'] for piece in sweep['pieces']], ['infeasible', 'optimal'])
+        self.assertEqual(sweep['values'], [None, 1.0, 2.0])
+
+    def test_breakpoint_before_infeasible_piece(self):
+        # x >= 1 et x <= 2 - t : réalisable jusqu'à t = 1 (ligne sans colonne entrante au-delà)
+        constraints = [{'coefficients': [1.0], 'sense': '>=', 'rhs': 1.0}, {'coefficients': [1.0], 'sense': '<=', 'rhs': 2.0}]
+        sweep = rhs_sweep('min', [1.0], constraints, [0.0, -1.0], (-3, 3))
+        self.assertEqual(sweep['pieces'][-1]['status'], 'infeasible')
+        breakpoint = sweep['pieces'][-1]['start']
+        self.assertAlmostEqual(breakpoint, 1.0)
+        self.assertAlmostEqual(evaluate_sweep(sweep, breakpoint), 1.0)
+        self.assertIsNone(evaluate_sweep(sweep, breakpoint + 0.5))
+
+
+class ObjectiveSweepTests(SimpleTestCase):
+
+    def test_breakpoint_after_unbounded_piece(self):
+        # max x - t y, x <= 2, x - y <= 1 : non borné pour t < 0, optimum 2 en t = 0
+        constraints = [{'coefficients': [1.0, 0.0], 'sense': '<=', 'rhs': 2.0}, {'coefficients': [1.0, -1.0], 'sense': '<=', 'rhs': 1.0}]
+        sweep = objective_sweep('max', [1.0, 0.0], constraints, [0.0, -1.0], (-3, 3), values=[-1, 0, 1, 3])
+        self.assertEqual([piece['status'] for piece in sweep['pieces']], ['unbounded', 'optimal', 'optimal'])
+        self.assertEqual(sweep['values'], [None, 2.0, 1.0, 1.0])
+
+
+class SweepResolveTests(SimpleTestCase):
+    """Valeurs du balayage comparées à une résolution complète en chaque point."""
+
+    def resolve(self, objective_type, c, constraints, bounds=None):
+        result = SimplexSolver(objective_type, c, constraints, bounds=bounds, history=HISTORY_NONE).solve()
+        return result['optimal_value'] if result['status'] == 'optimal' else None
+
+    def assertMatchesResolves(self, sweep, resolve_at, points):
+        for t, value in zip(points, [evaluate_sweep(sweep, t) for t in points]):
+            with self.subTest(t=t):
+                expected = resolve_at(t)
+                if expected is None:
+                    self.assertIsNone(value)
+                else:
+                    self.assertAlmostEqual(value, expected, places=6)
+
+    def test_rhs_sweep(self):
+        for name, objective_type, c, constraints, direction, bounds in RHS_CASES:
+            with self.subTest(problem=name):
+                sweep = rhs_sweep(objective_type, c, constraints, direction, (-10, 10), bounds=bounds)
+                # Points de rupture compris : la valeur optimale y est continue
+                points = np.union1d(np.linspace(-10, 10, 41), sweep['breakpoints'])
+
+                def resolve_at(t):
+                    shifted = [dict(row, rhs=row['rhs'] + t * d) for row, d in zip(constraints, direction)]
+                    return self.resolve(objective_type, c, shifted, bounds)
+                self.assertMatchesResolves(sweep, resolve_at, points)
+
+    def test_objective_sweep(self):
+        for name, objective_type, c, constraints, direction, bounds in OBJECTIVE_CASES:
+            with self.subTest(problem=name):
+                sweep = objective_sweep(objective_type, c, constraints, direction, (-10, 10), bounds=bounds)
+                points = np.union1d(np.linspace(-10, 10, 41), sweep['breakpoints'])
+
+                def resolve_at(t):
+                    return self.resolve(objective_type, (np.array(c) + t * np.array(direction)).tolist(), constraints, bounds)
+                self.assertMatchesResolves(sweep, resolve_at, points)
+
+    def test_sparse_constraints(self):
+        _, objective_type, c, constraints, direction, _ = RHS_CASES[0]
+        sweep = rhs_sweep(objective_type, c, constraints, direction, (-10, 10))
+        self.assertEqual(rhs_sweep(objective_type, c, constraints_to_sparse(constraints), direction, (-10, 10)), sweep)
@@ -0,0 +1,49 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import klee_minty_lp
+from problems.simplex import PIVOT_BLOCK_ROWS, SimplexSolver, pivot_in_place, pivot_workspace
+
+
+def _reference_pivot(tableau, pivot_row, pivot_col):
+    # Élimination de Gauss-Jordan ligne par ligne, sur une copie
+    new_tableau = tableau.copy()
+    new_tableau[pivot_row, :] /= new_tableau[pivot_row, pivot_col]
+    for i in range(new_tableau.shape[0]):
+        if i != pivot_row:
+            new_tableau[i, :] -= new_tableau[i, pivot_col] * new_tableau[pivot_row, :]
+    return new_tableau
+
+
+class PivotInPlaceTests(SimpleTestCase):
+
+    def test_matches_row_by_row_elimination(self):
+        rng = np.random.default_rng(0)
+        # Moins d'un bloc, exactement un bloc, plusieurs blocs dont le dernier incomplet
+        for num_rows in (5, PIVOT_BLOCK_ROWS, 2 * PIVOT_BLOCK_ROWS + 7):
+            with self.subTest(rows=num_rows):
+                tableau = rng.uniform(-5.0, 5.0, (num_rows, 40))
+                column, block = pivot_workspace(tableau)
+                expected = tableau.copy()
+                for pivot_row, pivot_col in ((0, 3), (num_rows - 1, 17), (num_rows // 2, 39)):
+                    expected = _reference_pivot(expected, pivot_row, pivot_col)
+                    self.assertIs(pivot_in_place(tableau, pivot_row, pivot_col, column, block), tableau)
+                    np.testing.assert_allclose(tableau, expected, atol=1e-9)
+                self.assertLessEqual(block.shape[0], PIVOT_BLOCK_ROWS)
+
+    def test_zero_pivot_is_rejected(self):
+        tableau = np.array([[0.0, 1.0], [1.0, 1.0]])
+        with self.assertRaises(ValueError):
+            pivot_in_place(tableau, 0, 0)
+
+    def test_solver_tableaus_follow_reference_pivots(self):
+        # Chaque tableau de l'historique est le précédent après un pivot de référence (15 pivots)
+        c, constraints = klee_minty_lp(4)
+        result = SimplexSolver('max', c, constraints).solve()
+        self.assertEqual(result['status'], 'optimal')
+        tableaus = [np.array(step['tableau']) for step in result['tableaus']]
+        self.assertEqual(len(tableaus), 16)
+        for k in range(1, len(tableaus)):
+            before, after = result['tableaus'][k - 1]['basis_vars'], result['tableaus'][k]['basis_vars']
+            pivot_row = next(i for i, (a, b) in enumerate(zip(before, after)) if a != b)
+            np.testing.assert_allclose(tableaus[k], _reference_pivot(tableaus[k - 1], pivot_row, after[pivot_row]), atol=1e-9)
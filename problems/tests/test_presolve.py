@@ -0,0 +1,66 @@
+from django.test import SimpleTestCase
+
+from problems.simplex import (ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_FINAL, HISTORY_FULL, HISTORY_PIVOT_LOG, SimplexSolver,
+                             expand_tableaus_history)
+from problems.tests import WYNDOR
+
+# Wyndor, avec un doublon moins serré de la troisième ligne et un singleton redondant (x2 >= -1)
+CONSTRAINTS = WYNDOR + [
+    {'coefficients': [6, 4], 'sense': '<=', 'rhs': 40},
+    {'coefficients': [0, 1], 'sense': '>=', 'rhs': -1},
+]
+
+
+class PresolveSensitivityTests(SimpleTestCase):
+
+    def test_removed_rows_limit_rhs_ranges(self):
+        for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+            with self.subTest(engine=engine):
+                reference = SimplexSolver('max', [3, 5], CONSTRAINTS, engine=engine, presolve=False).solve()
+                result = SimplexSolver('max', [3, 5], CONSTRAINTS, engine=engine, presolve=True).solve()
+                self.assertEqual(result['presolve']['rows_removed'], 2)
+                # Au-delà de 20, le doublon 6 x1 + 4 x2 <= 40 devient serrant
+                self.assertEqual(result['sensitivity']['rhs_ranges'][2], {'current': 18.0, 'lower': 12.0, 'upper': 20.0})
+                self.assertEqual(result['sensitivity']['rhs_ranges'], reference['sensitivity']['rhs_ranges'])
+                self.assertEqual(sorted(result['basis_vars']), sorted(reference['basis_vars']))
+
+    def test_binding_fixing_row_range(self):
+        # 2 x <= 0 fixe x = 0 et reste serrante (prix -1.5) : au-delà de 1, 4 x <= 2 devient serrante
+        constraints = [
+            {'coefficients': [2.0], 'sense': '<=', 'rhs': 0.0},
+            {'coefficients': [4.0], 'sense': '<=', 'rhs': 2.0},
+            {'coefficients': [-2.0], 'sense': '<=', 'rhs': 7.0},
+        ]
+        reference = SimplexSolver('min', [-3.0], constraints, presolve=False).solve()
+        result = SimplexSolver('min', [-3.0], constraints, presolve=True).solve()
+        self.assertEqual(result['presolve']['rows_removed'], 3)
+        self.assertEqual(result['sensitivity']['shadow_prices'], reference['sensitivity']['shadow_prices'])
+        self.assertEqual(result['sensitivity']['rhs_ranges'][0], {'current': 0.0, 'lower': 0.0, 'upper': 1.0})
+        self.assertEqual(result['sensitivity']['rhs_ranges'], reference['sensitivity']['rhs_ranges'])
+
+    def test_empty_reduction_keeps_basis_and_history(self):
+        # -2 x <= 8 ne limite rien et x a un coût négatif : la présolution fixe x = 0 et retire la ligne
+        constraints = [{'coefficients': [-2.0], 'sense': '<=', 'rhs': 8.0}]
+        for history in (HISTORY_FULL, HISTORY_FINAL, HISTORY_PIVOT_LOG):
+            with self.subTest(history=history):
+                result = SimplexSolver('max', [-1.0], constraints, history=history, presolve=True).solve()
+                self.assertEqual(result['presolve']['rows_removed'], 1)
+                self.assertEqual(result['status'], 'optimal')
+                # Seul l'écart de la ligne retirée est en base, comme sans présolution
+                self.assertEqual(result['basis_vars'], [1])
+                history_json = result['pivot_log'] or result['tableaus']
+                self.assertEqual(len(expand_tableaus_history(history_json)), 1)
+
+    def test_fixed_column_keeps_original_rhs(self):
+        # x2 >= -5 est redondante et x2, absente des autres lignes, est fixée à sa borne 3 :
+        # le second membre décalé ne sert qu'au problème réduit, la postsolution lit celui d'origine
+        constraints = [
+            {'coefficients': [1, 0], 'sense': '<=', 'rhs': 4},
+            {'coefficients': [0, 1], 'sense': '>=', 'rhs': -5},
+        ]
+        reference = SimplexSolver('max', [1, 1], constraints, bounds=[[0, None], [0, 3]], presolve=False).solve()
+        result = SimplexSolver('max', [1, 1], constraints, bounds=[[0, None], [0, 3]], presolve=True).solve()
+        self.assertEqual(result['presolve']['columns_removed'], 1)
+        self.assertEqual(result['solution'], reference['solution'])
+        self.assertEqual(result['sensitivity']['rhs_ranges'][1], {'current': -5.0, 'lower': None, 'upper': 3.0})
+        self.assertEqual(result['sensitivity']['rhs_ranges'], reference['sensitivity']['rhs_ranges'])
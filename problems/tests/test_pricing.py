@@ -0,0 +1,59 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import degenerate_lp, klee_minty_lp, random_dense_lp
+from problems.pricing import PRICING_DANTZIG, PRICING_DEVEX, PRICING_RULES, PRICING_STEEPEST_EDGE
+from problems.simplex import ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_NONE, SimplexSolver
+from problems.tests.test_engines import KNOWN_PROBLEMS
+
+# (nom, coefficients, contraintes) : maximisations sous contraintes '<='
+GENERATED = [
+    ('klee-minty', *klee_minty_lp(5)),
+    ('random', *random_dense_lp(15, 10, seed=2)),
+    ('degenerate', *degenerate_lp(15, 10, seed=3)),
+    # Assez de colonnes pour que le pricing partiel parcoure plusieurs segments
+    ('wide', *random_dense_lp(300, 20, seed=5)),
+]
+
+
+class PricingRuleTests(SimpleTestCase):
+    """Chaque règle de pricing, sur chaque moteur, atteint l'optimum de la règle de Dantzig."""
+
+    def solve(self, objective_type, c, constraints, engine, pricing):
+        return SimplexSolver(objective_type, c, constraints, engine=engine, pricing=pricing, history=HISTORY_NONE).solve()
+
+    def test_known_problems(self):
+        for name, objective_type, c, constraints, status, value, _ in KNOWN_PROBLEMS:
+            for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+                for pricing in PRICING_RULES:
+                    with self.subTest(problem=name, engine=engine, pricing=pricing):
+                        result = self.solve(objective_type, c, constraints, engine, pricing)
+                        self.assertEqual(result['status'], status)
+                        self.assertEqual(result['pricing'], pricing)
+                        if status == 'optimal':
+                            self.assertAlmostEqual(result['optimal_value'], value)
+
+    def test_generated_problems(self):
+        for name, c, constraints in GENERATED:
+            A = np.array([constraint['coefficients'] for constraint in constraints])
+            b = np.array([constraint['rhs'] for constraint in constraints])
+            reference = self.solve('max', c, constraints, ENGINE_TABLEAU, PRICING_DANTZIG)
+            for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+                for pricing in PRICING_RULES:
+                    with self.subTest(problem=name, engine=engine, pricing=pricing):
+                        result = self.solve('max', c, constraints, engine, pricing)
+                        self.assertEqual(result['status'], 'optimal')
+                        self.assertAlmostEqual(result['optimal_value'], reference['optimal_value'], places=6)
+                        # Les optimums dégénérés peuvent différer : on vérifie seulement la réalisabilité
+                        x = np.array(result['solution'])
+                        self.assertTrue(np.all(x >= -1e-9))
+                        self.assertTrue(np.all(A @ x <= b + 1e-7))
+
+    def test_weighted_rules_shorten_klee_minty(self):
+        c, constraints = klee_minty_lp(5)
+        iterations = {pricing: self.solve('max', c, constraints, ENGINE_TABLEAU, pricing)['iterations']
+                      for pricing in (PRICING_DANTZIG, PRICING_DEVEX, PRICING_STEEPEST_EDGE)}
+        # Dantzig visite les 2^5 sommets du cube
+        self.assertEqual(iterations[PRICING_DANTZIG], 31)
+        self.assertLess(iterations[PRICING_DEVEX], iterations[PRICING_DANTZIG])
+        self.assertLess(iterations[PRICING_STEEPEST_EDGE], iterations[PRICING_DANTZIG])
@@ -0,0 +1,78 @@
+import pickle
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.program import LinearProgram
+from problems.simplex import ENGINE_INTERIOR_POINT, ENGINE_REVISED, ENGINE_TABLEAU, SimplexSolver
+from problems.sparse import constraints_to_sparse
+from problems.tests import WYNDOR
+
+CONSTRAINTS = WYNDOR + [{'coefficients': [1, 1], 'sense': '>=', 'rhs': 1}]
+
+
+class LinearProgramTests(SimpleTestCase):
+
+    def setUp(self):
+        self.program = LinearProgram.from_constraints('max', [3, 5], CONSTRAINTS, names=['x1', 'x2'])
+
+    def test_attributes_and_arrays_are_frozen(self):
+        with self.assertRaises(AttributeError):
+            self.program.c = np.zeros(2)
+        for array in (self.program.c, self.program.A, self.program.b, self.program.senses):
+            with self.assertRaises(ValueError):
+                array[0] = 0
+        sparse = LinearProgram.from_constraints('max', [3, 5], constraints_to_sparse(CONSTRAINTS))
+        with self.assertRaises(ValueError):
+            sparse.A.data[0] = 0.0
+
+    def test_caller_data_is_copied(self):
+        c, A, b = np.array([3.0, 5.0]), np.eye(2), np.array([4.0, 6.0])
+        program = LinearProgram('max', c, A, b, ['<=', '<='])
+        c[0], A[0, 0], b[0] = -1.0, -1.0, -1.0
+        np.testing.assert_array_equal(program.c, [3.0, 5.0])
+        np.testing.assert_array_equal(program.A, np.eye(2))
+        np.testing.assert_array_equal(program.b, [4.0, 6.0])
+        # L'appelant garde des tableaux modifiables
+        self.assertTrue(c.flags.writeable)
+
+    def test_solvers_do_not_modify_a_shared_program(self):
+        snapshot = pickle.loads(pickle.dumps(self.program))
+        reference = SimplexSolver('max', [3, 5], CONSTRAINTS).solve()
+        options = [{'engine': engine} for engine in (ENGINE_TABLEAU, ENGINE_REVISED, ENGINE_INTERIOR_POINT)]
+        options += [{'presolve': True}, {'scaling': 'geometric'}, {'bounds': [[0, 3], [1, None]]}, {'exact': True}]
+        for solver_options in options:
+            with self.subTest(**solver_options):
+                result = SimplexSolver('max', self.program.c, self.program, **solver_options).solve()
+                self.assertEqual(result['status'], 'optimal')
+                if 'bounds' not in solver_options:
+                    self.assertAlmostEqual(result['optimal_value'], reference['optimal_value'])
+                for name in ('c', 'A', 'b', 'senses'):
+                    np.testing.assert_array_equal(getattr(self.program, name), getattr(snapshot, name))
+
+    def test_with_objective_shares_constraints(self):
+        other = self.program.with_objective('min', [1, 1])
+        self.assertIs(other.A, self.program.A)
+        self.assertIs(other.b, self.program.b)
+        self.assertEqual(other.objective_type, 'min')
+        self.assertFalse(other.c.flags.writeable)
+        with self.assertRaises(ValueError):
+            self.program.with_objective('max', [1, 2, 3])
+        # Le programme passé comme contraintes garde ses lignes, avec l'objectif donné au solveur
+        result = SimplexSolver('min', [1, 1], self.program).solve()
+        self.assertAlmostEqual(result['optimal_value'], 1.0)
+
+    def test_pickle_and_json_round_trip(self):
+        copy = pickle.loads(pickle.dumps(self.program))
+        self.assertFalse(copy.A.flags.writeable)
+        self.assertEqual(copy.names, ('x1', 'x2'))
+        self.assertEqual(self.program.to_constraints(),
+                         [dict(row, coefficients=[float(v) for v in row['coefficients']], rhs=float(row['rhs'])) for row in CONSTRAINTS])
+
+    def test_inconsistent_dimensions(self):
+        with self.assertRaises(ValueError):
+            LinearProgram('max', [1, 2], np.eye(2), [1, 2, 3], ['<='] * 3)
+        with self.assertRaises(ValueError):
+            LinearProgram('max', [1, 2], np.eye(2), [1, 2], ['<='])
+        with self.assertRaises(ValueError):
+            LinearProgram.from_constraints('max', [1, 2], [{'coefficients': [1], 'sense': '<=', 'rhs': 1}])
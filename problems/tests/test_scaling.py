@@ -0,0 +1,59 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import badly_scaled_lp, random_dense_lp
+from problems.scaling import SCALING_METHODS, compute_scaling, scale_matrix
+from problems.simplex import ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_FINAL, SimplexSolver
+from problems.tests import MIN_GE
+
+# MIN_GE, lignes multipliées par 1e-3 et 1e3
+BADLY_SCALED_MIN_GE = [dict(row, coefficients=[factor * a for a in row['coefficients']], rhs=factor * row['rhs'])
+                       for row, factor in zip(MIN_GE, (1e-3, 1e3))]
+
+
+def _spread(A):
+    values = np.abs(A[A != 0])
+    return values.max() / values.min()
+
+
+class ScalingTests(SimpleTestCase):
+
+    def test_factors_are_powers_of_two_and_reduce_spread(self):
+        _, constraints = badly_scaled_lp(random_dense_lp, 12, 8, seed=1)
+        A = np.array([constraint['coefficients'] for constraint in constraints])
+        for method in SCALING_METHODS:
+            with self.subTest(method=method):
+                row_scale, column_scale = compute_scaling(A, method)
+                for scale in (row_scale, column_scale):
+                    exponents = np.log2(scale)
+                    np.testing.assert_array_equal(exponents, np.round(exponents))
+                scaled = scale_matrix(A, row_scale, column_scale)
+                np.testing.assert_array_equal(scaled, row_scale[:, np.newaxis] * A * column_scale)
+                self.assertLess(_spread(scaled), _spread(A) / 100)
+
+    def test_same_results_as_unscaled(self):
+        cases = [
+            ('badly-scaled', 'max', *badly_scaled_lp(random_dense_lp, 10, 6, seed=3), None),
+            ('min-ge', 'min', [2e-3, 3e3], BADLY_SCALED_MIN_GE, None),
+            ('bounded', 'max', *random_dense_lp(6, 4, seed=5), [[0, 2]] * 6),
+        ]
+        for name, objective_type, c, constraints, bounds in cases:
+            for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+                reference = SimplexSolver(objective_type, c, constraints, engine=engine, bounds=bounds, history=HISTORY_FINAL).solve()
+                self.assertEqual(reference['status'], 'optimal')
+                for method in SCALING_METHODS:
+                    with self.subTest(problem=name, engine=engine, scaling=method):
+                        result = SimplexSolver(objective_type, c, constraints, engine=engine, bounds=bounds,
+                                               history=HISTORY_FINAL, scaling=method).solve()
+                        self.assertEqual(result['status'], 'optimal')
+                        self.assertAlmostEqual(result['optimal_value'] / reference['optimal_value'], 1.0, places=9)
+                        np.testing.assert_allclose(result['solution'], reference['solution'], rtol=1e-9, atol=1e-12)
+
+                        # Le tableau final est rendu à l'échelle d'origine : c'est celui de la même base sans mise à l'échelle
+                        final = result['tableaus'][-1]
+                        unscaled = SimplexSolver(objective_type, c, constraints, engine=engine, bounds=bounds)
+                        expected = unscaled._tableau_from_basis(final['basis_vars'], final.get('at_upper'))
+                        np.testing.assert_allclose(final['tableau'], expected, rtol=1e-9, atol=1e-9)
+
+                        for key in ('shadow_prices', 'reduced_costs'):
+                            np.testing.assert_allclose(result['sensitivity'][key], reference['sensitivity'][key], rtol=1e-9, atol=1e-12)
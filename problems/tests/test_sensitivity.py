@@ -0,0 +1,74 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import random_dense_lp
+from problems.simplex import ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_NONE, SimplexSolver
+from problems.tests import MIN_GE, WYNDOR
+
+# (nom, objectif, coefficients, contraintes, bornes)
+CASES = [
+    ('wyndor', 'max', [3, 5], WYNDOR, None),
+    ('min-ge', 'min', [2, 3], MIN_GE, None),
+    ('random', 'max', *random_dense_lp(5, 4, seed=11), None),
+    # x2 s'arrête à sa borne supérieure
+    ('bounded', 'max', [3, 5], [WYNDOR[0], WYNDOR[2]], [[0, None], [0, 5]]),
+]
+
+# Pas hors de l'intervalle, relatif à la largeur de l'intervalle (ou absolu s'il est infini)
+STEP = 0.25
+
+
+class SensitivityResolveTests(SimpleTestCase):
+    """Les intervalles de l'analyse de sensibilité, vérifiés en résolvant à nouveau le problème modifié."""
+
+    def solve(self, objective_type, c, constraints, bounds, engine=ENGINE_TABLEAU):
+        return SimplexSolver(objective_type, c, constraints, bounds=bounds, engine=engine, history=HISTORY_NONE).solve()
+
+    def _probes(self, interval):
+        lower, upper, current = interval['lower'], interval['upper'], interval['current']
+        width = (upper if upper is not None else current + 10.0) - (lower if lower is not None else current - 10.0)
+        inside = [value for value in (lower, upper, current) if value is not None]
+        inside.append(((lower if lower is not None else current - 10.0) + (upper if upper is not None else current + 10.0)) / 2)
+        outside = [value for value in (lower - STEP * width if lower is not None else None,
+                                       upper + STEP * width if upper is not None else None) if value is not None]
+        return inside, outside
+
+    def test_rhs_ranges(self):
+        for name, objective_type, c, constraints, bounds in CASES:
+            for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+                reference = self.solve(objective_type, c, constraints, bounds, engine)
+                sensitivity = reference['sensitivity']
+                for i, interval in enumerate(sensitivity['rhs_ranges']):
+                    inside, outside = self._probes(interval)
+                    for rhs in inside + outside:
+                        with self.subTest(problem=name, engine=engine, row=i, rhs=rhs):
+                            modified = [dict(constraint) for constraint in constraints]
+                            modified[i]['rhs'] = rhs
+                            result = self.solve(objective_type, c, modified, bounds, engine)
+                            predicted = reference['optimal_value'] + sensitivity['shadow_prices'][i] * (rhs - interval['current'])
+                            if rhs in inside:
+                                # Même base : la valeur optimale varie au taux du prix dual
+                                self.assertEqual(result['status'], 'optimal')
+                                self.assertAlmostEqual(result['optimal_value'], predicted, places=6)
+                            elif result['status'] == 'optimal':
+                                # Hors de l'intervalle, le prix dual ne vaut plus
+                                self.assertNotAlmostEqual(result['optimal_value'], predicted, places=6)
+
+    def test_objective_ranges(self):
+        for name, objective_type, c, constraints, bounds in CASES:
+            for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+                reference = self.solve(objective_type, c, constraints, bounds, engine)
+                for j, interval in enumerate(reference['sensitivity']['objective_ranges']):
+                    inside, outside = self._probes(interval)
+                    for cost in inside + outside:
+                        with self.subTest(problem=name, engine=engine, variable=j, cost=cost):
+                            modified = list(map(float, c))
+                            modified[j] = cost
+                            result = self.solve(objective_type, modified, constraints, bounds, engine)
+                            if cost in inside:
+                                # Même base optimale : la solution ne bouge pas
+                                self.assertEqual(result['status'], 'optimal')
+                                self.assertAlmostEqual(result['optimal_value'], float(np.dot(modified, reference['solution'])), places=6)
+                            elif result['status'] == 'optimal':
+                                # Hors de l'intervalle, l'ancienne solution n'est plus optimale
+                                self.assertNotAlmostEqual(result['optimal_value'], float(np.dot(modified, reference['solution'])), places=6)
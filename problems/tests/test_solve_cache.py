@@ -0,0 +1,83 @@
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase
+
+from problems.simplex import HISTORY_PIVOT_LOG, SimplexSolver, expand_tableaus_history
+from problems.solve_cache import CanonicalProblem, SolveCache
+
+OBJECTIVE = [5, 4, 3]
+CONSTRAINTS = [
+    {'coefficients': [2, 3, 1], 'sense': '<=', 'rhs': 5},
+    {'coefficients': [4, 1, 2], 'sense': '<=', 'rhs': 11},
+    {'coefficients': [3, 4, 2], 'sense': '<=', 'rhs': 8},
+]
+
+
+def _permuted(objective, constraints, columns, rows, write=float):
+    """Même problème, variables dans l'ordre `columns`, contraintes dans l'ordre `rows`, nombres écrits par `write`."""
+    return ([write(objective[j]) for j in columns],
+            [{'coefficients': [write(constraints[i]['coefficients'][j]) for j in columns],
+              'sense': constraints[i]['sense'], 'rhs': write(constraints[i]['rhs'])} for i in rows])
+
+
+def _basis_columns(basis_vars, num_columns, columns, rows):
+    """Base (indices de la saisie permutée) -> ensemble de ('x' ou 's', indice dans la saisie d'origine)."""
+    return {('x', columns[j]) if j < num_columns else ('s', rows[j - num_columns]) for j in basis_vars}
+
+
+class SolveCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        self.cache = SolveCache()
+        self.result = SimplexSolver('max', OBJECTIVE, CONSTRAINTS, history=HISTORY_PIVOT_LOG).solve()
+        self.assertTrue(self.cache.put(CanonicalProblem('max', OBJECTIVE, CONSTRAINTS), self.result))
+
+    def test_permuted_problem_hits_with_remapped_result(self):
+        columns, rows = [2, 0, 1], [1, 2, 0]
+        objective, constraints = _permuted(OBJECTIVE, CONSTRAINTS, columns, rows)
+        cached = self.cache.get(CanonicalProblem('max', objective, constraints))
+        self.assertIsNotNone(cached)
+        self.assertEqual(self.cache.hits, 1)
+
+        direct = SimplexSolver('max', objective, constraints).solve()
+        self.assertAlmostEqual(cached['optimal_value'], direct['optimal_value'])
+        for cached_value, value in zip(cached['solution'], direct['solution']):
+            self.assertAlmostEqual(cached_value, value)
+        self.assertEqual(cached['solution'], [self.result['solution'][j] for j in columns])
+        self.assertEqual(sorted(cached['basis_vars']), sorted(direct['basis_vars']))
+        self.assertEqual(_basis_columns(cached['basis_vars'], 3, columns, rows),
+                         _basis_columns(self.result['basis_vars'], 3, [0, 1, 2], [0, 1, 2]))
+        self.assertEqual(cached['sensitivity']['shadow_prices'],
+                         [self.result['sensitivity']['shadow_prices'][i] for i in rows])
+        # Le journal de pivots renuméroté, rejoué, aboutit à la même base et à la même solution
+        final = expand_tableaus_history(cached['pivot_log'])[-1]
+        self.assertEqual(sorted(final['basis_vars']), sorted(cached['basis_vars']))
+        self.assertAlmostEqual(final['tableau'][-1][-1], direct['optimal_value'])
+
+    def test_number_writing_hits(self):
+        # 3, 3.0 et '3.00' : même problème
+        objective, constraints = _permuted(OBJECTIVE, CONSTRAINTS, [0, 1, 2], [0, 1, 2], write=lambda v: f'{v:.2f}')
+        cached = self.cache.get(CanonicalProblem('max', objective, constraints))
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached['solution'], self.result['solution'])
+        self.assertEqual(cached['basis_vars'], self.result['basis_vars'])
+
+    def test_different_problem_misses(self):
+        constraints = [dict(constraint) for constraint in CONSTRAINTS]
+        constraints[1]['rhs'] = 12
+        for objective_type, objective, rows, options in (
+                ('max', OBJECTIVE, constraints, None),
+                ('min', OBJECTIVE, CONSTRAINTS, None),
+                ('max', [5, 4, 2], CONSTRAINTS, None),
+                ('max', OBJECTIVE, CONSTRAINTS, {'engine': 'revised'})):
+            with self.subTest(objective_type=objective_type, objective=objective, options=options):
+                self.assertIsNone(self.cache.get(CanonicalProblem(objective_type, objective, rows, options=options)))
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 4)
+
+    def test_shared_backend_hits_in_another_cache(self):
+        backend = LocMemCache('solve-cache-tests', {})
+        SolveCache(backend=backend).put(CanonicalProblem('max', OBJECTIVE, CONSTRAINTS), self.result)
+        objective, constraints = _permuted(OBJECTIVE, CONSTRAINTS, [1, 2, 0], [2, 0, 1])
+        cached = SolveCache(backend=backend).get(CanonicalProblem('max', objective, constraints))
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached['solution'], [self.result['solution'][j] for j in [1, 2, 0]])
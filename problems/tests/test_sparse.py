@@ -0,0 +1,51 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from problems.benchmarks.common import random_sparse_lp
+from problems.simplex import ENGINE_REVISED, ENGINE_TABLEAU, SimplexSolver
+from problems.sparse import CSCMatrix, CSRMatrix, as_compressed, constraints_to_sparse
+from problems.tests import array_rows
+
+
+class CompressedMatrixTests(SimpleTestCase):
+
+    def test_products_match_dense(self):
+        _, A, _ = random_sparse_lp(30, 12, 0.1, seed=3)
+        dense = A.to_dense()
+        x, y = np.arange(30, dtype=float), np.arange(12, dtype=float)
+        for matrix in (A, A.tocsc(), as_compressed(A.to_dict()), as_compressed(A.tocsc().to_dict())):
+            with self.subTest(format=matrix.format):
+                np.testing.assert_allclose(matrix.to_dense(), dense)
+                np.testing.assert_allclose(matrix.matvec(x), dense @ x)
+                np.testing.assert_allclose(matrix.rmatvec(y), dense.T @ y)
+                np.testing.assert_allclose(matrix.getrow(4), dense[4])
+                np.testing.assert_allclose(matrix.getcol(7), dense[:, 7])
+        np.testing.assert_allclose(CSRMatrix.from_dense(dense).T.to_dense(), dense.T)
+        np.testing.assert_allclose(CSCMatrix.from_dense(dense).tocsr().to_dense(), dense)
+
+
+class SparseSolveTests(SimpleTestCase):
+    """Une matrice de contraintes creuse (CSR, CSC ou sa forme JSON) donne le résultat de la liste dense."""
+
+    def test_same_result_as_dense_constraints(self):
+        c, A, b = random_sparse_lp(40, 15, 0.08, seed=7)
+        dense = A.to_dense()
+        cases = [('max', c, ['<='] * 15)]
+        # Minimisation avec des lignes '>=' : chemin du simplexe dual, qui transpose la matrice
+        cases.append(('min', c, ['>='] * 5 + ['<='] * 10))
+        for objective_type, costs, senses in cases:
+            reference = SimplexSolver(objective_type, list(costs), array_rows(dense, b, senses)).solve()
+            sparse_forms = {
+                'json': constraints_to_sparse(array_rows(dense, b, senses)),
+                'csr': {'matrix': A, 'senses': senses, 'rhs': b.tolist()},
+                'csc': {'matrix': A.tocsc(), 'senses': senses, 'rhs': b.tolist()},
+            }
+            for engine in (ENGINE_TABLEAU, ENGINE_REVISED):
+                for form, constraints in sparse_forms.items():
+                    with self.subTest(objective=objective_type, engine=engine, form=form):
+                        result = SimplexSolver(objective_type, list(costs), constraints, engine=engine).solve()
+                        self.assertEqual(result['status'], reference['status'])
+                        if reference['status'] != 'optimal':
+                            continue
+                        self.assertAlmostEqual(result['optimal_value'], reference['optimal_value'])
+                        np.testing.assert_allclose(result['solution'], reference['solution'], atol=1e-7)
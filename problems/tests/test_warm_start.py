@@ -0,0 +1,62 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from problems.models import Problem
+from problems.tests import WYNDOR
+from problems.views import is_up_to_date
+
+
+@override_settings(SIMPLEX_SOLVE_CACHE=False, SIMPLEX_WARM_START=True, SIMPLEX_SOLVE_ASYNC=False)
+class WarmStartTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user('etudiant', password='secret')
+        self.client.force_login(self.user)
+        self.problem = Problem.objects.create(
+            user=self.user, nom='wyndor', objective_type='max', objective_coefficients=[3, 5], num_variables=2,
+            variable_names=['x1', 'x2'], constraints=[dict(row) for row in WYNDOR])
+
+    def solve(self):
+        response = self.client.post(reverse('solve_problem', args=[self.problem.pk]), follow=True)
+        self.problem.refresh_from_db()
+        return [str(message) for message in response.context['messages']]
+
+    def test_unchanged_problem_is_up_to_date(self):
+        self.solve()
+        self.assertEqual(self.problem.status, 'optimal')
+        self.assertTrue(is_up_to_date(self.problem))
+        history = self.problem.tableaus_history
+
+        # Même données écrites autrement : toujours à jour, résultats et tableaux conservés
+        self.problem.constraints[0]['rhs'] = 4.0
+        self.problem.save()
+        self.assertTrue(is_up_to_date(self.problem))
+        messages = self.solve()
+        self.assertIn('pas changé', messages[0])
+        self.assertEqual(self.problem.tableaus_history, history)
+
+    def test_changed_problem_warm_starts(self):
+        self.solve()
+        fingerprint = self.problem.solved_fingerprint
+
+        self.problem.constraints[2]['rhs'] = 20
+        self.problem.save()
+        self.assertFalse(is_up_to_date(self.problem))
+        messages = self.solve()
+        self.assertIn('reprise depuis la base précédente', messages[0])
+        self.assertAlmostEqual(self.problem.optimal_value, 3 * 8 / 3 + 5 * 6)
+        self.assertNotEqual(self.problem.solved_fingerprint, fingerprint)
+
+    def test_permuted_problem_does_not_reuse_basis(self):
+        self.solve()
+        # Même problème, lignes dans un autre ordre : la base (indices de la saisie) ne vaut plus
+        self.problem.constraints.reverse()
+        self.problem.save()
+        self.assertFalse(is_up_to_date(self.problem))
+
+    def test_first_solve_is_cold(self):
+        self.problem.basis_vars = [2, 3, 4]
+        self.problem.save()
+        messages = self.solve()
+        self.assertNotIn('reprise', messages[0])
@@ -5,5 +5,7 @@ urlpatterns = [
     path('create/manual/', views.create_manual_problem, name='create_manual_problem'),
     path('problem/<int:pk>/', views.problem_detail, name='problem_detail'),
     path('problem/<int:pk>/solve/', views.solve_problem, name='solve_problem'),
+    path('problem/<int:pk>/status/', views.problem_status, name='problem_status'),
     path('import/', views.import_problem, name='import_problem'),
+    path('import/<int:pk>/progress/', views.import_progress, name='import_progress'),
 ]
\ No newline at end of file
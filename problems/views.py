@@ -1,17 +1,26 @@
 # problems/views.py
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.db import transaction
 import json
 import re
+import time
 from django.http import JsonResponse
-from .services import GeminiService
 from django.utils import timezone
+from django.conf import settings
 
 from .forms import ManualProblemForm
 from .models import Problem, ImportedProblem
-from problems.simplex import SimplexSolver, STATUS_UNSUPPORTED
+from problems.bounds import extract_bounds
+from problems.branch_and_bound import BranchAndBoundSolver
+from problems.import_pipeline import is_stale as is_stale_import, progress_summary, reset_stale_imports, submit_import
+from problems.jobs import IN_PROGRESS_STATUSES, is_stale, reset_stale_jobs, submit_solve
+from problems.limits import LIMIT_CANCELLED, LIMIT_ITERATIONS, LIMIT_NODES, LIMIT_TIME, STATUS_TIME_LIMIT
+from problems.solve_cache import CACHEABLE_STATUSES, CanonicalProblem, SolveCache
+from problems.simplex import SimplexSolver, STATUS_UNSUPPORTED, ENGINE_INTERIOR_POINT, ENGINE_REVISED, ENGINE_TABLEAU, HISTORY_PIVOT_LOG, expand_tableaus_history
+from problems.pricing import PRICING_DANTZIG
 
 @login_required
 def create_manual_problem(request):
@@ -35,7 +44,9 @@ def create_manual_problem(request):
                     num_variables=parsed_data['num_variables'],
                     variable_names=parsed_data['variable_names'],
                     objective_coefficients=parsed_data['objective_coefficients'],
-                    constraints=parsed_data['constraints']
+                    constraints=parsed_data['constraints'],
+                    bounds=parsed_data['bounds'],
+                    integer_variables=parsed_data['integer_variables']
                 )
                 
                 print("\n")
@@ -59,33 +70,26 @@ def create_manual_problem(request):
 
     return render(request, 'problems/create_manual.html', {'form': form})
 
+INTEGER_DECLARATION = re.compile(r'^(?:entiers?|int|integers?)\s*:\s*(.*)$', re.IGNORECASE)
+
 def parse_problem_equations(objective_str, constraints_str):
     # Extraction des variables et coefficients
     variables = set()
-    objective_terms = []
-    constraints_list = []
     
     # 1. Parse la fonction objectif
-    objective_terms = re.findall(r'([+-]?\s*\d*\.?\d*)\s*([a-zA-Z_][a-zA-Z0-9_]*)', objective_str)
-    objective_coefficients = []
-    
-    for coeff_str, var_name in objective_terms:
-        # Gestion des coefficients
-        coeff_str = coeff_str.strip()
-        if not coeff_str or coeff_str == '+':
-            coeff = 1.0
-        elif coeff_str == '-':
-            coeff = -1.0
-        else:
-            coeff = float(coeff_str.replace(' ', ''))
-        
-        variables.add(var_name)
-        objective_coefficients.append(coeff)
+    objective_terms = parse_linear_terms(objective_str)
+    variables.update(objective_terms)
     
     # 2. Parse les contraintes
     constraints = []
+    integer_names = []
     for line in constraints_str.split('\n'):
         line = line.strip()
+        # Déclaration des variables entières : « entiers : x1, x2 » (ou int / integer)
+        declaration = INTEGER_DECLARATION.match(line)
+        if declaration:
+            integer_names.extend(re.findall(r'[a-zA-Z_][a-zA-Z0-9_]*', declaration.group(1)))
+            continue
         if line:
             # Sépare le côté gauche et droit
             match = re.match(r'^(.*?)\s*([<>=]=?)\s*([+-]?\s*\d*\.?\d+)$', line)
@@ -96,23 +100,11 @@ def parse_problem_equations(objective_str, constraints_str):
             rhs = float(rhs.replace(' ', ''))
             
             # Parse les termes du côté gauche
-            terms = re.findall(r'([+-]?\s*\d*\.?\d*)\s*([a-zA-Z_][a-zA-Z0-9_]*)', lhs)
-            constraint_coeffs = []
-            
-            for coeff_str, var_name in terms:
-                coeff_str = coeff_str.strip()
-                if not coeff_str or coeff_str == '+':
-                    coeff = 1.0
-                elif coeff_str == '-':
-                    coeff = -1.0
-                else:
-                    coeff = float(coeff_str.replace(' ', ''))
-                
-                variables.add(var_name)
-                constraint_coeffs.append(coeff)
+            terms = parse_linear_terms(lhs)
+            variables.update(terms)
             
             constraints.append({
-                'coefficients': constraint_coeffs,
+                'terms': terms,
                 'sense': sense,
                 'rhs': rhs
             })
@@ -121,86 +113,207 @@ def parse_problem_equations(objective_str, constraints_str):
     variable_names = sorted(variables)
     num_variables = len(variable_names)
     
-    # Convertit les coefficients en listes ordonnées
-    final_objective = [0.0] * num_variables
-    for var_name, coeff in zip(variable_names, objective_coefficients):
-        final_objective[variable_names.index(var_name)] = coeff
+    # Convertit les coefficients en listes ordonnées, chaque coefficient à la position de sa variable
+    final_objective = [objective_terms.get(var_name, 0.0) for var_name in variable_names]
     
     final_constraints = []
     for constraint in constraints:
-        coeffs = [0.0] * num_variables
-        for var_name, coeff in zip(variable_names, constraint['coefficients']):
-            coeffs[variable_names.index(var_name)] = coeff
-        
         final_constraints.append({
-            'coefficients': coeffs,
+            'coefficients': [constraint['terms'].get(var_name, 0.0) for var_name in variable_names],
             'sense': constraint['sense'],
             'rhs': constraint['rhs']
         })
     
+    # Les contraintes à une seule variable (ex: x3 <= 40) deviennent des bornes, hors du tableau
+    final_constraints, bounds = extract_bounds(final_constraints, num_variables)
+
+    unknown = [name for name in integer_names if name not in variable_names]
+    if unknown:
+        raise ValueError(f"Variable(s) entière(s) inconnue(s) : {', '.join(unknown)}")
+    integer_variables = sorted({variable_names.index(name) for name in integer_names}) or None
+    
     return {
         'num_variables': num_variables,
         'variable_names': variable_names,
         'objective_coefficients': final_objective,
-        'constraints': final_constraints
+        'constraints': final_constraints,
+        'bounds': bounds,
+        'integer_variables': integer_variables
     }
 
+def parse_linear_terms(expression):
+    """Coefficients d'une expression linéaire par nom de variable (une variable répétée cumule ses coefficients)."""
+    coefficients = {}
+    for coeff_str, var_name in re.findall(r'([+-]?\s*\d*\.?\d*)\s*([a-zA-Z_][a-zA-Z0-9_]*)', expression):
+        # Gestion des coefficients
+        coeff_str = coeff_str.strip()
+        if not coeff_str or coeff_str == '+':
+            coeff = 1.0
+        elif coeff_str == '-':
+            coeff = -1.0
+        else:
+            coeff = float(coeff_str.replace(' ', ''))
+        coefficients[var_name] = coefficients.get(var_name, 0.0) + coeff
+    return coefficients
+
+def sensitivity_rows(problem):
+    """Lignes d'affichage de l'analyse de sensibilité enregistrée sur le Problem (une par variable et par contrainte)."""
+    sensitivity = problem.sensitivity
+    if problem.status != 'optimal' or not sensitivity:
+        return None
+    variables = [
+        {'name': name, 'value': value, 'reduced_cost': reduced_cost, 'range': objective_range}
+        for name, value, reduced_cost, objective_range in zip(
+            problem.variable_names, problem.solution_variables or [], sensitivity['reduced_costs'], sensitivity['objective_ranges'])
+    ]
+    constraints = [
+        {'index': i + 1, 'sense': constraint.get('sense'), 'shadow_price': shadow_price, 'range': rhs_range}
+        for i, (constraint, shadow_price, rhs_range) in enumerate(zip(
+            problem.constraints or [], sensitivity['shadow_prices'], sensitivity['rhs_ranges']))
+    ]
+    return {'variables': variables, 'constraints': constraints}
+
+def bound_rows(problem):
+    """Bornes à afficher : uniquement les variables dont le domaine n'est pas [0, +inf)."""
+    if not problem.bounds:
+        return []
+    return [
+        {'name': name, 'lower': lower, 'upper': upper}
+        for name, (lower, upper) in zip(problem.variable_names, problem.bounds)
+        if lower != 0 or upper is not None
+    ]
+
 @login_required
 def problem_detail(request, pk):
     problem = get_object_or_404(Problem, pk=pk, user=request.user)
+
+    # L'historique peut être un journal de pivots : les tableaux sont reconstruits ici,
+    # tous, ou une seule itération avec ?iteration=k
+    iteration = request.GET.get('iteration')
+    iteration = int(iteration) if iteration and iteration.isdigit() else None
+
     context = {
         'problem': problem,
+        'tableaus': expand_tableaus_history(problem.tableaus_history, iteration=iteration),
+        'sensitivity': sensitivity_rows(problem),
+        'bounds': bound_rows(problem),
+        'integer_names': [problem.variable_names[j] for j in problem.integer_variables or []],
     }
     return render(request, 'problems/problem_detail.html', context)
 
+def solver_engine(problem):
+    """
+    Les modèles creux passent par le simplexe révisé, qui travaille sur la matrice CSR sans la densifier ;
+    les grands modèles denses (variables x contraintes >= SIMPLEX_INTERIOR_POINT_MIN_SIZE) par les points intérieurs ;
+    tout passe par le moteur tableau en mode exact (SIMPLEX_EXACT).
+    """
+    if getattr(settings, 'SIMPLEX_EXACT', False):
+        # Le mode exact ne fonctionne qu'avec le moteur tableau
+        return ENGINE_TABLEAU
+    if problem.sparse_constraints:
+        return ENGINE_REVISED
+    min_size = getattr(settings, 'SIMPLEX_INTERIOR_POINT_MIN_SIZE', None)
+    if min_size is not None and len(problem.objective_coefficients or []) * len(problem.constraints or []) >= min_size:
+        return ENGINE_INTERIOR_POINT
+    return ENGINE_TABLEAU
+
+_solve_cache = None
+
+def solve_cache():
+    """Cache des résultats partagé entre utilisateurs (LRU du processus, puis cache Django SIMPLEX_SOLVE_CACHE_ALIAS)."""
+    global _solve_cache
+    if _solve_cache is None:
+        from django.core.cache import caches
+        alias = getattr(settings, 'SIMPLEX_SOLVE_CACHE_ALIAS', 'default')
+        _solve_cache = SolveCache(
+            backend=caches[alias] if alias else None,
+            lru_size=getattr(settings, 'SIMPLEX_SOLVE_CACHE_SIZE', 256),
+            timeout=getattr(settings, 'SIMPLEX_SOLVE_CACHE_TIMEOUT', None),
+        )
+    return _solve_cache
+
+def solver_settings(problem):
+    """Réglages du solveur pour `problem` (settings SIMPLEX_*), hors données du problème."""
+    return dict(
+        engine=solver_engine(problem),
+        history=getattr(settings, 'SIMPLEX_HISTORY_MODE', HISTORY_PIVOT_LOG),
+        pricing=getattr(settings, 'SIMPLEX_PRICING', PRICING_DANTZIG),
+        presolve=getattr(settings, 'SIMPLEX_PRESOLVE', True),
+        scaling=None if getattr(settings, 'SIMPLEX_EXACT', False) else getattr(settings, 'SIMPLEX_SCALING', None),
+        # Une résolution trop longue rend la main avec la meilleure base atteinte (statut 'time_limit')
+        time_limit=getattr(settings, 'SIMPLEX_TIME_LIMIT', None),
+        instrument=getattr(settings, 'SIMPLEX_INSTRUMENTATION', False),
+    )
+
+def is_up_to_date(problem):
+    """
+    Résultat enregistré toujours valable : mêmes données et mêmes réglages que la dernière résolution,
+    terminée (statut définitif) avec son historique. Une nouvelle résolution ne ferait que le remplacer
+    par un historique sans pivot.
+    """
+    if problem.solved_fingerprint is None or problem.status not in CACHEABLE_STATUSES or not problem.tableaus_history:
+        return False
+    try:
+        return canonical_problem(problem, solver_settings(problem)).fingerprint == problem.solved_fingerprint
+    except (KeyError, TypeError, ValueError):
+        # Données devenues incomplètes : la résolution signalera l'erreur
+        return False
+
+def canonical_problem(problem, options):
+    """Forme canonique du Problem pour le cache, avec les réglages du solveur qui changent le résultat."""
+    fingerprint = {key: value for key, value in options.items() if key in ('engine', 'history', 'pricing', 'presolve', 'scaling')}
+    fingerprint['exact'] = getattr(settings, 'SIMPLEX_EXACT', False)
+    return CanonicalProblem(problem.objective_type, problem.objective_coefficients, problem.constraints or [],
+                            bounds=problem.bounds, integer_variables=problem.integer_variables, options=fingerprint)
+
+def solve_summary(result, engine, solve_ms, cached=False):
+    """Résumé de la résolution enregistré sur le Problem (Problem.solve_summary)."""
+    summary = {'iterations': result['iterations'], 'solve_ms': solve_ms, 'engine': engine, 'cached': cached}
+    instrumentation = result.get('instrumentation')
+    if instrumentation and not cached:
+        # L'instrumentation d'un résultat en cache est celle de la résolution d'origine : non reprise
+        summary.update(
+            phases_ms={phase: elapsed * 1e3 for phase, elapsed in instrumentation['times'].items()},
+            degenerate_pivots=instrumentation['degenerate_pivots'],
+            basis_condition=instrumentation['basis_condition'],
+            peak_tableau_bytes=instrumentation['peak_tableau_bytes'],
+        )
+    return summary
+
+# Champs écrits par une résolution (save(update_fields=...) : le reste du problème n'est pas réécrit)
+SOLUTION_FIELDS = ['status', 'optimal_value', 'solution_variables', 'basis_vars', 'solved_fingerprint', 'sensitivity',
+                   'solve_summary', 'tableaus_history', 'date_updated']
+
 @login_required
 def solve_problem(request, pk):
     problem = get_object_or_404(Problem, pk=pk, user=request.user)
-    
+
+    if problem.status in IN_PROGRESS_STATUSES:
+        if not (is_stale(problem) and reset_stale_jobs(pk=problem.pk)):
+            messages.info(request, 'La résolution de ce problème est déjà en cours.')
+            return redirect('problem_detail', pk=problem.pk)
+        # Résolution précédente abandonnée : relancée
+        problem.refresh_from_db()
+
+    if is_up_to_date(problem):
+        messages.info(request, 'Le problème n\'a pas changé depuis sa dernière résolution : résultats et tableaux conservés.')
+        return redirect('problem_detail', pk=problem.pk)
+
+    if getattr(settings, 'SIMPLEX_SOLVE_ASYNC', False):
+        # Résolution dans un processus du pool : la page suit l'avancement par problem_status
+        try:
+            if submit_solve(problem):
+                messages.info(request, 'Résolution lancée : les résultats s\'afficheront dès qu\'elle sera terminée.')
+            else:
+                messages.warning(request, 'Trop de résolutions en attente : veuillez réessayer dans quelques instants.')
+        except Exception as e:
+            messages.error(request, f'Erreur lors du lancement de la résolution : {str(e)}')
+        return redirect('problem_detail', pk=problem.pk)
+
     try:
-        # Préparation des données pour le solveur
-        solver = SimplexSolver(
-            objective_type=problem.objective_type,
-            objective_coefficients=problem.objective_coefficients,
-            constraints=problem.constraints
-        )
-        
-        # Résolution du problème
-        result = solver.solve()
-        
-        print("\nRésultat du solveur:")
-        print(result)
-        
-        # Mise à jour du problème avec les résultats
-        problem.status = result['status']
-        if result['status'] == 'optimal':
-            problem.optimal_value = result['optimal_value']
-            problem.solution_variables = result['solution']
-        
-        # Conversion des tableaux en format JSON-sérialisable
-        if 'tableaus' in result:
-            tableaus_json = []
-            for tableau in result['tableaus']:
-                print("\nTableau avant conversion:")
-                print(tableau)
-                
-                tableau_json = {
-                    'tableau': [row.tolist() if hasattr(row, 'tolist') else row for row in tableau['tableau']],
-                    'basis_vars': [int(x) if hasattr(x, 'item') else x for x in tableau['basis_vars']],  # Conversion des np.int64 en int
-                    'variable_names': tableau['variable_names']
-                }
-                print("\nTableau après conversion:")
-                print(tableau_json)
-                tableaus_json.append(tableau_json)
-            
-            print("\nTableaus JSON final:")
-            print(tableaus_json)
-            problem.tableaus_history = tableaus_json
-        
-        problem.save()
-        
-        messages.success(request, 'Le problème a été résolu avec succès.')
-        
+        level, message = run_solve(problem)
+        problem.save(update_fields=SOLUTION_FIELDS)
+        messages.add_message(request, level, message)
     except Exception as e:
         print("\nErreur détaillée:")
         print(str(e))
@@ -208,6 +321,143 @@ def solve_problem(request, pk):
     
     return redirect('problem_detail', pk=problem.pk)
 
+@login_required
+def problem_status(request, pk):
+    """Statut d'une résolution, interrogé par la page du problème tant qu'elle est en cours."""
+    problem = get_object_or_404(Problem, pk=pk, user=request.user)
+    if is_stale(problem) and reset_stale_jobs(pk=problem.pk):
+        problem.refresh_from_db()
+    summary = problem.solve_summary or {}
+    return JsonResponse({
+        'status': problem.status,
+        'status_display': problem.get_status_display(),
+        'done': problem.status not in IN_PROGRESS_STATUSES,
+        'optimal_value': problem.optimal_value,
+        'iterations': summary.get('iterations'),
+        'solve_ms': summary.get('solve_ms'),
+        'message': summary.get('message') or summary.get('error'),
+    })
+
+def run_solve(problem):
+    """
+    Résout `problem` et renseigne ses champs de résultat (SOLUTION_FIELDS), sans l'enregistrer.
+    Renvoie le message pour l'utilisateur : (niveau django.contrib.messages, texte).
+    """
+    # Préparation des données pour le solveur
+    exact = getattr(settings, 'SIMPLEX_EXACT', False)
+    options = dict(
+        objective_type=problem.objective_type,
+        objective_coefficients=problem.objective_coefficients,
+        constraints=problem.get_program(),
+        bounds=problem.bounds,
+        **solver_settings(problem)
+    )
+    start = time.perf_counter()
+    canonical = canonical_problem(problem, options)
+    use_cache = getattr(settings, 'SIMPLEX_SOLVE_CACHE', True)
+    result = solve_cache().get(canonical) if use_cache else None
+    if result is not None:
+        # Même problème déjà résolu (par n'importe quel utilisateur) : résultat et tableaux renumérotés
+        solver = None
+    elif problem.integer_variables:
+        # Variables entières : séparation et évaluation, chaque nœud repartant de la base de son parent
+        solver = BranchAndBoundSolver(
+            integer_variables=problem.integer_variables,
+            workers=getattr(settings, 'SIMPLEX_MIP_WORKERS', 1),
+            exact=exact,
+            **options
+        )
+    else:
+        # Reprise depuis la base finale précédente seulement si les données ont changé depuis (sinon
+        # la résolution serait sans pivot) ; le solveur vérifie qu'elle convient encore et la répare
+        # par le simplexe dual si besoin
+        data_changed = problem.solved_fingerprint not in (None, canonical.fingerprint)
+        warm_start = getattr(settings, 'SIMPLEX_WARM_START', True) and data_changed
+        solver = SimplexSolver(
+            initial_basis=problem.basis_vars if warm_start else None,
+            # Tableaux en fractions exactes, comparables aux calculs à la main
+            exact=exact,
+            **options
+        )
+    
+    if solver is not None:
+        # Résolution du problème
+        result = solver.solve()
+        if use_cache and not result.get('warm_start'):
+            # Une reprise depuis une base précédente n'a qu'un historique partiel : elle n'est pas partagée
+            solve_cache().put(canonical, result)
+    solve_ms = (time.perf_counter() - start) * 1e3
+    
+    logger.info(f"Problème {problem.pk} : {result['status']}, valeur {result['optimal_value']}, "
+                f"{result['iterations']} itération(s), {solve_ms:.2f} ms")
+    if result.get('presolve'):
+        report = result['presolve']
+        logger.debug(f"Présolution : {report['rows_removed']} ligne(s) et {report['columns_removed']} colonne(s) supprimée(s), "
+                     f"{report['presolve_time'] * 1e3:.2f} ms, gain estimé {(report['estimated_time_saved'] or 0.0) * 1e3:.2f} ms")
+    if result.get('interior_point'):
+        report = result['interior_point']
+        logger.debug(f"Points intérieurs : {report['status']} en {report['iterations']} itération(s), "
+                     f"{report['ipm_time'] * 1e3:.2f} ms, crossover {report['crossover_time'] * 1e3:.2f} ms, "
+                     f"{result['iterations']} pivot(s) de nettoyage")
+    if result.get('branch_and_bound'):
+        report = result['branch_and_bound']
+        logger.debug(f"Séparation et évaluation : {report['nodes']} nœud(s), {report['workers']} processus, "
+                     f"{report['solve_time'] * 1e3:.2f} ms")
+    
+    # Mise à jour du problème avec les résultats
+    problem.status = result['status']
+    if result['status'] == 'optimal' or (result['status'] == STATUS_TIME_LIMIT and result['solution'] is not None):
+        problem.optimal_value = result['optimal_value']
+        problem.solution_variables = result['solution']
+    # La base finale d'une séparation et évaluation est celle d'un nœud (bornes resserrées) : pas de reprise
+    problem.basis_vars = None if result.get('branch_and_bound') else result.get('basis_vars')
+    problem.solved_fingerprint = canonical.fingerprint
+    problem.sensitivity = result.get('sensitivity')
+    problem.solve_summary = solve_summary(result, options['engine'], solve_ms, cached=solver is None)
+    
+    # Conversion des tableaux en format JSON-sérialisable
+    if result.get('pivot_log'):
+        # Mode 'pivot-log' : tableau initial + suite des pivots, rejouée à l'affichage
+        problem.tableaus_history = result['pivot_log']
+    elif 'tableaus' in result:
+        tableaus_json = []
+        for tableau in result['tableaus']:
+            tableau_json = {
+                'tableau': [row.tolist() if hasattr(row, 'tolist') else row for row in tableau['tableau']],
+                'basis_vars': [int(x) if hasattr(x, 'item') else x for x in tableau['basis_vars']],  # Conversion des np.int64 en int
+                'variable_names': tableau['variable_names'],
+                'iteration': tableau.get('iteration')
+            }
+            if tableau.get('at_upper'):
+                # Colonnes complémentées (x_j = u_j - x̄_j), marquées à l'affichage
+                tableau_json['at_upper'] = [int(j) for j in tableau['at_upper']]
+            if tableau.get('exact_tableau') is not None:
+                tableau_json['exact_tableau'] = tableau['exact_tableau']
+            tableaus_json.append(tableau_json)
+
+        problem.tableaus_history = tableaus_json
+    
+    report = result.get('branch_and_bound')
+    if solver is None:
+        return messages.SUCCESS, 'Le problème a été résolu avec succès (résultat déjà calculé pour un problème identique).'
+    elif result['status'] == STATUS_TIME_LIMIT:
+        reason = {LIMIT_TIME: "limite de temps", LIMIT_ITERATIONS: "limite d'itérations", LIMIT_CANCELLED: "annulation",
+                  LIMIT_NODES: "limite de nœuds"}[result['limit']]
+        if report:
+            gap = f"écart {report['gap']:.2%}" if report['gap'] is not None else "aucune solution entière"
+            return messages.WARNING, (f"Résolution interrompue ({reason}) après {report['nodes']} nœud(s) ({gap}) : "
+                                      f"la meilleure solution entière trouvée a été enregistrée.")
+        else:
+            return messages.WARNING, (f"Résolution interrompue ({reason}) après {result['iterations']} itération(s) : "
+                                      f"la meilleure base atteinte a été enregistrée.")
+    elif report:
+        return messages.SUCCESS, (f"Le problème a été résolu avec succès ({report['nodes']} nœud(s) explorés en "
+                                  f"{report['solve_time']:.2f} s).")
+    elif result.get('warm_start'):
+        return messages.SUCCESS, f"Le problème a été résolu avec succès (reprise depuis la base précédente, {result['iterations']} itération(s))."
+    else:
+        return messages.SUCCESS, 'Le problème a été résolu avec succès.'
+
 import logging
 logger = logging.getLogger(__name__)
 
@@ -224,70 +474,43 @@ def import_problem(request):
                 'error': 'Format de fichier non supporté'
             })
         
+        # Le fichier est enregistré, le traitement se fait en arrière-plan (problems.import_pipeline) :
+        # la page suit l'avancement par import_progress
+        problem = ImportedProblem.objects.create(
+            user=request.user,
+            file=file,
+            nom=f"Problème importé - {file.name}",
+            statusForImport='pending',
+        )
         try:
-            # Création du problème importé
-            problem = ImportedProblem.objects.create(
-                user=request.user,
-                file=file,
-                nom=f"Problème importé - {file.name}",
-                statusForImport='processing',
-                processing_started_at=timezone.now()
-            )
-            
-            # Traitement avec Gemini
-            gemini_service = GeminiService()
-            
-            if file.content_type.startswith('image/'):
-                result = gemini_service.process_image(file)
-            else:
-                result = gemini_service.process_pdf(file)
-            
-            print(result['objective_coefficients'])
-            
-            # Mise à jour du problème avec les résultats
-            problem.objective_type = result['objective_type']
-            problem.objective_coefficients = result['objective_coefficients']
-            problem.constraints = result['constraints']
-            
-            problem.num_variables = len(result['objective_coefficients'])
-            
-            # Assurer la cohérence des longueurs de coefficients dans les contraintes
-            for constraint in problem.constraints:
-                if len(constraint['coefficients']) < problem.num_variables:
-                    constraint['coefficients'].extend(
-                        [0.0] * (problem.num_variables - len(constraint['coefficients'])))
-                    
-            problem.variable_names = [f"x{i+1}" for i in range(problem.num_variables)]
-            
-            if 'objective_function' in result: # Si Gemini renvoie la chaîne de l'objectif
-                problem.objective_equation_str = result['objective_function']
-            if 'constraints_equations' in result: # Si Gemini renvoie la liste des chaînes des contraintes
-                problem.constraints_equation_str = "\n".join(result['constraints_equations'])
-                
-            problem.statusForImport = 'completed'
-            problem.processing_completed_at = timezone.now()
-            
-            problem.save()
-            
-            return JsonResponse({
-                'success': True,
-                'problem_id': problem.id
-            })
-            
+            submit_import(problem)
         except Exception as e:
             logger.error(f"Erreur lors de l'importation : {str(e)}", exc_info=True)
-            if problem:
-                problem.statusForImport = 'failed'
-                problem.error_message = str(e)
-                problem.processing_completed_at = timezone.now() 
-                problem.save()
-            
+            problem.statusForImport = 'failed'
+            problem.error_message = str(e)
+            problem.processing_completed_at = timezone.now()
+            problem.save(update_fields=['statusForImport', 'error_message', 'processing_completed_at', 'date_updated'])
             return JsonResponse({
                 'success': False,
                 'error': f"Erreur interne du serveur : {str(e)}" # Message d'erreur plus générique à l'utilisateur
             })
+
+        return JsonResponse({
+            'success': True,
+            'problem_id': problem.id,
+            'progress_url': reverse('import_progress', args=[problem.pk]),
+        })
     
     return JsonResponse({
         'success': False,
         'error': 'Méthode non autorisée ou fichier manquant'
-    })
\ No newline at end of file
+    })
+@login_required
+def import_progress(request, pk):
+    """Avancement d'une importation en arrière-plan, interrogé par le tableau de bord après l'envoi du fichier."""
+    problem = get_object_or_404(ImportedProblem, pk=pk, user=request.user)
+    if is_stale_import(problem) and reset_stale_imports(pk=problem.pk):
+        problem.refresh_from_db()
+    data = progress_summary(problem)
+    data['detail_url'] = reverse('problem_detail', args=[problem.pk])
+    return JsonResponse(data)